@@ -0,0 +1,207 @@
+# Copyright 2025 Emcie Co Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+import asyncio
+import collections.abc
+from collections import Counter
+from enum import Enum
+import types
+from typing import Any, Literal, Mapping, Union, get_args, get_origin
+from typing_extensions import override
+
+from pydantic import BaseModel
+
+from parlant.adapters.nlp.replay_service import (
+    LatencySampler,
+    ReplayEmbedder,
+    ReplayEstimatingTokenizer,
+)
+from parlant.core.engines.alpha.message_generator import MessageSchema, Revision
+from parlant.core.engines.alpha.prompt_builder import PromptBuilder
+from parlant.core.loggers import Logger
+from parlant.core.meter import Meter
+from parlant.core.nlp.embedding import Embedder
+from parlant.core.nlp.generation import T, BaseSchematicGenerator, SchematicGenerationResult
+from parlant.core.nlp.generation_info import GenerationInfo, UsageInfo
+from parlant.core.nlp.moderation import ModerationService, NoModeration
+from parlant.core.nlp.service import EmbedderHints, NLPService, SchematicGeneratorHints
+from parlant.core.nlp.tokenization import EstimatingTokenizer
+from parlant.core.tracer import Tracer
+
+
+def synthesize(annotation: Any) -> Any:
+    """Returns the smallest value that validates against a type annotation."""
+
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+
+    if annotation is type(None):
+        return None
+    if origin in (Union, types.UnionType):
+        return None if type(None) in args else synthesize(args[0])
+    if origin is Literal:
+        return args[0]
+    if isinstance(container := origin or annotation, type) and not issubclass(container, str):
+        if issubclass(container, collections.abc.Mapping):
+            return {}
+        if issubclass(container, (collections.abc.Sequence, collections.abc.Set)):
+            return []
+    if isinstance(annotation, type):
+        if issubclass(annotation, BaseModel):
+            return {
+                name: synthesize(field.annotation)
+                for name, field in annotation.model_fields.items()
+                if field.is_required()
+            }
+        if issubclass(annotation, Enum):
+            return next(iter(annotation)).value
+        if issubclass(annotation, bool):
+            return False
+        if issubclass(annotation, (int, float)):
+            return 0
+        if issubclass(annotation, str):
+            return ""
+
+    return None
+
+
+# Fields whose minimal value wouldn't let the engine make progress
+_FIELD_OVERRIDES: dict[str, dict[str, Any]] = {
+    "JourneyNextStepSelectionSchema": {"applied_condition_id": "None"},
+}
+
+
+class MockSchematicGenerator(BaseSchematicGenerator[T]):
+    """Responds to every prompt with a minimal, valid instance of its schema.
+
+    Message generation gets an actual reply, so that turns complete as they would with an LLM.
+    """
+
+    def __init__(
+        self,
+        latency: LatencySampler,
+        calls: Counter[str],
+        logger: Logger,
+        tracer: Tracer,
+        meter: Meter,
+    ) -> None:
+        super().__init__(logger=logger, tracer=tracer, meter=meter, model_name="mock")
+
+        self._latency = latency
+        self._calls = calls
+        self._tokenizer = ReplayEstimatingTokenizer()
+
+    @property
+    @override
+    def id(self) -> str:
+        return "mock"
+
+    @property
+    @override
+    def max_tokens(self) -> int:
+        return 1_000_000
+
+    @property
+    @override
+    def tokenizer(self) -> EstimatingTokenizer:
+        return self._tokenizer
+
+    def _content(self) -> T:
+        if self.schema is MessageSchema:
+            return MessageSchema(
+                produced_reply=True,
+                revisions=[
+                    Revision(
+                        revision_number=1,
+                        content="Thanks, I can help with that.",
+                        is_repeat_message=False,
+                        followed_all_instructions=True,
+                    )
+                ],
+            )  # type: ignore
+
+        return self.schema.model_validate(
+            {
+                **synthesize(self.schema),
+                **_FIELD_OVERRIDES.get(self.schema.__name__, {}),
+            }
+        )
+
+    @override
+    async def do_generate(
+        self,
+        prompt: str | PromptBuilder,
+        hints: Mapping[str, Any] = {},
+    ) -> SchematicGenerationResult[T]:
+        if isinstance(prompt, PromptBuilder):
+            prompt = prompt.build()
+
+        self._calls[self.schema.__name__] += 1
+
+        if duration := self._latency.sample():
+            await asyncio.sleep(duration)
+
+        return SchematicGenerationResult(
+            content=self._content(),
+            info=GenerationInfo(
+                schema_name=self.schema.__name__,
+                model="mock",
+                duration=duration,
+                usage=UsageInfo(input_tokens=len(prompt) // 4, output_tokens=50),
+            ),
+        )
+
+
+class MockNLPService(NLPService):
+    """An NLP service for benchmarks, which answers after a simulated latency and counts calls."""
+
+    def __init__(
+        self,
+        generation_latency: LatencySampler,
+        embedding_latency: LatencySampler,
+        logger: Logger,
+        tracer: Tracer,
+        meter: Meter,
+    ) -> None:
+        self.calls: Counter[str] = Counter()
+
+        self._latency = generation_latency
+        self._logger = logger
+        self._tracer = tracer
+        self._meter = meter
+
+        self.embedder = ReplayEmbedder(embedding_latency, logger, tracer, meter)
+
+    @override
+    async def get_schematic_generator(
+        self,
+        t: type[T],
+        hints: SchematicGeneratorHints = {},
+    ) -> MockSchematicGenerator[T]:
+        return MockSchematicGenerator[t](  # type: ignore
+            self._latency,
+            self.calls,
+            self._logger,
+            self._tracer,
+            self._meter,
+        )
+
+    @override
+    async def get_embedder(self, hints: EmbedderHints = {}) -> Embedder:
+        return self.embedder
+
+    @override
+    async def get_moderation_service(self) -> ModerationService:
+        return NoModeration()
@@ -0,0 +1,149 @@
+# Copyright 2025 Emcie Co Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+from dataclasses import asdict, dataclass
+import json
+import math
+from pathlib import Path
+import resource
+import sys
+from typing import Any, Mapping, Sequence
+
+import rich
+from rich.table import Table
+
+
+@dataclass(frozen=True)
+class Metric:
+    name: str
+    value: float
+    unit: str
+    higher_is_better: bool
+
+
+@dataclass(frozen=True)
+class Regression:
+    metric: Metric
+    baseline: float
+
+
+def percentile(values: Sequence[float], p: float) -> float:
+    """Returns the p-th percentile (0-100) of the values, interpolating between ranks."""
+
+    if not values:
+        return 0.0
+
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * p / 100
+    low, high = math.floor(rank), math.ceil(rank)
+
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def peak_memory_metric() -> Metric:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # Linux reports kilobytes, macOS reports bytes
+    megabytes = peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+    return Metric("process.peak_rss", megabytes, "MB", higher_is_better=False)
+
+
+def save_baseline(
+    path: Path,
+    metrics: Sequence[Metric],
+    parameters: Mapping[str, Any],
+) -> None:
+    path.write_text(
+        json.dumps(
+            {
+                "parameters": parameters,
+                "metrics": {m.name: asdict(m) for m in metrics},
+            },
+            indent=2,
+        )
+    )
+
+
+def load_baseline(path: Path) -> tuple[dict[str, Any], dict[str, Metric]]:
+    content = json.loads(path.read_text())
+
+    return content["parameters"], {
+        name: Metric(**metric) for name, metric in content["metrics"].items()
+    }
+
+
+def find_regressions(
+    metrics: Sequence[Metric],
+    baseline: Mapping[str, Metric],
+    tolerance: float,
+) -> list[Regression]:
+    """Returns the metrics that got worse than their baseline by more than the tolerance (a ratio)."""
+
+    regressions = []
+
+    for metric in metrics:
+        if metric.name not in baseline:
+            continue
+
+        reference = baseline[metric.name].value
+
+        if metric.higher_is_better:
+            regressed = metric.value < reference * (1 - tolerance)
+        else:
+            regressed = metric.value > reference * (1 + tolerance)
+
+        if regressed:
+            regressions.append(Regression(metric, reference))
+
+    return regressions
+
+
+def print_report(
+    metrics: Sequence[Metric],
+    baseline: Mapping[str, Metric] = {},
+    regressions: Sequence[Regression] = (),
+) -> None:
+    regressed = {r.metric.name for r in regressions}
+
+    table = Table(title="Benchmark Results")
+    table.add_column("Metric")
+    table.add_column("Value", justify="right")
+    table.add_column("Unit")
+
+    if baseline:
+        table.add_column("Baseline", justify="right")
+        table.add_column("Change", justify="right")
+
+    for metric in metrics:
+        row = [metric.name, f"{metric.value:,.2f}", metric.unit]
+
+        if baseline:
+            if reference := baseline.get(metric.name):
+                change = (
+                    (metric.value - reference.value) / reference.value if reference.value else 0.0
+                )
+                formatted = f"{change:+.1%}"
+
+                if metric.name in regressed:
+                    formatted = f"[red]{formatted}[/red]"
+
+                row += [f"{reference.value:,.2f}", formatted]
+            else:
+                row += ["-", "-"]
+
+        table.add_row(*row)
+
+    rich.print(table)
@@ -0,0 +1,263 @@
+# Copyright 2025 Emcie Co Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Runs the benchmark suite against a server container that uses a mock NLP service.
+
+python -m benchmarks.run --sessions 50 --concurrency 10 --generation-latency fixed:0.2
+"""
+
+from __future__ import annotations
+import asyncio
+import os
+from pathlib import Path
+import sys
+import tempfile
+from typing import Any, Optional
+
+import click
+import rich
+from lagom import Container
+
+from benchmarks.mock_nlp import MockNLPService
+from benchmarks.report import (
+    Metric,
+    find_regressions,
+    load_baseline,
+    peak_memory_metric,
+    print_report,
+    save_baseline,
+)
+from benchmarks.scenarios import (
+    run_engine_scenario,
+    run_session_store_scenario,
+    run_vector_search_scenario,
+)
+from benchmarks.workload import Workload, create_agent
+from parlant.adapters.nlp.replay_service import ReplayEmbedder, SimulatedLatency
+from parlant.core.agents import CompositionMode
+from parlant.core.background_tasks import BackgroundTaskService
+from parlant.core.loggers import Logger
+from parlant.core.meter import Meter
+from parlant.core.nlp.service import NLPService
+from parlant.core.tracer import Tracer
+
+
+SCENARIOS = ["engine", "session-store", "vector-search"]
+
+
+async def run_benchmarks(
+    workload: Workload,
+    scenarios: list[str],
+    parameters: dict[str, Any],
+    generation_latency: SimulatedLatency,
+    embedding_latency: SimulatedLatency,
+) -> list[Metric]:
+    # The server module reads PARLANT_HOME on import, so it's only imported once that's set
+    from parlant.bin.server import StartupParameters, load_app
+
+    async def load_mock_service(container: Container) -> NLPService:
+        service = MockNLPService(
+            generation_latency.sampler(),
+            embedding_latency.sampler(),
+            container[Logger],
+            container[Tracer],
+            container[Meter],
+        )
+
+        container[ReplayEmbedder] = service.embedder
+
+        return service
+
+    async def configure(container: Container) -> Container:
+        return container
+
+    metrics: list[Metric] = []
+
+    async with load_app(
+        StartupParameters(
+            host="127.0.0.1",
+            port=0,
+            nlp_service=load_mock_service,
+            log_level="error",
+            modules=[],
+            migrate=False,
+            configure=configure,
+        )
+    ) as (_, container):
+        agent = await create_agent(container, workload)
+
+        try:
+            if "engine" in scenarios:
+                metrics += await run_engine_scenario(
+                    container,
+                    agent,
+                    sessions=parameters["sessions"],
+                    concurrency=parameters["concurrency"],
+                    turns=parameters["turns"],
+                    timeout=parameters["timeout"],
+                    seed=workload.seed,
+                )
+
+            if "session-store" in scenarios:
+                metrics += await run_session_store_scenario(
+                    container,
+                    agent,
+                    events=parameters["events"],
+                )
+
+            if "vector-search" in scenarios:
+                metrics += await run_vector_search_scenario(
+                    container,
+                    documents=parameters["documents"],
+                    queries=parameters["queries"],
+                    concurrency=parameters["concurrency"],
+                    seed=workload.seed,
+                )
+        finally:
+            # As when the server shuts down, long-running tasks would otherwise keep it alive
+            await container[BackgroundTaskService].cancel_all(reason="Benchmarks done")
+
+    return [*metrics, peak_memory_metric()]
+
+
+@click.command()
+@click.option(
+    "--scenario",
+    "scenarios",
+    type=click.Choice(SCENARIOS),
+    multiple=True,
+    help="Scenarios to run (default: all)",
+)
+@click.option("--sessions", type=int, default=20, show_default=True)
+@click.option("--concurrency", type=int, default=10, show_default=True)
+@click.option("--turns", type=int, default=2, show_default=True, help="Messages per session")
+@click.option("--guidelines", type=int, default=50, show_default=True)
+@click.option("--journeys", type=int, default=5, show_default=True)
+@click.option("--canned-responses", type=int, default=50, show_default=True)
+@click.option(
+    "--composition-mode",
+    type=click.Choice([m.value for m in CompositionMode]),
+    default=CompositionMode.FLUID.value,
+    show_default=True,
+)
+@click.option("--events", type=int, default=2000, show_default=True, help="Session store events")
+@click.option("--documents", type=int, default=1000, show_default=True, help="Vector documents")
+@click.option("--queries", type=int, default=500, show_default=True, help="Vector queries")
+@click.option(
+    "--generation-latency",
+    default="fixed:0.1",
+    show_default=True,
+    help="Simulated LLM latency, e.g. none, fixed:0.5, uniform:0.2,1.5 or lognormal:-0.5,0.4",
+)
+@click.option("--embedding-latency", default="none", show_default=True)
+@click.option("--timeout", type=float, default=120, show_default=True, help="Per-turn timeout")
+@click.option("--seed", type=int, default=0, show_default=True)
+@click.option(
+    "--baseline",
+    type=click.Path(path_type=Path, exists=True, dir_okay=False),
+    help="Compare against a baseline saved by --save-baseline",
+)
+@click.option(
+    "--tolerance",
+    type=float,
+    default=0.1,
+    show_default=True,
+    help="Relative change beyond which a metric counts as regressed",
+)
+@click.option(
+    "--save-baseline",
+    "baseline_output",
+    type=click.Path(path_type=Path, dir_okay=False),
+    help="Save the results as a baseline for later runs",
+)
+def main(
+    scenarios: tuple[str, ...],
+    sessions: int,
+    concurrency: int,
+    turns: int,
+    guidelines: int,
+    journeys: int,
+    canned_responses: int,
+    composition_mode: str,
+    events: int,
+    documents: int,
+    queries: int,
+    generation_latency: str,
+    embedding_latency: str,
+    timeout: float,
+    seed: int,
+    baseline: Optional[Path],
+    tolerance: float,
+    baseline_output: Optional[Path],
+) -> None:
+    workload = Workload(
+        guidelines=guidelines,
+        journeys=journeys,
+        canned_responses=canned_responses,
+        composition_mode=CompositionMode(composition_mode),
+        seed=seed,
+    )
+
+    parameters: dict[str, Any] = {
+        "scenarios": sorted(scenarios or SCENARIOS),
+        "sessions": sessions,
+        "concurrency": concurrency,
+        "turns": turns,
+        "guidelines": guidelines,
+        "journeys": journeys,
+        "canned_responses": canned_responses,
+        "composition_mode": composition_mode,
+        "events": events,
+        "documents": documents,
+        "queries": queries,
+        "generation_latency": generation_latency,
+        "embedding_latency": embedding_latency,
+        "timeout": timeout,
+    }
+
+    with tempfile.TemporaryDirectory() as home:
+        os.environ["PARLANT_HOME"] = home
+
+        metrics = asyncio.run(
+            run_benchmarks(
+                workload,
+                parameters["scenarios"],
+                parameters,
+                SimulatedLatency.parse(generation_latency, seed=seed),
+                SimulatedLatency.parse(embedding_latency, seed=seed),
+            )
+        )
+
+    if not baseline:
+        print_report(metrics)
+    else:
+        baseline_parameters, baseline_metrics = load_baseline(baseline)
+
+        if baseline_parameters != parameters:
+            rich.print("[yellow]The baseline was run with different parameters[/yellow]")
+
+        regressions = find_regressions(metrics, baseline_metrics, tolerance)
+
+        print_report(metrics, baseline_metrics, regressions)
+
+        if regressions:
+            rich.print(f"[red]{len(regressions)} metric(s) regressed beyond {tolerance:.0%}[/red]")
+            sys.exit(1)
+
+    if baseline_output:
+        save_baseline(baseline_output, metrics, parameters)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+# Copyright 2025 Emcie Co Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+import asyncio
+import random
+import time
+from typing import Optional, TypedDict, cast
+from typing_extensions import Required
+
+from lagom import Container
+
+from benchmarks.mock_nlp import MockNLPService
+from benchmarks.report import Metric, percentile
+from benchmarks.workload import customer_message
+from parlant.adapters.vector_db.transient import TransientVectorDatabase
+from parlant.core.agents import Agent
+from parlant.core.application import Application
+from parlant.core.app_modules.sessions import Moderation
+from parlant.core.async_utils import Timeout
+from parlant.core.common import Version, generate_id, md5_checksum
+from parlant.core.loggers import Logger
+from parlant.core.nlp.embedding import EmbedderFactory, NullEmbeddingCache
+from parlant.core.nlp.service import NLPService
+from parlant.core.persistence.common import ObjectId
+from parlant.core.persistence.vector_database import BaseDocument
+from parlant.core.sessions import EventKind, EventSource, SessionStore
+from parlant.core.tracer import Tracer
+from parlant.adapters.nlp.replay_service import ReplayEmbedder
+
+
+async def run_engine_scenario(
+    container: Container,
+    agent: Agent,
+    sessions: int,
+    concurrency: int,
+    turns: int,
+    timeout: float,
+    seed: int,
+) -> list[Metric]:
+    """Drives concurrent conversations through the session module and the engine.
+
+    Each turn is timed from the moment the customer's message is created
+    until the agent's reply to it is stored.
+    """
+
+    app = container[Application]
+    service = cast(MockNLPService, container[NLPService])
+    rng = random.Random(seed)
+
+    customer = await app.customers.create(name="Benchmark Customer", extra={}, tags=None)
+
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    calls_before = sum(service.calls.values())
+
+    async def converse(messages: list[str]) -> None:
+        async with semaphore:
+            session = await app.sessions.create(customer_id=customer.id, agent_id=agent.id)
+
+            for message in messages:
+                turn_start = time.perf_counter()
+
+                event = await app.sessions.create_customer_message(
+                    session_id=session.id,
+                    moderation=Moderation.NONE,
+                    message=message,
+                    source=EventSource.CUSTOMER,
+                    trigger_processing=True,
+                    metadata=None,
+                )
+
+                if not await app.sessions.wait_for_update(
+                    session_id=session.id,
+                    min_offset=event.offset + 1,
+                    kinds=[EventKind.MESSAGE],
+                    source=EventSource.AI_AGENT,
+                    timeout=Timeout(timeout),
+                ):
+                    raise TimeoutError(f"Session {session.id} got no reply within {timeout}s")
+
+                latencies.append(time.perf_counter() - turn_start)
+
+    conversations = [[customer_message(rng) for _ in range(turns)] for _ in range(sessions)]
+
+    start = time.perf_counter()
+    await asyncio.gather(*(converse(messages) for messages in conversations))
+    elapsed = time.perf_counter() - start
+
+    calls = sum(service.calls.values()) - calls_before
+
+    return [
+        Metric("engine.throughput", len(latencies) / elapsed, "turns/s", higher_is_better=True),
+        Metric("engine.turn_latency.p50", percentile(latencies, 50), "s", higher_is_better=False),
+        Metric("engine.turn_latency.p99", percentile(latencies, 99), "s", higher_is_better=False),
+        Metric("engine.llm_calls_per_turn", calls / len(latencies), "calls", False),
+    ]
+
+
+async def run_session_store_scenario(
+    container: Container,
+    agent: Agent,
+    events: int,
+    page_size: int = 100,
+) -> list[Metric]:
+    """Measures how fast events are appended to, and listed from, a single session."""
+
+    session_store = container[SessionStore]
+    app = container[Application]
+
+    customer = await app.customers.create(name="Benchmark Customer", extra={}, tags=None)
+    session = await session_store.create_session(customer_id=customer.id, agent_id=agent.id)
+
+    start = time.perf_counter()
+
+    for i in range(events):
+        await session_store.create_event(
+            session_id=session.id,
+            source=EventSource.CUSTOMER if i % 2 == 0 else EventSource.AI_AGENT,
+            kind=EventKind.MESSAGE,
+            trace_id="benchmark",
+            data={"message": f"Message number {i}", "participant": {"display_name": "Someone"}},
+        )
+
+    write_elapsed = time.perf_counter() - start
+
+    listed = 0
+    cursor = None
+    start = time.perf_counter()
+
+    while True:
+        listing = await session_store.list_events(
+            session_id=session.id,
+            limit=page_size,
+            cursor=cursor,
+        )
+
+        listed += len(listing.items)
+
+        if not (cursor := listing.next_cursor):
+            break
+
+    read_elapsed = time.perf_counter() - start
+
+    return [
+        Metric("session_store.writes", events / write_elapsed, "events/s", higher_is_better=True),
+        Metric("session_store.reads", listed / read_elapsed, "events/s", higher_is_better=True),
+    ]
+
+
+class _BenchmarkDocument(TypedDict, total=False):
+    id: ObjectId
+    version: Version.String
+    content: str
+    checksum: Required[str]
+
+
+async def _load_document(document: BaseDocument) -> Optional[_BenchmarkDocument]:
+    return document
+
+
+async def run_vector_search_scenario(
+    container: Container,
+    documents: int,
+    queries: int,
+    concurrency: int,
+    k: int = 10,
+    seed: int = 0,
+) -> list[Metric]:
+    """Measures similarity-search throughput over a transient collection of synthetic documents."""
+
+    rng = random.Random(seed)
+
+    vector_db = TransientVectorDatabase(
+        container[Logger],
+        container[Tracer],
+        EmbedderFactory(container),
+        lambda: NullEmbeddingCache(),
+    )
+
+    collection = await vector_db.get_or_create_collection(
+        name="benchmark_documents",
+        schema=_BenchmarkDocument,
+        embedder_type=ReplayEmbedder,
+        document_loader=_load_document,
+    )
+
+    for i in range(documents):
+        content = customer_message(rng) + f" (document {i})"
+
+        await collection.insert_one(
+            {
+                "id": ObjectId(generate_id()),
+                "version": Version.String("0.1.0"),
+                "content": content,
+                "checksum": md5_checksum(content),
+            }
+        )
+
+    semaphore = asyncio.Semaphore(concurrency)
+    texts = [customer_message(rng) for _ in range(queries)]
+
+    async def query(text: str) -> None:
+        async with semaphore:
+            await collection.find_similar_documents(filters={}, query=text, k=k)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(query(text) for text in texts))
+    elapsed = time.perf_counter() - start
+
+    return [Metric("vector_search.throughput", queries / elapsed, "queries/s", True)]
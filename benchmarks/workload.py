@@ -0,0 +1,129 @@
+# Copyright 2025 Emcie Co Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+from dataclasses import dataclass
+import random
+
+from lagom import Container
+
+from parlant.core.agents import Agent, CompositionMode
+from parlant.core.application import Application
+from parlant.core.journeys import JourneyStore
+from parlant.core.tags import Tag
+
+
+_TOPICS = [
+    "refunds",
+    "shipping",
+    "billing",
+    "passwords",
+    "subscriptions",
+    "returns",
+    "invoices",
+    "discounts",
+    "warranty",
+    "delivery times",
+    "order tracking",
+    "account deletion",
+]
+
+_CUSTOMER_MESSAGES = [
+    "Hi, I'd like to ask about {topic}",
+    "Can you help me with {topic}?",
+    "I have a problem regarding {topic}",
+    "What's your policy on {topic}?",
+]
+
+
+@dataclass(frozen=True)
+class Workload:
+    """The size of the synthetic agent that benchmarks run against."""
+
+    guidelines: int = 50
+    journeys: int = 5
+    journey_steps: int = 3
+    canned_responses: int = 50
+    composition_mode: CompositionMode = CompositionMode.FLUID
+    seed: int = 0
+
+
+def _topic(index: int) -> str:
+    return f"{_TOPICS[index % len(_TOPICS)]} (case {index})"
+
+
+def customer_message(rng: random.Random) -> str:
+    return rng.choice(_CUSTOMER_MESSAGES).format(topic=rng.choice(_TOPICS))
+
+
+async def create_agent(container: Container, workload: Workload) -> Agent:
+    app = container[Application]
+
+    agent = await app.agents.create(
+        name="Benchmark Agent",
+        description="An agent with synthetic guidelines, journeys and canned responses",
+        max_engine_iterations=None,
+        composition_mode=workload.composition_mode,
+        tags=None,
+    )
+
+    agent_tag = Tag.for_agent_id(agent.id)
+
+    for i in range(workload.guidelines):
+        await app.guidelines.create(
+            condition=f"The customer asks about {_topic(i)}",
+            action=f"Explain our policy on {_topic(i)} and offer further help",
+            description=None,
+            criticality=None,
+            metadata=None,
+            enabled=True,
+            tags=[agent_tag],
+        )
+
+    for i in range(workload.journeys):
+        journey, _ = await app.journeys.create(
+            title=f"Handle {_topic(i)}",
+            description=f"Walk the customer through resolving an issue with {_topic(i)}",
+            conditions=[f"The customer wants to resolve an issue with {_topic(i)}"],
+            tags=[agent_tag],
+        )
+
+        journey_store = container[JourneyStore]
+        previous = journey.root_id
+
+        for step in range(workload.journey_steps):
+            node = await journey_store.create_node(
+                journey_id=journey.id,
+                action=f"Step {step + 1}: ask the customer for details about {_topic(i)}",
+                tools=[],
+            )
+
+            await journey_store.create_edge(
+                journey_id=journey.id,
+                source=previous,
+                target=node.id,
+                condition=None,
+            )
+
+            previous = node.id
+
+    for i in range(workload.canned_responses):
+        await app.canned_responses.create(
+            value=f"Happy to help with {_topic(i)}. Could you share a few more details?",
+            fields=[],
+            signals=None,
+            tags=[agent_tag],
+        )
+
+    return agent
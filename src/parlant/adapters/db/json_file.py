@@ -23,6 +23,7 @@ from parlant.core.persistence.common import (
     Cursor,
     SortDirection,
     Where,
+    exclude_document_fields,
     matches_filters,
     ensure_is_total,
     ObjectId,
@@ -135,8 +136,11 @@ class JSONFileDocumentDatabase(DocumentDatabase):
                 "failed_migrations", BaseDocument, identity_loader
             )
 
-            for doc in failed_migrations:
-                await failed_migrations_collection.insert_one(doc)
+            # Writing the failed documents at once, as every insert would rewrite the file
+            async with failed_migrations_collection._lock.writer_lock:
+                failed_migrations_collection.documents.extend(failed_migrations)
+
+            await self.flush()
 
         return data
 
@@ -245,6 +249,7 @@ class JSONFileDocumentCollection(DocumentCollection[TDocument]):
         limit: Optional[int] = None,
         cursor: Optional[Cursor] = None,
         sort_direction: Optional[SortDirection] = None,
+        exclude_fields: Optional[Sequence[str]] = None,
     ) -> FindResult[TDocument]:
         async with self._lock.reader_lock:
             # First, filter documents
@@ -279,6 +284,9 @@ class JSONFileDocumentCollection(DocumentCollection[TDocument]):
             else:
                 result_docs = filtered_docs
 
+            if exclude_fields:
+                result_docs = [exclude_document_fields(d, exclude_fields) for d in result_docs]
+
             return FindResult(
                 items=result_docs,
                 total_count=total_count,
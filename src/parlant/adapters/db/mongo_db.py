@@ -12,8 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, Awaitable, Callable, Optional
-from bson import CodecOptions
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Mapping, Optional, Sequence, cast
 from typing_extensions import Self
 from parlant.core.loggers import Logger
 from parlant.core.persistence.common import Cursor, SortDirection, Where, ObjectId
@@ -27,22 +28,28 @@ from parlant.core.persistence.document_database import (
     TDocument,
     UpdateResult,
 )
-from pymongo import AsyncMongoClient
+from pymongo import ASCENDING, AsyncMongoClient, ReturnDocument
 from pymongo.asynchronous.database import AsyncDatabase
 from pymongo.asynchronous.collection import AsyncCollection
 
 
+def _without_object_id(document: Mapping[str, Any]) -> dict[str, Any]:
+    return {k: v for k, v in document.items() if k != "_id"}
+
+
 class MongoDocumentDatabase(DocumentDatabase):
     def __init__(
         self,
         mongo_client: AsyncMongoClient[Any],
         database_name: str,
         logger: Logger,
+        migration_batch_size: int = 1000,
     ):
         self.mongo_client: AsyncMongoClient[Any] = mongo_client
         self.database_name = database_name
 
         self._logger = logger
+        self._migration_batch_size = migration_batch_size
 
         self._database: Optional[AsyncDatabase[Any]] = None
         self._collections: dict[str, MongoDocumentCollection[Any]] = {}
@@ -55,13 +62,9 @@ class MongoDocumentDatabase(DocumentDatabase):
         if self._database is None:
             raise Exception("underlying database missing.")
 
-        collection = await self._database.create_collection(
-            name=name,
-            codec_options=CodecOptions(document_class=schema),
-        )
-
-        # Create index on creation_utc field
-        await collection.create_index([("creation_utc", 1)])
+        # Mongo creates the collection along with its first index
+        collection = self._database.get_collection(name=name)
+        await self._create_base_indexes(collection)
 
         self._collections[name] = MongoDocumentCollection(self, collection)
         return self._collections[name]
@@ -75,54 +78,107 @@ class MongoDocumentDatabase(DocumentDatabase):
         if self._database is None:
             raise Exception("underlying database missing.")
 
-        result_collection = self._database.get_collection(
-            name=name,
-            codec_options=CodecOptions(document_class=schema),
-        )
+        result_collection = self._database.get_collection(name=name)
 
         failed_migrations_collection_name = f"{self.database_name}_{name}_failed_migrations"
-        collection_existing_documents = result_collection.find({})
         if failed_migrations_collection_name in await self._database.list_collection_names():
             self._logger.info(f"deleting old `{failed_migrations_collection_name}` collection")
             await self.delete_collection(failed_migrations_collection_name)
 
-        failed_migration_collection: Optional[DocumentCollection[TDocument]] = None
-        for doc in await collection_existing_documents.to_list():
+        start = time.perf_counter()
+
+        if migrated_count := await self._load_documents(
+            result_collection,
+            document_loader,
+            failed_migrations_collection_name,
+        ):
+            elapsed = time.perf_counter() - start
+
+            self._logger.info(
+                f"migrated {migrated_count} documents in `{name}` "
+                f"in {elapsed:.2f}s ({migrated_count / elapsed:.0f} documents/s)"
+            )
+
+        await self._create_base_indexes(result_collection)
+
+        self._collections[name] = MongoDocumentCollection(self, result_collection)
+        return self._collections[name]
+
+    async def _load_documents(
+        self,
+        collection: AsyncCollection[Any],
+        document_loader: Callable[[BaseDocument], Awaitable[TDocument | None]],
+        failed_migrations_collection_name: str,
+    ) -> int:
+        """Runs every document through the loader, writing back only those it changed.
+
+        Documents are streamed from the cursor, and the writes are sent a batch at a time.
+        Since documents that load unchanged aren't written again, a migration that was
+        interrupted simply picks up from where it stopped the next time the collection is loaded.
+
+        Returns the number of documents that were migrated and written back.
+        """
+        if self._database is None:
+            raise Exception("underlying database missing.")
+
+        failed_migrations_collection = self._database[failed_migrations_collection_name]
+
+        replacements: list[tuple[Any, TDocument]] = []
+        failed_documents: list[BaseDocument] = []
+        unloadable_document_ids: list[Any] = []
+
+        migrated_count = 0
+
+        async def write_batch() -> None:
+            # The replacements of a batch are independent, so they're sent concurrently
+            await asyncio.gather(
+                *(
+                    collection.replace_one({"_id": document_id}, loaded_doc)
+                    for document_id, loaded_doc in replacements
+                )
+            )
+
+            if failed_documents:
+                self._logger.warning(
+                    f"storing {len(failed_documents)} failed migrations in `{failed_migrations_collection_name}`"
+                )
+                await failed_migrations_collection.insert_many(failed_documents)
+
+            if unloadable_document_ids:
+                await collection.delete_many({"_id": {"$in": unloadable_document_ids}})
+
+            replacements.clear()
+            failed_documents.clear()
+            unloadable_document_ids.clear()
+
+        async for doc in collection.find({}).batch_size(self._migration_batch_size):
             try:
-                if loaded_doc := await document_loader(doc):
-                    await result_collection.replace_one(doc, loaded_doc)
-                    continue
-
-                if failed_migration_collection is None:
-                    self._logger.warning(
-                        f"creating: `{failed_migrations_collection_name}` collection to store failed migrations..."
-                    )
-                    failed_migration_collection = await self.create_collection(
-                        failed_migrations_collection_name, schema
-                    )
-
-                self._logger.warning(f'failed to load document "{doc}"')
-                await failed_migration_collection.insert_one(doc)
-                await result_collection.delete_one(doc)
+                loaded_doc = await document_loader(doc)
             except Exception as e:
-                if failed_migration_collection is None:
-                    self._logger.warning(
-                        f"creating: `{failed_migrations_collection_name}` collection to store failed migrations..."
-                    )
-                    failed_migration_collection = await self.create_collection(
-                        failed_migrations_collection_name, schema
-                    )
-
                 self._logger.error(
                     f"failed to load document '{doc}' with error: {e}. Added to `{failed_migrations_collection_name}` collection."
                 )
-                await failed_migration_collection.insert_one(doc)
+                failed_documents.append(doc)
+            else:
+                if loaded_doc is None:
+                    self._logger.warning(f'failed to load document "{doc}"')
+                    failed_documents.append(doc)
+                    unloadable_document_ids.append(doc["_id"])
+                elif _without_object_id(loaded_doc) != _without_object_id(doc):
+                    replacements.append((doc["_id"], loaded_doc))
+                    migrated_count += 1
 
-        # Create index on creation_utc field
-        await result_collection.create_index([("creation_utc", 1)])
+            if len(replacements) + len(failed_documents) >= self._migration_batch_size:
+                await write_batch()
 
-        self._collections[name] = MongoDocumentCollection(self, result_collection)
-        return self._collections[name]
+        await write_batch()
+
+        return migrated_count
+
+    async def _create_base_indexes(self, collection: AsyncCollection[Any]) -> None:
+        # Every store looks documents up by id, and pages through them by creation_utc
+        await collection.create_index([("id", ASCENDING)])
+        await collection.create_index([("creation_utc", ASCENDING)])
 
     async def get_or_create_collection(
         self,
@@ -169,8 +225,9 @@ class MongoDocumentCollection(DocumentCollection[TDocument]):
         limit: Optional[int] = None,
         cursor: Optional[Cursor] = None,
         sort_direction: Optional[SortDirection] = None,
+        exclude_fields: Optional[Sequence[str]] = None,
     ) -> FindResult[TDocument]:
-        query = dict(filters) if filters else {}
+        query: dict[str, Any] = dict(filters) if filters else {}
         sort_direction = sort_direction or SortDirection.ASC
 
         if cursor is not None:
@@ -194,7 +251,13 @@ class MongoDocumentCollection(DocumentCollection[TDocument]):
                         ]
                     },
                 ]
-            query["$or"] = cursor_conditions
+
+            # The filters may have an $or of their own, which must not be overridden
+            query = (
+                {"$and": [query, {"$or": cursor_conditions}]}
+                if query
+                else {"$or": cursor_conditions}
+            )
 
         # Sort by creation_utc with _id as tiebreaker according to sort_direction
         sort_order = -1 if sort_direction == SortDirection.DESC else 1
@@ -203,7 +266,9 @@ class MongoDocumentCollection(DocumentCollection[TDocument]):
         # Get one extra document to check if there are more
         query_limit = (limit + 1) if limit else None
 
-        mongo_cursor = self._collection.find(query).sort(sort_spec)
+        projection = {field: 0 for field in exclude_fields} if exclude_fields else None
+
+        mongo_cursor = self._collection.find(query, projection).sort(sort_spec)
         if query_limit:
             mongo_cursor = mongo_cursor.limit(query_limit)
 
@@ -238,29 +303,38 @@ class MongoDocumentCollection(DocumentCollection[TDocument]):
         insert_result = await self._collection.insert_one(document)
         return InsertResult(acknowledged=insert_result.acknowledged)
 
+    async def ensure_index(self, fields: Sequence[str]) -> None:
+        await self._collection.create_index([(field, ASCENDING) for field in fields])
+
     async def update_one(
         self,
         filters: Where,
         params: TDocument,
         upsert: bool = False,
     ) -> UpdateResult[TDocument]:
-        update_result = await self._collection.update_one(filters, {"$set": params}, upsert)
-        result_document = await self._collection.find_one(filters)
+        # Getting the document as it was before the update tells whether it was
+        # matched or upserted, while saving another round trip to read it back
+        original_document = await self._collection.find_one_and_update(
+            filters,
+            {"$set": params},
+            upsert=upsert,
+            return_document=ReturnDocument.BEFORE,
+        )
+
+        if original_document is None:
+            return UpdateResult[TDocument](True, 0, 0, params if upsert else None)
+
         return UpdateResult[TDocument](
-            update_result.acknowledged,
-            update_result.matched_count,
-            update_result.modified_count,
-            result_document,
+            True,
+            1,
+            1,
+            cast(TDocument, {**original_document, **params}),
         )
 
     async def delete_one(self, filters: Where) -> DeleteResult[TDocument]:
-        result_document = await self._collection.find_one(filters)
+        result_document = await self._collection.find_one_and_delete(filters)
+
         if result_document is None:
             return DeleteResult(True, 0, None)
 
-        delete_result = await self._collection.delete_one(filters)
-        return DeleteResult(
-            delete_result.acknowledged,
-            deleted_count=delete_result.deleted_count,
-            deleted_document=result_document,
-        )
+        return DeleteResult(True, deleted_count=1, deleted_document=result_document)
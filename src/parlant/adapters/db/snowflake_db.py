@@ -36,7 +36,14 @@ from typing import (
 from typing_extensions import Self
 
 from parlant.core.loggers import Logger
-from parlant.core.persistence.common import Cursor, ObjectId, SortDirection, Where, ensure_is_total
+from parlant.core.persistence.common import (
+    Cursor,
+    ObjectId,
+    SortDirection,
+    Where,
+    ensure_is_total,
+    exclude_document_fields,
+)
 from parlant.core.persistence.document_database import (
     BaseDocument,
     DeleteResult,
@@ -417,6 +424,7 @@ class SnowflakeDocumentCollection(DocumentCollection[TDocument]):
         limit: Optional[int] = None,
         cursor: Optional[Cursor] = None,
         sort_direction: Optional[SortDirection] = None,
+        exclude_fields: Optional[Sequence[str]] = None,
     ) -> FindResult[TDocument]:
         await self.ensure_table()
 
@@ -437,7 +445,20 @@ class SnowflakeDocumentCollection(DocumentCollection[TDocument]):
         query_limit = (limit + 1) if limit else None
         limit_sql = f" LIMIT {query_limit}" if query_limit else ""
 
-        sql = f"SELECT DATA FROM {self._table}"
+        # Top-level fields are dropped by Snowflake itself. Nested ones may go through
+        # arrays, which can't be expressed generically in SQL, so they're dropped here.
+        top_level_exclusions = [f for f in exclude_fields or [] if "." not in f]
+        nested_exclusions = [f for f in exclude_fields or [] if "." in f]
+
+        select = "DATA"
+        if top_level_exclusions:
+            placeholders: list[str] = []
+            for i, field in enumerate(top_level_exclusions):
+                params[f"exclude_{i}"] = field
+                placeholders.append(f"%(exclude_{i})s")
+            select = f"OBJECT_DELETE(DATA, {', '.join(placeholders)}) AS DATA"
+
+        sql = f"SELECT {select} FROM {self._table}"
         if clause:
             sql += f" {clause}"
         sql += f" {order_by}{limit_sql}"
@@ -445,6 +466,9 @@ class SnowflakeDocumentCollection(DocumentCollection[TDocument]):
         rows = await self._database._execute(sql, params or None, fetch="all")
         documents = [cast(TDocument, self._row_to_document(row)) for row in rows or []]
 
+        if nested_exclusions:
+            documents = [exclude_document_fields(d, nested_exclusions) for d in documents]
+
         total_count = len(documents)
         has_more = False
         next_cursor = None
@@ -20,6 +20,7 @@ from typing_extensions import get_type_hints
 from parlant.core.persistence.common import (
     Cursor,
     SortDirection,
+    exclude_document_fields,
     matches_filters,
     Where,
     ObjectId,
@@ -115,6 +116,7 @@ class TransientDocumentCollection(DocumentCollection[TDocument]):
         limit: Optional[int] = None,
         cursor: Optional[Cursor] = None,
         sort_direction: Optional[SortDirection] = None,
+        exclude_fields: Optional[Sequence[str]] = None,
     ) -> FindResult[TDocument]:
         # First, filter documents
         filtered_docs = [doc for doc in self._documents if matches_filters(filters, doc)]
@@ -148,6 +150,9 @@ class TransientDocumentCollection(DocumentCollection[TDocument]):
         else:
             result_docs = filtered_docs
 
+        if exclude_fields:
+            result_docs = [exclude_document_fields(d, exclude_fields) for d in result_docs]
+
         return FindResult(
             items=result_docs,
             total_count=total_count,
@@ -13,7 +13,7 @@ from opentelemetry.exporter.otlp.proto.grpc._log_exporter import (
 from opentelemetry.exporter.otlp.proto.http._log_exporter import (
     OTLPLogExporter as HttpOTLPLogExporter,
 )
-from parlant.core.loggers import LogLevel, TracingLogger
+from parlant.core.loggers import LogLevel, LogMessage, TracingLogger, resolve_log_message
 from parlant.core.tracer import Tracer
 
 
@@ -129,28 +129,33 @@ class OpenTelemetryLogger(TracingLogger):
         )
 
     @override
-    def trace(self, message: str) -> None:
-        if self.log_level != LogLevel.TRACE:
+    def trace(self, message: LogMessage) -> None:
+        if not self.is_enabled(LogLevel.TRACE):
             return
 
-        self._logger.debug(message, actual_level="trace")
+        self._logger.debug(resolve_log_message(message), actual_level="trace")
 
     @override
-    def debug(self, message: str) -> None:
-        self._logger.debug(message)
+    def debug(self, message: LogMessage) -> None:
+        if self.is_enabled(LogLevel.DEBUG):
+            self._logger.debug(resolve_log_message(message))
 
     @override
-    def info(self, message: str) -> None:
-        self._logger.info(message)
+    def info(self, message: LogMessage) -> None:
+        if self.is_enabled(LogLevel.INFO):
+            self._logger.info(resolve_log_message(message))
 
     @override
-    def warning(self, message: str) -> None:
-        self._logger.warning(message)
+    def warning(self, message: LogMessage) -> None:
+        if self.is_enabled(LogLevel.WARNING):
+            self._logger.warning(resolve_log_message(message))
 
     @override
-    def error(self, message: str) -> None:
-        self._logger.error(message)
+    def error(self, message: LogMessage) -> None:
+        if self.is_enabled(LogLevel.ERROR):
+            self._logger.error(resolve_log_message(message))
 
     @override
-    def critical(self, message: str) -> None:
-        self._logger.critical(message)
+    def critical(self, message: LogMessage) -> None:
+        if self.is_enabled(LogLevel.CRITICAL):
+            self._logger.critical(resolve_log_message(message))
@@ -14,112 +14,199 @@
 
 import asyncio
 from collections import deque
-from dataclasses import dataclass
-from typing import Any
+from dataclasses import dataclass, field
+from typing import Any, Optional
 from fastapi import WebSocket
 from typing_extensions import override
 
 from parlant.core.engines.alpha.entity_context import EntityContext
 from parlant.core.common import UniqueId, generate_id
 from parlant.core.tracer import Tracer
-from parlant.core.loggers import TracingLogger, LogLevel
+from parlant.core.loggers import LogMessage, TracingLogger, LogLevel, resolve_log_message
 
 
-@dataclass(frozen=True)
+DEFAULT_SUBSCRIPTION_QUEUE_SIZE = 1000
+DEFAULT_FLUSH_INTERVAL = 0.1
+
+
+@dataclass
 class WebSocketSubscription:
     socket: WebSocket
     expiration: asyncio.Event
+    min_level: LogLevel = LogLevel.TRACE
+    trace_id: Optional[str] = None
+    batched: bool = False
+    queue: deque[dict[str, Any]] = field(
+        default_factory=lambda: deque(maxlen=DEFAULT_SUBSCRIPTION_QUEUE_SIZE)
+    )
+    dropped: int = 0
+    sending: Optional[asyncio.Task[None]] = None
+
+    def accepts(self, level: LogLevel, trace_id: str) -> bool:
+        if level < self.min_level:
+            return False
+
+        return self.trace_id is None or trace_id.startswith(self.trace_id)
 
 
 class WebSocketLogger(TracingLogger):
+    """Streams log lines to subscribed web sockets (e.g., the dashboard's log viewer).
+
+    Each subscriber has its own bounded queue, which drops its oldest lines
+    when the subscriber can't keep up, so a slow socket never holds back the others.
+    Lines are only formatted if at least one subscriber wants them.
+    """
+
     def __init__(
         self,
         tracer: Tracer,
         log_level: LogLevel = LogLevel.DEBUG,
         logger_id: str | None = None,
+        queue_size: int = DEFAULT_SUBSCRIPTION_QUEUE_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
     ) -> None:
         super().__init__(tracer, log_level, logger_id)
 
-        self._message_queue = deque[Any]()
-        self._messages_in_queue = asyncio.Semaphore(0)
+        self._queue_size = queue_size
+        self._flush_interval = flush_interval
+
+        self._messages_available = asyncio.Event()
         self._socket_subscriptions: dict[UniqueId, WebSocketSubscription] = {}
         self._lock = asyncio.Lock()
 
-    def _enqueue_message(self, timestamp: str, level: str, message: str) -> None:
+    @override
+    def is_enabled(self, log_level: LogLevel) -> bool:
+        return any(s.min_level <= log_level for s in self._socket_subscriptions.values())
+
+    def _enqueue_message(self, level: LogLevel, message: LogMessage) -> None:
+        if not self._socket_subscriptions:
+            return
+
+        trace_id = self._tracer.trace_id
+
+        subscriptions = [
+            s for s in self._socket_subscriptions.values() if s.accepts(level, trace_id)
+        ]
+
+        if not subscriptions:
+            return
+
+        text = f"{self.current_scope} {resolve_log_message(message)}"
+
+        if context_creation := EntityContext.get_context_creation():
+            text = f"[T+{round(context_creation.elapsed, 3)}s]{text}"
+
         payload = {
-            "level": level,
-            "trace_id": self._tracer.trace_id,
-            "message": message,
+            "level": level.name,
+            "trace_id": trace_id,
+            "message": text,
         }
 
-        if context_creation := EntityContext.get_context_creation():
-            payload["message"] = f"[T+{round(context_creation.elapsed, 3)}s]{message}"
+        for subscription in subscriptions:
+            if len(subscription.queue) == subscription.queue.maxlen:
+                subscription.dropped += 1
 
-        self._message_queue.append(payload)
-        self._messages_in_queue.release()
+            subscription.queue.append(payload)
 
-    async def subscribe(self, web_socket: WebSocket) -> WebSocketSubscription:
+        self._messages_available.set()
+
+    async def subscribe(
+        self,
+        web_socket: WebSocket,
+        min_level: LogLevel = LogLevel.TRACE,
+        trace_id: Optional[str] = None,
+        batched: bool = False,
+    ) -> WebSocketSubscription:
         socket_id = generate_id()
 
-        subscription = WebSocketSubscription(web_socket, asyncio.Event())
+        subscription = WebSocketSubscription(
+            socket=web_socket,
+            expiration=asyncio.Event(),
+            min_level=min_level,
+            trace_id=trace_id,
+            batched=batched,
+            queue=deque(maxlen=self._queue_size),
+        )
 
         async with self._lock:
             self._socket_subscriptions[socket_id] = subscription
 
         return subscription
 
-    def _timestamp(self) -> str:
-        return round(asyncio.get_event_loop().time(), 3).__str__()
-
     @override
-    def trace(self, message: str) -> None:
-        self._enqueue_message(self._timestamp(), "TRACE", f"{self.current_scope} {message}")
+    def trace(self, message: LogMessage) -> None:
+        self._enqueue_message(LogLevel.TRACE, message)
 
     @override
-    def debug(self, message: str) -> None:
-        self._enqueue_message(self._timestamp(), "DEBUG", f"{self.current_scope} {message}")
+    def debug(self, message: LogMessage) -> None:
+        self._enqueue_message(LogLevel.DEBUG, message)
 
     @override
-    def info(self, message: str) -> None:
-        self._enqueue_message(self._timestamp(), "INFO", f"{self.current_scope} {message}")
+    def info(self, message: LogMessage) -> None:
+        self._enqueue_message(LogLevel.INFO, message)
 
     @override
-    def warning(self, message: str) -> None:
-        self._enqueue_message(self._timestamp(), "WARNING", f"{self.current_scope} {message}")
+    def warning(self, message: LogMessage) -> None:
+        self._enqueue_message(LogLevel.WARNING, message)
 
     @override
-    def error(self, message: str) -> None:
-        self._enqueue_message(self._timestamp(), "ERROR", f"{self.current_scope} {message}")
+    def error(self, message: LogMessage) -> None:
+        self._enqueue_message(LogLevel.ERROR, message)
 
     @override
-    def critical(self, message: str) -> None:
-        self._enqueue_message(self._timestamp(), "CRITICAL", f"{self.current_scope} {message}")
+    def critical(self, message: LogMessage) -> None:
+        self._enqueue_message(LogLevel.CRITICAL, message)
+
+    async def _flush(self, socket_id: UniqueId, subscription: WebSocketSubscription) -> None:
+        payloads = list(subscription.queue)
+        subscription.queue.clear()
+
+        dropped, subscription.dropped = subscription.dropped, 0
+
+        try:
+            if subscription.batched:
+                await subscription.socket.send_json({"messages": payloads, "dropped": dropped})
+            else:
+                for payload in payloads:
+                    await subscription.socket.send_json(payload)
+        except Exception:
+            async with self._lock:
+                self._socket_subscriptions.pop(socket_id, None)
+            subscription.expiration.set()
+            return
+
+        if subscription.queue:
+            # More lines arrived while we were sending
+            self._messages_available.set()
 
     async def start(self) -> None:
         try:
             while True:
                 try:
-                    await self._messages_in_queue.acquire()
-                    payload = self._message_queue.popleft()
+                    await self._messages_available.wait()
+
+                    # Give more lines a chance to arrive, so they go out together
+                    await asyncio.sleep(self._flush_interval)
+                    self._messages_available.clear()
 
                     async with self._lock:
                         socket_subscriptions = dict(self._socket_subscriptions)
 
-                    expired_ids = set()
-
                     for socket_id, subscription in socket_subscriptions.items():
-                        try:
-                            await subscription.socket.send_json(payload)
-                        except Exception:
-                            expired_ids.add(socket_id)
+                        if not subscription.queue:
+                            continue
 
-                    async with self._lock:
-                        for socket_id in expired_ids:
-                            subscription = self._socket_subscriptions.pop(socket_id)
-                            subscription.expiration.set()
+                        if subscription.sending and not subscription.sending.done():
+                            continue
+
+                        subscription.sending = asyncio.create_task(
+                            self._flush(socket_id, subscription)
+                        )
                 except asyncio.CancelledError:
                     return
         finally:
             async with self._lock:
                 for socket_id, subscription in self._socket_subscriptions.items():
+                    if subscription.sending:
+                        subscription.sending.cancel()
                     subscription.expiration.set()
@@ -7,7 +7,11 @@ from typing_extensions import override, Self
 from contextlib import asynccontextmanager
 
 from opentelemetry import metrics
-from opentelemetry.metrics import Counter as OTelCounter, Histogram as OTelHistogram
+from opentelemetry.metrics import (
+    Counter as OTelCounter,
+    Histogram as OTelHistogram,
+    _Gauge as OTelGauge,
+)
 from opentelemetry.sdk.metrics import (
     MeterProvider,
 )
@@ -22,7 +26,7 @@ from opentelemetry.exporter.otlp.proto.http.metric_exporter import (
     OTLPMetricExporter as HttpOTLPMetricExporter,
 )
 
-from parlant.core.meter import Counter, DurationHistogram, Meter
+from parlant.core.meter import Counter, DurationHistogram, Gauge, Meter
 
 
 class OpenTelemetryCounter(Counter):
@@ -38,6 +42,19 @@ class OpenTelemetryCounter(Counter):
         self._otel_counter.add(value, attributes)
 
 
+class OpenTelemetryGauge(Gauge):
+    def __init__(self, otel_gauge: OTelGauge) -> None:
+        self._otel_gauge = otel_gauge
+
+    @override
+    async def set(
+        self,
+        value: float,
+        attributes: Mapping[str, str] | None = None,
+    ) -> None:
+        self._otel_gauge.set(value, attributes)
+
+
 class OpenTelemetryHistogram(DurationHistogram):
     def __init__(self, otel_histogram: OTelHistogram) -> None:
         self._otel_histogram = otel_histogram
@@ -134,6 +151,19 @@ class OpenTelemetryMeter(Meter):
 
         return OpenTelemetryCounter(otel_counter)
 
+    @override
+    def create_gauge(
+        self,
+        name: str,
+        description: str,
+    ) -> Gauge:
+        otel_gauge = self._meter.create_gauge(
+            name=name,
+            description=description,
+        )
+
+        return OpenTelemetryGauge(otel_gauge)
+
     @override
     def create_custom_histogram(
         self,
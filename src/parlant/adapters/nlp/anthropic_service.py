@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from functools import partial
 import time
 from pydantic import ValidationError
 from anthropic import (
@@ -28,7 +29,6 @@ import jsonfinder  # type: ignore
 import os
 
 from parlant.adapters.nlp.common import normalize_json_output, record_llm_metrics
-from parlant.adapters.nlp.hugging_face import JinaAIEmbedder
 from parlant.core.engines.alpha.canned_response_generator import CannedResponseSelectionSchema
 from parlant.core.engines.alpha.guideline_matching.generic.disambiguation_batch import (
     DisambiguationGuidelineMatchesSchema,
@@ -158,7 +158,7 @@ class AnthropicAISchematicGenerator(BaseSchematicGenerator[T]):
         t_end = time.time()
 
         if response.usage:
-            self._logger.trace(response.usage.model_dump_json(indent=2))
+            self._logger.trace(partial(response.usage.model_dump_json, indent=2))
 
         raw_content = response.content[0].text
 
@@ -280,6 +280,8 @@ Please set ANTHROPIC_API_KEY in your environment before running Parlant.
 
     @override
     async def get_embedder(self, hints: EmbedderHints = {}) -> Embedder:
+        from parlant.adapters.nlp.hugging_face import JinaAIEmbedder
+
         return JinaAIEmbedder(self._logger, self._tracer, self._meter)
 
     @override
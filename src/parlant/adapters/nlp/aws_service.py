@@ -29,7 +29,6 @@ import os
 import tiktoken
 
 from parlant.adapters.nlp.common import normalize_json_output, record_llm_metrics
-from parlant.adapters.nlp.hugging_face import JinaAIEmbedder
 from parlant.core.engines.alpha.prompt_builder import PromptBuilder
 from parlant.core.tracer import Tracer
 from parlant.core.meter import Meter
@@ -234,6 +233,8 @@ Please consider setting the following your environment before running Parlant.
 
     @override
     async def get_embedder(self, hints: EmbedderHints = {}) -> Embedder:
+        from parlant.adapters.nlp.hugging_face import JinaAIEmbedder
+
         return JinaAIEmbedder(self._logger, self._tracer, self._meter)
 
     @override
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 from __future__ import annotations
+from functools import partial
 import time
 from openai import (
     AsyncAzureOpenAI,
@@ -162,7 +163,7 @@ class AzureSchematicGenerator(BaseSchematicGenerator[T]):
             t_end = time.time()
 
             if response.usage:
-                self._logger.trace(response.usage.model_dump_json(indent=2))
+                self._logger.trace(partial(response.usage.model_dump_json, indent=2))
 
             parsed_object = response.choices[0].message.parsed
             assert parsed_object
@@ -228,7 +229,7 @@ class AzureSchematicGenerator(BaseSchematicGenerator[T]):
             t_end = time.time()
 
             if response.usage:
-                self._logger.trace(response.usage.model_dump_json(indent=2))
+                self._logger.trace(partial(response.usage.model_dump_json, indent=2))
 
             raw_content = response.choices[0].message.content or "{}"
 
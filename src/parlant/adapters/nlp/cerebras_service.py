@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from functools import partial
 import time
 from pydantic import ValidationError
 from cerebras.cloud.sdk import AsyncCerebras
@@ -28,7 +29,6 @@ import os
 import tiktoken
 
 from parlant.adapters.nlp.common import normalize_json_output, record_llm_metrics
-from parlant.adapters.nlp.hugging_face import JinaAIEmbedder
 from parlant.core.engines.alpha.prompt_builder import PromptBuilder
 from parlant.core.tracer import Tracer
 from parlant.core.meter import Meter
@@ -131,7 +131,7 @@ class CerebrasSchematicGenerator(BaseSchematicGenerator[T]):
         t_end = time.time()
 
         if response.usage:  # type: ignore
-            self._logger.trace(response.usage.model_dump_json(indent=2))  # type: ignore
+            self._logger.trace(partial(response.usage.model_dump_json, indent=2))  # type: ignore
 
         raw_content = response.choices[0].message.content or "{}"  # type: ignore
 
@@ -259,6 +259,8 @@ Please set CEREBRAS_API_KEY in your environment before running Parlant.
 
     @override
     async def get_embedder(self, hints: EmbedderHints = {}) -> Embedder:
+        from parlant.adapters.nlp.hugging_face import JinaAIEmbedder
+
         return JinaAIEmbedder(self._logger, self._tracer, self._meter)
 
     @override
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 from __future__ import annotations
+from functools import partial
 import time
 from openai import (
     APIConnectionError,
@@ -33,7 +34,6 @@ from pydantic import ValidationError
 import tiktoken
 
 from parlant.adapters.nlp.common import normalize_json_output, record_llm_metrics
-from parlant.adapters.nlp.hugging_face import JinaAIEmbedder
 from parlant.core.engines.alpha.prompt_builder import PromptBuilder
 from parlant.core.loggers import Logger
 from parlant.core.tracer import Tracer
@@ -145,7 +145,7 @@ class DeepSeekSchematicGenerator(BaseSchematicGenerator[T]):
         t_end = time.time()
 
         if response.usage:
-            self._logger.trace(response.usage.model_dump_json(indent=2))
+            self._logger.trace(partial(response.usage.model_dump_json, indent=2))
 
         raw_content = response.choices[0].message.content or "{}"
 
@@ -242,6 +242,8 @@ Please set DEEPSEEK_API_KEY in your environment before running Parlant.
 
     @override
     async def get_embedder(self, hints: EmbedderHints = {}) -> Embedder:
+        from parlant.adapters.nlp.hugging_face import JinaAIEmbedder
+
         return JinaAIEmbedder(self._logger, self._tracer, self._meter)
 
     @override
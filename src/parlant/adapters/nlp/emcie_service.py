@@ -207,7 +207,7 @@ class EmcieSchematicGenerator(BaseSchematicGenerator[T]):
         usage = response_data["usage"]
         cost = response_data["cost"]
 
-        self.logger.trace(f"Emcie usage data:\n{pformat({**usage, **cost})}")
+        self.logger.trace(lambda: f"Emcie usage data:\n{pformat({**usage, **cost})}")
 
         raw_content = response_data["completion"]
 
@@ -23,7 +23,6 @@ from typing_extensions import override
 from fireworks.client.error import RateLimitError  # type: ignore
 
 from parlant.adapters.nlp.common import normalize_json_output, record_llm_metrics
-from parlant.adapters.nlp.hugging_face import JinaAIEmbedder
 from parlant.core.engines.alpha.prompt_builder import PromptBuilder
 from parlant.core.tracer import Tracer
 from parlant.core.meter import Meter
@@ -146,7 +145,7 @@ class FireworksSchematicGenerator(BaseSchematicGenerator[T]):
         t_end = time.time()
 
         if response.usage:  # type: ignore
-            self._logger.trace(f"Usage: {response.usage.model_dump_json(indent=2)}")  # type: ignore
+            self._logger.trace(lambda: f"Usage: {response.usage.model_dump_json(indent=2)}")  # type: ignore
 
         raw_content = response.choices[0].message.content or "{}"  # type: ignore
 
@@ -419,6 +418,8 @@ You can get your API key from: https://app.fireworks.ai/settings/users/api-keys
 
     @override
     async def get_embedder(self, hints: EmbedderHints = {}) -> Embedder:
+        from parlant.adapters.nlp.hugging_face import JinaAIEmbedder
+
         return JinaAIEmbedder(self._logger, self._tracer, self._meter)
 
     @override
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from functools import partial
 import enum
 import inspect
 import os
@@ -172,7 +173,7 @@ class GeminiSchematicGenerator(BaseSchematicGenerator[T]):
         )
 
         if response.usage_metadata:
-            self.logger.trace(response.usage_metadata.model_dump_json(indent=2))
+            self.logger.trace(partial(response.usage_metadata.model_dump_json, indent=2))
 
         try:
             model_content = self.schema.model_validate(json_result)
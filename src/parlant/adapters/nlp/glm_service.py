@@ -13,6 +13,7 @@
 # limitations under the License.
 
 from __future__ import annotations
+from functools import partial
 import time
 from openai import (
     APIConnectionError,
@@ -229,7 +230,7 @@ class GLMSchematicGenerator(BaseSchematicGenerator[T]):
         t_end = time.time()
 
         if response.usage:
-            self._logger.trace(response.usage.model_dump_json(indent=2))
+            self._logger.trace(partial(response.usage.model_dump_json, indent=2))
 
         raw_content = response.choices[0].message.content or "{}"
 
@@ -12,14 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import annotations
 from collections.abc import Mapping
 import os
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from typing_extensions import override
-import torch  # type: ignore
 from typing import cast
-from transformers import AutoModel, AutoTokenizer, PreTrainedTokenizer, PreTrainedModel  # type: ignore
 from huggingface_hub.errors import (  # type: ignore
     InferenceTimeoutError,
     InferenceEndpointError,
@@ -36,6 +35,12 @@ from parlant.core.nlp.policies import policy, retry
 from parlant.core.nlp.tokenization import EstimatingTokenizer
 from parlant.core.nlp.embedding import BaseEmbedder, EmbeddingResult
 
+if TYPE_CHECKING:
+    # torch and transformers take seconds to import, and most deployments
+    # use a hosted embedder, so they're only loaded once a model is created
+    import torch  # type: ignore
+    from transformers import PreTrainedTokenizer, PreTrainedModel  # type: ignore
+
 
 _TOKENIZER_MODELS: dict[str, PreTrainedTokenizer] = {}
 _AUTO_MODELS: dict[str, PreTrainedModel] = {}
@@ -50,6 +55,8 @@ def _create_tokenizer(model_name: str) -> PreTrainedTokenizer:
     if model_name in _TOKENIZER_MODELS:
         return _TOKENIZER_MODELS[model_name]
 
+    from transformers import AutoTokenizer
+
     save_dir = os.environ.get("PARLANT_HOME", _model_temp_dir())
     os.makedirs(save_dir, exist_ok=True)
 
@@ -68,6 +75,8 @@ def _get_device() -> torch.device:
     if _DEVICE:
         return _DEVICE
 
+    import torch
+
     if torch.backends.mps.is_available():
         _DEVICE = torch.device("mps")
     elif torch.cuda.is_available():
@@ -82,6 +91,8 @@ def _create_auto_model(model_name: str) -> PreTrainedModel:
     if model_name in _AUTO_MODELS:
         return _AUTO_MODELS[model_name]
 
+    from transformers import AutoModel
+
     save_dir = os.environ.get("PARLANT_HOME", _model_temp_dir())
     os.makedirs(save_dir, exist_ok=True)
 
@@ -156,6 +167,8 @@ class HuggingFaceEmbedder(BaseEmbedder):
         )
         tokenized_texts = {key: value.to(_get_device()) for key, value in tokenized_texts.items()}
 
+        import torch
+
         with torch.no_grad():
             embeddings = self._model(**tokenized_texts).last_hidden_state[:, 0, :]
 
@@ -34,7 +34,6 @@ from pydantic import ValidationError
 import tiktoken
 
 from parlant.adapters.nlp.common import normalize_json_output, record_llm_metrics
-from parlant.adapters.nlp.hugging_face import JinaAIEmbedder
 from parlant.core.engines.alpha.prompt_builder import PromptBuilder
 from parlant.core.loggers import Logger
 from parlant.core.tracer import Tracer
@@ -158,8 +157,8 @@ class ModelScopeSchematicGenerator(BaseSchematicGenerator[T]):
         try:
             content = self.schema.model_validate(json_content)
 
-            input_tokens = await self.tokenizer.estimate_token_count(prompt)
-            output_tokens = await self.tokenizer.estimate_token_count(raw_content)
+            input_tokens = await self.tokenizer.budgeting.estimate_token_count(prompt)
+            output_tokens = await self.tokenizer.budgeting.estimate_token_count(raw_content)
 
             await record_llm_metrics(
                 self.meter,
@@ -238,6 +237,8 @@ Please set MODELSCOPE_API_KEY in your environment before running Parlant.
 
     @override
     async def get_embedder(self, hints: EmbedderHints = {}) -> Embedder:
+        from parlant.adapters.nlp.hugging_face import JinaAIEmbedder
+
         return JinaAIEmbedder(self._logger, self._tracer, self._meter)
 
     @override
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 from __future__ import annotations
+from functools import partial
 from itertools import chain
 import time
 from openai import (
@@ -201,7 +202,7 @@ class OpenAISchematicGenerator(BaseSchematicGenerator[T]):
             t_end = time.time()
 
             if response.usage:
-                self.logger.trace(response.usage.model_dump_json(indent=2))
+                self.logger.trace(partial(response.usage.model_dump_json, indent=2))
 
             parsed_object = response.choices[0].message.parsed
             assert parsed_object
@@ -250,7 +251,7 @@ class OpenAISchematicGenerator(BaseSchematicGenerator[T]):
                 raise
 
             if response.usage:
-                self.logger.trace(response.usage.model_dump_json(indent=2))
+                self.logger.trace(partial(response.usage.model_dump_json, indent=2))
 
             raw_content = response.choices[0].message.content or "{}"
 
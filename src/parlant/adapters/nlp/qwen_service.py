@@ -14,6 +14,7 @@
 # Maintainer: Ji Qing <jiqing19861123@163.com>
 
 from __future__ import annotations
+from functools import partial
 import time
 from openai import (
     APIConnectionError,
@@ -230,7 +231,7 @@ class QwenSchematicGenerator(BaseSchematicGenerator[T]):
         t_end = time.time()
 
         if response.usage:
-            self._logger.trace(response.usage.model_dump_json(indent=2))
+            self._logger.trace(partial(response.usage.model_dump_json, indent=2))
 
         raw_content = response.choices[0].message.content or "{}"
 
@@ -0,0 +1,407 @@
+# Copyright 2025 Emcie Co Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+import asyncio
+from collections import defaultdict
+from dataclasses import dataclass
+import gzip
+import hashlib
+import json
+import math
+from pathlib import Path
+import random
+import re
+from typing import Any, Literal, Mapping, Optional, Sequence, cast
+from typing_extensions import override
+
+from parlant.core.engines.alpha.prompt_builder import PromptBuilder
+from parlant.core.loggers import Logger
+from parlant.core.meter import Meter
+from parlant.core.nlp.embedding import BaseEmbedder, Embedder, EmbeddingResult
+from parlant.core.nlp.generation import (
+    T,
+    BaseSchematicGenerator,
+    SchematicGenerationResult,
+)
+from parlant.core.nlp.generation_info import GenerationInfo, UsageInfo
+from parlant.core.nlp.moderation import ModerationService, NoModeration
+from parlant.core.nlp.service import EmbedderHints, NLPService, SchematicGeneratorHints
+from parlant.core.nlp.tokenization import EstimatingTokenizer
+from parlant.core.tracer import Tracer
+
+
+_WHITESPACE = re.compile(r"\s+")
+_WORD = re.compile(r"\w+")
+
+
+def normalize_prompt(prompt: str) -> str:
+    return _WHITESPACE.sub(" ", prompt).strip()
+
+
+def prompt_hash(prompt: str) -> str:
+    return hashlib.sha256(normalize_prompt(prompt).encode("utf-8")).hexdigest()
+
+
+class ReplayEstimatingTokenizer(EstimatingTokenizer):
+    """Estimates one token per word, which is enough for chunking queries without a model."""
+
+    async def estimate_token_count(self, prompt: str) -> int:
+        return len(_WORD.findall(prompt))
+
+
+class ReplayMissError(Exception):
+    def __init__(self, message: str) -> None:
+        super().__init__(message)
+
+
+LatencyKind = Literal["none", "recorded", "fixed", "uniform", "normal", "lognormal"]
+
+
+@dataclass(frozen=True)
+class SimulatedLatency:
+    """How long replayed requests should take.
+
+    Parsed from specs such as `none`, `recorded`, `fixed:0.5`, `uniform:0.2,1.5`,
+    `normal:0.8,0.2` or `lognormal:-0.5,0.4` (all in seconds, or in the underlying
+    normal's parameters for `lognormal`). `recorded` waits as long as the original request took.
+    """
+
+    kind: LatencyKind = "none"
+    parameters: tuple[float, ...] = ()
+    seed: int = 0
+
+    @staticmethod
+    def parse(spec: str, seed: int = 0) -> SimulatedLatency:
+        kind, _, parameters = spec.partition(":")
+
+        expected_parameters = {
+            "none": 0,
+            "recorded": 0,
+            "fixed": 1,
+            "uniform": 2,
+            "normal": 2,
+            "lognormal": 2,
+        }
+
+        if kind not in expected_parameters:
+            raise ValueError(f"Unknown latency distribution '{kind}'")
+
+        values = tuple(float(p) for p in parameters.split(",")) if parameters else ()
+
+        if len(values) != expected_parameters[kind]:
+            raise ValueError(
+                f"Latency distribution '{kind}' takes {expected_parameters[kind]} parameter(s)"
+            )
+
+        return SimulatedLatency(kind=cast(LatencyKind, kind), parameters=values, seed=seed)
+
+    def sampler(self) -> LatencySampler:
+        return LatencySampler(self)
+
+
+class LatencySampler:
+    def __init__(self, latency: SimulatedLatency) -> None:
+        self._latency = latency
+        self._random = random.Random(latency.seed)
+
+    def sample(self, recorded: float = 0.0) -> float:
+        match self._latency.kind, self._latency.parameters:
+            case "none", _:
+                return 0.0
+            case "recorded", _:
+                return recorded
+            case "fixed", (value,):
+                return value
+            case "uniform", (low, high):
+                return self._random.uniform(low, high)
+            case "normal", (mean, std):
+                return max(0.0, self._random.gauss(mean, std))
+            case "lognormal", (mu, sigma):
+                return self._random.lognormvariate(mu, sigma)
+
+        raise ValueError(f"Invalid latency distribution {self._latency}")
+
+
+@dataclass(frozen=True)
+class RecordedGeneration:
+    schema: str
+    prompt_hash: str
+    completion: Mapping[str, Any]
+    model: str
+    duration: float
+    input_tokens: int
+    output_tokens: int
+
+
+class ReplayCorpus:
+    """Recorded generations, indexed by schema and normalized prompt hash.
+
+    A prompt that was recorded more than once replays its completions in the order
+    they were recorded. Unless the corpus is strict, a prompt that was never recorded
+    replays the schema's completions round-robin, so that benchmarks can run on prompts
+    that differ slightly (e.g., in timestamps or IDs) from the recorded ones.
+    """
+
+    def __init__(self, generations: Sequence[RecordedGeneration], strict: bool = False) -> None:
+        self.strict = strict
+
+        self._by_prompt: dict[tuple[str, str], list[RecordedGeneration]] = defaultdict(list)
+        self._by_schema: dict[str, list[RecordedGeneration]] = defaultdict(list)
+        self._cursors: dict[Any, int] = defaultdict(int)
+
+        for generation in generations:
+            self._by_prompt[(generation.schema, generation.prompt_hash)].append(generation)
+            self._by_schema[generation.schema].append(generation)
+
+    def __len__(self) -> int:
+        return sum(len(generations) for generations in self._by_schema.values())
+
+    @staticmethod
+    def load(path: Path, strict: bool = False) -> ReplayCorpus:
+        """Loads the JSON-lines segments (gzipped or not) written by a DataCollectionSink."""
+
+        generations = []
+
+        for segment in sorted([*path.rglob("*.jsonl.gz"), *path.rglob("*.jsonl")]):
+            content = (
+                gzip.decompress(segment.read_bytes())
+                if segment.suffix == ".gz"
+                else segment.read_bytes()
+            )
+
+            for line in content.decode("utf-8").splitlines():
+                if not line.strip():
+                    continue
+
+                record = json.loads(line)
+                usage = record.get("usage", {})
+
+                generations.append(
+                    RecordedGeneration(
+                        schema=record["schema"],
+                        prompt_hash=prompt_hash(record["prompt"]),
+                        completion=record["completion"],
+                        model=usage.get("model", "unknown"),
+                        duration=usage.get("duration", 0.0),
+                        input_tokens=usage.get("input_tokens", 0),
+                        output_tokens=usage.get("output_tokens", 0),
+                    )
+                )
+
+        return ReplayCorpus(generations, strict=strict)
+
+    def _next(self, key: Any, generations: Sequence[RecordedGeneration]) -> RecordedGeneration:
+        index = self._cursors[key]
+        self._cursors[key] = index + 1
+        return generations[index % len(generations)]
+
+    def find(self, schema: str, prompt: str) -> tuple[RecordedGeneration, bool]:
+        """Returns the generation to replay, and whether it was recorded for this very prompt."""
+
+        key = (schema, prompt_hash(prompt))
+
+        if generations := self._by_prompt.get(key):
+            return self._next(key, generations), True
+
+        if not self.strict and (generations := self._by_schema.get(schema)):
+            return self._next(schema, generations), False
+
+        raise ReplayMissError(f"No recorded generation of {schema} matches the prompt")
+
+
+class ReplaySchematicGenerator(BaseSchematicGenerator[T]):
+    def __init__(
+        self,
+        corpus: ReplayCorpus,
+        latency: LatencySampler,
+        logger: Logger,
+        tracer: Tracer,
+        meter: Meter,
+    ) -> None:
+        super().__init__(logger=logger, tracer=tracer, meter=meter, model_name="replay")
+
+        self._corpus = corpus
+        self._latency = latency
+        self._tokenizer = ReplayEstimatingTokenizer()
+
+        self._misses = meter.create_counter(
+            "replay.misses",
+            description="Replayed generations that weren't recorded for the same prompt",
+        )
+
+    @property
+    @override
+    def id(self) -> str:
+        return "replay"
+
+    @property
+    @override
+    def max_tokens(self) -> int:
+        return 1_000_000
+
+    @property
+    @override
+    def tokenizer(self) -> EstimatingTokenizer:
+        return self._tokenizer
+
+    @override
+    async def do_generate(
+        self,
+        prompt: str | PromptBuilder,
+        hints: Mapping[str, Any] = {},
+    ) -> SchematicGenerationResult[T]:
+        if isinstance(prompt, PromptBuilder):
+            prompt = prompt.build()
+
+        generation, matched = self._corpus.find(self.schema.__name__, prompt)
+
+        if not matched:
+            await self._misses.increment(1, {"schema.name": self.schema.__name__})
+
+        duration = self._latency.sample(generation.duration)
+
+        if duration:
+            await asyncio.sleep(duration)
+
+        return SchematicGenerationResult(
+            content=self.schema.model_validate(generation.completion),
+            info=GenerationInfo(
+                schema_name=self.schema.__name__,
+                model=f"replay/{generation.model}",
+                duration=duration,
+                usage=UsageInfo(
+                    input_tokens=generation.input_tokens,
+                    output_tokens=generation.output_tokens,
+                ),
+            ),
+        )
+
+
+class ReplayEmbedder(BaseEmbedder):
+    """Embeds texts deterministically, without a model.
+
+    Each word is hashed into a bucket of the vector, so texts that share words
+    are similar to one another, which keeps retrieval roughly meaningful.
+    """
+
+    DIMENSIONS = 768
+
+    def __init__(
+        self,
+        latency: LatencySampler,
+        logger: Logger,
+        tracer: Tracer,
+        meter: Meter,
+    ) -> None:
+        super().__init__(logger=logger, tracer=tracer, meter=meter, model_name="replay")
+
+        self._latency = latency
+        self._tokenizer = ReplayEstimatingTokenizer()
+
+    @property
+    @override
+    def id(self) -> str:
+        return "replay"
+
+    @property
+    @override
+    def max_tokens(self) -> int:
+        return 8192
+
+    @property
+    @override
+    def tokenizer(self) -> EstimatingTokenizer:
+        return self._tokenizer
+
+    @property
+    @override
+    def dimensions(self) -> int:
+        return self.DIMENSIONS
+
+    def _embed_one(self, text: str) -> list[float]:
+        vector = [0.0] * self.DIMENSIONS
+
+        for word in _WORD.findall(text.lower()):
+            digest = hashlib.blake2b(word.encode("utf-8"), digest_size=8).digest()
+            bucket = int.from_bytes(digest[:4], "little") % self.DIMENSIONS
+            vector[bucket] += 1.0 if digest[4] & 1 else -1.0
+
+        norm = math.sqrt(sum(v * v for v in vector)) or 1.0
+
+        return [v / norm for v in vector]
+
+    @override
+    async def do_embed(
+        self,
+        texts: list[str],
+        hints: Mapping[str, Any] = {},
+    ) -> EmbeddingResult:
+        if duration := self._latency.sample():
+            await asyncio.sleep(duration)
+
+        return EmbeddingResult(vectors=[self._embed_one(text) for text in texts])
+
+
+class ReplayService(NLPService):
+    """Replays generations recorded by a DataCollectionSink, instead of calling an LLM.
+
+    It needs no network access and responds deterministically, which makes it
+    suitable for reproducible throughput and latency benchmarks of the engine.
+    """
+
+    def __init__(
+        self,
+        corpus: ReplayCorpus,
+        logger: Logger,
+        tracer: Tracer,
+        meter: Meter,
+        latency: Optional[SimulatedLatency] = None,
+    ) -> None:
+        self._corpus = corpus
+        self._logger = logger
+        self._tracer = tracer
+        self._meter = meter
+
+        # Generators and the embedder share a sampler, so a seeded run is reproducible
+        self._latency = (latency or SimulatedLatency()).sampler()
+        self._embedder = ReplayEmbedder(self._latency, logger, tracer, meter)
+
+        self._logger.info(f"Replaying {len(corpus)} recorded generations")
+
+    @override
+    async def get_schematic_generator(
+        self,
+        t: type[T],
+        hints: SchematicGeneratorHints = {},
+    ) -> ReplaySchematicGenerator[T]:
+        return ReplaySchematicGenerator[t](  # type: ignore
+            self._corpus,
+            self._latency,
+            self._logger,
+            self._tracer,
+            self._meter,
+        )
+
+    @property
+    def embedder(self) -> ReplayEmbedder:
+        return self._embedder
+
+    @override
+    async def get_embedder(self, hints: EmbedderHints = {}) -> Embedder:
+        return self._embedder
+
+    @override
+    async def get_moderation_service(self) -> ModerationService:
+        return NoModeration()
@@ -18,6 +18,7 @@
 # Usage guidelines - Use gemini-2.5-pro and claude sonnet 4 models for best results
 # Set env variables: VERTEX_AI_PROJECT_ID VERTEX_AI_REGION, VERTEX_AI_MODEL
 
+from functools import partial
 import os
 import time
 from typing import Any, Mapping, cast
@@ -406,7 +407,7 @@ class VertexAIGeminiSchematicGenerator(BaseSchematicGenerator[T]):
             raise
 
         if response.usage_metadata:
-            self._logger.trace(response.usage_metadata.model_dump_json(indent=2))
+            self._logger.trace(partial(response.usage_metadata.model_dump_json, indent=2))
 
         try:
             model_content = self.schema.model_validate(json_object)
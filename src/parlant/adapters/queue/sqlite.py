@@ -0,0 +1,236 @@
+# Copyright 2025 Emcie Co Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+import asyncio
+from pathlib import Path
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Optional, TypeVar
+from typing_extensions import Self, override
+
+from parlant.core.common import generate_id
+from parlant.core.session_work_queue import SessionLease, SessionWorkQueue
+from parlant.core.sessions import SessionId
+
+
+T = TypeVar("T")
+
+
+class SQLiteSessionWorkQueue(SessionWorkQueue):
+    """A work queue shared by the processes of a single machine, through a SQLite file.
+
+    Leases expire unless their holders keep renewing them, so that the sessions
+    of a worker that died are claimed by the others once `lease_duration` passes.
+    Workers learn of new requests, including ones that supersede their leases,
+    by polling every `poll_interval` seconds.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        lease_duration: float = 30.0,
+        poll_interval: float = 0.1,
+    ) -> None:
+        self._path = path
+        self._lease_duration = lease_duration
+        self._poll_interval = poll_interval
+
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    async def __aenter__(self) -> Self:
+        self._connection = await asyncio.to_thread(self._connect)
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[object],
+    ) -> bool:
+        if self._connection:
+            self._connection.close()
+            self._connection = None
+
+        return False
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(
+            self._path,
+            timeout=30,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS session_work (
+                session_id TEXT PRIMARY KEY,
+                generation INTEGER NOT NULL,
+                completed INTEGER NOT NULL DEFAULT 0,
+                trace_id TEXT NOT NULL,
+                requested_at REAL NOT NULL,
+                lease_id TEXT,
+                lease_generation INTEGER,
+                lease_expiry REAL
+            )
+            """
+        )
+
+        return connection
+
+    async def _run(self, f: Callable[[sqlite3.Connection], T]) -> T:
+        def run_locked() -> T:
+            if self._connection is None:
+                raise Exception("Work queue is not open")
+
+            with self._lock:
+                return f(self._connection)
+
+        return await asyncio.to_thread(run_locked)
+
+    def _transaction(
+        self,
+        connection: sqlite3.Connection,
+        f: Callable[[sqlite3.Connection], T],
+    ) -> T:
+        # Taking the write lock upfront, so that concurrent claims don't both read the same row
+        connection.execute("BEGIN IMMEDIATE")
+
+        try:
+            result = f(connection)
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+        connection.execute("COMMIT")
+        return result
+
+    @override
+    async def enqueue(
+        self,
+        session_id: SessionId,
+        trace_id: str,
+    ) -> None:
+        await self._run(
+            lambda connection: connection.execute(
+                """
+                INSERT INTO session_work (session_id, generation, trace_id, requested_at)
+                VALUES (?, 1, ?, ?)
+                ON CONFLICT (session_id) DO UPDATE SET
+                    generation = generation + 1,
+                    trace_id = excluded.trace_id,
+                    requested_at = excluded.requested_at
+                """,
+                (session_id, trace_id, time.time()),
+            )
+        )
+
+    @override
+    async def claim(self) -> SessionLease:
+        while True:
+            if lease := await self._run(
+                lambda connection: self._transaction(connection, self._try_claim)
+            ):
+                return lease
+
+            await asyncio.sleep(self._poll_interval)
+
+    def _try_claim(self, connection: sqlite3.Connection) -> Optional[SessionLease]:
+        now = time.time()
+
+        row: Any = connection.execute(
+            """
+            SELECT session_id, generation, trace_id, requested_at FROM session_work
+            WHERE generation > completed AND (lease_id IS NULL OR lease_expiry < ?)
+            ORDER BY requested_at
+            LIMIT 1
+            """,
+            (now,),
+        ).fetchone()
+
+        if not row:
+            return None
+
+        lease = SessionLease(
+            id=generate_id(),
+            session_id=SessionId(row[0]),
+            generation=row[1],
+            trace_id=row[2],
+            requested_at=row[3],
+        )
+
+        connection.execute(
+            """
+            UPDATE session_work SET lease_id = ?, lease_generation = ?, lease_expiry = ?
+            WHERE session_id = ?
+            """,
+            (lease.id, lease.generation, now + self._lease_duration, lease.session_id),
+        )
+
+        return lease
+
+    @override
+    async def hold(self, lease: SessionLease) -> None:
+        while await self._run(lambda connection: self._renew(connection, lease)):
+            await asyncio.sleep(self._poll_interval)
+
+    def _renew(self, connection: sqlite3.Connection, lease: SessionLease) -> bool:
+        # Fails once the session is requested again, or the lease has been taken over
+        cursor = connection.execute(
+            """
+            UPDATE session_work SET lease_expiry = ?
+            WHERE session_id = ? AND lease_id = ? AND generation = lease_generation
+            """,
+            (time.time() + self._lease_duration, lease.session_id, lease.id),
+        )
+
+        return cursor.rowcount > 0
+
+    @override
+    async def complete(self, lease: SessionLease) -> None:
+        await self._run(
+            lambda connection: self._transaction(
+                connection, lambda c: self._end(c, lease, completed=True)
+            )
+        )
+
+    @override
+    async def release(self, lease: SessionLease) -> None:
+        await self._run(
+            lambda connection: self._transaction(
+                connection, lambda c: self._end(c, lease, completed=False)
+            )
+        )
+
+    def _end(self, connection: sqlite3.Connection, lease: SessionLease, completed: bool) -> None:
+        connection.execute(
+            """
+            UPDATE session_work SET
+                completed = CASE WHEN ? THEN MAX(completed, lease_generation) ELSE completed END,
+                lease_id = NULL,
+                lease_generation = NULL,
+                lease_expiry = NULL
+            WHERE session_id = ? AND lease_id = ?
+            """,
+            (completed, lease.session_id, lease.id),
+        )
+
+        connection.execute(
+            "DELETE FROM session_work WHERE session_id = ? AND lease_id IS NULL AND generation = completed",
+            (lease.session_id,),
+        )
@@ -137,7 +137,7 @@ class OpenTelemetryTracer(Tracer):
 
         if not current_spans:
             new_spans = span_id
-            custom_trace_id = generate_id({"strategy": "uuid4"})
+            custom_trace_id = self._trace_id.get() or generate_id({"strategy": "uuid4"})
             trace_id_reset_token = self._trace_id.set(custom_trace_id)
 
             # Convert UUID hex to proper OpenTelemetry format
@@ -226,6 +226,16 @@ class OpenTelemetryTracer(Tracer):
         finally:
             self._attributes.reset(attributes_reset_token)
 
+    @contextmanager
+    @override
+    def continue_trace(self, trace_id: str) -> Iterator[None]:
+        # Continuing the main context's (non-)trace leaves root spans to start new ones
+        reset_token = self._trace_id.set(trace_id if trace_id != "<main>" else "")
+
+        yield
+
+        self._trace_id.reset(reset_token)
+
     @property
     @override
     def trace_id(self) -> str:
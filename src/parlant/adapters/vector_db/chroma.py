@@ -45,6 +45,7 @@ from parlant.core.persistence.vector_database import (
     VectorDatabase,
     TDocument,
     identity_loader,
+    merge_similar_documents,
 )
 
 
@@ -721,7 +722,7 @@ class ChromaCollection(Generic[TDocument], BaseVectorCollection[TDocument]):
                 return []
 
             self._logger.trace(
-                f"Similar documents found\n{json.dumps(docs['metadatas'][0], indent=2)}"
+                lambda: f"Similar documents found\n{json.dumps(docs['metadatas'][0], indent=2)}"
             )
 
             assert docs["distances"]
@@ -729,3 +730,39 @@ class ChromaCollection(Generic[TDocument], BaseVectorCollection[TDocument]):
                 SimilarDocumentResult(document=cast(TDocument, m), distance=d)
                 for m, d in zip(docs["metadatas"][0], docs["distances"][0])
             ]
+
+    @override
+    async def do_find_similar_documents_for_queries(
+        self,
+        filters: Where,
+        queries: Sequence[str],
+        k: int,
+        hints: Mapping[str, Any] = {},
+    ) -> Sequence[SimilarDocumentResult[TDocument]]:
+        if not queries:
+            return []
+
+        async with self._lock.reader_lock:
+            query_embeddings = list((await self._embedder.embed(list(queries), hints)).vectors)
+
+            # Chroma answers all queries in a single call, with a result list per query
+            docs = self.embedded_collection.query(
+                where=cast(chromadb.Where, filters) or None,
+                query_embeddings=query_embeddings,
+                n_results=k,
+            )
+
+            if not docs["metadatas"]:
+                return []
+
+            assert docs["distances"]
+            return merge_similar_documents(
+                [
+                    [
+                        SimilarDocumentResult(document=cast(TDocument, m), distance=d)
+                        for m, d in zip(metadatas, distances)
+                    ]
+                    for metadatas, distances in zip(docs["metadatas"], docs["distances"])
+                ],
+                k,
+            )
@@ -47,6 +47,7 @@ from parlant.core.persistence.vector_database import (
     VectorDatabase,
     TDocument,
     identity_loader,
+    merge_similar_documents,
 )
 from parlant.core.tracer import Tracer
 
@@ -1380,7 +1381,9 @@ class QdrantCollection(Generic[TDocument], BaseVectorCollection[TDocument]):
                 return []
 
             self._logger.trace(
-                f"Similar documents found\n{json.dumps([r.payload for r in search_results], indent=2)}"
+                lambda: (
+                    f"Similar documents found\n{json.dumps([r.payload for r in search_results], indent=2)}"
+                )
             )
 
             return [
@@ -1390,3 +1393,60 @@ class QdrantCollection(Generic[TDocument], BaseVectorCollection[TDocument]):
                 )
                 for result in search_results
             ]
+
+    @override
+    async def do_find_similar_documents_for_queries(
+        self,
+        filters: Where,
+        queries: Sequence[str],
+        k: int,
+        hints: Mapping[str, Any] = {},
+    ) -> Sequence[SimilarDocumentResult[TDocument]]:
+        if not queries:
+            return []
+
+        async with self._lock.reader_lock:
+            if filters and self._database:
+                field_names: set[str] = set()
+                _extract_field_names_from_where(filters, field_names)
+                for field_name in field_names:
+                    self._database._ensure_payload_index(self.embedded_collection_name, field_name)
+
+            query_embeddings = [
+                list(v)
+                for v in (await self._embedder.embed(list(queries), hints)).vectors
+                if len(v) > 0
+            ]
+            qdrant_filter = _convert_where_to_qdrant_filter(filters)
+
+            if not query_embeddings:
+                self._logger.warning(f"Empty embeddings generated for queries: {queries}")
+                return []
+
+            # A single round trip for all queries
+            responses = self.qdrant_client.query_batch_points(
+                collection_name=self.embedded_collection_name,
+                requests=[
+                    models.QueryRequest(
+                        query=embedding,
+                        filter=qdrant_filter,
+                        limit=k,
+                        with_payload=True,
+                    )
+                    for embedding in query_embeddings
+                ],
+            )
+
+            return merge_similar_documents(
+                [
+                    [
+                        SimilarDocumentResult(
+                            document=cast(TDocument, result.payload),
+                            distance=1.0 - result.score,
+                        )
+                        for result in response.points
+                    ]
+                    for response in responses
+                ],
+                k,
+            )
@@ -63,7 +63,7 @@ from parlant.core.nlp.embedding import (
     EmbeddingCacheProvider,
 )
 from parlant.core.loggers import Logger
-from parlant.core.persistence.common import ensure_is_total, matches_filters, Where
+from parlant.core.persistence.common import ObjectId, ensure_is_total, matches_filters, Where
 from parlant.core.persistence.vector_database import (
     BaseDocument,
     BaseVectorCollection,
@@ -214,6 +214,9 @@ class TransientVectorCollection(Generic[TDocument], BaseVectorCollection[TDocume
         self._nano_db = nano_db
         self._documents: list[TDocument] = []
 
+        # Normalized copies of the vectors, so that several queries can be scored at once
+        self._vectors: dict[ObjectId, np.ndarray] = {}
+
     @staticmethod
     def _build_filter_lambda(
         filters: Where,
@@ -275,6 +278,7 @@ class TransientVectorCollection(Generic[TDocument], BaseVectorCollection[TDocume
         async with self._lock:
             self._nano_db.upsert([data])
             self._documents.append(document)
+            self._vectors[document["id"]] = nano_vectordb.dbs.normalize(vector)
 
         return InsertResult(acknowledged=True)
 
@@ -311,6 +315,7 @@ class TransientVectorCollection(Generic[TDocument], BaseVectorCollection[TDocume
 
                     self._nano_db.upsert([data])
                     self._documents[i] = cast(TDocument, {**self._documents[i], **params})
+                    self._vectors[doc["id"]] = nano_vectordb.dbs.normalize(vector)
 
                     return UpdateResult(
                         acknowledged=True,
@@ -347,6 +352,7 @@ class TransientVectorCollection(Generic[TDocument], BaseVectorCollection[TDocume
                 document = self._documents.pop(i)
 
                 self._nano_db.delete([d["id"]])
+                self._vectors.pop(d["id"], None)
 
                 return DeleteResult(deleted_count=1, acknowledged=True, deleted_document=document)
 
@@ -389,7 +395,7 @@ class TransientVectorCollection(Generic[TDocument], BaseVectorCollection[TDocume
         ]
 
         self._logger.trace(
-            f"Similar documents found\n{json.dumps(docs_and_similarities[0], indent=2)}"
+            lambda: f"Similar documents found\n{json.dumps(docs_and_similarities[0], indent=2)}"
         )
 
         results = [
@@ -401,3 +407,32 @@ class TransientVectorCollection(Generic[TDocument], BaseVectorCollection[TDocume
         ]
 
         return results
+
+    @override
+    async def do_find_similar_documents_for_queries(
+        self,
+        filters: Where,
+        queries: Sequence[str],
+        k: int,
+        hints: Mapping[str, Any] = {},
+    ) -> Sequence[SimilarDocumentResult[TDocument]]:
+        if not queries or not (documents := await self.find(filters)):
+            return []
+
+        query_vectors = nano_vectordb.dbs.normalize(
+            np.array((await self._embedder.embed(list(queries), hints)).vectors, dtype=np.float32)
+        )
+        document_vectors = np.stack([self._vectors[d["id"]] for d in documents])
+
+        # Scores all documents against all queries at once,
+        # taking each document's similarity to its closest query
+        similarities = np.abs(document_vectors @ query_vectors.T).max(axis=1)
+        top_indices = np.argsort(-similarities, kind="stable")[:k]
+
+        return [
+            SimilarDocumentResult(
+                document=documents[i],
+                distance=1 - float(similarities[i]),
+            )
+            for i in top_indices
+        ]
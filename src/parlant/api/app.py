@@ -20,7 +20,7 @@ from typing import Awaitable, Callable, TypeAlias
 import mimetypes
 
 from fastapi import APIRouter, FastAPI, HTTPException, Request, Response, status
-from fastapi.responses import RedirectResponse
+from fastapi.responses import PlainTextResponse, RedirectResponse
 from fastapi.routing import APIRoute
 from fastapi.staticfiles import StaticFiles
 from starlette.types import Receive, Scope, Send
@@ -50,7 +50,7 @@ from parlant.api.authorization import (
     RateLimitExceededException,
 )
 from parlant.core.version import VERSION
-from parlant.core.meter import Meter
+from parlant.core.meter import LocalMeter, Meter
 from parlant.core.tracer import Tracer
 from parlant.core.common import ItemNotFoundError, generate_id
 from parlant.core.loggers import Logger
@@ -237,6 +237,21 @@ async def create_api_app(
     async def health_check() -> dict[str, str]:
         return {"status": "ok"}
 
+    if isinstance(meter, LocalMeter):
+        local_meter = meter
+
+        @api_app.get("/metrics", include_in_schema=False)
+        async def metrics(request: Request) -> Response:
+            await authorization_policy.authorize(
+                request=request,
+                operation=Operation.READ_METRICS,
+            )
+
+            return PlainTextResponse(
+                local_meter.render_prometheus(),
+                media_type="text/plain; version=0.0.4",
+            )
+
     agent_router = APIRouter(prefix="/agents")
 
     api_app.include_router(
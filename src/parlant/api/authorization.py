@@ -13,14 +13,18 @@
 # limitations under the License.
 
 from abc import ABC, abstractmethod
+import asyncio
+from dataclasses import dataclass
 from enum import Enum
+import time
 from typing import Awaitable, Callable
 
+from cachetools import LRUCache
 from typing_extensions import override
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 
-from limits.storage import MemoryStorage
+from limits.storage import MemoryStorage, Storage
 from limits.strategies import (
     MovingWindowRateLimiter,
     FixedWindowRateLimiter,
@@ -32,6 +36,7 @@ from limits import RateLimitItem, RateLimitItemPerMinute
 class Operation(Enum):
     ACCESS_INTEGRATED_UI = "access_integrated_ui"
     ACCESS_API_DOCS = "access_api_docs"
+    READ_METRICS = "read_metrics"
 
     CREATE_AGENT = "create_agent"
     READ_AGENT = "read_agent"
@@ -116,8 +121,11 @@ class Operation(Enum):
     CREATE_STATUS_EVENT = "create_status_event"
     CREATE_CUSTOM_EVENT = "create_custom_event"
     LIST_EVENTS = "list_events"
+    STREAM_EVENTS = "stream_events"
     DELETE_EVENTS = "delete_events"
     UPDATE_EVENT = "update_event"
+    LIST_TURN_PROFILES = "list_turn_profiles"
+    READ_TURN_PROFILE = "read_turn_profile"
 
     CREATE_TAG = "create_tag"
     READ_TAG = "read_tag"
@@ -211,7 +219,11 @@ class RateLimiter(ABC):
 
 
 class ProductionAuthorizationPolicy(AuthorizationPolicy):
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        rate_limit_storage: Storage | None = None,
+        rate_limit_batch_size: int = 1,
+    ) -> None:
         # This can be modified externally to install specific limiters
         # for specific API operations.
         self.specific_limiters: dict[
@@ -228,9 +240,12 @@ class ProductionAuthorizationPolicy(AuthorizationPolicy):
                 Operation.CREATE_GUEST_SESSION: RateLimitItemPerMinute(10),
                 Operation.READ_SESSION: RateLimitItemPerMinute(30),
                 Operation.LIST_EVENTS: RateLimitItemPerMinute(240),
+                Operation.STREAM_EVENTS: RateLimitItemPerMinute(30),
                 Operation.CREATE_CUSTOMER_EVENT: RateLimitItemPerMinute(30),
                 Operation.CREATE_STATUS_EVENT: RateLimitItemPerMinute(60),
-            }
+            },
+            storage=rate_limit_storage,
+            batch_size=rate_limit_batch_size,
         )
 
     async def configure_app(self, app: FastAPI) -> FastAPI:
@@ -262,6 +277,7 @@ class ProductionAuthorizationPolicy(AuthorizationPolicy):
             Operation.CREATE_GUEST_SESSION,
             Operation.READ_SESSION,
             Operation.LIST_EVENTS,
+            Operation.STREAM_EVENTS,
             Operation.CREATE_CUSTOMER_EVENT,
         ]:
             return True
@@ -275,18 +291,38 @@ class ProductionAuthorizationPolicy(AuthorizationPolicy):
         return await self.default_limiter.check(request, operation)
 
 
+@dataclass
+class _Allowance:
+    remaining: int
+    expiry: float
+
+
 class BasicRateLimiter(RateLimiter):
+    """Limits the rate of each operation per client IP, using a `limits` strategy and storage.
+
+    To keep limits when running several processes or replicas, pass a storage they share,
+    e.g. `limits.storage.storage_from_string("redis://...")`. Calls to a storage other than
+    the in-memory one are run off the event loop. With a `batch_size` above 1, hits are
+    reserved from the storage that many at a time, and then spent locally, which saves
+    round trips at the cost of a client being limited a little early when a process
+    doesn't spend its whole reservation within the window.
+    """
+
     def __init__(
         self,
         rate_limit_item_per_operation: dict[Operation, RateLimitItem],
-        storage: MemoryStorage | None = None,
+        storage: Storage | None = None,
         limiter_type: type[
             MovingWindowRateLimiter | FixedWindowRateLimiter | SlidingWindowCounterRateLimiter
         ] = MovingWindowRateLimiter,
+        batch_size: int = 1,
     ) -> None:
         self.rate_limit_item_per_operation = rate_limit_item_per_operation
-        self._limiter = limiter_type(storage or MemoryStorage())
+        self._storage = storage or MemoryStorage()
+        self._limiter = limiter_type(self._storage)
         self._default_rate_limit_item = RateLimitItemPerMinute(100)
+        self._batch_size = batch_size
+        self._allowances: LRUCache[str, _Allowance] = LRUCache(maxsize=100_000)
 
     async def check(
         self,
@@ -294,9 +330,36 @@ class BasicRateLimiter(RateLimiter):
         operation: Operation,
     ) -> bool:
         if item := self.rate_limit_item_per_operation.get(operation):
-            return self._limiter.hit(item, self._build_key(request, operation))
+            return await self._hit(item, self._build_key(request, operation))
+
+        return await self._hit(self._default_rate_limit_item, self._build_key(request, None))
+
+    async def _hit(self, item: RateLimitItem, key: str) -> bool:
+        if self._batch_size == 1:
+            return await self._hit_storage(item, key, cost=1)
+
+        now = time.monotonic()
+
+        if (allowance := self._allowances.get(key)) and allowance.expiry > now:
+            if allowance.remaining > 0:
+                allowance.remaining -= 1
+                return True
+
+        if (cost := min(self._batch_size, item.amount)) > 1 and await self._hit_storage(
+            item, key, cost
+        ):
+            # Reserved hits only last as long as the window they were counted in
+            self._allowances[key] = _Allowance(remaining=cost - 1, expiry=now + item.get_expiry())
+            return True
+
+        # Close to the limit, a whole batch may not fit where a single hit still does
+        return await self._hit_storage(item, key, cost=1)
+
+    async def _hit_storage(self, item: RateLimitItem, key: str, cost: int) -> bool:
+        if isinstance(self._storage, MemoryStorage):
+            return self._limiter.hit(item, key, cost=cost)
 
-        return self._limiter.hit(self._default_rate_limit_item, self._build_key(request, None))
+        return await asyncio.to_thread(self._limiter.hit, item, key, cost=cost)
 
     def _build_key(
         self,
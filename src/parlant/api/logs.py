@@ -12,9 +12,30 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from fastapi import APIRouter, WebSocket
+from typing import Annotated, Literal, Optional, TypeAlias
+from fastapi import APIRouter, Query, WebSocket
 
 from parlant.adapters.loggers.websocket import WebSocketLogger
+from parlant.core.loggers import LogLevel
+
+
+LogLevelQuery: TypeAlias = Annotated[
+    Literal["trace", "debug", "info", "warning", "error", "critical"],
+    Query(description="Only stream lines at or above this level"),
+]
+
+TraceIdQuery: TypeAlias = Annotated[
+    Optional[str],
+    Query(description="Only stream lines whose trace ID starts with this prefix"),
+]
+
+BatchQuery: TypeAlias = Annotated[
+    bool,
+    Query(
+        description="Send lines in periodic frames of the form "
+        '`{"messages": [...], "dropped": n}` rather than one at a time',
+    ),
+]
 
 
 def create_router(
@@ -23,9 +44,19 @@ def create_router(
     router = APIRouter()
 
     @router.websocket("/logs")
-    async def stream_logs(websocket: WebSocket) -> None:
+    async def stream_logs(
+        websocket: WebSocket,
+        level: LogLevelQuery = "trace",
+        trace_id: TraceIdQuery = None,
+        batch: BatchQuery = False,
+    ) -> None:
         await websocket.accept()
-        subscription = await websocket_logger.subscribe(websocket)
+        subscription = await websocket_logger.subscribe(
+            websocket,
+            min_level=LogLevel[level.upper()],
+            trace_id=trace_id,
+            batched=batch,
+        )
         await subscription.expiration.wait()
 
     return router
@@ -12,11 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+from contextlib import suppress
 from datetime import datetime
 from enum import Enum
-from fastapi import APIRouter, HTTPException, Path, Query, Request, status
+from fastapi import APIRouter, Header, HTTPException, Path, Query, Request, status
+from fastapi.responses import StreamingResponse
 from pydantic import Field
-from typing import Annotated, Mapping, Sequence, TypeAlias, cast
+from typing import Annotated, AsyncIterator, Mapping, Sequence, TypeAlias, cast
 
 
 from parlant.api.authorization import AuthorizationPolicy, Operation
@@ -52,6 +55,8 @@ from parlant.core.sessions import (
     Participant,
     SessionId,
     SessionStatus,
+    SpanProfile,
+    TurnProfile,
 )
 from parlant.core.canned_responses import CannedResponseId
 
@@ -422,6 +427,14 @@ class EventDTO(
     deleted: bool
 
 
+class EventListingDTO(DefaultBaseModel):
+    """Paginated response for events"""
+
+    items: Sequence[EventDTO]
+    has_more: bool
+    next_cursor: str | None = None
+
+
 class ConsumptionOffsetsUpdateParamsDTO(
     DefaultBaseModel,
     json_schema_extra={"example": consumption_offsets_example},
@@ -1092,6 +1105,174 @@ class EventInspectionResult(
     trace: EventTraceDTO | None = None
 
 
+SpanProfileNameField: TypeAlias = Annotated[
+    str,
+    Field(
+        description="Name of the span (e.g., `guideline_matcher` or `gen.request_completed`)",
+        examples=["guideline_matcher"],
+    ),
+]
+
+SpanProfileStartOffsetField: TypeAlias = Annotated[
+    float,
+    Field(
+        description="Seconds from the start of the turn until the span started",
+        examples=[0.012],
+        ge=0,
+    ),
+]
+
+SpanProfileEndOffsetField: TypeAlias = Annotated[
+    float,
+    Field(
+        description="Seconds from the start of the turn until the span ended",
+        examples=[1.53],
+        ge=0,
+    ),
+]
+
+SpanProfileDurationField: TypeAlias = Annotated[
+    float,
+    Field(
+        description="Duration of the span in seconds",
+        examples=[1.518],
+        ge=0,
+    ),
+]
+
+SpanProfileInputTokensField: TypeAlias = Annotated[
+    int,
+    Field(
+        description="Input tokens consumed by the span itself, excluding its children",
+        examples=[1024],
+        ge=0,
+    ),
+]
+
+SpanProfileOutputTokensField: TypeAlias = Annotated[
+    int,
+    Field(
+        description="Output tokens generated by the span itself, excluding its children",
+        examples=[128],
+        ge=0,
+    ),
+]
+
+SpanProfileAttributesField: TypeAlias = Annotated[
+    Mapping[str, JSONSerializableDTO],
+    Field(
+        description="Attributes the span was opened with",
+        examples=[{"phase": "initial"}],
+    ),
+]
+
+SpanProfileOnCriticalPathField: TypeAlias = Annotated[
+    bool,
+    Field(
+        description="Whether the span is on the critical path of the turn, "
+        "i.e., the chain of spans that determined when the turn ended",
+    ),
+]
+
+span_profile_example: ExampleJson = {
+    "name": "guideline_matcher",
+    "start_offset": 0.012,
+    "end_offset": 1.53,
+    "duration": 1.518,
+    "input_tokens": 0,
+    "output_tokens": 0,
+    "attributes": {"phase": "initial"},
+    "on_critical_path": True,
+    "children": [],
+}
+
+
+class SpanProfileDTO(
+    DefaultBaseModel,
+    json_schema_extra={"example": span_profile_example},
+):
+    """A timed section of a turn, with the sections nested within it."""
+
+    name: SpanProfileNameField
+    start_offset: SpanProfileStartOffsetField
+    end_offset: SpanProfileEndOffsetField
+    duration: SpanProfileDurationField
+    input_tokens: SpanProfileInputTokensField
+    output_tokens: SpanProfileOutputTokensField
+    attributes: SpanProfileAttributesField
+    on_critical_path: SpanProfileOnCriticalPathField
+    children: Sequence["SpanProfileDTO"]
+
+
+TurnProfileTraceIdPath: TypeAlias = Annotated[
+    str,
+    Path(
+        description="Trace ID of the turn, as found on the events it emitted",
+        examples=["trace_13xyz"],
+    ),
+]
+
+TurnProfileCreationUTCField: TypeAlias = Annotated[
+    datetime,
+    Field(description="UTC timestamp of when the turn ended"),
+]
+
+turn_profile_example: ExampleJson = {
+    "session_id": "sess_123yz",
+    "trace_id": "trace_13xyz",
+    "creation_utc": "2024-03-24T12:00:00Z",
+    "root": {
+        "name": "turn",
+        "start_offset": 0.0,
+        "end_offset": 2.41,
+        "duration": 2.41,
+        "input_tokens": 0,
+        "output_tokens": 0,
+        "attributes": {},
+        "on_critical_path": True,
+        "children": [span_profile_example],
+    },
+}
+
+
+class TurnProfileDTO(
+    DefaultBaseModel,
+    json_schema_extra={"example": turn_profile_example},
+):
+    """Where the wall-clock time of a single agent turn went."""
+
+    session_id: SessionIdPath
+    trace_id: TurnProfileTraceIdPath
+    creation_utc: TurnProfileCreationUTCField
+    root: SpanProfileDTO
+
+
+def span_profile_to_dto(
+    span: SpanProfile,
+    critical_path: Sequence[SpanProfile],
+) -> SpanProfileDTO:
+    return SpanProfileDTO(
+        name=span.name,
+        start_offset=span.start_offset,
+        end_offset=span.end_offset,
+        duration=span.duration,
+        input_tokens=span.input_tokens,
+        output_tokens=span.output_tokens,
+        attributes=cast(Mapping[str, JSONSerializableDTO], span.attributes),
+        on_critical_path=any(span is s for s in critical_path),
+        children=[span_profile_to_dto(c, critical_path) for c in span.children],
+    )
+
+
+def turn_profile_to_dto(profile: TurnProfile) -> TurnProfileDTO:
+    return TurnProfileDTO(
+        session_id=profile.session_id,
+        trace_id=profile.trace_id,
+        creation_utc=profile.creation_utc,
+        root=span_profile_to_dto(profile.root, profile.root.critical_path()),
+    )
+
+
 def event_to_dto(event: Event) -> EventDTO:
     return EventDTO(
         id=event.id,
@@ -1194,6 +1375,22 @@ CorrelationIdQuery: TypeAlias = Annotated[
 ]
 
 
+MaxOffsetQuery: TypeAlias = Annotated[
+    int,
+    Query(
+        description="Only return events with offset <= this value",
+        examples=[42, 100],
+    ),
+]
+
+OmitToolResultsQuery: TypeAlias = Annotated[
+    bool,
+    Query(
+        description="If set, the results of tool calls are left out of tool events' data",
+        examples=[True],
+    ),
+]
+
 KindsQuery: TypeAlias = Annotated[
     str,
     Query(
@@ -1202,6 +1399,26 @@ KindsQuery: TypeAlias = Annotated[
     ),
 ]
 
+HeartbeatQuery: TypeAlias = Annotated[
+    float,
+    Query(
+        description="Seconds of inactivity after which a heartbeat comment is sent, "
+        "to keep the connection from being closed by proxies",
+        examples=[15],
+        gt=0,
+    ),
+]
+
+LastEventIdHeader: TypeAlias = Annotated[
+    str | None,
+    Header(
+        alias="Last-Event-ID",
+        description="Offset of the last event the client received. "
+        "Sent by browsers when reconnecting, in order to resume the stream after it",
+        examples=["41"],
+    ),
+]
+
 LimitQuery: TypeAlias = Annotated[
     int,
     Query(
@@ -1882,10 +2099,13 @@ def create_router(
     @router.get(
         "/{session_id}/events",
         operation_id="list_events",
-        response_model=Sequence[EventDTO],
+        response_model=EventListingDTO | Sequence[EventDTO],
         responses={
             status.HTTP_200_OK: {
-                "description": "List of events matching the specified criteria",
+                "description": (
+                    "List of events matching the specified criteria. "
+                    "If a limit is provided, a paginated list of events will be returned."
+                ),
                 "content": {"application/json": {"example": [event_example]}},
             },
             status.HTTP_404_NOT_FOUND: {
@@ -1909,13 +2129,18 @@ def create_router(
         trace_id: TraceIdQuery | None = None,
         kinds: KindsQuery | None = None,
         wait_for_data: int = 60,
-    ) -> Sequence[EventDTO]:
+        max_offset: MaxOffsetQuery | None = None,
+        limit: LimitQuery | None = None,
+        cursor: CursorQuery | None = None,
+        omit_tool_results: OmitToolResultsQuery = False,
+    ) -> EventListingDTO | Sequence[EventDTO]:
         """Lists events from a session with optional filtering and waiting capabilities.
 
         This endpoint retrieves events from a specified session and can:
         1. Filter events by their offset, source, type, and trace ID
         2. Wait for new events to arrive if requested
         3. Return events in chronological order based on their offset
+        4. Return events a page at a time, if a limit is provided
 
         Notes:
             Long Polling Behavior:
@@ -1955,23 +2180,135 @@ def create_router(
             source=event_source,
             kinds=kind_list,
             trace_id=trace_id,
+            max_offset=max_offset,
+            limit=limit,
+            cursor=decode_cursor(cursor) if cursor else None,
+            omit_tool_results=omit_tool_results,
         )
 
-        return [
-            EventDTO(
-                id=e.id,
-                source=_event_source_to_event_source_dto(e.source),
-                kind=_event_kind_to_event_kind_dto(e.kind),
-                offset=e.offset,
-                creation_utc=e.creation_utc,
-                trace_id=e.trace_id,
-                correlation_id=e.trace_id,
-                data=cast(JSONSerializableDTO, e.data),
-                metadata=e.metadata,
-                deleted=e.deleted,
-            )
-            for e in events
-        ]
+        if limit is None:
+            return [event_to_dto(e) for e in events]
+
+        return EventListingDTO(
+            items=[event_to_dto(e) for e in events],
+            has_more=events.has_more,
+            next_cursor=encode_cursor(events.next_cursor) if events.next_cursor else None,
+        )
+
+    @router.get(
+        "/{session_id}/events/stream",
+        operation_id="stream_events",
+        response_class=StreamingResponse,
+        responses={
+            status.HTTP_200_OK: {
+                "description": "Stream of events matching the specified criteria",
+                "content": {"text/event-stream": {}},
+            },
+            status.HTTP_404_NOT_FOUND: {
+                "description": "Session not found",
+            },
+            status.HTTP_422_UNPROCESSABLE_CONTENT: {
+                "description": "Validation error in request parameters"
+            },
+        },
+        **apigen_config(group_name=API_GROUP, method_name="stream_events"),
+    )
+    async def stream_events(
+        request: Request,
+        session_id: SessionIdPath,
+        min_offset: MinOffsetQuery | None = None,
+        source: EventSourceDTO | None = None,
+        trace_id: TraceIdQuery | None = None,
+        kinds: KindsQuery | None = None,
+        heartbeat: HeartbeatQuery = 15,
+        last_event_id: LastEventIdHeader = None,
+    ) -> StreamingResponse:
+        """Streams events from a session as Server-Sent Events.
+
+        Existing events matching the criteria are sent first, followed by new ones as they
+        are created, over a single connection. This is a push-based alternative to
+        repeatedly long-polling the list endpoint.
+
+        Notes:
+            - Each event is sent as an SSE message with `event: event`, its offset as the
+              SSE `id`, and the event itself (as returned by the list endpoint) as `data`.
+            - Changes to events that were already sent (e.g., their deletion) are sent
+              with `event: update` and no `id`.
+            - Statuses that aren't stored take the offset of the event they follow,
+              and are sent with `event: status` and no `id`.
+            - When reconnecting, browsers send the `Last-Event-ID` header, and the
+              stream resumes right after that offset (overriding `min_offset`).
+            - While no events arrive, a `: heartbeat` comment is sent every
+              `heartbeat` seconds.
+        """
+        await authorization_policy.authorize(request=request, operation=Operation.STREAM_EVENTS)
+
+        # Fail with a 404 before the stream starts, rather than in the middle of it
+        _ = await app.sessions.read(session_id=session_id)
+
+        if last_event_id is not None and last_event_id.isdigit():
+            min_offset = int(last_event_id) + 1
+
+        events = app.sessions.stream_events(
+            session_id=session_id,
+            min_offset=min_offset or 0,
+            source=_event_source_dto_to_event_source(source) if source else None,
+            kinds=[
+                _event_kind_dto_to_event_kind(EventKindDTO(k))
+                for k in (kinds.split(",") if kinds else [])
+            ],
+            trace_id=trace_id,
+        )
+
+        async def send_events() -> AsyncIterator[str]:
+            pending = asyncio.Queue[Event | None](maxsize=100)
+
+            async def receive() -> None:
+                try:
+                    async for event in events:
+                        await pending.put(event)
+                finally:
+                    with suppress(asyncio.QueueFull):
+                        pending.put_nowait(None)
+
+            receiving = asyncio.create_task(receive())
+            last_offset = (min_offset or 0) - 1
+
+            try:
+                while True:
+                    try:
+                        event = await asyncio.wait_for(pending.get(), timeout=heartbeat)
+                    except asyncio.TimeoutError:
+                        if receiving.done() and pending.empty():
+                            return
+
+                        yield ": heartbeat\n\n"
+                        continue
+
+                    if event is None:
+                        return
+
+                    data = event_to_dto(event).model_dump_json()
+
+                    if event.offset > last_offset:
+                        last_offset = event.offset
+                        yield f"id: {event.offset}\nevent: event\ndata: {data}\n\n"
+                    elif event.kind == EventKind.STATUS and not event.deleted:
+                        yield f"event: status\ndata: {data}\n\n"
+                    else:
+                        yield f"event: update\ndata: {data}\n\n"
+            finally:
+                receiving.cancel()
+
+        return StreamingResponse(
+            send_events(),
+            media_type="text/event-stream",
+            headers={
+                "Cache-Control": "no-cache",
+                # Keeps reverse proxies (e.g., nginx) from buffering the stream
+                "X-Accel-Buffering": "no",
+            },
+        )
 
     @router.delete(
         "/{session_id}/events",
@@ -2049,4 +2386,61 @@ def create_router(
 
         return event_to_dto(event)
 
+    @router.get(
+        "/{session_id}/profiles",
+        operation_id="list_turn_profiles",
+        response_model=Sequence[TurnProfileDTO],
+        responses={
+            status.HTTP_200_OK: {
+                "description": "Profiles of the session's turns, oldest first",
+                "content": {"application/json": {"example": [turn_profile_example]}},
+            },
+            status.HTTP_404_NOT_FOUND: {"description": "Session not found"},
+        },
+        **apigen_config(group_name=API_GROUP, method_name="list_turn_profiles"),
+    )
+    async def list_turn_profiles(
+        request: Request,
+        session_id: SessionIdPath,
+    ) -> Sequence[TurnProfileDTO]:
+        """Lists latency profiles of the agent's turns in a session.
+
+        Each profile is a tree of timed spans, from the time processing was requested
+        until the turn ended, including token usage of LLM requests.
+        """
+        await authorization_policy.authorize(
+            request=request, operation=Operation.LIST_TURN_PROFILES
+        )
+
+        _ = await app.sessions.read(session_id=session_id)
+
+        profiles = await app.sessions.find_turn_profiles(session_id=session_id)
+
+        return [turn_profile_to_dto(p) for p in profiles]
+
+    @router.get(
+        "/{session_id}/profiles/{trace_id}",
+        operation_id="read_turn_profile",
+        response_model=TurnProfileDTO,
+        responses={
+            status.HTTP_200_OK: {
+                "description": "Profile of the turn",
+                "content": {"application/json": {"example": turn_profile_example}},
+            },
+            status.HTTP_404_NOT_FOUND: {"description": "Session or turn profile not found"},
+        },
+        **apigen_config(group_name=API_GROUP, method_name="retrieve_turn_profile"),
+    )
+    async def read_turn_profile(
+        request: Request,
+        session_id: SessionIdPath,
+        trace_id: TurnProfileTraceIdPath,
+    ) -> TurnProfileDTO:
+        """Retrieves the latency profile of the turn that emitted events with the given trace ID."""
+        await authorization_policy.authorize(request=request, operation=Operation.READ_TURN_PROFILE)
+
+        profile = await app.sessions.read_turn_profile(session_id=session_id, trace_id=trace_id)
+
+        return turn_profile_to_dto(profile)
+
     return router
@@ -30,11 +30,13 @@ from rich.progress import Progress, TimeElapsedColumn, BarColumn, TaskProgressCo
 from rich import box
 from rich.table import Table
 from rich.text import Text
+from rich.tree import Tree
 import sys
 from typing import Any, Callable, Iterator, Optional, OrderedDict, cast
 
 from parlant.client import ParlantClient
 from parlant.client.core import ApiError
+from parlant.client.core.pydantic_utilities import parse_obj_as
 from parlant.client.types import (
     Agent,
     AgentTagUpdateParams,
@@ -326,9 +328,72 @@ class Actions:
     def list_events(
         ctx: click.Context,
         session_id: str,
+        min_offset: Optional[int] = None,
+        max_offset: Optional[int] = None,
+        omit_tool_results: bool = False,
     ) -> list[Event]:
         client = cast(ParlantClient, ctx.obj.client)
-        return client.sessions.list_events(session_id=session_id, wait_for_data=0)
+        return client.sessions.list_events(
+            session_id=session_id,
+            min_offset=min_offset,
+            wait_for_data=0,
+            request_options={
+                "additional_query_parameters": {
+                    **({"max_offset": max_offset} if max_offset is not None else {}),
+                    **({"omit_tool_results": True} if omit_tool_results else {}),
+                }
+            },
+        )
+
+    @staticmethod
+    def list_events_page(
+        ctx: click.Context,
+        session_id: str,
+        limit: int,
+        cursor: Optional[str] = None,
+        min_offset: Optional[int] = None,
+        max_offset: Optional[int] = None,
+        omit_tool_results: bool = False,
+    ) -> tuple[list[Event], Optional[str]]:
+        params: dict[str, str | int] = {"limit": limit, "wait_for_data": 0}
+
+        if cursor:
+            params["cursor"] = cursor
+        if min_offset is not None:
+            params["min_offset"] = min_offset
+        if max_offset is not None:
+            params["max_offset"] = max_offset
+        if omit_tool_results:
+            params["omit_tool_results"] = "true"
+
+        response = requests.get(
+            f"{ctx.obj.server_address}/sessions/{session_id}/events",
+            params=params,
+        )
+        raise_for_status_with_detail(response)
+
+        page = response.json()
+
+        return parse_obj_as(list[Event], page["items"]), page["next_cursor"]
+
+    @staticmethod
+    def read_turn_profile(
+        ctx: click.Context,
+        session_id: str,
+        trace_id: Optional[str],
+    ) -> Optional[dict[str, Any]]:
+        if trace_id:
+            response = requests.get(
+                f"{ctx.obj.server_address}/sessions/{session_id}/profiles/{trace_id}"
+            )
+            raise_for_status_with_detail(response)
+            return cast(dict[str, Any], response.json())
+
+        response = requests.get(f"{ctx.obj.server_address}/sessions/{session_id}/profiles")
+        raise_for_status_with_detail(response)
+        profiles = cast(list[dict[str, Any]], response.json())
+
+        return profiles[-1] if profiles else None
 
     @staticmethod
     def create_term(
@@ -1709,8 +1774,32 @@ class Interface:
     def view_session(
         ctx: click.Context,
         session_id: str,
+        min_offset: Optional[int] = None,
+        max_offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        omit_tool_results: bool = False,
     ) -> None:
-        events = Actions.list_events(ctx, session_id)
+        next_cursor: Optional[str] = None
+
+        if limit:
+            events, next_cursor = Actions.list_events_page(
+                ctx,
+                session_id,
+                limit=limit,
+                cursor=cursor,
+                min_offset=min_offset,
+                max_offset=max_offset,
+                omit_tool_results=omit_tool_results,
+            )
+        else:
+            events = Actions.list_events(
+                ctx,
+                session_id,
+                min_offset=min_offset,
+                max_offset=max_offset,
+                omit_tool_results=omit_tool_results,
+            )
 
         if not events:
             rich.print(Text("No data available", style="bold yellow"))
@@ -1718,6 +1807,58 @@ class Interface:
 
         Interface._render_events(events=events)
 
+        if next_cursor:
+            rich.print(Text(f"More events are available (--cursor {next_cursor})", style="dim"))
+
+    @staticmethod
+    def _render_span_profile(
+        span: dict[str, Any],
+        tree: Tree,
+    ) -> None:
+        tokens = ""
+
+        if span["input_tokens"] or span["output_tokens"]:
+            tokens = f" [dim]({span['input_tokens']} in / {span['output_tokens']} out)[/dim]"
+
+        label = (
+            f"{span['name']} "
+            f"[cyan]{span['duration'] * 1000:.1f}ms[/cyan] "
+            f"[dim]@ +{span['start_offset'] * 1000:.1f}ms[/dim]"
+            f"{tokens}"
+        )
+
+        if span["on_critical_path"]:
+            label = f"[bold yellow]{label}[/bold yellow]"
+
+        branch = tree.add(label)
+
+        for child in span["children"]:
+            Interface._render_span_profile(child, branch)
+
+    @staticmethod
+    def view_turn_profile(
+        ctx: click.Context,
+        session_id: str,
+        trace_id: Optional[str],
+    ) -> None:
+        profile = Actions.read_turn_profile(ctx, session_id, trace_id)
+
+        if not profile:
+            rich.print(Text("No data available", style="bold yellow"))
+            return
+
+        root = profile["root"]
+
+        tree = Tree(
+            f"Trace {profile['trace_id']} "
+            f"[dim]({reformat_datetime(datetime.fromisoformat(profile['creation_utc']))})[/dim]"
+        )
+
+        Interface._render_span_profile(root, tree)
+
+        rich.print(tree)
+        rich.print(Text("Spans on the critical path are highlighted", style="dim"))
+
     @staticmethod
     def list_sessions(
         ctx: click.Context,
@@ -3479,9 +3620,62 @@ async def async_main() -> None:
 
     @session.command("view", help="View session content")
     @click.option("--id", type=str, metavar="ID", help="Session ID", required=True)
+    @click.option(
+        "--min-offset", type=int, help="Only show events from this offset", required=False
+    )
+    @click.option(
+        "--max-offset", type=int, help="Only show events up to this offset", required=False
+    )
+    @click.option(
+        "--limit",
+        type=click.IntRange(1, 100),
+        help="Show at most this many events",
+        required=False,
+    )
+    @click.option(
+        "--cursor",
+        type=str,
+        help="Continue from where a previous --limit left off",
+        required=False,
+    )
+    @click.option(
+        "--omit-tool-results",
+        is_flag=True,
+        default=False,
+        help="Leave tool call results out of tool events",
+    )
+    @click.pass_context
+    def session_view(
+        ctx: click.Context,
+        id: str,
+        min_offset: Optional[int],
+        max_offset: Optional[int],
+        limit: Optional[int],
+        cursor: Optional[str],
+        omit_tool_results: bool,
+    ) -> None:
+        Interface.view_session(
+            ctx,
+            id,
+            min_offset=min_offset,
+            max_offset=max_offset,
+            limit=limit,
+            cursor=cursor,
+            omit_tool_results=omit_tool_results,
+        )
+
+    @session.command("profile", help="View where the time of an agent's turn went")
+    @click.option("--id", type=str, metavar="ID", help="Session ID", required=True)
+    @click.option(
+        "--trace-id",
+        type=str,
+        metavar="ID",
+        help="Trace ID of the turn (defaults to the session's latest turn)",
+        required=False,
+    )
     @click.pass_context
-    def session_view(ctx: click.Context, id: str) -> None:
-        Interface.view_session(ctx, id)
+    def session_profile(ctx: click.Context, id: str, trace_id: Optional[str]) -> None:
+        Interface.view_turn_profile(ctx, id, trace_id)
 
     @cli.group(help="Manage an agent's glossary")
     def glossary() -> None:
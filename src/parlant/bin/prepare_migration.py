@@ -67,6 +67,7 @@ from lagom import Container
 from typing_extensions import NoReturn
 from pathlib import Path
 import sys
+import time
 import rich
 from rich.prompt import Confirm, Prompt
 
@@ -182,7 +183,8 @@ class VersionCheckpoint:
         return f"{self.component}: {self.from_version} -> {self.to_version}"
 
 
-MigrationFunction = Callable[[type[DocumentDatabase], type[VectorDatabase]], Awaitable[None]]
+# Migrations return the number of documents they wrote
+MigrationFunction = Callable[[type[DocumentDatabase], type[VectorDatabase]], Awaitable[int]]
 migration_registry: dict[tuple[str, str, str], MigrationFunction] = {}
 
 
@@ -426,8 +428,10 @@ async def create_metadata_collection(db: DocumentDatabase, collection_name: str)
         rich.print(f"[yellow]No documents found in {collection_name} collection.")
 
 
-async def migrate_glossary_with_metadata() -> None:
+async def migrate_glossary_with_metadata() -> int:
     rich.print("[green]Starting glossary migration...")
+    written_documents = 0
+
     try:
         embedder_factory = EmbedderFactory(Container())
 
@@ -445,7 +449,7 @@ async def migrate_glossary_with_metadata() -> None:
             old_collection = db.chroma_client.get_collection("glossary")
         except Exception:
             rich.print("[yellow]Glossary collection not found, skipping...")
-            return
+            return 0
 
         if docs := old_collection.peek(limit=1)["metadatas"]:
             document = docs[0]
@@ -485,7 +489,7 @@ async def migrate_glossary_with_metadata() -> None:
 
             if all_items["metadatas"] is None:
                 rich.print("[yellow]No metadatas found in glossary collection, skipping...")
-                return
+                return 0
 
             for i in range(len(all_items["metadatas"])):
                 assert all_items["documents"] is not None
@@ -510,6 +514,8 @@ async def migrate_glossary_with_metadata() -> None:
                     embeddings=all_items["embeddings"][i],
                 )
 
+                written_documents += 2
+
             # Version starts at 1
             chroma_unembedded_collection.modify(
                 metadata={"version": 1 + len(all_items["metadatas"])}
@@ -527,6 +533,8 @@ async def migrate_glossary_with_metadata() -> None:
         db.chroma_client.delete_collection(old_collection.name)
         rich.print("[green]Cleaned up old glossary collection")
 
+        return written_documents
+
     except Exception as e:
         rich.print(f"[red]Failed to migrate glossary: {e}")
         die(f"Error migrating glossary: {e}")
@@ -536,7 +544,7 @@ async def migrate_glossary_with_metadata() -> None:
 async def migrate_agents_0_1_0_to_0_2_0(
     document_database_type: type[DocumentDatabase],
     vector_database_type: type[VectorDatabase],
-) -> None:
+) -> int:
     rich.print("[green]Starting migration for agents 0.1.0 -> 0.2.0")
 
     agents_db = await EXIT_STACK.enter_async_context(
@@ -589,7 +597,7 @@ async def migrate_agents_0_1_0_to_0_2_0(
     )
     await create_metadata_collection(services_db, "tool_services")
 
-    await migrate_glossary_with_metadata()
+    written_documents = await migrate_glossary_with_metadata()
 
     agent_collection = await agents_db.get_or_create_collection(
         "agents",
@@ -602,15 +610,18 @@ async def migrate_agents_0_1_0_to_0_2_0(
             filters={"id": {"$eq": ObjectId(doc["id"])}},
             params={"version": Version.String("0.2.0")},
         )
+        written_documents += 1
 
     await upgrade_document_database_metadata(agents_db, Version.String("0.2.0"))
 
+    return written_documents
+
 
 @register_migration("guidelines", "0.1.0", "0.3.0")
 async def migrate_guidelines_0_1_0_to_0_3_0(
     document_database_type: type[DocumentDatabase],
     vector_database_type: type[VectorDatabase],
-) -> None:
+) -> int:
     async def _association_document_loader(
         doc: BaseDocument,
     ) -> Optional[GuidelineTagAssociationDocument]:
@@ -633,6 +644,8 @@ async def migrate_guidelines_0_1_0_to_0_3_0(
         _association_document_loader,
     )
 
+    written_documents = 0
+
     for guideline in await guideline_collection.find(filters={}):
         guideline_to_use = cast(GuidelineDocument_v0_2_0, guideline)
         if guideline["version"] == "0.1.0":
@@ -668,17 +681,20 @@ async def migrate_guidelines_0_1_0_to_0_3_0(
                 ),
             }
         )
+        written_documents += 2
 
     await upgrade_document_database_metadata(guidelines_db, Version.String("0.3.0"))
 
     rich.print("[green]Successfully migrated guidelines to 0.3.0")
 
+    return written_documents
+
 
 @register_migration("context_variables", "0.1.0", "0.2.0")
 async def migrate_context_variables_0_1_0_to_0_2_0(
     document_database_type: type[DocumentDatabase],
     vector_database_type: type[VectorDatabase],
-) -> None:
+) -> int:
     async def _association_document_loader(
         doc: BaseDocument,
     ) -> Optional[ContextVariableTagAssociationDocument]:
@@ -699,6 +715,8 @@ async def migrate_context_variables_0_1_0_to_0_2_0(
         _association_document_loader,
     )
 
+    written_documents = 0
+
     for context_variable in await context_variables_collection.find(filters={}):
         await context_variable_tags_collection.insert_one(
             {
@@ -716,6 +734,7 @@ async def migrate_context_variables_0_1_0_to_0_2_0(
             filters={"id": {"$eq": ObjectId(context_variable["id"])}},
             params={"version": Version.String("0.2.0")},
         )
+        written_documents += 2
 
     context_variable_values_collection = await context_variables_db.get_or_create_collection(
         "context_variable_values",
@@ -728,17 +747,20 @@ async def migrate_context_variables_0_1_0_to_0_2_0(
             filters={"id": {"$eq": ObjectId(value["id"])}},
             params={"version": Version.String("0.2.0")},
         )
+        written_documents += 1
 
     await upgrade_document_database_metadata(context_variables_db, Version.String("0.2.0"))
 
     rich.print("[green]Successfully migrated context variables to 0.2.0")
 
+    return written_documents
+
 
 @register_migration("agents", "0.2.0", "0.3.0")
 async def migrate_agents_0_2_0_to_0_3_0(
     document_database_type: type[DocumentDatabase],
     vector_database_type: type[VectorDatabase],
-) -> None:
+) -> int:
     if document_database_type != JSONFileDocumentDatabase:
         raise NotImplementedError(
             f"Migration not supported for document database type: {document_database_type.__name__}. "
@@ -761,6 +783,8 @@ async def migrate_agents_0_2_0_to_0_3_0(
         identity_loader,
     )
 
+    written_documents = 0
+
     for agent in await agent_collection.find(filters={}):
         if agent["version"] == "0.2.0":
             await agent_collection.update_one(
@@ -769,17 +793,20 @@ async def migrate_agents_0_2_0_to_0_3_0(
                     "version": Version.String("0.3.0"),
                 },
             )
+            written_documents += 1
 
     await upgrade_document_database_metadata(agent_db, Version.String("0.3.0"))
 
     rich.print("[green]Successfully migrated agents from 0.2.0 to 0.3.0")
 
+    return written_documents
+
 
 @register_migration("glossary", "0.1.0", "0.2.0")
 async def migrate_glossary_0_1_0_to_0_2_0(
     document_database_type: type[DocumentDatabase],
     vector_database_type: type[VectorDatabase],
-) -> None:
+) -> int:
     rich.print("[green]Starting migration for glossary 0.1.0 -> 0.2.0")
 
     async def _association_document_loader(
@@ -819,6 +846,8 @@ async def migrate_glossary_0_1_0_to_0_2_0(
     ) or db.chroma_client.create_collection(name="glossary_unembedded")
 
     migrated_count = 0
+    written_documents = 0
+
     if metadatas := chroma_unembedded_collection.get()["metadatas"]:
         for doc in metadatas:
             new_doc = {
@@ -854,6 +883,7 @@ async def migrate_glossary_0_1_0_to_0_2_0(
                     "tag_id": Tag.for_agent_id(cast(TermDocument_v0_1_0, doc)["term_set"]),
                 }
             )
+            written_documents += 2
 
     chroma_unembedded_collection.modify(metadata={"version": 1 + migrated_count})
 
@@ -865,12 +895,14 @@ async def migrate_glossary_0_1_0_to_0_2_0(
 
     rich.print("[green]Successfully migrated glossary from 0.1.0 to 0.2.0")
 
+    return written_documents
+
 
 @register_migration("utterances", "0.1.0", "0.2.0")
 async def migrate_utterances_0_1_0_to_0_2_0(
     document_database_type: type[DocumentDatabase],
     vector_database_type: type[VectorDatabase],
-) -> None:
+) -> int:
     rich.print("[green]Starting migration for utterances 0.1.0 -> 0.2.0")
 
     async def _association_document_loader(
@@ -956,6 +988,8 @@ async def migrate_utterances_0_1_0_to_0_2_0(
 
             migrated_count += 1
 
+    written_documents = 0
+
     for tag_doc in await utterance_tags_collection.find(filters={}):
         await new_utterance_tags_collection.insert_one(
             {
@@ -966,6 +1000,7 @@ async def migrate_utterances_0_1_0_to_0_2_0(
                 "tag_id": tag_doc["tag_id"],
             }
         )
+        written_documents += 1
 
     chroma_unembedded_collection.modify(metadata={"version": 1 + migrated_count})
 
@@ -981,12 +1016,14 @@ async def migrate_utterances_0_1_0_to_0_2_0(
 
     rich.print("[green]Successfully migrated utterances from 0.1.0 to 0.2.0")
 
+    return migrated_count + written_documents
+
 
 @register_migration("journeys", "0.1.0", "0.2.0")
 async def migrate_journeys_0_1_0_to_0_2_0(
     document_database_type: type[DocumentDatabase],
     vector_database_type: type[VectorDatabase],
-) -> None:
+) -> int:
     rich.print("[green]Starting migration for journeys 0.1.0 -> 0.2.0")
 
     async def _tag_association_document_loader(
@@ -1094,6 +1131,8 @@ async def migrate_journeys_0_1_0_to_0_2_0(
 
             migrated_count += 1
 
+    written_documents = 0
+
     for tag_doc in await journey_tags_collection.find(filters={}):
         await new_journey_tags_collection.insert_one(
             {
@@ -1104,6 +1143,7 @@ async def migrate_journeys_0_1_0_to_0_2_0(
                 "tag_id": tag_doc["tag_id"],
             }
         )
+        written_documents += 1
 
     for condition_doc in await journey_conditions_collection.find(filters={}):
         await new_journey_conditions_collection.insert_one(
@@ -1115,6 +1155,7 @@ async def migrate_journeys_0_1_0_to_0_2_0(
                 "condition": condition_doc["condition"],
             }
         )
+        written_documents += 1
 
     chroma_unembedded_collection.modify(metadata={"version": 1 + migrated_count})
 
@@ -1125,12 +1166,14 @@ async def migrate_journeys_0_1_0_to_0_2_0(
 
     rich.print("[green]Successfully migrated journeys from 0.1.0 to 0.2.0")
 
+    return migrated_count + written_documents
+
 
 @register_migration("evaluations", "0.1.0", "0.2.0")
 async def migrate_evaluations_0_1_0_to_0_2_0(
     document_database_type: type[DocumentDatabase],
     vector_database_type: type[VectorDatabase],
-) -> None:
+) -> int:
     async def _association_document_loader(
         doc: BaseDocument,
     ) -> Optional[EvaluationTagAssociationDocument]:
@@ -1153,6 +1196,8 @@ async def migrate_evaluations_0_1_0_to_0_2_0(
         _association_document_loader,
     )
 
+    written_documents = 0
+
     for doc in await evaluation_collection.find(filters={}):
         if doc["version"] == "0.1.0":
             evaluation_doc = cast(EvaluationDocument_v0_1_0, doc)
@@ -1212,17 +1257,20 @@ async def migrate_evaluations_0_1_0_to_0_2_0(
                     "tag_id": Tag.for_agent_id(evaluation_doc["agent_id"]),
                 }
             )
+            written_documents += 2
 
     await upgrade_document_database_metadata(evaluations_db, Version.String("0.2.0"))
 
     rich.print("[green]Successfully migrated evaluations from 0.1.0 to 0.2.0")
 
+    return written_documents
+
 
 @register_migration("guideline_connections", "0.1.0", "0.2.0")
 async def migrate_guideline_relationships_0_1_0_to_0_2_0(
     document_database_type: type[DocumentDatabase],
     vector_database_type: type[VectorDatabase],
-) -> None:
+) -> int:
     rich.print("[green]Starting migration for guideline relationships 0.1.0 -> 0.2.0")
 
     guideline_relationships_db = await EXIT_STACK.enter_async_context(
@@ -1250,6 +1298,8 @@ async def migrate_guideline_relationships_0_1_0_to_0_2_0(
             identity_loader,
         )
 
+        written_documents = 0
+
         for doc in await guideline_connections_collection.find(filters={}):
             doc = cast(GuidelineRelationshipDocument_v0_1_0, doc)
             await guideline_relationships_collection.insert_one(
@@ -1265,6 +1315,7 @@ async def migrate_guideline_relationships_0_1_0_to_0_2_0(
                     },
                 )
             )
+            written_documents += 1
 
         connections_metadata_collection = await guideline_connections_db.get_or_create_collection(
             "metadata",
@@ -1287,12 +1338,14 @@ async def migrate_guideline_relationships_0_1_0_to_0_2_0(
 
     rich.print("[green]Successfully migrated guideline connections to guideline relationships")
 
+    return written_documents
+
 
 @register_migration("guideline_relationships", "0.2.0", "0.3.0")
 async def migrate_relationships_0_2_0_to_0_3_0(
     document_database_type: type[DocumentDatabase],
     vector_database_type: type[VectorDatabase],
-) -> None:
+) -> int:
     rich.print("[green]Starting migration for relationships 0.2.0 -> 0.3.0")
 
     relationships_db = await EXIT_STACK.enter_async_context(
@@ -1322,6 +1375,8 @@ async def migrate_relationships_0_2_0_to_0_3_0(
             )
         )
 
+        written_documents = 0
+
         for doc in await guideline_relationships_collection.find(filters={}):
             doc = cast(GuidelineRelationshipDocument_v0_2_0, doc)
             await relationships_collection.insert_one(
@@ -1339,6 +1394,7 @@ async def migrate_relationships_0_2_0_to_0_3_0(
                     },
                 )
             )
+            written_documents += 1
 
         guideline_relationships_metadata_collection = (
             await guideline_relationships_db.get_or_create_collection(
@@ -1363,12 +1419,14 @@ async def migrate_relationships_0_2_0_to_0_3_0(
 
     rich.print("[green]Successfully migrated guideline connections to guideline relationships")
 
+    return written_documents
+
 
 @register_migration("journeys", "0.2.0", "0.3.0")
 async def migrate_journeys_0_2_0_to_0_3_0(
     document_database_type: type[DocumentDatabase],
     vector_database_type: type[VectorDatabase],
-) -> None:
+) -> int:
     rich.print("[green]Starting migration for journeys 0.2.0 -> 0.3.0")
 
     async def _journey_loader(
@@ -1456,6 +1514,8 @@ async def migrate_journeys_0_2_0_to_0_3_0(
     )
 
     migrated_count = 0
+    written_documents = 0
+
     if metadatas := chroma_unembedded_collection.get()["metadatas"]:
         for doc in metadatas:
             content = JourneyVectorStore.assemble_content(
@@ -1507,6 +1567,7 @@ async def migrate_journeys_0_2_0_to_0_3_0(
             )
 
             await journeys_collection.insert_one(j_doc)
+            written_documents += 3
 
     chroma_unembedded_collection.modify(metadata={"version": 1 + migrated_count})
 
@@ -1521,6 +1582,7 @@ async def migrate_journeys_0_2_0_to_0_3_0(
                 "tag_id": tag_doc["tag_id"],
             },
         )
+        written_documents += 1
 
     for condition_doc in await journey_conditions_collection.find(filters={}):
         await journey_conditions_collection.update_one(
@@ -1533,6 +1595,7 @@ async def migrate_journeys_0_2_0_to_0_3_0(
                 "condition": condition_doc["condition"],
             },
         )
+        written_documents += 1
 
     await chroma_db.upsert_metadata(
         VectorDocumentStoreMigrationHelper.get_store_version_key(JourneyVectorStore.__name__),
@@ -1543,12 +1606,14 @@ async def migrate_journeys_0_2_0_to_0_3_0(
 
     rich.print("[green]Successfully migrated journeys from 0.2.0 to 0.3.0")
 
+    return written_documents
+
 
 @register_migration("utterances", "0.2.0", "0.4.0")
 async def migrate_canned_responses_0_2_0_to_0_4_0(
     document_database_type: type[DocumentDatabase],
     vector_database_type: type[VectorDatabase],
-) -> None:
+) -> int:
     rich.print("[green]Starting migration for canned responses 0.2.0 -> 0.4.0")
 
     async def _old_association_document_loader(
@@ -1625,6 +1690,7 @@ async def migrate_canned_responses_0_2_0_to_0_4_0(
     ) or db.chroma_client.create_collection(name="canned_responses_unembedded")
 
     migrated_count = 0
+    written_documents = 0
     unique_docs = set()
     vector_docs = []
     docs = []
@@ -1701,6 +1767,7 @@ async def migrate_canned_responses_0_2_0_to_0_4_0(
 
         for c_doc in docs:
             await canned_response_collection.insert_one(c_doc)
+            written_documents += 1
 
     for tag_doc in await utterance_tags_collection.find(filters={}):
         await canned_response_tags_collection.insert_one(
@@ -1712,6 +1779,7 @@ async def migrate_canned_responses_0_2_0_to_0_4_0(
                 "tag_id": tag_doc["tag_id"],
             }
         )
+        written_documents += 1
 
     chroma_canreps_unembedded_collection.modify(metadata={"version": 1 + migrated_count})
 
@@ -1733,12 +1801,14 @@ async def migrate_canned_responses_0_2_0_to_0_4_0(
 
     rich.print("[green]Successfully migrated canned responses from 0.2.0 to 0.4.0")
 
+    return migrated_count + written_documents
+
 
 @register_migration("capabilities", "0.1.0", "0.2.0")
 async def migrate_capabilities_0_1_0_to_0_2_0(
     document_database_type: type[DocumentDatabase],
     vector_database_type: type[VectorDatabase],
-) -> None:
+) -> int:
     rich.print("[green]Starting migration for capabilities 0.1.0 -> 0.2.0")
 
     async def _vector_document_loader(
@@ -1806,6 +1876,7 @@ async def migrate_capabilities_0_1_0_to_0_2_0(
     ) or db.chroma_client.create_collection(name="capabilities_unembedded")
 
     migrated_count = 0
+    written_documents = 0
     unique_docs = set()
     vector_docs = []
     docs = []
@@ -1860,6 +1931,7 @@ async def migrate_capabilities_0_1_0_to_0_2_0(
 
         for c_doc in docs:
             await capabilities_collection.insert_one(c_doc)
+            written_documents += 1
 
     for tag_doc in await old_capability_tags_collection.find(filters={}):
         await capability_tags_collection.insert_one(
@@ -1871,6 +1943,7 @@ async def migrate_capabilities_0_1_0_to_0_2_0(
                 "tag_id": tag_doc["tag_id"],
             }
         )
+        written_documents += 1
 
     chroma_capabilities_unembedded_collection.modify(metadata={"version": 1 + migrated_count})
 
@@ -1885,6 +1958,8 @@ async def migrate_capabilities_0_1_0_to_0_2_0(
 
     rich.print("[green]Successfully migrated capabilities from 0.2.0 to 0.2.0")
 
+    return migrated_count + written_documents
+
 
 async def upgrade_document_database_metadata(
     db: DocumentDatabase,
@@ -1951,6 +2026,8 @@ async def migrate(
     backup_data()
 
     applied_migrations = set()
+    start = time.perf_counter()
+    migrated_documents = 0
 
     while required_migrations:
         for migration_key in required_migrations:
@@ -1961,9 +2038,18 @@ async def migrate(
             migration_func = migration_registry[migration_key]
 
             rich.print(f"[green]Running migration: {component} {from_version} -> {to_version}")
-            await migration_func(document_database_type, vector_database_type)
+            migration_start = time.perf_counter()
+            document_count = await migration_func(document_database_type, vector_database_type)
             applied_migrations.add(migration_key)
 
+            migration_elapsed = time.perf_counter() - migration_start
+            migrated_documents += document_count
+
+            rich.print(
+                f"[green]Migrated {component} to {to_version}: {document_count} documents "
+                f"in {migration_elapsed:.2f}s ({document_count / migration_elapsed:.0f} documents/s)"
+            )
+
         new_required_migrations = await detect_required_migrations(
             document_database_type, vector_database_type
         )
@@ -1972,8 +2058,11 @@ async def migrate(
         if not required_migrations:
             rich.print("[green]No more migrations required.")
 
+    elapsed = time.perf_counter() - start
+
     rich.print(
-        f"[green]All migrations completed successfully. Applied {len(applied_migrations)} migrations in total."
+        f"[green]All migrations completed successfully. Applied {len(applied_migrations)} migrations in total, "
+        f"to {migrated_documents} documents in {elapsed:.2f}s ({migrated_documents / elapsed:.0f} documents/s)."
     )
 
 
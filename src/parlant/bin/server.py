@@ -15,26 +15,32 @@
 # mypy: disable-error-code=import-untyped
 
 import asyncio
-from contextlib import asynccontextmanager, AsyncExitStack
+from collections import defaultdict
+from contextlib import asynccontextmanager, contextmanager, AsyncExitStack
 from dataclasses import dataclass
 import importlib
 import inspect
 import os
+import subprocess
+import time
 import traceback
 from fastapi import FastAPI
 from lagom import Container, Singleton
+from limits.storage import Storage, storage_from_string
 from typing import (
     Any,
     AsyncIterator,
     Awaitable,
     Callable,
     Iterable,
+    Iterator,
     Literal,
     Optional,
     Sequence,
     cast,
 )
 import rich
+from rich.table import Table
 import toml
 from typing_extensions import NoReturn
 import click
@@ -133,7 +139,9 @@ from parlant.core.engines.alpha.canned_response_generator import (
     NoMatchResponseProvider,
 )
 from parlant.core.journey_guideline_projection import JourneyGuidelineProjection
+from parlant.core.behavior_snapshots import BehaviorSnapshotProvider
 from parlant.core.meter import Meter, LocalMeter
+from parlant.core.profiling import ProfilingTracer, TurnProfiler
 from parlant.core.services.indexing.guideline_agent_intention_proposer import (
     AgentIntentionProposerSchema,
 )
@@ -154,6 +162,7 @@ from parlant.core.services.indexing.guideline_continuous_proposer import (
 from parlant.core.services.indexing.journey_reachable_nodes_evaluation import (
     ReachableNodesEvaluationSchema,
 )
+from parlant.core.services.indexing.evaluation_cache import BasicEvaluationCache, EvaluationCache
 from parlant.core.services.indexing.relative_action_proposer import RelativeActionSchema
 from parlant.core.services.indexing.tool_running_action_detector import (
     ToolRunningActionDetector,
@@ -180,6 +189,7 @@ from parlant.core.evaluations import (
     EvaluationStore,
 )
 from parlant.core.entity_cq import EntityQueries, EntityCommands
+from parlant.core.engines.alpha.context_variable_loader import ContextVariableLoader
 from parlant.core.relationships import (
     RelationshipDocumentStore,
     RelationshipStore,
@@ -197,15 +207,30 @@ from parlant.core.nlp.embedding import (
     NullEmbeddingCache,
 )
 from parlant.core.nlp.generation import SchematicGenerator
-from parlant.core.persistence.data_collection import DataCollectingSchematicGenerator
+from parlant.core.persistence.data_collection import (
+    DataCollectingSchematicGenerator,
+    DataCollectionConfig,
+    DataCollectionSink,
+)
 from parlant.core.services.tools.service_registry import (
     ServiceRegistry,
     ServiceDocumentRegistry,
 )
+from parlant.core.services.tools.transport import (
+    ToolServiceTransport,
+    ToolServiceTransportConfig,
+)
+from parlant.core.session_work_queue import (
+    InProcessSessionWorkQueue,
+    SessionWorker,
+    SessionWorkQueue,
+)
 from parlant.core.sessions import (
-    PollingSessionListener,
+    NotifyingSessionListener,
     SessionDocumentStore,
+    SessionEventNotifier,
     SessionListener,
+    SessionStatusChannel,
     SessionStore,
 )
 from parlant.core.glossary import GlossaryStore, GlossaryVectorStore
@@ -232,7 +257,7 @@ from parlant.core.engines.alpha.message_generator import (
 from parlant.core.engines.alpha.tool_event_generator import ToolEventGenerator
 from parlant.core.engines.types import Engine
 from parlant.core.services.indexing.behavioral_change_evaluation import BehavioralChangeEvaluator
-from parlant.core.loggers import CompositeLogger, FileLogger, LogLevel, Logger
+from parlant.core.loggers import CompositeLogger, FileLogger, LogFormat, LogLevel, Logger
 from parlant.core.application import Application
 from parlant.core.version import VERSION
 
@@ -256,7 +281,13 @@ sys.path.append(PARLANT_HOME_DIR.as_posix())
 sys.path.append(".")
 
 TRACER = LocalTracer()
-LOGGER = FileLogger(PARLANT_HOME_DIR / "parlant.log", TRACER, LogLevel.INFO)
+LOGGER = FileLogger(
+    PARLANT_HOME_DIR / "parlant.log",
+    TRACER,
+    LogLevel.INFO,
+    log_format=LogFormat.from_environment(),
+    background=True,
+)
 
 
 class StartupError(Exception):
@@ -264,6 +295,82 @@ class StartupError(Exception):
         super().__init__(message)
 
 
+class StartupProfiler:
+    """Measures how long each step of the server's startup takes.
+
+    Import times are measured separately, in a fresh interpreter, since by the
+    time the command line is parsed the server's own imports have already happened.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self._steps: list[tuple[str, float]] = []
+
+    @contextmanager
+    def measure(self, step: str) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+
+        start = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            self._steps.append((step, time.perf_counter() - start))
+
+    def measure_imports(self, module: str, top: int = 20) -> list[tuple[str, float]]:
+        """Returns the packages that took the longest to import while importing `module`."""
+
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True,
+            text=True,
+        )
+
+        durations: dict[str, float] = defaultdict(float)
+
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:") or "|" not in line:
+                continue
+
+            self_us, _, name = line.removeprefix("import time:").split("|")
+
+            if not self_us.strip().isdigit():
+                continue  # This is the header line
+
+            name = name.strip()
+
+            # Group parlant modules by sub-package, and 3rd-party modules by distribution
+            parts = name.split(".")
+            package = ".".join(parts[:3]) if parts[0] == "parlant" else parts[0]
+
+            durations[package] += int(self_us) / 1_000_000
+
+        return sorted(durations.items(), key=lambda item: item[1], reverse=True)[:top]
+
+    def report(self) -> None:
+        imports = Table(title="Imports (parlant.bin.server)")
+        imports.add_column("Package")
+        imports.add_column("Seconds", justify="right")
+
+        for package, duration in self.measure_imports("parlant.bin.server"):
+            imports.add_row(package, f"{duration:.3f}")
+
+        steps = Table(title="Container initialization")
+        steps.add_column("Step")
+        steps.add_column("Seconds", justify="right")
+
+        for step, duration in self._steps:
+            steps.add_row(step, f"{duration:.3f}")
+
+        rich.print(imports)
+        rich.print(steps)
+
+
+STARTUP_PROFILER = StartupProfiler()
+
+
 NLPServiceName = Literal[
     "anthropic",
     "aws",
@@ -286,6 +393,7 @@ class StartupParameters:
     log_level: str | LogLevel
     modules: list[str]
     migrate: bool
+    profile_startup: bool = False
     configure: Callable[[Container], Awaitable[Container]] | None = None
     initialize: Callable[[Container], Awaitable[None]] | None = None
     configure_api: Callable[[FastAPI], Awaitable[None]] | None = None
@@ -394,6 +502,35 @@ def load_litellm(container: Container) -> NLPService:
     )
 
 
+def replay_loader(
+    path: Path,
+    latency: str,
+    strict: bool,
+) -> Callable[[Container], Awaitable[NLPService]]:
+    async def load_replay(container: Container) -> NLPService:
+        from parlant.adapters.nlp.replay_service import (
+            ReplayCorpus,
+            ReplayEmbedder,
+            ReplayService,
+            SimulatedLatency,
+        )
+
+        service = ReplayService(
+            ReplayCorpus.load(path, strict=strict),
+            LOGGER,
+            container[Tracer],
+            container[Meter],
+            latency=SimulatedLatency.parse(latency),
+        )
+
+        # Stores resolve their embedder by type, so it has to be the service's own
+        container[ReplayEmbedder] = service.embedder
+
+        return service
+
+    return load_replay
+
+
 NLP_SERVICE_INITIALIZERS: dict[NLPServiceName, Callable[[Container], NLPService]] = {
     "anthropic": load_anthropic,
     "aws": load_aws,
@@ -472,14 +609,35 @@ async def _define_logger(container: Container) -> None:
 
 
 async def _define_tracer(container: Container) -> None:
+    tracer: Tracer
+
     if os.environ.get("OTEL_EXPORTER_OTLP_TRACES_ENDPOINT"):
         from parlant.adapters.tracing.opentelemetry import OpenTelemetryTracer
 
         print("OpenTelemetry tracing is enabled.")
-        container[Tracer] = await EXIT_STACK.enter_async_context(OpenTelemetryTracer())
+        tracer = await EXIT_STACK.enter_async_context(OpenTelemetryTracer())
+
+    else:
+        tracer = LocalTracer()
+
+    # Profiles are stored with every recorded turn, so they're opt-in,
+    # either for all turns or for a sampled fraction of them (e.g. 0.01)
+    turn_profiling = os.environ.get("PARLANT_TURN_PROFILING", "false").lower()
 
+    if turn_profiling in ["true", "yes"]:
+        turn_profiling_rate = 1.0
+    elif turn_profiling in ["false", "no"]:
+        turn_profiling_rate = 0.0
     else:
-        _define_singleton(container, Tracer, LocalTracer)
+        turn_profiling_rate = float(turn_profiling)
+
+    turn_profiler = TurnProfiler(
+        enabled=turn_profiling_rate > 0,
+        sample_rate=turn_profiling_rate,
+    )
+
+    container[TurnProfiler] = turn_profiler
+    container[Tracer] = ProfilingTracer(tracer, turn_profiler)
 
 
 async def _define_meter(container: Container) -> None:
@@ -592,10 +750,49 @@ async def setup_container() -> AsyncIterator[Container]:
     _define_singleton(c, CustomerDependentActionDetector, CustomerDependentActionDetector)
     _define_singleton(c, ToolRunningActionDetector, ToolRunningActionDetector)
 
-    _define_singleton(c, JourneyGuidelineProjection, JourneyGuidelineProjection)
+    if os.environ.get("PARLANT_SESSION_QUEUE"):
+        # Other processes may mutate the stores, and revisions only count this process's
+        # mutations, so behavior is read from the stores on every turn
+        c[JourneyGuidelineProjection] = Singleton(
+            lambda c: JourneyGuidelineProjection(
+                c[JourneyStore],
+                c[GuidelineStore],
+                cached_journeys=0,
+            )
+        )
+        c[BehaviorSnapshotProvider] = Singleton(
+            lambda c: BehaviorSnapshotProvider(
+                c[AgentStore],
+                c[GuidelineStore],
+                c[JourneyStore],
+                c[ContextVariableStore],
+                c[CannedResponseStore],
+                c[GuidelineToolAssociationStore],
+                cached=False,
+            )
+        )
+    else:
+        _define_singleton(c, JourneyGuidelineProjection, JourneyGuidelineProjection)
+        _define_singleton(c, BehaviorSnapshotProvider, BehaviorSnapshotProvider)
 
     _define_singleton(c, BehavioralChangeEvaluator, BehavioralChangeEvaluator)
     _define_singleton(c, EvaluationListener, PollingEvaluationListener)
+    _define_singleton_value(c, SessionEventNotifier, SessionEventNotifier())
+
+    if os.environ.get("PARLANT_SESSION_QUEUE"):
+        # The API of a session may be served by another process than the one processing it,
+        # and that process is only notified of events written in it, so statuses are stored
+        c[SessionStatusChannel] = Singleton(
+            lambda c: SessionStatusChannel(
+                c[SessionStore],
+                c[SessionEventNotifier],
+                persist_all_statuses=True,
+            )
+        )
+    else:
+        _define_singleton(c, SessionStatusChannel, SessionStatusChannel)
+
+    _define_singleton(c, SessionWorker, SessionWorker)
 
     _define_singleton(c, ResponseAnalysisBatch, GenericResponseAnalysisBatch)
     _define_singleton(c, ObservationalGuidelineMatching, ObservationalGuidelineMatching)
@@ -622,16 +819,40 @@ async def setup_container() -> AsyncIterator[Container]:
 
     _define_singleton(c, RelationalGuidelineResolver, RelationalGuidelineResolver)
 
-    _define_singleton(
-        c,
-        AuthorizationPolicy,
-        (
-            ProductionAuthorizationPolicy
-            if os.environ.get("PARLANT_ENV") == "production"
-            else DevelopmentAuthorizationPolicy
-        ),
+    c[ContextVariableLoader] = Singleton(
+        lambda c: ContextVariableLoader(
+            c[Logger],
+            c[EntityQueries],
+            c[EntityCommands],
+            c[BackgroundTaskService],
+            refresh_in_background=os.environ.get(
+                "PARLANT_CONTEXT_VARIABLE_BACKGROUND_REFRESH", "false"
+            ).lower()
+            not in ["false", "no", "0"],
+        )
     )
 
+    if os.environ.get("PARLANT_ENV") == "production":
+        if rate_limit_storage_uri := os.environ.get("PARLANT_RATE_LIMIT_STORAGE"):
+            # Shared by all processes and replicas, e.g. redis://host:6379
+            rate_limit_storage = storage_from_string(rate_limit_storage_uri)
+
+            if not isinstance(rate_limit_storage, Storage):
+                raise ValueError(f"Unsupported rate limit storage: {rate_limit_storage_uri}")
+
+            _define_singleton_value(
+                c,
+                AuthorizationPolicy,
+                ProductionAuthorizationPolicy(
+                    rate_limit_storage=rate_limit_storage,
+                    rate_limit_batch_size=int(os.environ.get("PARLANT_RATE_LIMIT_BATCH_SIZE", "5")),
+                ),
+            )
+        else:
+            _define_singleton(c, AuthorizationPolicy, ProductionAuthorizationPolicy)
+    else:
+        _define_singleton(c, AuthorizationPolicy, DevelopmentAuthorizationPolicy)
+
     _define_singleton(c, Engine, AlphaEngine)
 
     _define_singleton(c, Application, Application)
@@ -687,8 +908,17 @@ async def initialize_container(
 
             args.extend([db, migrate])
 
+            kwargs: dict[str, Any] = {}
+
+            if "event_notifier" in params:
+                kwargs["event_notifier"] = c[SessionEventNotifier]
+
+            if "cache_graphs" in params and os.environ.get("PARLANT_SESSION_QUEUE"):
+                # Other processes may mutate the same database
+                kwargs["cache_graphs"] = False
+
             c[store_implementation] = await EXIT_STACK.enter_async_context(
-                store_implementation(*args)
+                store_implementation(*args, **kwargs)
             )
             c[store_interface] = lambda _c: c[store_implementation]
 
@@ -735,17 +965,40 @@ async def initialize_container(
 
     await c[BackgroundTaskService].start(c[WebSocketLogger].start(), tag="websocket-logger")
 
-    try_define(SessionListener, PollingSessionListener)
+    if session_queue_path := os.environ.get("PARLANT_SESSION_QUEUE"):
+        if SessionListener not in c.defined_types:
+            # Events written by workers in other processes are only found by polling the store
+            c[SessionListener] = Singleton(
+                lambda c: NotifyingSessionListener(
+                    c[SessionStore],
+                    c[SessionEventNotifier],
+                    poll_interval=0.25,
+                )
+            )
+
+        # Lets several server processes on this machine share the processing of sessions
+        from parlant.adapters.queue.sqlite import SQLiteSessionWorkQueue
+
+        await try_define_func(
+            SessionWorkQueue,
+            lambda: EXIT_STACK.enter_async_context(
+                SQLiteSessionWorkQueue(Path(session_queue_path))
+            ),
+        )
+    else:
+        try_define(SessionListener, NotifyingSessionListener)
+        try_define(SessionWorkQueue, InProcessSessionWorkQueue)
 
     nlp_service_name: str
     nlp_service_instance: NLPService
 
-    if isinstance(nlp_service_descriptor, str):
-        nlp_service_name = nlp_service_descriptor
-        nlp_service_instance = NLP_SERVICE_INITIALIZERS[nlp_service_name](c)
-    else:
-        nlp_service_instance = await nlp_service_descriptor(c)
-        nlp_service_name = nlp_service_instance.__class__.__name__
+    with STARTUP_PROFILER.measure("NLP service"):
+        if isinstance(nlp_service_descriptor, str):
+            nlp_service_name = nlp_service_descriptor
+            nlp_service_instance = NLP_SERVICE_INITIALIZERS[nlp_service_name](c)
+        else:
+            nlp_service_instance = await nlp_service_descriptor(c)
+            nlp_service_name = nlp_service_instance.__class__.__name__
 
     try:
         for interface, implementation, filename in [
@@ -763,7 +1016,19 @@ async def initialize_container(
             (RelationshipStore, RelationshipDocumentStore, "relationships.json"),
             (SessionStore, SessionDocumentStore, "sessions.json"),
         ]:
-            await try_define_document_store(interface, implementation, filename)
+            with STARTUP_PROFILER.measure(f"Document store: {interface.__name__}"):
+                await try_define_document_store(interface, implementation, filename)
+
+        async def make_tool_service_transport() -> ToolServiceTransport:
+            return await EXIT_STACK.enter_async_context(
+                ToolServiceTransport(
+                    logger=c[Logger],
+                    meter=c[Meter],
+                    config=ToolServiceTransportConfig.from_environment(),
+                )
+            )
+
+        await try_define_func(ToolServiceTransport, make_tool_service_transport)
 
         async def make_service_document_registry() -> ServiceRegistry:
             db = await EXIT_STACK.enter_async_context(
@@ -779,12 +1044,15 @@ async def initialize_container(
                     event_emitter_factory=c[EventEmitterFactory],
                     logger=c[Logger],
                     tracer=c[Tracer],
+                    meter=c[Meter],
                     nlp_services_provider=lambda: {nlp_service_name: nlp_service_instance},
                     allow_migration=migrate,
+                    transport=c[ToolServiceTransport],
                 )
             )
 
-        await try_define_func(ServiceRegistry, make_service_document_registry)
+        with STARTUP_PROFILER.measure("Service registry"):
+            await try_define_func(ServiceRegistry, make_service_document_registry)
 
         try_define(NLPService, nlp_service_instance)
 
@@ -819,14 +1087,15 @@ async def initialize_container(
             (JourneyStore, JourneyVectorStore, "journey_associations.json"),
             (CapabilityStore, CapabilityVectorStore, "capabilities.json"),
         ]:
-            await try_define_vector_store(
-                store_interface,
-                store_implementation,
-                lambda: get_transient_vector_db(),
-                document_db_filename,
-                get_embedder_type,
-                embedder_factory,
-            )
+            with STARTUP_PROFILER.measure(f"Vector store: {store_interface.__name__}"):
+                await try_define_vector_store(
+                    store_interface,
+                    store_implementation,
+                    lambda: get_transient_vector_db(),
+                    document_db_filename,
+                    get_embedder_type,
+                    embedder_factory,
+                )
 
     except MigrationRequired as e:
         c[Logger].critical(str(e))
@@ -837,47 +1106,83 @@ async def initialize_container(
             "Your runtime data came from a higher server version and is not supported.\nPlease upgrade to the latest version of Parlant."
         )
 
-    for schema in (
-        GenericResponseAnalysisSchema,
-        GenericPreviouslyAppliedActionableGuidelineMatchesSchema,
-        GenericActionableGuidelineMatchesSchema,
-        GenericPreviouslyAppliedActionableCustomerDependentGuidelineMatchesSchema,
-        GenericObservationalGuidelineMatchesSchema,
-        MessageSchema,
-        CannedResponseDraftSchema,
-        CannedResponseSelectionSchema,
-        CannedResponsePreambleSchema,
-        CannedResponseRevisionSchema,
-        CannedResponseFieldExtractionSchema,
-        FollowUpCannedResponseSelectionSchema,
-        SingleToolBatchSchema,
-        NonConsequentialToolBatchSchema,
-        OverlappingToolsBatchSchema,
-        GuidelineActionPropositionSchema,
-        GuidelineContinuousPropositionSchema,
-        CustomerDependentActionSchema,
-        ToolRunningActionSchema,
-        AgentIntentionProposerSchema,
-        DisambiguationGuidelineMatchesSchema,
-        JourneyBacktrackNodeSelectionSchema,
-        JourneyNextStepSelectionSchema,
-        JourneyBacktrackCheckSchema,
-        RelativeActionSchema,
-        ReachableNodesEvaluationSchema,
-    ):
-        generator = await nlp_service_instance.get_schematic_generator(schema)
-
-        if os.environ.get("PARLANT_DATA_COLLECTION", "false").lower() not in ["false", "no", "0"]:
-            generator = DataCollectingSchematicGenerator[schema](  # type: ignore
+    data_collection_sink: DataCollectionSink | None = None
+
+    if os.environ.get("PARLANT_DATA_COLLECTION", "false").lower() not in ["false", "no", "0"]:
+        data_collection_sink = await EXIT_STACK.enter_async_context(
+            DataCollectionSink(c[Logger], c[Meter], DataCollectionConfig.from_environment())
+        )
+
+    with STARTUP_PROFILER.measure("Schematic generators"):
+        for schema in (
+            GenericResponseAnalysisSchema,
+            GenericPreviouslyAppliedActionableGuidelineMatchesSchema,
+            GenericActionableGuidelineMatchesSchema,
+            GenericPreviouslyAppliedActionableCustomerDependentGuidelineMatchesSchema,
+            GenericObservationalGuidelineMatchesSchema,
+            MessageSchema,
+            CannedResponseDraftSchema,
+            CannedResponseSelectionSchema,
+            CannedResponsePreambleSchema,
+            CannedResponseRevisionSchema,
+            CannedResponseFieldExtractionSchema,
+            FollowUpCannedResponseSelectionSchema,
+            SingleToolBatchSchema,
+            NonConsequentialToolBatchSchema,
+            OverlappingToolsBatchSchema,
+            GuidelineActionPropositionSchema,
+            GuidelineContinuousPropositionSchema,
+            CustomerDependentActionSchema,
+            ToolRunningActionSchema,
+            AgentIntentionProposerSchema,
+            DisambiguationGuidelineMatchesSchema,
+            JourneyBacktrackNodeSelectionSchema,
+            JourneyNextStepSelectionSchema,
+            JourneyBacktrackCheckSchema,
+            RelativeActionSchema,
+            ReachableNodesEvaluationSchema,
+        ):
+            generator = await nlp_service_instance.get_schematic_generator(schema)
+
+            if data_collection_sink:
+                generator = DataCollectingSchematicGenerator[schema](  # type: ignore
+                    generator,
+                    c[Tracer],
+                    data_collection_sink,
+                )
+
+            try_define(
+                SchematicGenerator[schema],  # type: ignore
                 generator,
-                c[Tracer],
             )
 
-        try_define(
-            SchematicGenerator[schema],  # type: ignore
-            generator,
+    async def make_evaluation_cache() -> EvaluationCache:
+        # Evaluations are keyed on the models that produced them, so changing models re-evaluates
+        model_id = ", ".join(
+            c[SchematicGenerator[schema]].id  # type: ignore
+            for schema in (
+                GuidelineActionPropositionSchema,
+                GuidelineContinuousPropositionSchema,
+                CustomerDependentActionSchema,
+                ToolRunningActionSchema,
+                AgentIntentionProposerSchema,
+                RelativeActionSchema,
+                ReachableNodesEvaluationSchema,
+            )
+        )
+
+        return BasicEvaluationCache(
+            await EXIT_STACK.enter_async_context(
+                JSONFileDocumentDatabase(
+                    c[Logger],
+                    PARLANT_HOME_DIR / "evaluation_cache.json",
+                )
+            ),
+            model_id=model_id,
         )
 
+    await try_define_func(EvaluationCache, make_evaluation_cache)
+
 
 async def recover_server_tasks(
     evaluation_store: EvaluationStore,
@@ -911,23 +1216,27 @@ async def load_app(params: StartupParameters) -> AsyncIterator[tuple[ASGIApplica
 
     EXIT_STACK = AsyncExitStack()
 
-    async with (
-        setup_container() as base_container,
-        EXIT_STACK,
-    ):
+    STARTUP_PROFILER.enabled = params.profile_startup
+
+    async with EXIT_STACK:
+        with STARTUP_PROFILER.measure("Container setup"):
+            base_container = await EXIT_STACK.enter_async_context(setup_container())
+
         modules = set(await get_module_list_from_config() + params.modules)
 
         if modules:
             # Allow modules to return a different container
-            actual_container, module_initializers = await EXIT_STACK.enter_async_context(
-                load_modules(base_container, modules),
-            )
+            with STARTUP_PROFILER.measure("Module configuration"):
+                actual_container, module_initializers = await EXIT_STACK.enter_async_context(
+                    load_modules(base_container, modules),
+                )
         else:
             actual_container, module_initializers = base_container, []
             LOGGER.info("No external modules selected")
 
         if params.configure:
-            actual_container = await params.configure(actual_container.clone())
+            with STARTUP_PROFILER.measure("Configuration"):
+                actual_container = await params.configure(actual_container.clone())
 
         await initialize_container(
             actual_container,
@@ -938,23 +1247,39 @@ async def load_app(params: StartupParameters) -> AsyncIterator[tuple[ASGIApplica
 
         for module_name, initializer in module_initializers:
             LOGGER.info(f"Initializing module '{module_name}'")
-            await initializer(actual_container)
+
+            with STARTUP_PROFILER.measure(f"Module initialization: {module_name}"):
+                await initializer(actual_container)
 
         if params.initialize:
-            await params.initialize(actual_container)
+            with STARTUP_PROFILER.measure("Initialization"):
+                await params.initialize(actual_container)
 
-        await recover_server_tasks(
-            evaluation_store=actual_container[EvaluationStore],
-            evaluator=actual_container[BehavioralChangeEvaluator],
-        )
+        with STARTUP_PROFILER.measure("Task recovery"):
+            await recover_server_tasks(
+                evaluation_store=actual_container[EvaluationStore],
+                evaluator=actual_container[BehavioralChangeEvaluator],
+            )
+
+        if os.environ.get("PARLANT_SESSION_WORKER", "true").lower() not in ["false", "no", "0"]:
+            # Otherwise, this process only serves the API, and sessions are processed elsewhere
+            await actual_container[BackgroundTaskService].start(
+                actual_container[SessionWorker].run(), tag="session-worker"
+            )
 
         if not params.configure:
             # Running in non-SDK mode
             await create_agent_if_absent(actual_container[AgentStore])
 
+        with STARTUP_PROFILER.measure("API app"):
+            app = await create_api_app(actual_container, params.configure_api)
+
+        if STARTUP_PROFILER.enabled:
+            STARTUP_PROFILER.report()
+
         _print_startup_banner()
 
-        yield await create_api_app(actual_container, params.configure_api), actual_container
+        yield app, actual_container
 
 
 def _print_startup_banner() -> None:
@@ -1213,6 +1538,35 @@ def main() -> None:
             "Disable to exit if the database schema is not up-to-date."
         ),
     )
+    @click.option(
+        "--replay",
+        type=click.Path(exists=True, file_okay=False, path_type=Path),
+        metavar="DIRECTORY",
+        help=(
+            "Replay the generations recorded (with PARLANT_DATA_COLLECTION) in this directory "
+            "instead of calling an NLP service, e.g. for offline benchmarks"
+        ),
+    )
+    @click.option(
+        "--replay-latency",
+        type=str,
+        default="recorded",
+        metavar="DISTRIBUTION",
+        help=(
+            "How long replayed generations take: none, recorded, fixed:<s>, "
+            "uniform:<min>,<max>, normal:<mean>,<std> or lognormal:<mu>,<sigma>"
+        ),
+    )
+    @click.option(
+        "--replay-strict",
+        is_flag=True,
+        help="Fail generations whose prompt wasn't recorded, instead of replaying another one",
+    )
+    @click.option(
+        "--profile-startup",
+        is_flag=True,
+        help="Print how long importing and initializing each part of the server took",
+    )
     @click.pass_context
     def run(
         ctx: click.Context,
@@ -1232,6 +1586,10 @@ def main() -> None:
         module: tuple[str],
         version: bool,
         migrate: bool,
+        replay: Optional[Path],
+        replay_latency: str,
+        replay_strict: bool,
+        profile_startup: bool,
     ) -> None:
         if version:
             print(f"Parlant v{VERSION}")
@@ -1261,7 +1619,18 @@ def main() -> None:
             (aws, azure, deepseek, gemini, anthropic, cerebras, together, litellm, modelscope)
         )
 
-        if not non_default_service_selected:
+        nlp_service: NLPServiceName | Callable[[Container], Awaitable[NLPService]]
+
+        if replay:
+            from parlant.adapters.nlp.replay_service import SimulatedLatency
+
+            try:
+                SimulatedLatency.parse(replay_latency)
+            except ValueError as exc:
+                die(f"error: invalid --replay-latency: {exc}")
+
+            nlp_service = replay_loader(replay, replay_latency, replay_strict)
+        elif not non_default_service_selected:
             nlp_service = "openai"
             require_env_keys(["OPENAI_API_KEY"])
         elif aws:
@@ -1297,10 +1666,11 @@ def main() -> None:
         ctx.obj = StartupParameters(
             host=host,
             port=port,
-            nlp_service=cast(NLPServiceName, nlp_service),
+            nlp_service=nlp_service,
             log_level=log_level,
             modules=list(module),
             migrate=migrate,
+            profile_startup=profile_startup,
         )
 
         async def start() -> None:
@@ -122,6 +122,11 @@ class AgentStore(ABC):
         tag_id: TagId,
     ) -> None: ...
 
+    @abstractmethod
+    async def read_revision(self) -> int:
+        """Returns a number that changes whenever an agent or its tags change."""
+        ...
+
 
 class _AgentDocument(TypedDict, total=False):
     id: ObjectId
@@ -158,6 +163,7 @@ class AgentDocumentStore(AgentStore):
         self._allow_migration = allow_migration
 
         self._lock = ReaderWriterLock()
+        self._revision = 0
 
     async def _document_loader(self, doc: BaseDocument) -> Optional[_AgentDocument]:
         async def v0_1_0_to_v0_2_0(doc: BaseDocument) -> Optional[BaseDocument]:
@@ -244,6 +250,9 @@ class AgentDocumentStore(AgentStore):
                 document_loader=self._association_document_loader,
             )
 
+        await self._tag_association_collection.ensure_index(["agent_id"])
+        await self._tag_association_collection.ensure_index(["tag_id"])
+
         return self
 
     async def __aexit__(
@@ -335,6 +344,8 @@ class AgentDocumentStore(AgentStore):
                     }
                 )
 
+            self._revision += 1
+
         return agent
 
     @override
@@ -382,6 +393,8 @@ class AgentDocumentStore(AgentStore):
                 params=cast(_AgentDocument, to_json_dict(params)),
             )
 
+            self._revision += 1
+
         assert result.updated_document
 
         return await self._deserialize_agent(agent_document=result.updated_document)
@@ -403,6 +416,8 @@ class AgentDocumentStore(AgentStore):
                     filters={"id": {"$eq": doc["id"]}}
                 )
 
+            self._revision += 1
+
         if result.deleted_count == 0:
             raise ItemNotFoundError(item_id=UniqueId(agent_id))
 
@@ -433,6 +448,8 @@ class AgentDocumentStore(AgentStore):
 
             _ = await self._tag_association_collection.insert_one(document=association_document)
 
+            self._revision += 1
+
             agent_document = await self._agents_collection.find_one({"id": {"$eq": agent_id}})
 
         if not agent_document:
@@ -457,7 +474,13 @@ class AgentDocumentStore(AgentStore):
             if delete_result.deleted_count == 0:
                 raise ItemNotFoundError(item_id=UniqueId(tag_id))
 
+            self._revision += 1
+
             agent_document = await self._agents_collection.find_one({"id": {"$eq": agent_id}})
 
         if not agent_document:
             raise ItemNotFoundError(item_id=UniqueId(agent_id))
+
+    @override
+    async def read_revision(self) -> int:
+        return self._revision
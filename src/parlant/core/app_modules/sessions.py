@@ -1,11 +1,10 @@
 import asyncio
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Mapping, Sequence, Set
+from typing import Any, AsyncGenerator, Mapping, Sequence, Set
 
 from parlant.core.agents import AgentId, AgentStore
 from parlant.core.async_utils import Timeout
-from parlant.core.background_tasks import BackgroundTaskService
 from parlant.core.common import JSONSerializable
 from parlant.core.meter import Meter
 from parlant.core.persistence.common import Cursor, SortDirection
@@ -16,12 +15,14 @@ from parlant.core.engines.types import Context, Engine, UtteranceRequest
 from parlant.core.loggers import Logger
 from parlant.core.nlp.moderation import CustomerModerationContext, ModerationService
 from parlant.core.nlp.service import NLPService
+from parlant.core.session_work_queue import SessionWorkQueue
 from parlant.core.sessions import (
     AgentState,
     ConsumerId,
     Event,
     EventId,
     EventKind,
+    EventListing,
     EventSource,
     EventUpdateParams,
     MessageEventData,
@@ -31,8 +32,10 @@ from parlant.core.sessions import (
     SessionListener,
     SessionMode,
     SessionStatus,
+    SessionStatusChannel,
     SessionStore,
     StatusEventData,
+    TurnProfile,
 )
 from dataclasses import dataclass
 from typing_extensions import TypedDict
@@ -97,10 +100,11 @@ class SessionModule:
         session_store: SessionStore,
         customer_store: CustomerStore,
         session_listener: SessionListener,
+        status_channel: SessionStatusChannel,
         nlp_service: NLPService,
         engine: Engine,
         event_emitter_factory: EventEmitterFactory,
-        background_task_service: BackgroundTaskService,
+        work_queue: SessionWorkQueue,
     ):
         self._logger = logger
         self._meter = meter
@@ -110,11 +114,12 @@ class SessionModule:
         self._session_store = session_store
         self._customer_store = customer_store
         self._session_listener = session_listener
+        self._status_channel = status_channel
         self._nlp_service = nlp_service
 
         self._engine = engine
         self._event_emitter_factory = event_emitter_factory
-        self._background_task_service = background_task_service
+        self._work_queue = work_queue
 
         self._lock = asyncio.Lock()
 
@@ -366,26 +371,11 @@ class SessionModule:
         return event
 
     async def dispatch_processing_task(self, session: Session) -> str:
-        await self._background_task_service.restart(
-            self._process_session(session),
-            tag=f"process-session({session.id})",
-        )
+        trace_id = self._tracer.trace_id
 
-        return self._tracer.trace_id
+        await self._work_queue.enqueue(session.id, trace_id)
 
-    async def _process_session(self, session: Session) -> None:
-        event_emitter = await self._event_emitter_factory.create_event_emitter(
-            emitting_agent_id=session.agent_id,
-            session_id=session.id,
-        )
-
-        await self._engine.process(
-            Context(
-                session_id=session.id,
-                agent_id=session.agent_id,
-            ),
-            event_emitter=event_emitter,
-        )
+        return trace_id
 
     async def process(
         self,
@@ -397,14 +387,17 @@ class SessionModule:
 
         await self._session_listener.wait_for_events(
             session_id=session_id,
+            kinds=[EventKind.STATUS],
             trace_id=trace_id,
             timeout=Timeout(60),
         )
 
         event = next(
             iter(
-                await self._session_store.list_events(
+                await self.find_events(
                     session_id=session_id,
+                    min_offset=0,
+                    source=None,
                     trace_id=trace_id,
                     kinds=[EventKind.STATUS],
                 )
@@ -447,17 +440,60 @@ class SessionModule:
         source: EventSource | None,
         kinds: Sequence[EventKind],
         trace_id: str | None,
-    ) -> Sequence[Event]:
+        max_offset: int | None = None,
+        limit: int | None = None,
+        cursor: Cursor | None = None,
+        omit_tool_results: bool = False,
+    ) -> EventListing:
         events = await self._session_store.list_events(
             session_id=session_id,
             min_offset=min_offset,
             source=source,
             kinds=kinds,
             trace_id=trace_id,
+            max_offset=max_offset,
+            limit=limit,
+            cursor=cursor,
+            omit_tool_results=omit_tool_results,
         )
 
+        # The session's current status may not be stored,
+        # in which case it's listed among the stored events around it
+        if (
+            not events.has_more
+            and (status := self._status_channel.read_status(session_id))
+            and status.offset + 1 >= min_offset
+            and (max_offset is None or status.offset <= max_offset)
+            and (not kinds or EventKind.STATUS in kinds)
+            and (source is None or status.source == source)
+            and (trace_id is None or status.trace_id == trace_id)
+        ):
+            position = sum(1 for e in events.items if e.offset <= status.offset)
+
+            return EventListing(
+                items=[*events.items[:position], status, *events.items[position:]],
+                has_more=events.has_more,
+                next_cursor=events.next_cursor,
+            )
+
         return events
 
+    def stream_events(
+        self,
+        session_id: SessionId,
+        min_offset: int,
+        source: EventSource | None,
+        kinds: Sequence[EventKind],
+        trace_id: str | None,
+    ) -> AsyncGenerator[Event, None]:
+        return self._session_listener.stream_events(
+            session_id=session_id,
+            min_offset=min_offset,
+            source=source,
+            kinds=kinds,
+            trace_id=trace_id,
+        )
+
     async def delete_events(
         self,
         session_id: SessionId,
@@ -550,3 +586,19 @@ class SessionModule:
             event_id=event_id,
             params=store_params,
         )
+
+    async def read_turn_profile(
+        self,
+        session_id: SessionId,
+        trace_id: str,
+    ) -> TurnProfile:
+        return await self._session_store.read_turn_profile(
+            session_id=session_id,
+            trace_id=trace_id,
+        )
+
+    async def find_turn_profiles(
+        self,
+        session_id: SessionId,
+    ) -> Sequence[TurnProfile]:
+        return await self._session_store.list_turn_profiles(session_id=session_id)
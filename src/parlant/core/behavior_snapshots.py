@@ -0,0 +1,248 @@
+# Copyright 2025 Emcie Co Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+import asyncio
+from collections import defaultdict
+from dataclasses import dataclass
+from itertools import chain
+from typing import Awaitable, Callable, Generic, Optional, Protocol, Sequence, TypeVar
+
+from cachetools import LRUCache
+
+from parlant.core.agents import Agent, AgentId, AgentStore
+from parlant.core.canned_responses import CannedResponse, CannedResponseStore
+from parlant.core.common import ItemNotFoundError
+from parlant.core.context_variables import ContextVariable, ContextVariableStore
+from parlant.core.guideline_tool_associations import (
+    GuidelineToolAssociation,
+    GuidelineToolAssociationStore,
+)
+from parlant.core.guidelines import Guideline, GuidelineStore
+from parlant.core.journeys import Journey, JourneyStore
+from parlant.core.tags import Tag, TagId
+
+
+class _Tagged(Protocol):
+    @property
+    def tags(self) -> Sequence[TagId]: ...
+
+
+_TTagged = TypeVar("_TTagged", bound=_Tagged)
+
+
+class TagIndex(Generic[_TTagged]):
+    """An immutable in-memory index of tagged entities, by tag."""
+
+    def __init__(self, entities: Sequence[_TTagged]) -> None:
+        self.untagged: Sequence[_TTagged] = [e for e in entities if not e.tags]
+
+        self._by_tag: dict[TagId, list[_TTagged]] = defaultdict(list)
+
+        for entity in entities:
+            for tag in entity.tags:
+                self._by_tag[tag].append(entity)
+
+    def find(self, tags: Sequence[TagId]) -> Sequence[_TTagged]:
+        """Returns the entities that have any of the tags, without duplicates."""
+        return list(dict.fromkeys(chain.from_iterable(self._by_tag.get(t, []) for t in tags)))
+
+    def find_for_agent(self, agent: Agent) -> Sequence[_TTagged]:
+        """Returns the agent's entities: those tagged for it or with its tags, and global ones."""
+        return list(
+            dict.fromkeys(
+                chain(
+                    self.find([Tag.for_agent_id(agent.id), *agent.tags]),
+                    self.untagged,
+                )
+            )
+        )
+
+
+@dataclass(frozen=True)
+class _Revisions:
+    agent: int
+    guidelines: int
+    journeys: int
+    context_variables: int
+    canned_responses: int
+
+
+@dataclass(frozen=True)
+class BehaviorSnapshot:
+    """Everything that defines an agent's behavior, as of one revision of the stores.
+
+    Snapshots are never mutated. When the stores change, a new snapshot replaces the old one.
+    """
+
+    agent: Agent
+    guidelines: Sequence[Guideline]
+    journeys: Sequence[Journey]
+    context_variables: Sequence[ContextVariable]
+    canned_responses: Sequence[CannedResponse]
+    guideline_index: TagIndex[Guideline]
+    canned_response_index: TagIndex[CannedResponse]
+
+
+class BehaviorSnapshotProvider:
+    """Serves per-agent behavior snapshots from memory.
+
+    The stores' entities are indexed by tag once per store revision, and the
+    indexes are shared by all agents. A mutation only rebuilds the indexes of
+    the stores it touched, and the snapshots assembled from them. Snapshots are
+    kept for the `cached_agents` most recently read agents.
+
+    Store revisions only count the mutations made in this process. When other
+    processes mutate the same stores, pass `cached=False` to rebuild every snapshot.
+    """
+
+    def __init__(
+        self,
+        agent_store: AgentStore,
+        guideline_store: GuidelineStore,
+        journey_store: JourneyStore,
+        context_variable_store: ContextVariableStore,
+        canned_response_store: CannedResponseStore,
+        guideline_tool_association_store: GuidelineToolAssociationStore,
+        cached: bool = True,
+        cached_agents: int = 1000,
+    ) -> None:
+        self._agent_store = agent_store
+        self._guideline_store = guideline_store
+        self._journey_store = journey_store
+        self._context_variable_store = context_variable_store
+        self._canned_response_store = canned_response_store
+        self._guideline_tool_association_store = guideline_tool_association_store
+        self._cached = cached
+
+        self._guideline_index: Optional[tuple[int, TagIndex[Guideline]]] = None
+        self._journey_index: Optional[tuple[int, TagIndex[Journey]]] = None
+        self._context_variable_index: Optional[tuple[int, TagIndex[ContextVariable]]] = None
+        self._canned_response_index: Optional[tuple[int, TagIndex[CannedResponse]]] = None
+        self._tool_associations: Optional[tuple[int, Sequence[GuidelineToolAssociation]]] = None
+
+        self._snapshots: LRUCache[AgentId, tuple[_Revisions, BehaviorSnapshot]] = LRUCache(
+            maxsize=cached_agents
+        )
+        self._locks: LRUCache[AgentId, asyncio.Lock] = LRUCache(maxsize=cached_agents)
+
+    async def _read_revisions(self) -> _Revisions:
+        return _Revisions(
+            agent=await self._agent_store.read_revision(),
+            guidelines=await self._guideline_store.read_revision(),
+            journeys=await self._journey_store.read_revision(),
+            context_variables=await self._context_variable_store.read_revision(),
+            canned_responses=await self._canned_response_store.read_revision(),
+        )
+
+    async def read_snapshot(self, agent_id: AgentId) -> BehaviorSnapshot:
+        if not self._cached:
+            return await self._build_snapshot(agent_id, await self._read_revisions())
+
+        if (cached := self._snapshots.get(agent_id)) and cached[0] == await self._read_revisions():
+            return cached[1]
+
+        if (lock := self._locks.get(agent_id)) is None:
+            lock = self._locks[agent_id] = asyncio.Lock()
+
+        # Concurrent turns of the same agent wait for a single rebuild
+        async with lock:
+            # Read the revisions before loading, so that a change made while
+            # building the snapshot invalidates it
+            revisions = await self._read_revisions()
+
+            if (cached := self._snapshots.get(agent_id)) and cached[0] == revisions:
+                return cached[1]
+
+            try:
+                snapshot = await self._build_snapshot(agent_id, revisions)
+            except ItemNotFoundError:
+                # The agent was deleted, so nothing will read its snapshot again
+                self._snapshots.pop(agent_id, None)
+                self._locks.pop(agent_id, None)
+                raise
+
+            self._snapshots[agent_id] = (revisions, snapshot)
+
+        return snapshot
+
+    async def read_guideline_index(self) -> TagIndex[Guideline]:
+        """Returns all guidelines, across agents, indexed by tag."""
+        self._guideline_index = await self._refresh_index(
+            self._guideline_index,
+            await self._guideline_store.read_revision(),
+            lambda: self._guideline_store.list_guidelines(),
+        )
+
+        return self._guideline_index[1]
+
+    async def read_tool_associations(self) -> Sequence[GuidelineToolAssociation]:
+        revision = await self._guideline_tool_association_store.read_revision()
+
+        if self._cached and self._tool_associations and self._tool_associations[0] == revision:
+            return self._tool_associations[1]
+
+        associations = await self._guideline_tool_association_store.list_associations()
+
+        self._tool_associations = (revision, associations)
+
+        return associations
+
+    async def _build_snapshot(self, agent_id: AgentId, revisions: _Revisions) -> BehaviorSnapshot:
+        agent = await self._agent_store.read_agent(agent_id)
+
+        self._guideline_index = await self._refresh_index(
+            self._guideline_index,
+            revisions.guidelines,
+            lambda: self._guideline_store.list_guidelines(),
+        )
+        self._journey_index = await self._refresh_index(
+            self._journey_index,
+            revisions.journeys,
+            lambda: self._journey_store.list_journeys(),
+        )
+        self._context_variable_index = await self._refresh_index(
+            self._context_variable_index,
+            revisions.context_variables,
+            lambda: self._context_variable_store.list_variables(),
+        )
+        self._canned_response_index = await self._refresh_index(
+            self._canned_response_index,
+            revisions.canned_responses,
+            lambda: self._canned_response_store.list_canned_responses(),
+        )
+
+        guideline_index = self._guideline_index[1]
+        canned_response_index = self._canned_response_index[1]
+
+        return BehaviorSnapshot(
+            agent=agent,
+            guidelines=guideline_index.find_for_agent(agent),
+            journeys=self._journey_index[1].find_for_agent(agent),
+            context_variables=self._context_variable_index[1].find_for_agent(agent),
+            canned_responses=canned_response_index.find_for_agent(agent),
+            guideline_index=guideline_index,
+            canned_response_index=canned_response_index,
+        )
+
+    async def _refresh_index(
+        self,
+        cached: Optional[tuple[int, TagIndex[_TTagged]]],
+        revision: int,
+        load: Callable[[], Awaitable[Sequence[_TTagged]]],
+    ) -> tuple[int, TagIndex[_TTagged]]:
+        if self._cached and cached and cached[0] == revision:
+            return cached
+
+        return revision, TagIndex(await load())
@@ -16,7 +16,6 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from itertools import chain
 import json
 from typing import Any, Awaitable, Callable, Mapping, NewType, Optional, Sequence, cast
 import jinja2
@@ -171,6 +170,11 @@ class CannedResponseStore(ABC):
         tag_id: TagId,
     ) -> None: ...
 
+    @abstractmethod
+    async def read_revision(self) -> int:
+        """Returns a number that changes whenever any canned response or its tags change."""
+        ...
+
 
 class _CannedResponseFieldDocument(TypedDict):
     name: str
@@ -275,6 +279,7 @@ class CannedResponseVectorStore(CannedResponseStore):
         ]
         self._allow_migration = allow_migration
         self._lock = ReaderWriterLock()
+        self._revision = 0
         self._embedder_factory = embedder_factory
         self._embedder_type_provider = embedder_type_provider
         self._embedder: Embedder
@@ -422,6 +427,9 @@ class CannedResponseVectorStore(CannedResponseStore):
                 document_loader=self._association_document_loader,
             )
 
+        await self._canrep_tag_association_collection.ensure_index(["canned_response_id"])
+        await self._canrep_tag_association_collection.ensure_index(["tag_id"])
+
         return self
 
     async def __aexit__(
@@ -546,6 +554,8 @@ class CannedResponseVectorStore(CannedResponseStore):
                     }
                 )
 
+            self._revision += 1
+
         return canrep
 
     def _validate_template(self, template: str) -> None:
@@ -611,6 +621,8 @@ class CannedResponseVectorStore(CannedResponseStore):
 
             doc = await self._insert_canned_response(canrep)
 
+            self._revision += 1
+
         return await self._deserialize_canned_response(doc)
 
     async def list_canned_responses(
@@ -677,6 +689,8 @@ class CannedResponseVectorStore(CannedResponseStore):
 
             await async_utils.safe_gather(*tasks)
 
+            self._revision += 1
+
     @override
     async def upsert_tag(
         self,
@@ -706,6 +720,8 @@ class CannedResponseVectorStore(CannedResponseStore):
                 document=association_document
             )
 
+            self._revision += 1
+
         return True
 
     @override
@@ -725,6 +741,12 @@ class CannedResponseVectorStore(CannedResponseStore):
             if delete_result.deleted_count == 0:
                 raise ItemNotFoundError(item_id=UniqueId(tag_id))
 
+            self._revision += 1
+
+    @override
+    async def read_revision(self) -> int:
+        return self._revision
+
     @override
     async def filter_relevant_canned_responses(
         self,
@@ -741,21 +763,16 @@ class CannedResponseVectorStore(CannedResponseStore):
                 "canned_response_id": {"$in": [str(c.id) for c in available_canned_responses]}
             }
 
-            tasks = [
-                self._canreps_vector_collection.find_similar_documents(
-                    filters=filters,
-                    query=q,
-                    k=calculate_min_vectors_for_max_item_count(
-                        items=available_canned_responses,
-                        count_item_vectors=lambda c: len(self._list_canned_response_contents(c)),
-                        max_items_to_return=max_count,
-                    ),
-                    hints={"tag": "canned_responses"},
-                )
-                for q in queries
-            ]
-
-        all_sdocs = chain.from_iterable(await async_utils.safe_gather(*tasks))
+            all_sdocs = await self._canreps_vector_collection.find_similar_documents_for_queries(
+                filters=filters,
+                queries=queries,
+                k=calculate_min_vectors_for_max_item_count(
+                    items=available_canned_responses,
+                    count_item_vectors=lambda c: len(self._list_canned_response_contents(c)),
+                    max_items_to_return=max_count,
+                ),
+                hints={"tag": "canned_responses"},
+            )
 
         unique_sdocs: dict[str, SimilarDocumentResult[CannedResponseVectorDocument]] = {}
 
@@ -15,7 +15,6 @@
 from abc import abstractmethod
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from itertools import chain
 from typing import Awaitable, Callable, NewType, Optional, Sequence, TypedDict, cast
 from typing_extensions import override, Self, Required
 
@@ -242,6 +241,9 @@ class CapabilityVectorStore(CapabilityStore):
                 document_loader=self._association_document_loader,
             )
 
+        await self._tag_association_collection.ensure_index(["capability_id"])
+        await self._tag_association_collection.ensure_index(["tag_id"])
+
         return self
 
     async def __aexit__(
@@ -481,21 +483,16 @@ class CapabilityVectorStore(CapabilityStore):
             queries = await query_chunks(query, self._embedder)
             filters: Where = {"capability_id": {"$in": [str(c.id) for c in available_capabilities]}}
 
-            tasks = [
-                self._vector_collection.find_similar_documents(
-                    filters=filters,
-                    query=q,
-                    k=calculate_min_vectors_for_max_item_count(
-                        items=available_capabilities,
-                        count_item_vectors=lambda c: len(self._list_capability_contents(c)),
-                        max_items_to_return=max_count,
-                    ),
-                    hints={"tag": "capabilities"},
-                )
-                for q in queries
-            ]
-
-        all_sdocs = chain.from_iterable(await async_utils.safe_gather(*tasks))
+            all_sdocs = await self._vector_collection.find_similar_documents_for_queries(
+                filters=filters,
+                queries=queries,
+                k=calculate_min_vectors_for_max_item_count(
+                    items=available_capabilities,
+                    count_item_vectors=lambda c: len(self._list_capability_contents(c)),
+                    max_items_to_return=max_count,
+                ),
+                hints={"tag": "capabilities"},
+            )
 
         unique_sdocs: dict[str, SimilarDocumentResult[CapabilityVectorDocument]] = {}
 
@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 from abc import ABC, abstractmethod
+from itertools import count
 from typing import NewType, Optional, Sequence, cast
 from typing_extensions import TypedDict, override, Self
 from datetime import datetime, timezone
@@ -74,6 +75,9 @@ class ContextVariableUpdateParams(TypedDict, total=False):
     freshness_rules: Optional[str]
 
 
+_untracked_revisions = count()
+
+
 class ContextVariableStore(ABC):
     GLOBAL_KEY = "DEFAULT"
 
@@ -156,6 +160,14 @@ class ContextVariableStore(ABC):
         tag_id: TagId,
     ) -> ContextVariable: ...
 
+    async def read_revision(self) -> int:
+        """Returns a number that changes whenever any variable or its tags change.
+
+        Values don't affect the revision. Stores that don't track revisions
+        report a new one on every call, so their variables are never cached.
+        """
+        return next(_untracked_revisions)
+
 
 class ContextVariableDocument_v0_1_0(TypedDict, total=False):
     id: ObjectId
@@ -244,6 +256,7 @@ class ContextVariableDocumentStore(ContextVariableStore):
         self._allow_migration = allow_migration
 
         self._lock = ReaderWriterLock()
+        self._revision = 0
 
     async def _variable_document_loader(
         self, doc: BaseDocument
@@ -367,6 +380,11 @@ class ContextVariableDocumentStore(ContextVariableStore):
                 schema=_ContextVariableValueDocument,
                 document_loader=self._value_document_loader,
             )
+
+        await self._variable_tag_association_collection.ensure_index(["variable_id"])
+        await self._variable_tag_association_collection.ensure_index(["tag_id"])
+        await self._value_collection.ensure_index(["variable_id", "key"])
+
         return self
 
     async def __aexit__(
@@ -485,6 +503,8 @@ class ContextVariableDocumentStore(ContextVariableStore):
                     }
                 )
 
+            self._revision += 1
+
         return context_variable
 
     @override
@@ -529,6 +549,8 @@ class ContextVariableDocumentStore(ContextVariableStore):
                 params=cast(_ContextVariableDocument, update_params),
             )
 
+            self._revision += 1
+
         assert result.updated_document
 
         return await self._deserialize_context_variable(
@@ -565,6 +587,8 @@ class ContextVariableDocumentStore(ContextVariableStore):
             for k, _ in await self.list_values(variable_id=variable_id):
                 await self.delete_value(variable_id=variable_id, key=k)
 
+            self._revision += 1
+
     @override
     async def list_variables(
         self,
@@ -732,6 +756,8 @@ class ContextVariableDocumentStore(ContextVariableStore):
                 document=association_document
             )
 
+            self._revision += 1
+
             variable_document = await self._variable_collection.find_one(
                 {"id": {"$eq": variable_id}}
             )
@@ -758,6 +784,8 @@ class ContextVariableDocumentStore(ContextVariableStore):
             if delete_result.deleted_count == 0:
                 raise ItemNotFoundError(item_id=UniqueId(tag_id))
 
+            self._revision += 1
+
             variable_document = await self._variable_collection.find_one(
                 {"id": {"$eq": variable_id}}
             )
@@ -766,3 +794,7 @@ class ContextVariableDocumentStore(ContextVariableStore):
             raise ItemNotFoundError(item_id=UniqueId(variable_id))
 
         return await self._deserialize_context_variable(context_variable_document=variable_document)
+
+    @override
+    async def read_revision(self) -> int:
+        return self._revision
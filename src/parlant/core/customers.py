@@ -207,6 +207,9 @@ class CustomerDocumentStore(CustomerStore):
                 document_loader=self._association_document_loader,
             )
 
+        await self._tag_association_collection.ensure_index(["customer_id"])
+        await self._tag_association_collection.ensure_index(["tag_id"])
+
         return self
 
     async def __aexit__(
@@ -33,6 +33,7 @@ from parlant.core.sessions import (
     EventUpdateParams,
     MessageEventData,
     SessionId,
+    SessionStatusChannel,
     SessionStore,
     StatusEventData,
     ToolEventData,
@@ -72,10 +73,12 @@ class EventPublisher(EventEmitter):
         emitting_agent: Agent,
         session_store: SessionStore,
         session_id: SessionId,
+        status_channel: SessionStatusChannel | None = None,
     ) -> None:
         self.agent = emitting_agent
         self._store = session_store
         self._session_id = session_id
+        self._status_channel = status_channel
 
     @override
     async def emit_status_event(
@@ -95,7 +98,16 @@ class EventPublisher(EventEmitter):
             metadata=metadata,
         )
 
-        await self._publish_event(event)
+        if self._status_channel and data:
+            await self._status_channel.publish(
+                session_id=self._session_id,
+                source=EventSource.AI_AGENT,
+                trace_id=trace_id,
+                data=data,
+                metadata=metadata or {},
+            )
+        else:
+            await self._publish_event(event)
 
         return event
 
@@ -205,9 +217,11 @@ class EventPublisherFactory(EventEmitterFactory):
         self,
         agent_store: AgentStore,
         session_store: SessionStore,
+        status_channel: SessionStatusChannel,
     ) -> None:
         self._agent_store = agent_store
         self._session_store = session_store
+        self._status_channel = status_channel
 
     @override
     async def create_event_emitter(
@@ -216,4 +230,4 @@ class EventPublisherFactory(EventEmitterFactory):
         session_id: SessionId,
     ) -> EventEmitter:
         agent = await self._agent_store.read_agent(emitting_agent_id)
-        return EventPublisher(agent, self._session_store, session_id)
+        return EventPublisher(agent, self._session_store, session_id, self._status_channel)
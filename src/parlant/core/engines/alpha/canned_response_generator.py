@@ -440,7 +440,9 @@ Example return value: ###
         result = await self._generator.generate(builder)
 
         self._logger.trace(
-            f"Canned response GenerativeFieldExtraction Completion:\n{result.content.model_dump_json(indent=2)}"
+            lambda: (
+                f"Canned response GenerativeFieldExtraction Completion:\n{result.content.model_dump_json(indent=2)}"
+            )
         )
 
         return result.content.field_value
@@ -774,7 +776,9 @@ You will now be given the current state of the interaction to which you must gen
         )
 
         self._logger.trace(
-            f"Canned Response Preamble Completion:\n{canrep.content.model_dump_json(indent=2)}"
+            lambda: (
+                f"Canned Response Preamble Completion:\n{canrep.content.model_dump_json(indent=2)}"
+            )
         )
 
         if composition_mode == CompositionMode.CANNED_STRICT:
@@ -1710,7 +1714,9 @@ Output a JSON object with three properties:
             )
 
         self._logger.trace(
-            f"Canned Response Draft Completion:\n{draft_response.content.model_dump_json(indent=2)}"
+            lambda: (
+                f"Canned Response Draft Completion:\n{draft_response.content.model_dump_json(indent=2)}"
+            )
         )
 
         draft_message = draft_response.content.response_body
@@ -1831,7 +1837,9 @@ Output a JSON object with three properties:
             )
 
         self._logger.trace(
-            f"Canned Response Selection Completion:\n{selection_response.content.model_dump_json(indent=2)}"
+            lambda: (
+                f"Canned Response Selection Completion:\n{selection_response.content.model_dump_json(indent=2)}"
+            )
         )
 
         # Step 5: Respond based on the match quality
@@ -2039,7 +2047,9 @@ Respond with a JSON object {{ "revised_canned_response": "<message_with_points_s
             hints={"temperature": 1},
         )
 
-        self._logger.trace(f"Composition Completion:\n{result.content.model_dump_json(indent=2)}")
+        self._logger.trace(
+            lambda: f"Composition Completion:\n{result.content.model_dump_json(indent=2)}"
+        )
 
         return result.info, result.content.revised_canned_response
 
@@ -2274,7 +2284,9 @@ Output a JSON object with three properties:
             )
 
             self._logger.trace(
-                f"Follow-up Canned Response Draft Completion:\n{response.content.model_dump_json(indent=2)}"
+                lambda: (
+                    f"Follow-up Canned Response Draft Completion:\n{response.content.model_dump_json(indent=2)}"
+                )
             )
 
             if (
@@ -0,0 +1,183 @@
+# Copyright 2025 Emcie Co Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from datetime import datetime, timezone
+from typing import Optional
+
+from croniter import croniter
+
+from parlant.core.agents import AgentId
+from parlant.core.background_tasks import BackgroundTaskService
+from parlant.core.context_variables import ContextVariable, ContextVariableId, ContextVariableValue
+from parlant.core.entity_cq import EntityCommands, EntityQueries
+from parlant.core.loggers import Logger
+from parlant.core.sessions import Session
+from parlant.core.tools import ToolContext
+
+
+def _expiry(variable: ContextVariable, value: ContextVariableValue) -> Optional[datetime]:
+    if not variable.freshness_rules:
+        return None
+
+    return croniter(variable.freshness_rules, value.last_modified).get_next(datetime)
+
+
+async def refresh_context_variable_value(
+    entity_queries: EntityQueries,
+    entity_commands: EntityCommands,
+    agent_id: AgentId,
+    session: Session,
+    variable: ContextVariable,
+    key: str,
+) -> ContextVariableValue:
+    """Stores a new value for the key, as returned by the variable's tool."""
+    assert variable.tool_id
+
+    tool_context = ToolContext(
+        agent_id=agent_id,
+        session_id=session.id,
+        customer_id=session.customer_id,
+    )
+
+    tool_service = await entity_queries.read_tool_service(variable.tool_id.service_name)
+
+    tool_result = await tool_service.call_tool(
+        variable.tool_id.tool_name,
+        context=tool_context,
+        arguments={},
+    )
+
+    return await entity_commands.update_context_variable_value(
+        variable_id=variable.id,
+        key=key,
+        data=tool_result.data,
+    )
+
+
+class ContextVariableLoader:
+    """Loads context variable values for the engine, refreshing stale ones with their tools.
+
+    Concurrent turns that find the same value stale share a single call to its tool.
+
+    With `refresh_in_background`, a value that a turn found fresh is also refreshed
+    when it expires, so that the next turns find it fresh again instead of waiting for
+    the tool. Only values that were used since their last refresh are refreshed again.
+    """
+
+    def __init__(
+        self,
+        logger: Logger,
+        entity_queries: EntityQueries,
+        entity_commands: EntityCommands,
+        background_task_service: BackgroundTaskService,
+        refresh_in_background: bool = False,
+    ) -> None:
+        self._logger = logger
+        self._entity_queries = entity_queries
+        self._entity_commands = entity_commands
+        self._background_task_service = background_task_service
+        self._refresh_in_background = refresh_in_background
+
+        self._refreshes: dict[
+            tuple[ContextVariableId, str], asyncio.Task[ContextVariableValue]
+        ] = {}
+        self._scheduled_refreshes: set[tuple[ContextVariableId, str]] = set()
+
+    async def load(
+        self,
+        agent_id: AgentId,
+        session: Session,
+        variable: ContextVariable,
+        key: str,
+        current_time: Optional[datetime] = None,
+    ) -> Optional[ContextVariableValue]:
+        value = await self._entity_queries.read_context_variable_value(
+            variable_id=variable.id,
+            key=key,
+        )
+
+        # Without a tool there's nothing to refresh the value with.
+        # Note that it may be None here, which is okay.
+        if not variable.tool_id:
+            return value
+
+        if value and (expiry := _expiry(variable, value)):
+            if expiry > (current_time or datetime.now(timezone.utc)):
+                if self._refresh_in_background:
+                    await self._schedule_refresh(agent_id, session, variable, key, expiry)
+
+                return value
+
+        return await self._refresh(agent_id, session, variable, key)
+
+    async def _refresh(
+        self,
+        agent_id: AgentId,
+        session: Session,
+        variable: ContextVariable,
+        key: str,
+    ) -> ContextVariableValue:
+        refresh_key = (variable.id, key)
+
+        if not (task := self._refreshes.get(refresh_key)):
+            task = asyncio.create_task(
+                refresh_context_variable_value(
+                    self._entity_queries,
+                    self._entity_commands,
+                    agent_id,
+                    session,
+                    variable,
+                    key,
+                )
+            )
+
+            self._refreshes[refresh_key] = task
+            task.add_done_callback(lambda _: self._refreshes.pop(refresh_key, None))
+
+        # A turn that gets cancelled mustn't cancel the refresh for the others waiting on it
+        return await asyncio.shield(task)
+
+    async def _schedule_refresh(
+        self,
+        agent_id: AgentId,
+        session: Session,
+        variable: ContextVariable,
+        key: str,
+        expiry: datetime,
+    ) -> None:
+        refresh_key = (variable.id, key)
+
+        if refresh_key in self._scheduled_refreshes:
+            return
+
+        self._scheduled_refreshes.add(refresh_key)
+
+        async def refresh_on_expiry() -> None:
+            try:
+                await asyncio.sleep((expiry - datetime.now(timezone.utc)).total_seconds())
+                await self._refresh(agent_id, session, variable, key)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                self._logger.warning(
+                    f"Failed to refresh context variable '{variable.name}' ({key}) in the background: {exc}"
+                )
+            finally:
+                self._scheduled_refreshes.discard(refresh_key)
+
+        await self._background_task_service.start(
+            refresh_on_expiry(),
+            tag=f"refresh-context-variable({variable.id}, {key})",
+        )
@@ -24,11 +24,10 @@ import json
 from pprint import pformat
 import traceback
 from typing import Awaitable, Callable, Optional, Sequence, cast
-from croniter import croniter
 from typing_extensions import override
 
 from parlant.core import async_utils
-from parlant.core.agents import Agent, AgentId, CompositionMode
+from parlant.core.agents import Agent, CompositionMode
 from parlant.core.capabilities import Capability
 from parlant.core.common import Criticality, JSONSerializable
 from parlant.core.context_variables import (
@@ -37,6 +36,7 @@ from parlant.core.context_variables import (
     ContextVariableStore,
 )
 from parlant.core.emission.event_buffer import EventBuffer
+from parlant.core.engines.alpha.context_variable_loader import ContextVariableLoader
 from parlant.core.engines.alpha.engine_context import (
     Interaction,
     IterationState,
@@ -94,10 +94,11 @@ from parlant.core.engines.alpha.tool_event_generator import (
 from parlant.core.engines.alpha.utils import context_variables_to_json
 from parlant.core.engines.types import Context, Engine, UtteranceRationale, UtteranceRequest
 from parlant.core.emissions import EventEmitter, EmittedEvent
+from parlant.core.profiling import TurnProfiler, TurnProfileRecording
 from parlant.core.tracer import Tracer
 from parlant.core.loggers import Logger
 from parlant.core.entity_cq import EntityQueries, EntityCommands
-from parlant.core.tools import ToolContext, ToolId
+from parlant.core.tools import ToolId
 
 
 _PREPARATION_ITERATION_SPAN_NAME = "preparation_iteration_{iteration_number}"
@@ -146,7 +147,9 @@ class AlphaEngine(Engine):
         fluid_message_generator: MessageGenerator,
         canned_response_generator: CannedResponseGenerator,
         perceived_performance_policy_provider: PerceivedPerformancePolicyProvider,
+        context_variable_loader: ContextVariableLoader,
         hooks: EngineHooks,
+        turn_profiler: TurnProfiler,
     ) -> None:
         self._logger = logger
         self._tracer = tracer
@@ -161,8 +164,10 @@ class AlphaEngine(Engine):
         self._fluid_message_generator = fluid_message_generator
         self._canned_response_generator = canned_response_generator
         self._perceived_performance_policy_provider = perceived_performance_policy_provider
+        self._context_variable_loader = context_variable_loader
 
         self._hooks = hooks
+        self._turn_profiler = turn_profiler
 
         self._hist_engine_process_duration = self._meter.create_duration_histogram(
             name="eng.process",
@@ -181,14 +186,32 @@ class AlphaEngine(Engine):
     ) -> bool:
         """Processes a context and emits new events as needed"""
 
+        with self._turn_profiler.profile("turn", context.session_id) as profile:
+            processed = await self._process(context, event_emitter, profile)
+
+        if profile:
+            await self._save_turn_profile(profile)
+
+        return processed
+
+    async def _process(
+        self,
+        context: Context,
+        event_emitter: EventEmitter,
+        profile: TurnProfileRecording | None,
+    ) -> bool:
         # Load the full relevant information from storage.
-        loaded_context = await self._load_context(context, event_emitter)
+        with self._turn_profiler.span("load_context"):
+            loaded_context = await self._load_context(context, event_emitter)
 
         if loaded_context.session.mode == "manual":
             return True
 
         try:
             with self._tracer.span("process", {"session_id": context.session_id}):
+                if profile:
+                    profile.trace_id = self._tracer.trace_id
+
                 async with self._hist_engine_process_duration.measure():
                     await self._do_process(loaded_context)
             return True
@@ -216,18 +239,37 @@ class AlphaEngine(Engine):
     ) -> bool:
         """Produces a new message into a session, guided by specific utterance requests"""
 
+        with self._turn_profiler.profile("turn", context.session_id) as profile:
+            uttered = await self._utter(context, event_emitter, requests, profile)
+
+        if profile:
+            await self._save_turn_profile(profile)
+
+        return uttered
+
+    async def _utter(
+        self,
+        context: Context,
+        event_emitter: EventEmitter,
+        requests: Sequence[UtteranceRequest],
+        profile: TurnProfileRecording | None,
+    ) -> bool:
         # Load the full relevant information from storage.
-        loaded_context = await self._load_context(
-            context,
-            event_emitter,
-            load_interaction=True,
-        )
+        with self._turn_profiler.span("load_context"):
+            loaded_context = await self._load_context(
+                context,
+                event_emitter,
+                load_interaction=True,
+            )
 
         try:
             async with self._hist_engine_utter_duration.measure(
                 {"session_id": context.session_id},
             ):
                 with self._tracer.span("utter", {"session_id": context.session_id}):
+                    if profile:
+                        profile.trace_id = self._tracer.trace_id
+
                     await self._do_utter(loaded_context, requests)
             return True
 
@@ -252,6 +294,12 @@ class AlphaEngine(Engine):
             )
             raise
 
+    async def _save_turn_profile(self, profile: TurnProfileRecording) -> None:
+        try:
+            await self._entity_commands.create_turn_profile(profile.result)
+        except Exception as exc:
+            self._logger.warning(f"Failed to save turn profile: {exc}")
+
     async def _load_interaction_state(self, context: Context) -> Interaction:
         history = await self._entity_queries.find_events(context.session_id)
 
@@ -1877,9 +1925,7 @@ class AlphaEngine(Engine):
         variable: ContextVariable,
         key: str,
     ) -> Optional[ContextVariableValue]:
-        return await load_fresh_context_variable_value(
-            entity_queries=self._entity_queries,
-            entity_commands=self._entity_commands,
+        return await self._context_variable_loader.load(
             agent_id=context.agent.id,
             session=context.session,
             variable=variable,
@@ -2044,58 +2090,3 @@ class AlphaEngine(Engine):
             journey_paths[journey_id] = [None]
 
         return journey_paths
-
-
-# This is module-level and public for isolated testability purposes.
-async def load_fresh_context_variable_value(
-    entity_queries: EntityQueries,
-    entity_commands: EntityCommands,
-    agent_id: AgentId,
-    session: Session,
-    variable: ContextVariable,
-    key: str,
-    current_time: datetime = datetime.now(timezone.utc),
-) -> Optional[ContextVariableValue]:
-    # Load the existing value
-    value = await entity_queries.read_context_variable_value(
-        variable_id=variable.id,
-        key=key,
-    )
-
-    # If there's no tool attached to this variable,
-    # return the value we found for the key.
-    # Note that this may be None here, which is okay.
-    if not variable.tool_id:
-        return value
-
-    # So we do have a tool attached.
-    # Do we already have a value, and is it sufficiently fresh?
-    if value and variable.freshness_rules:
-        cron_iterator = croniter(variable.freshness_rules, value.last_modified)
-
-        if cron_iterator.get_next(datetime) > current_time:
-            # We already have a fresh value in store. Return it.
-            return value
-
-    # We don't have a sufficiently fresh value.
-    # Get an updated one, utilizing the associated tool.
-
-    tool_context = ToolContext(
-        agent_id=agent_id,
-        session_id=session.id,
-        customer_id=session.customer_id,
-    )
-
-    tool_service = await entity_queries.read_tool_service(variable.tool_id.service_name)
-
-    tool_result = await tool_service.call_tool(
-        variable.tool_id.tool_name,
-        context=tool_context,
-        arguments={},
-    )
-
-    return await entity_commands.update_context_variable_value(
-        variable_id=variable.id,
-        key=key,
-        data=tool_result.data,
-    )
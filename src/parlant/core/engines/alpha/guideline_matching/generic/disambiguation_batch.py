@@ -168,7 +168,7 @@ class GenericDisambiguationGuidelineMatchingBatch(GuidelineMatchingBatch):
                     )
 
                     self._logger.trace(
-                        f"Completion:\n{inference.content.model_dump_json(indent=2)}"
+                        lambda: f"Completion:\n{inference.content.model_dump_json(indent=2)}"
                     )
 
                     metadata: dict[str, JSONSerializable] = {}
@@ -189,7 +189,9 @@ class GenericDisambiguationGuidelineMatchingBatch(GuidelineMatchingBatch):
                         metadata["disambiguation"] = disambiguation_data
 
                         self._logger.debug(
-                            f"Disambiguation activated: {inference.content.model_dump_json(indent=2)}"
+                            lambda: (
+                                f"Disambiguation activated: {inference.content.model_dump_json(indent=2)}"
+                            )
                         )
 
                     matches = [
@@ -121,14 +121,16 @@ class GenericPreviouslyAppliedActionableGuidelineMatchingBatch(GuidelineMatching
                         )
                     else:
                         self._logger.trace(
-                            f"Completion:\n{inference.content.model_dump_json(indent=2)}"
+                            lambda: f"Completion:\n{inference.content.model_dump_json(indent=2)}"
                         )
 
                     matches = []
 
                     for match in inference.content.checks:
                         if match.should_reapply:
-                            self._logger.debug(f"Activated:\n{match.model_dump_json(indent=2)}")
+                            self._logger.debug(
+                                lambda: f"Activated:\n{match.model_dump_json(indent=2)}"
+                            )
 
                             matches.append(
                                 GuidelineMatch(
@@ -138,7 +140,9 @@ class GenericPreviouslyAppliedActionableGuidelineMatchingBatch(GuidelineMatching
                                 )
                             )
                         else:
-                            self._logger.debug(f"Skipped:\n{match.model_dump_json(indent=2)}")
+                            self._logger.debug(
+                                lambda: f"Skipped:\n{match.model_dump_json(indent=2)}"
+                            )
 
                     return GuidelineMatchingBatchResult(
                         matches=matches,
@@ -128,14 +128,16 @@ class GenericPreviouslyAppliedActionableCustomerDependentGuidelineMatchingBatch(
                         )
                     else:
                         self._logger.trace(
-                            f"Completion:\n{inference.content.model_dump_json(indent=2)}"
+                            lambda: f"Completion:\n{inference.content.model_dump_json(indent=2)}"
                         )
 
                     matches = []
 
                     for match in inference.content.checks:
                         if match.should_apply:
-                            self._logger.debug(f"Activated:\n{match.model_dump_json(indent=2)}")
+                            self._logger.debug(
+                                lambda: f"Activated:\n{match.model_dump_json(indent=2)}"
+                            )
 
                             matches.append(
                                 GuidelineMatch(
@@ -145,7 +147,9 @@ class GenericPreviouslyAppliedActionableCustomerDependentGuidelineMatchingBatch(
                                 )
                             )
                         else:
-                            self._logger.debug(f"Skipped:\n{match.model_dump_json(indent=2)}")
+                            self._logger.debug(
+                                lambda: f"Skipped:\n{match.model_dump_json(indent=2)}"
+                            )
 
                     return GuidelineMatchingBatchResult(
                         matches=matches,
@@ -329,7 +329,9 @@ class JourneyBacktrackCheck:
                     hints={"temperature": generation_attempt_temperatures[generation_attempt]},
                 )
 
-                self._logger.trace(f"Completion:\n{inference.content.model_dump_json(indent=2)}")
+                self._logger.trace(
+                    lambda: f"Completion:\n{inference.content.model_dump_json(indent=2)}"
+                )
 
                 if not inference.content.requires_backtracking:
                     return BacktrackCheckResult(
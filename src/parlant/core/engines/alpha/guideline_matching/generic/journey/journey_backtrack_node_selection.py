@@ -450,7 +450,9 @@ class JourneyBacktrackNodeSelection:
                     prompt=prompt,
                     hints={"temperature": generation_attempt_temperatures[generation_attempt]},
                 )
-                self._logger.trace(f"Completion:\n{inference.content.model_dump_json(indent=2)}")
+                self._logger.trace(
+                    lambda: f"Completion:\n{inference.content.model_dump_json(indent=2)}"
+                )
 
                 journey_path = self._get_verified_node_advancement(inference.content)
 
@@ -250,7 +250,9 @@ class JourneyNextStepSelection:
                         "temperature": generation_attempt_temperatures[generation_attempt],
                     },
                 )
-                self._logger.trace(f"Completion:\n{inference.content.model_dump_json(indent=2)}")
+                self._logger.trace(
+                    lambda: f"Completion:\n{inference.content.model_dump_json(indent=2)}"
+                )
 
                 if inference.content.applied_condition_id:
                     if inference.content.applied_condition_id == "None":
@@ -181,7 +181,9 @@ class GenericResponseAnalysisBatch(ResponseAnalysisBatch):
 
                     for check in inference.content.checks:
                         if check.guideline_applied:
-                            self._logger.debug(f"Applied:\n{check.model_dump_json(indent=2)}")
+                            self._logger.debug(
+                                lambda: f"Applied:\n{check.model_dump_json(indent=2)}"
+                            )
                             analyzed_guidelines.append(
                                 AnalyzedGuideline(
                                     guideline=guidelines[check.guideline_id],
@@ -189,7 +191,9 @@ class GenericResponseAnalysisBatch(ResponseAnalysisBatch):
                                 )
                             )
                         else:
-                            self._logger.debug(f"Not applied:\n{check.model_dump_json(indent=2)}")
+                            self._logger.debug(
+                                lambda: f"Not applied:\n{check.model_dump_json(indent=2)}"
+                            )
                             analyzed_guidelines.append(
                                 AnalyzedGuideline(
                                     guideline=guidelines[GuidelineId(check.guideline_id)],
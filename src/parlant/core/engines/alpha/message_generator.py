@@ -736,7 +736,7 @@ Produce a valid JSON object in the following format: ###
         )
 
         self._logger.trace(
-            f"Completion:\n{message_event_response.content.model_dump_json(indent=2)}"
+            lambda: f"Completion:\n{message_event_response.content.model_dump_json(indent=2)}"
         )
 
         if (
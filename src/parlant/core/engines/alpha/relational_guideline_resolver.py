@@ -14,32 +14,74 @@
 
 from collections import defaultdict
 from itertools import chain
-from typing import Optional, Sequence, cast
+from typing import Iterable, Optional, Sequence, cast
 
+from parlant.core.async_utils import safe_gather
+from parlant.core.behavior_snapshots import BehaviorSnapshotProvider
 from parlant.core.common import JSONSerializable
 from parlant.core.journeys import Journey, JourneyId
 from parlant.core.loggers import Logger
 from parlant.core.engines.alpha.guideline_matching.guideline_match import GuidelineMatch
 from parlant.core.relationships import (
+    Relationship,
+    RelationshipEntityId,
     RelationshipEntityKind,
     RelationshipKind,
     RelationshipStore,
 )
-from parlant.core.guidelines import Guideline, GuidelineId, GuidelineStore
+from parlant.core.guidelines import Guideline, GuidelineId
 from parlant.core.tags import TagId, Tag
 from parlant.core.tracer import Tracer
 
 
+class _IndirectRelationships:
+    """Looks up each entity's indirect relationships of one kind at most once per resolution."""
+
+    def __init__(
+        self,
+        relationship_store: RelationshipStore,
+        kind: RelationshipKind,
+        by_target: bool,
+    ) -> None:
+        self._relationship_store = relationship_store
+        self._kind = kind
+        self._by_target = by_target
+        self._cache: dict[RelationshipEntityId, Sequence[Relationship]] = {}
+
+    async def prefetch(self, entity_ids: Iterable[RelationshipEntityId]) -> None:
+        missing = list(dict.fromkeys(id for id in entity_ids if id not in self._cache))
+
+        for entity_id, relationships in zip(
+            missing,
+            await safe_gather(*(self._list(entity_id) for entity_id in missing)),
+        ):
+            self._cache[entity_id] = relationships
+
+    async def read(self, entity_id: RelationshipEntityId) -> list[Relationship]:
+        if entity_id not in self._cache:
+            self._cache[entity_id] = await self._list(entity_id)
+
+        return list(self._cache[entity_id])
+
+    async def _list(self, entity_id: RelationshipEntityId) -> Sequence[Relationship]:
+        return await self._relationship_store.list_relationships(
+            kind=self._kind,
+            indirect=True,
+            target_id=entity_id if self._by_target else None,
+            source_id=None if self._by_target else entity_id,
+        )
+
+
 class RelationalGuidelineResolver:
     def __init__(
         self,
         relationship_store: RelationshipStore,
-        guideline_store: GuidelineStore,
+        behavior_snapshots: BehaviorSnapshotProvider,
         logger: Logger,
         tracer: Tracer,
     ) -> None:
         self._relationship_store = relationship_store
-        self._guideline_store = guideline_store
+        self._behavior_snapshots = behavior_snapshots
         self._logger = logger
         self._tracer = tracer
 
@@ -62,6 +104,16 @@ class RelationalGuidelineResolver:
 
         return None
 
+    def _journey_tags_by_guideline(
+        self,
+        matches: Sequence[GuidelineMatch],
+    ) -> dict[GuidelineId, TagId]:
+        return {
+            m.guideline.id: Tag.for_journey_id(journey_id)
+            for m in matches
+            if (journey_id := self._extract_journey_id_from_guideline(m.guideline))
+        }
+
     async def resolve(
         self,
         usable_guidelines: Sequence[Guideline],
@@ -103,28 +155,30 @@ class RelationalGuidelineResolver:
         # Such priority relationships are stored in RelationshipStore,
         # and those are the ones we are loading here.
         match_guideline_ids = {m.guideline.id for m in matches}
+        active_journey_ids = {journey.id for journey in journeys}
+
+        # Load the relationships of the whole match set up front. Those of guidelines
+        # reached through tags are loaded as they're reached, once per resolution.
+        prioritizing = _IndirectRelationships(
+            self._relationship_store,
+            RelationshipKind.PRIORITY,
+            by_target=True,
+        )
+        journey_tags = self._journey_tags_by_guideline(matches)
+
+        await prioritizing.prefetch(chain(match_guideline_ids, journey_tags.values()))
+
+        guideline_index = await self._behavior_snapshots.read_guideline_index()
 
         iterated_guidelines: set[GuidelineId] = set()
 
         result = []
 
         for match in matches:
-            priority_relationships = list(
-                await self._relationship_store.list_relationships(
-                    kind=RelationshipKind.PRIORITY,
-                    indirect=True,
-                    target_id=match.guideline.id,
-                )
-            )
+            priority_relationships = await prioritizing.read(match.guideline.id)
 
-            if journey_id := self._extract_journey_id_from_guideline(match.guideline):
-                priority_relationships.extend(
-                    await self._relationship_store.list_relationships(
-                        kind=RelationshipKind.PRIORITY,
-                        indirect=True,
-                        target_id=Tag.for_journey_id(journey_id),
-                    )
-                )
+            if journey_tag := journey_tags.get(match.guideline.id):
+                priority_relationships.extend(await prioritizing.read(journey_tag))
 
             if not priority_relationships:
                 result.append(match)
@@ -155,10 +209,8 @@ class RelationalGuidelineResolver:
                     # We then need to check if any of those guidelines have a priority relationship
                     #
                     # If not, we need to iterate over all those guidelines and add their priority relationships
-                    guideline_associated_with_prioritized_tag = (
-                        await self._guideline_store.list_guidelines(
-                            tags=[cast(TagId, prioritized_entity.id)]
-                        )
+                    guideline_associated_with_prioritized_tag = guideline_index.find(
+                        [cast(TagId, prioritized_entity.id)]
                     )
 
                     if prioritized_guideline_id := next(
@@ -178,13 +230,7 @@ class RelationalGuidelineResolver:
                         if g.id in iterated_guidelines or g.id in match_guideline_ids:
                             continue
 
-                        priority_relationships.extend(
-                            await self._relationship_store.list_relationships(
-                                kind=RelationshipKind.PRIORITY,
-                                indirect=True,
-                                target_id=g.id,
-                            )
-                        )
+                        priority_relationships.extend(await prioritizing.read(g.id))
 
                     iterated_guidelines.update(
                         g.id
@@ -193,7 +239,7 @@ class RelationalGuidelineResolver:
                     )
 
                     if journey_id := Tag.extract_journey_id(cast(TagId, prioritized_entity.id)):
-                        if any(journey.id == journey_id for journey in journeys):
+                        if journey_id in active_journey_ids:
                             deprioritized = True
                             prioritized_journey_id = journey_id
                             break
@@ -251,60 +297,57 @@ class RelationalGuidelineResolver:
         related_guidelines_by_match = defaultdict[GuidelineMatch, set[Guideline]](set)
 
         match_guideline_ids = {m.guideline.id for m in matches}
+        usable_guidelines_by_id = {g.id: g for g in usable_guidelines}
+
+        entailed = _IndirectRelationships(
+            self._relationship_store,
+            RelationshipKind.ENTAILMENT,
+            by_target=False,
+        )
+
+        await entailed.prefetch(match_guideline_ids)
+
+        guideline_index = await self._behavior_snapshots.read_guideline_index()
 
         for match in matches:
-            relationships = list(
-                await self._relationship_store.list_relationships(
-                    kind=RelationshipKind.ENTAILMENT,
-                    indirect=True,
-                    source_id=match.guideline.id,
-                )
-            )
+            relationships = await entailed.read(match.guideline.id)
+            expanded_guidelines: set[GuidelineId] = set()
 
             while relationships:
                 relationship = relationships.pop()
 
                 if relationship.target.kind == RelationshipEntityKind.GUIDELINE:
-                    if any(relationship.target.id == m.guideline.id for m in matches):
+                    if relationship.target.id in match_guideline_ids:
                         # no need to add this related guideline as it's already an assumed match
                         continue
                     related_guidelines_by_match[match].add(
-                        next(g for g in usable_guidelines if g.id == relationship.target.id)
+                        usable_guidelines_by_id[cast(GuidelineId, relationship.target.id)]
                     )
 
                 elif relationship.target.kind == RelationshipEntityKind.TAG:
                     # In case target is a tag, we need to find all guidelines
                     # that are associated with this tag.
-                    guidelines_associated_to_tag = await self._guideline_store.list_guidelines(
-                        tags=[cast(TagId, relationship.target.id)]
+                    guidelines_associated_to_tag = guideline_index.find(
+                        [cast(TagId, relationship.target.id)]
                     )
 
                     related_guidelines_by_match[match].update(
                         g for g in guidelines_associated_to_tag if g.id not in match_guideline_ids
                     )
 
-                    # Add all the relationships for the related guidelines to the stack
+                    # Add all the relationships for the related guidelines to the stack,
+                    # once per guideline, as their relationships would add nothing new
                     for g in guidelines_associated_to_tag:
-                        relationships.extend(
-                            await self._relationship_store.list_relationships(
-                                kind=RelationshipKind.ENTAILMENT,
-                                indirect=True,
-                                source_id=g.id,
-                            )
-                        )
+                        if g.id not in expanded_guidelines:
+                            expanded_guidelines.add(g.id)
+                            relationships.extend(await entailed.read(g.id))
 
-        match_and_inferred_guideline_pairs: list[tuple[GuidelineMatch, Guideline]] = []
+        # Each inferred guideline is associated with the highest-scoring match that entails it
+        match_by_inferred_guideline: dict[Guideline, GuidelineMatch] = {}
 
         for match, related_guidelines in related_guidelines_by_match.items():
             for related_guideline in related_guidelines:
-                if existing_related_guidelines := [
-                    (match, inferred_guideline)
-                    for match, inferred_guideline in match_and_inferred_guideline_pairs
-                    if inferred_guideline == related_guideline
-                ]:
-                    assert len(existing_related_guidelines) == 1
-                    existing_related_guideline = existing_related_guidelines[0]
-
+                if existing_match := match_by_inferred_guideline.get(related_guideline):
                     # We're basically saying, if this related guideline is already
                     # related to a match with a higher priority than the match
                     # at hand, then we want to keep the associated with the match
@@ -312,19 +355,15 @@ class RelationalGuidelineResolver:
                     # priority of our related guideline's match...
                     #
                     # Now try to read that out loud in one go :)
-                    if existing_related_guideline[0].score >= match.score:
+                    if existing_match.score >= match.score:
                         continue  # Stay with existing one
                     else:
                         # This match's score is higher, so it's better that
                         # we associate the related guideline with this one.
                         # we'll add it soon, but meanwhile let's remove the old one.
-                        match_and_inferred_guideline_pairs.remove(
-                            existing_related_guideline,
-                        )
+                        del match_by_inferred_guideline[related_guideline]
 
-                match_and_inferred_guideline_pairs.append(
-                    (match, related_guideline),
-                )
+                match_by_inferred_guideline[related_guideline] = match
 
         entailed_matches = [
             GuidelineMatch(
@@ -332,7 +371,7 @@ class RelationalGuidelineResolver:
                 score=match.score,
                 rationale="Automatically inferred from context",
             )
-            for match, inferred_guideline in match_and_inferred_guideline_pairs
+            for inferred_guideline, match in match_by_inferred_guideline.items()
         ]
 
         for m in entailed_matches:
@@ -360,26 +399,26 @@ class RelationalGuidelineResolver:
         # For example, if we matched guidelines "When X, Then Y" (S) and "When Y, Then Z" (T),
         # and S is depends on T, then S should not be activated unless T is activated.
         matched_guideline_ids = {m.guideline.id for m in matches}
+        active_journey_ids = {journey.id for journey in journeys}
+
+        depended_on = _IndirectRelationships(
+            self._relationship_store,
+            RelationshipKind.DEPENDENCY,
+            by_target=False,
+        )
+        journey_tags = self._journey_tags_by_guideline(matches)
+
+        await depended_on.prefetch(chain(matched_guideline_ids, journey_tags.values()))
+
+        guideline_index = await self._behavior_snapshots.read_guideline_index()
 
         result: list[GuidelineMatch] = []
 
         for match in matches:
-            dependencies = list(
-                await self._relationship_store.list_relationships(
-                    kind=RelationshipKind.DEPENDENCY,
-                    indirect=True,
-                    source_id=match.guideline.id,
-                )
-            )
+            dependencies = await depended_on.read(match.guideline.id)
 
-            if journey_id := self._extract_journey_id_from_guideline(match.guideline):
-                dependencies.extend(
-                    await self._relationship_store.list_relationships(
-                        kind=RelationshipKind.DEPENDENCY,
-                        indirect=True,
-                        source_id=Tag.for_journey_id(journey_id),
-                    )
-                )
+            if journey_tag := journey_tags.get(match.guideline.id):
+                dependencies.extend(await depended_on.read(journey_tag))
 
             if not dependencies:
                 result.append(match)
@@ -401,7 +440,7 @@ class RelationalGuidelineResolver:
 
                 if dependency.target.kind == RelationshipEntityKind.TAG:
                     if journey_id := Tag.extract_journey_id(cast(TagId, dependency.target.id)):
-                        if any(journey.id == journey_id for journey in journeys):
+                        if journey_id in active_journey_ids:
                             # If the tag is a journey tag and the journey is active,
                             # then this dependency is met.
                             continue
@@ -409,8 +448,8 @@ class RelationalGuidelineResolver:
                             dependent_on_inactive_guidelines = True
                             break
 
-                    guidelines_associated_to_tag = await self._guideline_store.list_guidelines(
-                        tags=[cast(TagId, dependency.target.id)]
+                    guidelines_associated_to_tag = guideline_index.find(
+                        [cast(TagId, dependency.target.id)]
                     )
 
                     for g in guidelines_associated_to_tag:
@@ -419,13 +458,7 @@ class RelationalGuidelineResolver:
                             break
 
                         if g.id not in iterated_guidelines:
-                            dependencies.extend(
-                                await self._relationship_store.list_relationships(
-                                    kind=RelationshipKind.DEPENDENCY,
-                                    indirect=True,
-                                    source_id=g.id,
-                                )
-                            )
+                            dependencies.extend(await depended_on.read(g.id))
 
                     iterated_guidelines.update(g.id for g in guidelines_associated_to_tag)
 
@@ -290,7 +290,9 @@ class OverlappingToolsBatch(ToolCallBatch):
                             if evaluation.parameter_name in tool.required
                         ):
                             self._logger.debug(
-                                f"Inference::Completion::Activated: {tool_id.to_string()}\n{tc.model_dump_json(indent=2)}"
+                                lambda: (
+                                    f"Inference::Completion::Activated: {tool_id.to_string()}\n{tc.model_dump_json(indent=2)}"
+                                )
                             )
 
                             arguments = {}
@@ -344,7 +346,9 @@ class OverlappingToolsBatch(ToolCallBatch):
 
                     else:
                         self._logger.debug(
-                            f"Inference::Completion::Skipped: {tool_id.to_string()}\n{tc.model_dump_json(indent=2)}"
+                            lambda: (
+                                f"Inference::Completion::Skipped: {tool_id.to_string()}\n{tc.model_dump_json(indent=2)}"
+                            )
                         )
 
         return tool_calls, evaluations, missing_data, invalid_data
@@ -721,7 +725,9 @@ Guidelines:
             hints={"temperature": temperature},
         )
 
-        self._logger.trace(f"Inference::Completion:\n{inference.content.model_dump_json(indent=2)}")
+        self._logger.trace(
+            lambda: f"Inference::Completion:\n{inference.content.model_dump_json(indent=2)}"
+        )
 
         return inference.info, inference.content.tools_evaluation
 
@@ -431,7 +431,9 @@ class SingleToolBatch(ToolCallBatch):
 
                     if all_values_valid:
                         self._logger.debug(
-                            f"Inference::Completion::Activated: {tool_id.to_string()}:\n{tc.model_dump_json(indent=2)}"
+                            lambda: (
+                                f"Inference::Completion::Activated: {tool_id.to_string()}:\n{tc.model_dump_json(indent=2)}"
+                            )
                         )
 
                         tool_calls.append(
@@ -507,12 +509,16 @@ class SingleToolBatch(ToolCallBatch):
                         evaluations.append((tool_id, ToolCallEvaluation.CANNOT_RUN))
 
                     self._logger.debug(
-                        f"Inference::Completion::Rejected: Missing arguments for {tool_id.to_string()}\n{tc.model_dump_json(indent=2)}"
+                        lambda: (
+                            f"Inference::Completion::Rejected: Missing arguments for {tool_id.to_string()}\n{tc.model_dump_json(indent=2)}"
+                        )
                     )
 
             else:
                 self._logger.debug(
-                    f"Inference::Completion::Skipped: {tool_id.to_string()}\n{tc.model_dump_json(indent=2)}"
+                    lambda: (
+                        f"Inference::Completion::Skipped: {tool_id.to_string()}\n{tc.model_dump_json(indent=2)}"
+                    )
                 )
 
                 evaluations.append((tool_id, ToolCallEvaluation.DATA_ALREADY_IN_CONTEXT))
@@ -965,7 +971,9 @@ Guidelines:
             hints={"temperature": temperature},
         )
         self._logger.trace(
-            f"Inference::Completion: {tool_id.to_string()}\n{inference.content.model_dump_json(indent=2)}"
+            lambda: (
+                f"Inference::Completion: {tool_id.to_string()}\n{inference.content.model_dump_json(indent=2)}"
+            )
         )
 
         return inference.info, inference.content.tool_calls_for_candidate_tool
@@ -1209,7 +1217,9 @@ OUTPUT FORMAT:
             hints={"temperature": temperature},
         )
         self._logger.trace(
-            f"Inference::Completion: {tool_id.to_string()}\n{inference.content.model_dump_json(indent=2)}"
+            lambda: (
+                f"Inference::Completion: {tool_id.to_string()}\n{inference.content.model_dump_json(indent=2)}"
+            )
         )
 
         return inference.info, inference.content.calls
@@ -1253,13 +1263,17 @@ OUTPUT FORMAT:
                     )
 
                     self._logger.debug(
-                        f"Inference::Completion::Activated: {tool_id.to_string()}:\n{tc.model_dump_json(indent=2)}"
+                        lambda: (
+                            f"Inference::Completion::Activated: {tool_id.to_string()}:\n{tc.model_dump_json(indent=2)}"
+                        )
                     )
 
                     evaluations.append((tool_id, ToolCallEvaluation.NEEDS_TO_RUN))
                 else:
                     self._logger.debug(
-                        f"Inference::Completion::Rejected: Missing arguments for {tool_id.to_string()}\n{tc.model_dump_json(indent=2)}"
+                        lambda: (
+                            f"Inference::Completion::Rejected: Missing arguments for {tool_id.to_string()}\n{tc.model_dump_json(indent=2)}"
+                        )
                     )
 
                     for parameter_name in missing_required:
@@ -1287,7 +1301,9 @@ OUTPUT FORMAT:
                     evaluations.append((tool_id, ToolCallEvaluation.CANNOT_RUN))
             else:
                 self._logger.debug(
-                    f"Inference::Completion::Skipped: {tool_id.to_string()}\n{tc.model_dump_json(indent=2)}"
+                    lambda: (
+                        f"Inference::Completion::Skipped: {tool_id.to_string()}\n{tc.model_dump_json(indent=2)}"
+                    )
                 )
 
                 evaluations.append((tool_id, ToolCallEvaluation.DATA_ALREADY_IN_CONTEXT))
@@ -256,8 +256,14 @@ class ToolCaller:
     ) -> ToolCallResult:
         try:
             self._logger.trace(
-                f"Execution::Invocation: ({tool_call.tool_id.to_string()}/{tool_call.id})"
-                + (f"\n{json.dumps(tool_call.arguments, indent=2)}" if tool_call.arguments else "")
+                lambda: (
+                    f"Execution::Invocation: ({tool_call.tool_id.to_string()}/{tool_call.id})"
+                    + (
+                        f"\n{json.dumps(tool_call.arguments, indent=2)}"
+                        if tool_call.arguments
+                        else ""
+                    )
+                )
             )
 
             try:
@@ -270,7 +276,9 @@ class ToolCaller:
                 )
 
                 self._logger.debug(
-                    f"Execution::Result: Tool call succeeded ({tool_call.tool_id.to_string()}/{tool_call.id})\n{json.dumps(asdict(result), indent=2, default=str)}"
+                    lambda: (
+                        f"Execution::Result: Tool call succeeded ({tool_call.tool_id.to_string()}/{tool_call.id})\n{json.dumps(asdict(result), indent=2, default=str)}"
+                    )
                 )
             except Exception as exc:
                 self._logger.error(
@@ -19,6 +19,7 @@ from cachetools import TTLCache
 
 from parlant.core import async_utils
 from parlant.core.agents import Agent, AgentId, AgentStore
+from parlant.core.behavior_snapshots import BehaviorSnapshotProvider
 from parlant.core.capabilities import Capability, CapabilityStore
 from parlant.core.common import JSONSerializable
 from parlant.core.context_variables import (
@@ -55,9 +56,10 @@ from parlant.core.sessions import (
     Session,
     SessionStore,
     Event,
+    TurnProfile,
 )
 from parlant.core.services.tools.service_registry import ServiceRegistry
-from parlant.core.tags import Tag
+from parlant.core.tags import Tag, TagId
 from parlant.core.tools import ToolId, ToolService
 from parlant.core.canned_responses import CannedResponse, CannedResponseStore
 
@@ -78,6 +80,7 @@ class EntityQueries:
         canned_response_store: CannedResponseStore,
         capability_store: CapabilityStore,
         journey_guideline_projection: JourneyGuidelineProjection,
+        behavior_snapshots: BehaviorSnapshotProvider,
     ) -> None:
         self._agent_store = agent_store
         self._session_store = session_store
@@ -92,6 +95,7 @@ class EntityQueries:
         self._service_registry = service_registry
         self._canned_response_store = canned_response_store
         self._journey_guideline_projection = journey_guideline_projection
+        self._behavior_snapshots = behavior_snapshots
 
         self.find_journeys_on_which_this_guideline_depends = TTLCache[GuidelineId, list[Journey]](
             maxsize=1024, ttl=120
@@ -101,7 +105,7 @@ class EntityQueries:
         self,
         agent_id: AgentId,
     ) -> Agent:
-        return await self._agent_store.read_agent(agent_id)
+        return (await self._behavior_snapshots.read_snapshot(agent_id)).agent
 
     async def read_session(
         self,
@@ -120,18 +124,10 @@ class EntityQueries:
         agent_id: AgentId,
         journeys: Sequence[Journey],
     ) -> Sequence[Guideline]:
-        agent_guidelines = await self._guideline_store.list_guidelines(
-            tags=[Tag.for_agent_id(agent_id)],
-        )
-        global_guidelines = await self._guideline_store.list_guidelines(tags=[])
+        snapshot = await self._behavior_snapshots.read_snapshot(agent_id)
 
-        agent = await self._agent_store.read_agent(agent_id)
-        guidelines_for_agent_tags = await self._guideline_store.list_guidelines(
-            tags=[tag for tag in agent.tags]
-        )
-
-        guidelines_for_journeys = await self._guideline_store.list_guidelines(
-            tags=[Tag.for_journey_id(journey.id) for journey in journeys]
+        guidelines_for_journeys = snapshot.guideline_index.find(
+            [Tag.for_journey_id(journey.id) for journey in journeys]
         )
 
         tasks = [
@@ -143,9 +139,7 @@ class EntityQueries:
 
         all_guidelines = set(
             chain(
-                agent_guidelines,
-                global_guidelines,
-                guidelines_for_agent_tags,
+                snapshot.guidelines,
                 guidelines_for_journeys,
                 *projected_journey_guidelines,
             )
@@ -210,23 +204,9 @@ class EntityQueries:
         self,
         agent_id: AgentId,
     ) -> Sequence[ContextVariable]:
-        agent_context_variables = await self._context_variable_store.list_variables(
-            tags=[Tag.for_agent_id(agent_id)],
-        )
-        global_context_variables = await self._context_variable_store.list_variables(tags=[])
-        agent = await self._agent_store.read_agent(agent_id)
-        context_variables_for_agent_tags = await self._context_variable_store.list_variables(
-            tags=[tag for tag in agent.tags]
-        )
+        snapshot = await self._behavior_snapshots.read_snapshot(agent_id)
 
-        all_context_variables = set(
-            chain(
-                agent_context_variables,
-                global_context_variables,
-                context_variables_for_agent_tags,
-            )
-        )
-        return list(all_context_variables)
+        return list(snapshot.context_variables)
 
     async def read_context_variable_value(
         self,
@@ -244,7 +224,7 @@ class EntityQueries:
     async def find_guideline_tool_associations(
         self,
     ) -> Sequence[GuidelineToolAssociation]:
-        return await self._guideline_tool_association_store.list_associations()
+        return await self._behavior_snapshots.read_tool_associations()
 
     async def find_journey_node_tool_associations(
         self,
@@ -262,7 +242,7 @@ class EntityQueries:
             tags=[Tag.for_agent_id(agent_id)],
         )
         global_capabilities = await self._capability_store.list_capabilities(tags=[])
-        agent = await self._agent_store.read_agent(agent_id)
+        agent = await self.read_agent(agent_id)
         capabilities_for_agent_tags = await self._capability_store.list_capabilities(
             tags=[tag for tag in agent.tags]
         )
@@ -292,7 +272,7 @@ class EntityQueries:
             tags=[Tag.for_agent_id(agent_id)],
         )
         global_terms = await self._glossary_store.list_terms(tags=[])
-        agent = await self._agent_store.read_agent(agent_id)
+        agent = await self.read_agent(agent_id)
         glossary_for_agent_tags = await self._glossary_store.list_terms(
             tags=[tag for tag in agent.tags]
         )
@@ -311,19 +291,9 @@ class EntityQueries:
         self,
         agent_id: AgentId,
     ) -> Sequence[Journey]:
-        agent_journeys = await self._journey_store.list_journeys(
-            tags=[Tag.for_agent_id(agent_id)],
-        )
-        global_journeys = await self._journey_store.list_journeys(tags=[])
-
-        agent = await self._agent_store.read_agent(agent_id)
-        journeys_for_agent_tags = (
-            await self._journey_store.list_journeys(tags=[tag for tag in agent.tags])
-            if agent.tags
-            else []
-        )
+        snapshot = await self._behavior_snapshots.read_snapshot(agent_id)
 
-        return list(set(chain(agent_journeys, global_journeys, journeys_for_agent_tags)))
+        return list(snapshot.journeys)
 
     async def sort_journeys_by_contextual_relevance(
         self,
@@ -342,26 +312,19 @@ class EntityQueries:
         journeys: Sequence[Journey],
         guidelines: Sequence[Guideline],
     ) -> Sequence[CannedResponse]:
-        agent_canreps = await self._canned_response_store.list_canned_responses(
-            tags=[Tag.for_agent_id(agent.id)],
-        )
-        global_canreps = await self._canned_response_store.list_canned_responses(tags=[])
+        snapshot = await self._behavior_snapshots.read_snapshot(agent.id)
 
-        canreps_for_agent_tags = await self._canned_response_store.list_canned_responses(
-            tags=[tag for tag in agent.tags]
+        journey_canreps = snapshot.canned_response_index.find(
+            [Tag.for_journey_id(journey.id) for journey in journeys]
         )
 
-        journey_canreps = await self._canned_response_store.list_canned_responses(
-            tags=[Tag.for_journey_id(journey.id) for journey in journeys]
+        guideline_canreps = snapshot.canned_response_index.find(
+            self._canned_response_tags_for_guidelines(guidelines)
         )
 
-        guideline_canreps = await self.find_canned_responses_for_guidelines(guidelines)
-
         all_canreps = set(
             chain(
-                agent_canreps,
-                global_canreps,
-                canreps_for_agent_tags,
+                snapshot.canned_responses,
                 journey_canreps,
                 guideline_canreps,
             )
@@ -373,6 +336,14 @@ class EntityQueries:
         self,
         guidelines: Sequence[Guideline],
     ) -> Sequence[CannedResponse]:
+        return await self._canned_response_store.list_canned_responses(
+            tags=self._canned_response_tags_for_guidelines(guidelines)
+        )
+
+    def _canned_response_tags_for_guidelines(
+        self,
+        guidelines: Sequence[Guideline],
+    ) -> list[TagId]:
         tags = []
 
         for g in guidelines:
@@ -384,7 +355,7 @@ class EntityQueries:
             else:
                 tags.append(Tag.for_guideline_id(g.id))
 
-        return await self._canned_response_store.list_canned_responses(tags=tags)
+        return tags
 
     async def find_guidelines_that_need_reevaluation(
         self,
@@ -503,6 +474,12 @@ class EntityCommands:
     ) -> None:
         await self._session_store.update_session(session_id, params)
 
+    async def create_turn_profile(
+        self,
+        profile: TurnProfile,
+    ) -> None:
+        await self._session_store.create_turn_profile(profile)
+
     async def update_context_variable_value(
         self,
         variable_id: ContextVariableId,
@@ -626,6 +626,9 @@ class EvaluationDocumentStore(EvaluationStore):
                 document_loader=self.tag_association_document_loader,
             )
 
+        await self._tag_association_collection.ensure_index(["evaluation_id"])
+        await self._tag_association_collection.ensure_index(["tag_id"])
+
         return self
 
     async def __aexit__(
@@ -15,11 +15,9 @@
 from abc import abstractmethod
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from itertools import chain
 from typing import Awaitable, Callable, NewType, Optional, Sequence, TypedDict, cast
 from typing_extensions import override, Self, Required
 
-from parlant.core import async_utils
 from parlant.core.async_utils import ReaderWriterLock
 from parlant.core.common import ItemNotFoundError, Version, IdGenerator, UniqueId, md5_checksum
 from parlant.core.persistence.common import ObjectId, Where
@@ -237,6 +235,9 @@ class GlossaryVectorStore(GlossaryStore):
                 document_loader=self._association_document_loader,
             )
 
+        await self._association_collection.ensure_index(["term_id"])
+        await self._association_collection.ensure_index(["tag_id"])
+
         return self
 
     async def __aexit__(
@@ -468,16 +469,12 @@ class GlossaryVectorStore(GlossaryStore):
 
             filters: Where = {"id": {"$in": [str(t.id) for t in available_terms]}}
 
-            tasks = [
-                self._collection.find_similar_documents(
-                    filters=filters, query=q, k=max_terms, hints={"tag": "glossary_terms"}
-                )
-                for q in queries
-            ]
-
-        all_results = chain.from_iterable(await async_utils.safe_gather(*tasks))
-        unique_results = list(set(all_results))
-        top_results = sorted(unique_results, key=lambda r: r.distance)[:max_terms]
+            top_results = await self._collection.find_similar_documents_for_queries(
+                filters=filters,
+                queries=queries,
+                k=max_terms,
+                hints={"tag": "glossary_terms"},
+            )
 
         return [await self._deserialize(r.document) for r in top_results]
 
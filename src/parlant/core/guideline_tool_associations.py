@@ -68,6 +68,11 @@ class GuidelineToolAssociationStore(ABC):
     @abstractmethod
     async def list_associations(self) -> Sequence[GuidelineToolAssociation]: ...
 
+    @abstractmethod
+    async def read_revision(self) -> int:
+        """Returns a number that changes whenever an association is created or deleted."""
+        ...
+
 
 class _GuidelineToolAssociationDocument(TypedDict, total=False):
     id: ObjectId
@@ -93,6 +98,7 @@ class GuidelineToolAssociationDocumentStore(GuidelineToolAssociationStore):
 
         self._allow_migration = allow_migration
         self._lock = ReaderWriterLock()
+        self._revision = 0
 
     async def _document_loader(
         self,
@@ -168,6 +174,8 @@ class GuidelineToolAssociationDocumentStore(GuidelineToolAssociationStore):
 
             await self._collection.insert_one(document=self._serialize(association))
 
+            self._revision += 1
+
         return association
 
     @override
@@ -190,6 +198,8 @@ class GuidelineToolAssociationDocumentStore(GuidelineToolAssociationStore):
         async with self._lock.writer_lock:
             result = await self._collection.delete_one(filters={"id": {"$eq": association_id}})
 
+            self._revision += 1
+
         if not result.deleted_document:
             raise ItemNotFoundError(item_id=UniqueId(association_id))
 
@@ -197,3 +207,7 @@ class GuidelineToolAssociationDocumentStore(GuidelineToolAssociationStore):
     async def list_associations(self) -> Sequence[GuidelineToolAssociation]:
         async with self._lock.reader_lock:
             return [self._deserialize(d) for d in await self._collection.find(filters={})]
+
+    @override
+    async def read_revision(self) -> int:
+        return self._revision
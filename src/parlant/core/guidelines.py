@@ -166,6 +166,11 @@ class GuidelineStore(ABC):
         key: str,
     ) -> Guideline: ...
 
+    @abstractmethod
+    async def read_revision(self) -> int:
+        """Returns a number that changes whenever any guideline or its tags change."""
+        ...
+
 
 class GuidelineDocument_v0_1_0(TypedDict, total=False):
     id: ObjectId
@@ -280,6 +285,7 @@ class GuidelineDocumentStore(GuidelineStore):
 
         self._allow_migration = allow_migration
         self._lock = ReaderWriterLock()
+        self._revision = 0
 
     async def _document_loader(self, doc: BaseDocument) -> Optional[GuidelineDocument]:
         async def v0_6_0_to_v0_7_0(doc: BaseDocument) -> Optional[BaseDocument]:
@@ -399,6 +405,9 @@ class GuidelineDocumentStore(GuidelineStore):
                 document_loader=self._association_document_loader,
             )
 
+        await self._tag_association_collection.ensure_index(["guideline_id"])
+        await self._tag_association_collection.ensure_index(["tag_id"])
+
         return self
 
     async def __aexit__(
@@ -521,6 +530,8 @@ class GuidelineDocumentStore(GuidelineStore):
                     }
                 )
 
+            self._revision += 1
+
         return guideline
 
     @override
@@ -596,6 +607,8 @@ class GuidelineDocumentStore(GuidelineStore):
                     filters={"id": {"$eq": doc["id"]}}
                 )
 
+            self._revision += 1
+
         if not result.deleted_document:
             raise ItemNotFoundError(item_id=UniqueId(guideline_id))
 
@@ -637,6 +650,8 @@ class GuidelineDocumentStore(GuidelineStore):
                 params=guideline_document,
             )
 
+            self._revision += 1
+
         assert result.updated_document
 
         return await self._deserialize(guideline_document=result.updated_document)
@@ -692,6 +707,8 @@ class GuidelineDocumentStore(GuidelineStore):
 
             _ = await self._tag_association_collection.insert_one(document=association_document)
 
+            self._revision += 1
+
             guideline_document = await self._collection.find_one({"id": {"$eq": guideline_id}})
 
         if not guideline_document:
@@ -716,6 +733,8 @@ class GuidelineDocumentStore(GuidelineStore):
             if delete_result.deleted_count == 0:
                 raise ItemNotFoundError(item_id=UniqueId(tag_id))
 
+            self._revision += 1
+
             guideline_document = await self._collection.find_one({"id": {"$eq": guideline_id}})
 
         if not guideline_document:
@@ -743,6 +762,8 @@ class GuidelineDocumentStore(GuidelineStore):
                 },
             )
 
+            self._revision += 1
+
         assert result.updated_document
 
         return await self._deserialize(guideline_document=result.updated_document)
@@ -768,6 +789,12 @@ class GuidelineDocumentStore(GuidelineStore):
                 },
             )
 
+            self._revision += 1
+
         assert result.updated_document
 
         return await self._deserialize(guideline_document=result.updated_document)
+
+    @override
+    async def read_revision(self) -> int:
+        return self._revision
@@ -1,7 +1,10 @@
 from collections import defaultdict, deque
 from datetime import datetime, timezone
 from typing import Sequence, cast
-from parlant.core.common import Criticality, JSONSerializable
+
+from cachetools import LRUCache
+
+from parlant.core.common import Criticality, ItemNotFoundError, JSONSerializable
 from parlant.core.engines.alpha.guideline_matching.generic.common import (
     format_journey_node_guideline_id,
 )
@@ -27,17 +30,54 @@ def extract_node_id_from_journey_node_guideline_id(
 
 
 class JourneyGuidelineProjection:
+    """Projects journeys onto the guidelines that represent their nodes and edges.
+
+    Projections are cached by journey and reused across sessions for as long as
+    the journey's version in the store stays the same. Only the `cached_journeys`
+    most recently projected journeys are kept, and deleted ones are dropped.
+
+    Journey versions only count the mutations made in this process. When other
+    processes mutate the same stores, pass `cached_journeys=0` to project every time.
+    """
+
     def __init__(
         self,
         journey_store: JourneyStore,
         guideline_store: GuidelineStore,
+        cached_journeys: int = 1000,
     ) -> None:
         self._journey_store = journey_store
         self._guideline_store = guideline_store
 
+        self._cache: LRUCache[JourneyId, tuple[int, Sequence[Guideline]]] = LRUCache(
+            maxsize=cached_journeys
+        )
+
     async def project_journey_to_guidelines(
         self,
         journey_id: JourneyId,
+    ) -> Sequence[Guideline]:
+        # Read the version first, so that a change made while projecting invalidates the result
+        version = await self._journey_store.read_journey_version(journey_id)
+
+        if (cached := self._cache.get(journey_id)) and cached[0] == version:
+            return list(cached[1])
+
+        try:
+            guidelines = await self._project(journey_id)
+        except ItemNotFoundError:
+            # A deleted journey's projection would never be used again
+            self._cache.pop(journey_id, None)
+            raise
+
+        if self._cache.maxsize:
+            self._cache[journey_id] = (version, guidelines)
+
+        return list(guidelines)
+
+    async def _project(
+        self,
+        journey_id: JourneyId,
     ) -> Sequence[Guideline]:
         guidelines: dict[GuidelineId, Guideline] = {}
 
@@ -13,14 +13,14 @@
 # limitations under the License.
 
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from dataclasses import dataclass, replace
 from datetime import datetime, timezone
-from itertools import chain
 from typing import Awaitable, Callable, Mapping, NewType, Optional, Sequence, cast
 from typing_extensions import override, TypedDict, Self, Required
 
 from parlant.core.agents import CompositionMode
-from parlant.core.async_utils import ReaderWriterLock, safe_gather
+from parlant.core.async_utils import ReaderWriterLock
 from parlant.core.common import JSONSerializable, md5_checksum
 from parlant.core.common import ItemNotFoundError, UniqueId, Version, IdGenerator, to_json_dict
 from parlant.core.guidelines import GuidelineId
@@ -159,6 +159,19 @@ class JourneyStore(ABC):
         journey_id: JourneyId,
     ) -> None: ...
 
+    @abstractmethod
+    async def read_journey_version(
+        self,
+        journey_id: JourneyId,
+    ) -> int:
+        """Returns a number that changes whenever the journey, its conditions, nodes or edges change."""
+        ...
+
+    @abstractmethod
+    async def read_revision(self) -> int:
+        """Returns a number that changes whenever any journey or its tags change."""
+        ...
+
     @abstractmethod
     async def add_condition(
         self,
@@ -428,6 +441,13 @@ class JourneyVectorStore(JourneyStore):
 
         self._lock = ReaderWriterLock()
 
+        self._journey_versions: dict[JourneyId, int] = defaultdict(int)
+        self._revision = 0
+
+    def _touch_journey(self, journey_id: JourneyId) -> None:
+        self._journey_versions[journey_id] += 1
+        self._revision += 1
+
     async def _vector_document_loader(self, doc: VectorDocument) -> Optional[JourneyVectorDocument]:
         async def v0_1_0_to_v0_3_0(doc: VectorDocument) -> Optional[VectorDocument]:
             raise Exception(
@@ -598,6 +618,14 @@ class JourneyVectorStore(JourneyStore):
                 )
             )
 
+        await self._node_association_collection.ensure_index(["journey_id"])
+        await self._node_association_collection.ensure_index(["node_id"])
+        await self._edge_association_collection.ensure_index(["journey_id"])
+        await self._tag_association_collection.ensure_index(["journey_id"])
+        await self._tag_association_collection.ensure_index(["tag_id"])
+        await self._condition_association_collection.ensure_index(["journey_id"])
+        await self._condition_association_collection.ensure_index(["condition"])
+
         return self
 
     async def __aexit__(
@@ -815,6 +843,8 @@ class JourneyVectorStore(JourneyStore):
                     }
                 )
 
+            self._touch_journey(journey.id)
+
         return journey
 
     @override
@@ -856,6 +886,8 @@ class JourneyVectorStore(JourneyStore):
                 params=cast(JourneyDocument, to_json_dict(updated)),
             )
 
+            self._touch_journey(journey_id)
+
             await self._vector_collection.update_one(
                 filters={"journey_id": {"$eq": journey_id}},
                 params={
@@ -975,9 +1007,22 @@ class JourneyVectorStore(JourneyStore):
 
             result = await self._collection.delete_one({"id": {"$eq": journey_id}})
 
+            self._touch_journey(journey_id)
+
         if result.deleted_count == 0:
             raise ItemNotFoundError(item_id=UniqueId(journey_id))
 
+    @override
+    async def read_journey_version(
+        self,
+        journey_id: JourneyId,
+    ) -> int:
+        return self._journey_versions[journey_id]
+
+    @override
+    async def read_revision(self) -> int:
+        return self._revision
+
     @override
     async def add_condition(
         self,
@@ -1002,6 +1047,8 @@ class JourneyVectorStore(JourneyStore):
                 }
             )
 
+            self._touch_journey(journey_id)
+
             return True
 
     @override
@@ -1018,6 +1065,8 @@ class JourneyVectorStore(JourneyStore):
                 }
             )
 
+            self._touch_journey(journey_id)
+
             return True
 
     @override
@@ -1047,6 +1096,8 @@ class JourneyVectorStore(JourneyStore):
 
             _ = await self._tag_association_collection.insert_one(document=association_document)
 
+            self._revision += 1
+
         return True
 
     @override
@@ -1066,6 +1117,8 @@ class JourneyVectorStore(JourneyStore):
             if delete_result.deleted_count == 0:
                 raise ItemNotFoundError(item_id=UniqueId(tag_id))
 
+            self._revision += 1
+
     @override
     async def find_relevant_journeys(
         self,
@@ -1080,19 +1133,12 @@ class JourneyVectorStore(JourneyStore):
             queries = await query_chunks(query, self._embedder)
             filters: Where = {"journey_id": {"$in": [str(j.id) for j in available_journeys]}}
 
-            tasks = [
-                self._vector_collection.find_similar_documents(
-                    filters=filters,
-                    query=q,
-                    k=max_journeys,
-                    hints={"tag": "journeys"},
-                )
-                for q in queries
-            ]
-
-        all_results = chain.from_iterable(await safe_gather(*tasks))
-        unique_results = list(set(all_results))
-        top_vectors = sorted(unique_results, key=lambda r: r.distance)[:max_journeys]
+            top_vectors = await self._vector_collection.find_similar_documents_for_queries(
+                filters=filters,
+                queries=queries,
+                k=max_journeys,
+                hints={"tag": "journeys"},
+            )
 
         return [
             await self._deserialize(doc)
@@ -1130,6 +1176,8 @@ class JourneyVectorStore(JourneyStore):
                 document=self._serialize_node(node, journey_id)
             )
 
+            self._touch_journey(journey_id)
+
         return node
 
     @override
@@ -1177,6 +1225,8 @@ class JourneyVectorStore(JourneyStore):
                 params=cast(JourneyNodeAssociationDocument, to_json_dict(updated)),
             )
 
+            self._touch_journey(doc["journey_id"])
+
         assert result.updated_document
 
         return self._deserialize_node(result.updated_document)
@@ -1203,6 +1253,8 @@ class JourneyVectorStore(JourneyStore):
                 filters={"node_id": {"$eq": node_id}}
             )
 
+            self._touch_journey(node_doc["journey_id"])
+
         if result.deleted_count == 0:
             raise ItemNotFoundError(item_id=UniqueId(node_id))
 
@@ -1254,6 +1306,8 @@ class JourneyVectorStore(JourneyStore):
                 },
             )
 
+            self._touch_journey(doc["journey_id"])
+
         assert result.updated_document
 
         return self._deserialize_node(result.updated_document)
@@ -1279,6 +1333,8 @@ class JourneyVectorStore(JourneyStore):
                 },
             )
 
+            self._touch_journey(doc["journey_id"])
+
         assert result.updated_document
 
         return self._deserialize_node(result.updated_document)
@@ -1307,6 +1363,8 @@ class JourneyVectorStore(JourneyStore):
                 document=self._serialize_edge(edge, journey_id)
             )
 
+            self._touch_journey(journey_id)
+
         return edge
 
     @override
@@ -1341,6 +1399,8 @@ class JourneyVectorStore(JourneyStore):
                 params=cast(JourneyEdgeAssociationDocument, to_json_dict(updated)),
             )
 
+            self._touch_journey(doc["journey_id"])
+
         assert result.updated_document
 
         return self._deserialize_edge(result.updated_document)
@@ -1382,6 +1442,9 @@ class JourneyVectorStore(JourneyStore):
                 filters={"id": {"$eq": edge_id}}
             )
 
+            if result.deleted_document:
+                self._touch_journey(result.deleted_document["journey_id"])
+
         if result.deleted_count == 0:
             raise ItemNotFoundError(item_id=UniqueId(edge_id))
 
@@ -1407,6 +1470,8 @@ class JourneyVectorStore(JourneyStore):
                 },
             )
 
+            self._touch_journey(doc["journey_id"])
+
         assert result.updated_document
 
         return self._deserialize_edge(result.updated_document)
@@ -1432,6 +1497,8 @@ class JourneyVectorStore(JourneyStore):
                 },
             )
 
+            self._touch_journey(doc["journey_id"])
+
         assert result.updated_document
 
         return self._deserialize_edge(result.updated_document)
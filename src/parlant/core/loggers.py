@@ -14,13 +14,18 @@
 
 from __future__ import annotations
 from abc import ABC, abstractmethod
+import atexit
 from contextlib import ExitStack, contextmanager
 import contextvars
 from enum import Enum, auto
+import functools
 import logging
+import logging.handlers
+import os
 from pathlib import Path
+import queue
 import structlog
-from typing import Iterator, Sequence
+from typing import Any, Callable, Iterator, MutableMapping, Sequence, TypeAlias
 from typing_extensions import override
 
 from parlant.core.common import generate_id
@@ -98,6 +103,42 @@ class LogLevel(Enum):
         }[self]
 
 
+class LogFormat(Enum):
+    """Enumeration of the formats in which log lines are rendered."""
+
+    CONSOLE = auto()
+    """Human-readable, colored lines for development."""
+
+    JSON = auto()
+    """One JSON object per line, for production log collectors."""
+
+    @staticmethod
+    def from_environment() -> LogFormat:
+        """Read the log format from the PARLANT_LOG_FORMAT environment variable."""
+
+        return {
+            "console": LogFormat.CONSOLE,
+            "json": LogFormat.JSON,
+        }[os.environ.get("PARLANT_LOG_FORMAT", "console").lower()]
+
+
+LogMessage: TypeAlias = str | Callable[[], str]
+"""A log message, or a callable producing it.
+
+Pass a callable when the message is expensive to build (e.g., serialized payloads),
+so that it only gets built if the level it is logged at is enabled.
+"""
+
+
+def resolve_log_message(message: LogMessage) -> str:
+    """Build the text of a (possibly lazy) log message."""
+
+    if isinstance(message, str):
+        return message
+
+    return message()
+
+
 class Logger(ABC):
     """An abstract base class for logging operations."""
 
@@ -106,33 +147,37 @@ class Logger(ABC):
         """Set the logging level for the logger."""
         ...
 
+    def is_enabled(self, log_level: LogLevel) -> bool:
+        """Check whether messages at the given level would be logged."""
+        return True
+
     @abstractmethod
-    def trace(self, message: str) -> None:
+    def trace(self, message: LogMessage) -> None:
         """Log a message at the TRACE level."""
         ...
 
     @abstractmethod
-    def debug(self, message: str) -> None:
+    def debug(self, message: LogMessage) -> None:
         """Log a message at the DEBUG level."""
         ...
 
     @abstractmethod
-    def info(self, message: str) -> None:
+    def info(self, message: LogMessage) -> None:
         """Log a message at the INFO level."""
         ...
 
     @abstractmethod
-    def warning(self, message: str) -> None:
+    def warning(self, message: LogMessage) -> None:
         """Log a message at the WARNING level."""
         ...
 
     @abstractmethod
-    def error(self, message: str) -> None:
+    def error(self, message: LogMessage) -> None:
         """Log a message at the ERROR level."""
         ...
 
     @abstractmethod
-    def critical(self, message: str) -> None:
+    def critical(self, message: LogMessage) -> None:
         """Log a message at the CRITICAL level."""
         ...
 
@@ -151,11 +196,17 @@ class TracingLogger(Logger):
         tracer: Tracer,
         log_level: LogLevel = LogLevel.DEBUG,
         logger_id: str | None = None,
+        log_format: LogFormat = LogFormat.CONSOLE,
+        background: bool = False,
     ) -> None:
         self._tracer = tracer
         self.raw_logger = logging.getLogger(logger_id or "parlant")
         self.raw_logger.setLevel(log_level.to_logging_level())
         self.log_level = log_level
+        self.log_format = log_format
+
+        self._background = background
+        self._queue_listener: logging.handlers.QueueListener | None = None
 
         # Wrap it with structlog configuration
         self._logger = structlog.wrap_logger(
@@ -163,11 +214,14 @@ class TracingLogger(Logger):
             processors=[
                 structlog.processors.TimeStamper(fmt="iso"),
                 structlog.stdlib.add_log_level,
+                self._apply_actual_level,
                 structlog.stdlib.filter_by_level,
                 structlog.stdlib.PositionalArgumentsFormatter(),
                 structlog.processors.StackInfoRenderer(),
                 structlog.processors.format_exc_info,
-                structlog.dev.ConsoleRenderer(colors=True),
+                structlog.processors.JSONRenderer()
+                if log_format == LogFormat.JSON
+                else structlog.dev.ConsoleRenderer(colors=True),
             ],
             wrapper_class=structlog.make_filtering_bound_logger(0),
         )
@@ -186,33 +240,49 @@ class TracingLogger(Logger):
         self.log_level = log_level
 
     @override
-    def trace(self, message: str) -> None:
-        if self.log_level != LogLevel.TRACE:
+    def is_enabled(self, log_level: LogLevel) -> bool:
+        return log_level >= self.log_level
+
+    @override
+    def trace(self, message: LogMessage) -> None:
+        if not self.is_enabled(LogLevel.TRACE):
             return
 
-        self._logger.debug(
-            f"TRACE {self._add_trace_id_and_scopes(message)}",
-        )
+        if self.log_format == LogFormat.JSON:
+            self._logger.debug(
+                resolve_log_message(message),
+                actual_level="trace",
+                **self._trace_id_and_scopes(),
+            )
+        else:
+            self._logger.debug(
+                f"TRACE {self._add_trace_id_and_scopes(resolve_log_message(message))}",
+            )
 
     @override
-    def debug(self, message: str) -> None:
-        self._logger.debug(self._add_trace_id_and_scopes(message))
+    def debug(self, message: LogMessage) -> None:
+        if self.is_enabled(LogLevel.DEBUG):
+            self._log(self._logger.debug, message)
 
     @override
-    def info(self, message: str) -> None:
-        self._logger.info(self._add_trace_id_and_scopes(message))
+    def info(self, message: LogMessage) -> None:
+        if self.is_enabled(LogLevel.INFO):
+            self._log(self._logger.info, message)
 
     @override
-    def warning(self, message: str) -> None:
-        self._logger.warning(self._add_trace_id_and_scopes(message))
+    def warning(self, message: LogMessage) -> None:
+        if self.is_enabled(LogLevel.WARNING):
+            self._log(self._logger.warning, message)
 
     @override
-    def error(self, message: str) -> None:
-        self._logger.error(self._add_trace_id_and_scopes(message))
+    def error(self, message: LogMessage) -> None:
+        if self.is_enabled(LogLevel.ERROR):
+            self._log(self._logger.error, message)
 
     @override
-    def critical(self, message: str) -> None:
-        self._logger.critical(self._add_trace_id_and_scopes(message))
+    def critical(self, message: LogMessage) -> None:
+        if self.is_enabled(LogLevel.CRITICAL):
+            self._log(self._logger.critical, message)
 
     @override
     @contextmanager
@@ -234,9 +304,57 @@ class TracingLogger(Logger):
     def current_scope(self) -> str:
         return self._get_scopes()
 
+    def close(self) -> None:
+        """Flush pending records and stop the background writer, if there is one."""
+
+        if self._queue_listener:
+            self._queue_listener.stop()
+            self._queue_listener = None
+
+    def _add_handlers(self, handlers: Sequence[logging.Handler]) -> None:
+        if not self._background:
+            for handler in handlers:
+                self.raw_logger.addHandler(handler)
+            return
+
+        # Handlers (especially file handlers) block on I/O, so run them
+        # on a writer thread and only pay for an enqueue on the caller's side.
+        records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+
+        self._queue_listener = logging.handlers.QueueListener(
+            records,
+            *handlers,
+            respect_handler_level=True,
+        )
+        self._queue_listener.start()
+
+        self.raw_logger.addHandler(logging.handlers.QueueHandler(records))
+
+        atexit.register(self.close)
+
+    def _log(self, method: Callable[..., Any], message: LogMessage) -> None:
+        if self.log_format == LogFormat.JSON:
+            method(resolve_log_message(message), **self._trace_id_and_scopes())
+        else:
+            method(self._add_trace_id_and_scopes(resolve_log_message(message)))
+
     def _add_trace_id_and_scopes(self, message: str) -> str:
         return f"[{self._tracer.trace_id}]{self.current_scope} {message}"
 
+    def _trace_id_and_scopes(self) -> dict[str, str]:
+        return {"trace_id": self._tracer.trace_id, "scope": self.current_scope}
+
+    @staticmethod
+    def _apply_actual_level(
+        _: Any,  # logger
+        method: str,
+        event_dict: MutableMapping[str, Any],
+    ) -> MutableMapping[str, Any]:
+        if actual_level := event_dict.pop("actual_level", None):
+            event_dict["level"] = actual_level
+
+        return event_dict
+
     def _get_scopes(self) -> str:
         if scopes := self._scopes.get():
             return scopes
@@ -251,9 +369,11 @@ class StdoutLogger(TracingLogger):
         tracer: Tracer,
         log_level: LogLevel = LogLevel.DEBUG,
         logger_id: str | None = None,
+        log_format: LogFormat = LogFormat.CONSOLE,
+        background: bool = False,
     ) -> None:
-        super().__init__(tracer, log_level, logger_id)
-        self.raw_logger.addHandler(logging.StreamHandler())
+        super().__init__(tracer, log_level, logger_id, log_format, background)
+        self._add_handlers([logging.StreamHandler()])
 
 
 class FileLogger(TracingLogger):
@@ -265,16 +385,17 @@ class FileLogger(TracingLogger):
         tracer: Tracer,
         log_level: LogLevel = LogLevel.DEBUG,
         logger_id: str | None = None,
+        log_format: LogFormat = LogFormat.CONSOLE,
+        background: bool = False,
     ) -> None:
-        super().__init__(tracer, log_level, logger_id)
-
-        handlers: list[logging.Handler] = [
-            logging.FileHandler(log_file_path),
-            logging.StreamHandler(),
-        ]
+        super().__init__(tracer, log_level, logger_id, log_format, background)
 
-        for handler in handlers:
-            self.raw_logger.addHandler(handler)
+        self._add_handlers(
+            [
+                logging.FileHandler(log_file_path),
+                logging.StreamHandler(),
+            ]
+        )
 
 
 class CompositeLogger(Logger):
@@ -292,32 +413,42 @@ class CompositeLogger(Logger):
             logger.set_level(log_level)
 
     @override
-    def trace(self, message: str) -> None:
+    def is_enabled(self, log_level: LogLevel) -> bool:
+        return any(logger.is_enabled(log_level) for logger in self._loggers)
+
+    @override
+    def trace(self, message: LogMessage) -> None:
+        message = self._build_once(message)
         for logger in self._loggers:
             logger.trace(message)
 
     @override
-    def debug(self, message: str) -> None:
+    def debug(self, message: LogMessage) -> None:
+        message = self._build_once(message)
         for logger in self._loggers:
             logger.debug(message)
 
     @override
-    def info(self, message: str) -> None:
+    def info(self, message: LogMessage) -> None:
+        message = self._build_once(message)
         for logger in self._loggers:
             logger.info(message)
 
     @override
-    def warning(self, message: str) -> None:
+    def warning(self, message: LogMessage) -> None:
+        message = self._build_once(message)
         for logger in self._loggers:
             logger.warning(message)
 
     @override
-    def error(self, message: str) -> None:
+    def error(self, message: LogMessage) -> None:
+        message = self._build_once(message)
         for logger in self._loggers:
             logger.error(message)
 
     @override
-    def critical(self, message: str) -> None:
+    def critical(self, message: LogMessage) -> None:
+        message = self._build_once(message)
         for logger in self._loggers:
             logger.critical(message)
 
@@ -328,3 +459,10 @@ class CompositeLogger(Logger):
             for context in [logger.scope(scope_id) for logger in self._loggers]:
                 stack.enter_context(context)
             yield
+
+    def _build_once(self, message: LogMessage) -> LogMessage:
+        # Lazy messages stay lazy, but are built at most once across all loggers
+        if isinstance(message, str):
+            return message
+
+        return functools.cache(message)
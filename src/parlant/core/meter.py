@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
 import asyncio
+from bisect import bisect_left
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator, Mapping
+import re
+from typing import AsyncGenerator, Callable, Mapping, Sequence, TypeAlias, TypeVar
 from typing_extensions import override
 
 from parlant.core.loggers import Logger
@@ -39,6 +41,15 @@ class Counter(ABC):
     ) -> None: ...
 
 
+class Gauge(ABC):
+    @abstractmethod
+    async def set(
+        self,
+        value: float,
+        attributes: Mapping[str, str] | None = None,
+    ) -> None: ...
+
+
 class Meter(ABC):
     @abstractmethod
     def create_counter(
@@ -47,6 +58,13 @@ class Meter(ABC):
         description: str,
     ) -> Counter: ...
 
+    @abstractmethod
+    def create_gauge(
+        self,
+        name: str,
+        description: str,
+    ) -> Gauge: ...
+
     @abstractmethod
     def create_custom_histogram(
         self,
@@ -73,10 +91,199 @@ class NullCounter(Counter):
         pass
 
 
-class LocalHistogram(DurationHistogram):
-    def __init__(self, name: str, logger: Logger) -> None:
-        self._name = name
+DEFAULT_DURATION_BUCKETS: Sequence[float] = (
+    5,
+    10,
+    25,
+    50,
+    100,
+    250,
+    500,
+    1_000,
+    2_500,
+    5_000,
+    10_000,
+    30_000,
+    60_000,
+    120_000,
+)
+"""Histogram bucket upper bounds, in milliseconds."""
+
+
+_AttributesKey: TypeAlias = tuple[tuple[str, str], ...]
+
+
+def _attributes_key(attributes: Mapping[str, str] | None) -> _AttributesKey:
+    return tuple(sorted(attributes.items())) if attributes else ()
+
+
+def _prometheus_name(name: str) -> str:
+    return re.sub(r"[^a-zA-Z0-9_]", "_", name)
+
+
+def _prometheus_labels(key: _AttributesKey, extra: Mapping[str, str] = {}) -> str:
+    def escape(value: str) -> str:
+        return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    labels = [f'{_prometheus_name(k)}="{escape(v)}"' for k, v in [*key, *extra.items()]]
+
+    return "{" + ",".join(labels) + "}" if labels else ""
+
+
+def _prometheus_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class _LocalMetric(ABC):
+    def __init__(self, name: str, description: str) -> None:
+        self.name = name
+        self.description = description
+
+    @property
+    @abstractmethod
+    def prometheus_type(self) -> str: ...
+
+    def prometheus_family(self, name: str) -> str:
+        return name
+
+    @abstractmethod
+    def prometheus_samples(self, family: str) -> list[str]: ...
+
+
+_TLocalMetric = TypeVar("_TLocalMetric", bound=_LocalMetric)
+
+
+class LocalCounter(Counter, _LocalMetric):
+    def __init__(self, name: str, description: str) -> None:
+        _LocalMetric.__init__(self, name, description)
+        self._values: dict[_AttributesKey, float] = {}
+
+    def value(self, attributes: Mapping[str, str] | None = None) -> float:
+        return self._values.get(_attributes_key(attributes), 0)
+
+    @override
+    async def increment(
+        self,
+        value: int,
+        attributes: Mapping[str, str] | None = None,
+    ) -> None:
+        key = _attributes_key(attributes)
+        self._values[key] = self._values.get(key, 0) + value
+
+    @property
+    @override
+    def prometheus_type(self) -> str:
+        return "counter"
+
+    @override
+    def prometheus_family(self, name: str) -> str:
+        return f"{name}_total"
+
+    @override
+    def prometheus_samples(self, family: str) -> list[str]:
+        return [
+            f"{family}{_prometheus_labels(key)} {_prometheus_value(value)}"
+            for key, value in list(self._values.items())
+        ]
+
+
+class LocalGauge(Gauge, _LocalMetric):
+    def __init__(self, name: str, description: str) -> None:
+        _LocalMetric.__init__(self, name, description)
+        self._values: dict[_AttributesKey, float] = {}
+
+    def value(self, attributes: Mapping[str, str] | None = None) -> float | None:
+        return self._values.get(_attributes_key(attributes))
+
+    @override
+    async def set(
+        self,
+        value: float,
+        attributes: Mapping[str, str] | None = None,
+    ) -> None:
+        self._values[_attributes_key(attributes)] = value
+
+    @property
+    @override
+    def prometheus_type(self) -> str:
+        return "gauge"
+
+    @override
+    def prometheus_samples(self, family: str) -> list[str]:
+        return [
+            f"{family}{_prometheus_labels(key)} {_prometheus_value(value)}"
+            for key, value in list(self._values.items())
+        ]
+
+
+class _HistogramSeries:
+    def __init__(self, bucket_count: int) -> None:
+        self.bucket_counts = [0] * (bucket_count + 1)  # The last one is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+
+class LocalHistogram(DurationHistogram, _LocalMetric):
+    """A fixed-bucket histogram, kept in memory.
+
+    Durations are measured in milliseconds, as with every other DurationHistogram.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        logger: Logger,
+        description: str = "",
+        unit: str = "ms",
+        buckets: Sequence[float] = DEFAULT_DURATION_BUCKETS,
+    ) -> None:
+        _LocalMetric.__init__(self, name, description)
+        self.unit = unit
+
         self._logger = logger
+        self._buckets = sorted(buckets)
+        self._series: dict[_AttributesKey, _HistogramSeries] = {}
+
+    @property
+    def buckets(self) -> Sequence[float]:
+        return self._buckets
+
+    def count(self, attributes: Mapping[str, str] | None = None) -> int:
+        series = self._series.get(_attributes_key(attributes))
+        return series.count if series else 0
+
+    def sum(self, attributes: Mapping[str, str] | None = None) -> float:
+        series = self._series.get(_attributes_key(attributes))
+        return series.sum if series else 0.0
+
+    def percentile(
+        self,
+        percentile: float,
+        attributes: Mapping[str, str] | None = None,
+    ) -> float | None:
+        """Estimates a percentile (0-100) by interpolating within its bucket, as Prometheus does."""
+
+        series = self._series.get(_attributes_key(attributes))
+
+        if not series or not series.count:
+            return None
+
+        rank = series.count * percentile / 100
+        cumulative = 0
+
+        for i, bucket_count in enumerate(series.bucket_counts):
+            if cumulative + bucket_count >= rank and bucket_count:
+                if i == len(self._buckets):
+                    return self._buckets[-1] if self._buckets else None
+
+                lower = self._buckets[i - 1] if i > 0 else 0.0
+                upper = self._buckets[i]
+
+                return lower + (upper - lower) * (rank - cumulative) / bucket_count
+
+            cumulative += bucket_count
+
+        return None
 
     @override
     async def record(
@@ -84,8 +291,21 @@ class LocalHistogram(DurationHistogram):
         value: float,
         attributes: Mapping[str, str] | None = None,
     ) -> None:
-        attrs = f" attributes={attributes}" if attributes else ""
-        self._logger.trace(f"Histogram '{self._name}' recorded duration={value:.6f}{attrs}")
+        key = _attributes_key(attributes)
+
+        if not (series := self._series.get(key)):
+            series = self._series.setdefault(key, _HistogramSeries(len(self._buckets)))
+
+        series.bucket_counts[bisect_left(self._buckets, value)] += 1
+        series.sum += value
+        series.count += 1
+
+        self._logger.trace(
+            lambda: (
+                f"Histogram '{self.name}' recorded {value:.3f}{self.unit}"
+                + (f" attributes={attributes}" if attributes else "")
+            )
+        )
 
     @override
     @asynccontextmanager
@@ -97,21 +317,93 @@ class LocalHistogram(DurationHistogram):
         try:
             yield
         finally:
-            duration = asyncio.get_running_loop().time() - start_time
+            duration = (
+                asyncio.get_running_loop().time() - start_time
+            ) * 1000  # Convert to milliseconds
             await self.record(duration, attributes)
 
+    @property
+    @override
+    def prometheus_type(self) -> str:
+        return "histogram"
+
+    @override
+    def prometheus_family(self, name: str) -> str:
+        return f"{name}_{_prometheus_name(self.unit)}" if self.unit else name
+
+    @override
+    def prometheus_samples(self, family: str) -> list[str]:
+        samples = []
+
+        for key, series in list(self._series.items()):
+            cumulative = 0
+
+            for i, bucket_count in enumerate(series.bucket_counts):
+                cumulative += bucket_count
+                le = _prometheus_value(self._buckets[i]) if i < len(self._buckets) else "+Inf"
+                samples.append(f"{family}_bucket{_prometheus_labels(key, {'le': le})} {cumulative}")
+
+            samples.append(f"{family}_sum{_prometheus_labels(key)} {_prometheus_value(series.sum)}")
+            samples.append(f"{family}_count{_prometheus_labels(key)} {series.count}")
+
+        return samples
+
 
 class LocalMeter(Meter):
-    def __init__(self, logger: Logger) -> None:
+    """Keeps metrics in memory, so they can be inspected (e.g., via the `/metrics` endpoint)
+    without an external collector.
+
+    Metrics are only ever updated from the event loop's thread, without awaiting
+    in between, so they need no locking.
+    """
+
+    def __init__(self, logger: Logger, namespace: str = "parlant") -> None:
         self._logger = logger
+        self._namespace = namespace
+        self._metrics: dict[str, _LocalMetric] = {}
+
+    @property
+    def metrics(self) -> Mapping[str, _LocalMetric]:
+        return self._metrics
+
+    def _get_or_create(
+        self,
+        metric_type: type[_TLocalMetric],
+        name: str,
+        create: Callable[[], _TLocalMetric],
+    ) -> _TLocalMetric:
+        if existing := self._metrics.get(name):
+            if not isinstance(existing, metric_type):
+                raise ValueError(f"Metric '{name}' is already registered as a different type")
+
+            return existing
+
+        metric = self._metrics[name] = create()
+        return metric
 
     @override
     def create_counter(
         self,
         name: str,
         description: str,
-    ) -> Counter:
-        return NullCounter()
+    ) -> LocalCounter:
+        return self._get_or_create(
+            LocalCounter,
+            name,
+            lambda: LocalCounter(name, description),
+        )
+
+    @override
+    def create_gauge(
+        self,
+        name: str,
+        description: str,
+    ) -> LocalGauge:
+        return self._get_or_create(
+            LocalGauge,
+            name,
+            lambda: LocalGauge(name, description),
+        )
 
     @override
     def create_custom_histogram(
@@ -119,13 +411,40 @@ class LocalMeter(Meter):
         name: str,
         description: str,
         unit: str,
-    ) -> DurationHistogram:
-        return LocalHistogram(name, self._logger)
+    ) -> LocalHistogram:
+        return self._get_or_create(
+            LocalHistogram,
+            name,
+            lambda: LocalHistogram(name, self._logger, description=description, unit=unit),
+        )
 
     @override
     def create_duration_histogram(
         self,
         name: str,
         description: str,
-    ) -> DurationHistogram:
-        return LocalHistogram(name, self._logger)
+    ) -> LocalHistogram:
+        return self.create_custom_histogram(name, description, "ms")
+
+    def render_prometheus(self) -> str:
+        """Renders all metrics in the Prometheus text exposition format (version 0.0.4)."""
+
+        lines = []
+
+        for metric in list(self._metrics.values()):
+            family = metric.prometheus_family(
+                _prometheus_name(
+                    f"{self._namespace}_{metric.name}" if self._namespace else metric.name
+                )
+            )
+
+            if not (samples := metric.prometheus_samples(family)):
+                continue
+
+            if metric.description:
+                lines.append(f"# HELP {family} {metric.description}")
+
+            lines.append(f"# TYPE {family} {metric.prometheus_type}")
+            lines.extend(samples)
+
+        return "".join(f"{line}\n" for line in lines)
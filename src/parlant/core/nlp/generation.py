@@ -137,6 +137,8 @@ class BaseSchematicGenerator(SchematicGenerator[T]):
                         "model.name": self.model_name,
                         "schema.name": self.schema.__name__,
                         "duration": start.elapsed,
+                        "usage.input_tokens": result.info.usage.input_tokens,
+                        "usage.output_tokens": result.info.usage.output_tokens,
                     },
                 )
 
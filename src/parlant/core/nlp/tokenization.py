@@ -12,7 +12,49 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import annotations
 from abc import ABC, abstractmethod
+from functools import cached_property
+import hashlib
+import math
+import os
+from typing import Optional
+
+from cachetools import LRUCache
+
+
+def parse_approximate_token_counts(value: str) -> bool | float:
+    """Parses the value of PARLANT_APPROXIMATE_TOKEN_COUNTS.
+
+    Returns False to count budget tokens exactly, True to approximate them
+    with a calibrated ratio, or a fixed ratio of (UTF-8) bytes per token.
+    """
+    value = value.strip().lower()
+
+    if value in ["false", "no", "off", "0", ""]:
+        return False
+
+    if value in ["true", "yes", "on", "1"]:
+        return True
+
+    try:
+        bytes_per_token = float(value)
+    except ValueError:
+        bytes_per_token = math.nan
+
+    if not (math.isfinite(bytes_per_token) and bytes_per_token > 0):
+        raise ValueError(
+            "PARLANT_APPROXIMATE_TOKEN_COUNTS must be true, false, "
+            f"or a positive ratio of bytes per token (got {value!r})"
+        )
+
+    return bytes_per_token
+
+
+# Parsed on import, so that an invalid value fails on startup rather than on first use
+APPROXIMATE_TOKEN_COUNTS = parse_approximate_token_counts(
+    os.environ.get("PARLANT_APPROXIMATE_TOKEN_COUNTS", "false")
+)
 
 
 class EstimatingTokenizer(ABC):
@@ -23,9 +65,117 @@ class EstimatingTokenizer(ABC):
         """Estimate the number of tokens in the given prompt."""
         ...
 
+    @cached_property
+    def cached(self) -> EstimatingTokenizer:
+        """This tokenizer, with the counts of recently estimated prompts cached."""
+        return CachingEstimatingTokenizer(self)
+
+    @cached_property
+    def budgeting(self) -> EstimatingTokenizer:
+        """The tokenizer to use where only a budget check is needed.
+
+        It counts exactly, with caching, unless PARLANT_APPROXIMATE_TOKEN_COUNTS is set.
+        """
+        if APPROXIMATE_TOKEN_COUNTS is False:
+            return self.cached
+
+        if APPROXIMATE_TOKEN_COUNTS is True:
+            return ApproximateEstimatingTokenizer(self)
+
+        return ApproximateEstimatingTokenizer(bytes_per_token=APPROXIMATE_TOKEN_COUNTS)
+
 
 class ZeroEstimatingTokenizer(EstimatingTokenizer):
     """A tokenizer that always returns zero for token count estimation."""
 
     async def estimate_token_count(self, prompt: str) -> int:
         return 0
+
+    @cached_property
+    def cached(self) -> EstimatingTokenizer:
+        return self
+
+    @cached_property
+    def budgeting(self) -> EstimatingTokenizer:
+        return self
+
+
+class CachingEstimatingTokenizer(EstimatingTokenizer):
+    """Remembers the token counts of recently estimated prompts, by a hash of their content."""
+
+    def __init__(
+        self,
+        tokenizer: EstimatingTokenizer,
+        max_entries: int = 1024,
+    ) -> None:
+        self._tokenizer = tokenizer
+        self._counts: LRUCache[bytes, int] = LRUCache(maxsize=max_entries)
+
+    async def estimate_token_count(self, prompt: str) -> int:
+        key = hashlib.blake2b(prompt.encode(), digest_size=16).digest()
+
+        if (count := self._counts.get(key)) is None:
+            count = await self._tokenizer.estimate_token_count(prompt)
+            self._counts[key] = count
+
+        return count
+
+    @cached_property
+    def cached(self) -> EstimatingTokenizer:
+        return self
+
+
+class ApproximateEstimatingTokenizer(EstimatingTokenizer):
+    """Estimates token counts from the prompt's size in (UTF-8) bytes.
+
+    Unless given a ratio of bytes per token, it calibrates one by counting its
+    first prompts with the reference tokenizer, which should be the model's own.
+    """
+
+    def __init__(
+        self,
+        reference: Optional[EstimatingTokenizer] = None,
+        bytes_per_token: Optional[float] = None,
+        calibration_samples: int = 8,
+    ) -> None:
+        if reference is None and bytes_per_token is None:
+            raise ValueError("Either a reference tokenizer or a ratio of bytes per token is needed")
+
+        self._reference = reference
+        self._bytes_per_token = bytes_per_token
+        self._calibration_samples = calibration_samples
+
+        self._sampled_bytes = 0
+        self._sampled_tokens = 0
+        self._samples = 0
+
+    @property
+    def bytes_per_token(self) -> Optional[float]:
+        return self._bytes_per_token
+
+    async def estimate_token_count(self, prompt: str) -> int:
+        if not prompt:
+            return 0
+
+        byte_count = len(prompt.encode())
+
+        if self._bytes_per_token is None:
+            assert self._reference
+
+            count = await self._reference.estimate_token_count(prompt)
+
+            if count > 0:
+                self._sampled_bytes += byte_count
+                self._sampled_tokens += count
+                self._samples += 1
+
+                if self._samples >= self._calibration_samples:
+                    self._bytes_per_token = self._sampled_bytes / self._sampled_tokens
+
+            return count
+
+        return max(1, math.ceil(byte_count / self._bytes_per_token))
+
+    @cached_property
+    def budgeting(self) -> EstimatingTokenizer:
+        return self
@@ -14,7 +14,18 @@
 
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import Any, Callable, Mapping, NewType, Protocol, Union, cast, get_type_hints
+from typing import (
+    Any,
+    Callable,
+    Mapping,
+    NewType,
+    Protocol,
+    Sequence,
+    TypeVar,
+    Union,
+    cast,
+    get_type_hints,
+)
 from typing_extensions import Literal, TypedDict
 
 from parlant.core.common import Version
@@ -160,3 +171,33 @@ def ensure_is_total(document: Mapping[str, Any], schema: type[Mapping[str, Any]]
             f"Provided TypedDict '{schema.__qualname__}' is missing required keys: {missing_keys}. "
             f"Expected at least the keys: {list(required_keys)}."
         )
+
+
+_TMapping = TypeVar("_TMapping", bound=Mapping[str, Any])
+
+
+def exclude_document_fields(document: _TMapping, fields: Sequence[str]) -> _TMapping:
+    """Returns a copy of the document without the given fields.
+
+    Fields are dot-separated paths (e.g., `data.tool_calls.result`). A path that goes
+    through a list applies to each of its items, as it does in MongoDB projections.
+    """
+
+    def exclude(value: Any, path: Sequence[str]) -> Any:
+        if isinstance(value, list):
+            return [exclude(item, path) for item in value]
+
+        if not isinstance(value, Mapping) or path[0] not in value:
+            return value
+
+        if len(path) == 1:
+            return {k: v for k, v in value.items() if k != path[0]}
+
+        return {**value, path[0]: exclude(value[path[0]], path[1:])}
+
+    result: Any = document
+
+    for field in fields:
+        result = exclude(result, field.split("."))
+
+    return cast(_TMapping, result)
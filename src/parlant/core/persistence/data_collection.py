@@ -1,18 +1,214 @@
+from __future__ import annotations
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime, timezone
+import gzip
 import json
 import os
 from pathlib import Path
-from typing import Any, Mapping, cast
-import aiofiles
-from typing_extensions import override
+from types import TracebackType
+from typing import Any, Mapping, Optional, Sequence
+from typing_extensions import Self, override
 
-from parlant.core.async_utils import safe_gather
 from parlant.core.common import generate_id
+from parlant.core.loggers import Logger
+from parlant.core.meter import Meter
 from parlant.core.tracer import Tracer
 from parlant.core.engines.alpha.prompt_builder import PromptBuilder
 from parlant.core.nlp.generation import T, SchematicGenerationResult, SchematicGenerator
 from parlant.core.nlp.tokenization import EstimatingTokenizer
 
 
+_TRACE_ATTRIBUTES = ("scope", "session_id", "request_id", "engine_iteration")
+
+
+@dataclass(frozen=True)
+class DataCollectionConfig:
+    """Where and how collected generations are written."""
+
+    path: str = "./data-collection"
+    queue_size: int = 1000
+    batch_size: int = 100
+    max_segment_bytes: int = 64 * 1024 * 1024
+    block_when_full: bool = False
+
+    @staticmethod
+    def from_environment() -> DataCollectionConfig:
+        defaults = DataCollectionConfig()
+
+        def get(name: str, default: Any) -> Any:
+            value = os.environ.get(f"PARLANT_DATA_COLLECTION_{name.upper()}")
+
+            if value is None:
+                return default
+            if isinstance(default, bool):
+                return value.lower() not in ["false", "no", "0"]
+
+            return type(default)(value)
+
+        return DataCollectionConfig(
+            **{
+                name: get(name, getattr(defaults, name))
+                for name in DataCollectionConfig.__dataclass_fields__
+            }
+        )
+
+
+@dataclass(frozen=True)
+class CollectedGeneration:
+    creation_utc: datetime
+    schema: str
+    generator: str
+    prompt: str
+    result: SchematicGenerationResult[Any]
+    trace_id: str
+    attributes: Mapping[str, Any]
+
+    def to_json(self) -> str:
+        usage = self.result.info.usage
+
+        return json.dumps(
+            {
+                "id": generate_id(),
+                "creation_utc": self.creation_utc.isoformat(),
+                "schema": self.schema,
+                "generator": self.generator,
+                "trace_id": self.trace_id,
+                "attributes": self.attributes,
+                "prompt": self.prompt,
+                "completion": self.result.content.model_dump(mode="json"),
+                "usage": {
+                    "model": self.result.info.model,
+                    "duration": self.result.info.duration,
+                    "input_tokens": usage.input_tokens,
+                    "cached_input_tokens": usage.extra
+                    and usage.extra.get("cached_input_tokens", 0)
+                    or 0,
+                    "output_tokens": usage.output_tokens,
+                },
+            },
+            ensure_ascii=False,
+        )
+
+
+class DataCollectionSink:
+    """Appends collected generations to gzipped JSON-lines segment files, in the background.
+
+    Collecting only enqueues a record. A writer task serializes records in batches,
+    appends each batch to the current segment as its own gzip member, and starts
+    a new segment once the current one grows past the configured size.
+    When the queue is full, records are dropped, unless the sink is
+    configured to block the collecting generation until there's room.
+    """
+
+    def __init__(
+        self,
+        logger: Logger,
+        meter: Meter,
+        config: Optional[DataCollectionConfig] = None,
+    ) -> None:
+        self._logger = logger
+        self._config = config or DataCollectionConfig()
+
+        self._queue: asyncio.Queue[CollectedGeneration] = asyncio.Queue(
+            maxsize=self._config.queue_size
+        )
+        self._writer: Optional[asyncio.Task[None]] = None
+
+        self._segment: Optional[Path] = None
+        self._segment_size = 0
+
+        self._records_written = meter.create_counter(
+            "data_collection.records",
+            description="Generations written by the data collection sink",
+        )
+        self._records_dropped = meter.create_counter(
+            "data_collection.dropped",
+            description="Generations dropped because the data collection queue was full",
+        )
+        self._bytes_written = meter.create_counter(
+            "data_collection.bytes",
+            description="Compressed bytes written by the data collection sink",
+        )
+        self._queue_depth = meter.create_gauge(
+            "data_collection.queue_depth",
+            description="Generations waiting to be written by the data collection sink",
+        )
+
+    @property
+    def path(self) -> Path:
+        return Path(self._config.path)
+
+    async def __aenter__(self) -> Self:
+        self._writer = asyncio.create_task(self._write_continuously())
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> bool:
+        if self._writer:
+            # Let everything that was collected so far reach the disk
+            await self._queue.join()
+
+            self._writer.cancel()
+            await asyncio.gather(self._writer, return_exceptions=True)
+            self._writer = None
+
+        return False
+
+    async def collect(self, generation: CollectedGeneration) -> None:
+        if self._config.block_when_full:
+            await self._queue.put(generation)
+            return
+
+        try:
+            self._queue.put_nowait(generation)
+        except asyncio.QueueFull:
+            await self._records_dropped.increment(1)
+
+    async def _write_continuously(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+
+            while len(batch) < self._config.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            try:
+                written = await asyncio.to_thread(self._write_batch, batch)
+
+                await self._records_written.increment(len(batch))
+                await self._bytes_written.increment(written)
+            except Exception as exc:
+                self._logger.error(f"Failed to write {len(batch)} collected generations: {exc}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+            await self._queue_depth.set(self._queue.qsize())
+
+    def _write_batch(self, batch: Sequence[CollectedGeneration]) -> int:
+        lines = "".join(f"{generation.to_json()}\n" for generation in batch)
+        data = gzip.compress(lines.encode("utf-8"))
+
+        if self._segment is None or self._segment_size >= self._config.max_segment_bytes:
+            self.path.mkdir(parents=True, exist_ok=True)
+
+            timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S")
+            self._segment = self.path / f"generations_{timestamp}_{generate_id()}.jsonl.gz"
+            self._segment_size = 0
+
+        # Concatenated gzip members read back as a single stream
+        with open(self._segment, "ab") as segment:
+            segment.write(data)
+
+        self._segment_size += len(data)
+
+        return len(data)
+
+
 class DataCollectingSchematicGenerator(SchematicGenerator[T]):
     """A schematic generator that collects data during generation."""
 
@@ -20,14 +216,11 @@ class DataCollectingSchematicGenerator(SchematicGenerator[T]):
         self,
         wrapped_generator: SchematicGenerator[T],
         tracer: Tracer,
+        sink: DataCollectionSink,
     ) -> None:
         self._wrapped_generator = wrapped_generator
         self._tracer = tracer
-
-        if path := os.environ.get("PARLANT_DATA_COLLECTION_PATH"):
-            self._base_path = Path(path)
-        else:
-            self._base_path = Path("./data-collection")
+        self._sink = sink
 
     @override
     async def generate(
@@ -37,57 +230,24 @@ class DataCollectingSchematicGenerator(SchematicGenerator[T]):
     ) -> SchematicGenerationResult[T]:
         result = await self._wrapped_generator.generate(prompt=prompt, hints=hints)
 
-        path = self._base_path
-
-        if scope := self._tracer.get_attribute("scope"):
-            path = path / cast(str, scope)
-
-        if self._tracer.get_attribute("session_id"):
-            session_id = self._tracer.get_attribute("session_id")
-            path = path / f"Session_{session_id}"
-
-        if request_id := self._tracer.get_attribute("request_id"):
-            path = path / f"R{request_id}"
-
-        if iteration := self._tracer.get_attribute("engine_iteration"):
-            path = path / f"Iteration_{iteration}"
-
-        path.mkdir(parents=True, exist_ok=True)
-
-        generation_id = generate_id()
-
-        prompt_path = path / f"{self._wrapped_generator.schema.__name__}_{generation_id}.prompt.txt"
-        completion_path = (
-            path / f"{self._wrapped_generator.schema.__name__}_{generation_id}.completion.txt"
-        )
-        usage_path = path / f"{self._wrapped_generator.schema.__name__}_{generation_id}.usage.txt"
-
         if isinstance(prompt, PromptBuilder):
             prompt = prompt.build()
 
-        async with (
-            aiofiles.open(prompt_path, "w", encoding="utf-8") as prompt_file,
-            aiofiles.open(completion_path, "w", encoding="utf-8") as completion_file,
-            aiofiles.open(usage_path, "w", encoding="utf-8") as usage_file,
-        ):
-            usage_info = json.dumps(
-                {
-                    "model": result.info.model,
-                    "duration": result.info.duration,
-                    "input_tokens": result.info.usage.input_tokens,
-                    "cached_input_tokens": result.info.usage.extra
-                    and result.info.usage.extra.get("cached_input_tokens", 0)
-                    or 0,
-                    "output_tokens": result.info.usage.output_tokens,
+        await self._sink.collect(
+            CollectedGeneration(
+                creation_utc=datetime.now(timezone.utc),
+                schema=self._wrapped_generator.schema.__name__,
+                generator=self._wrapped_generator.id,
+                prompt=prompt,
+                result=result,
+                trace_id=self._tracer.trace_id,
+                attributes={
+                    name: value
+                    for name in _TRACE_ATTRIBUTES
+                    if (value := self._tracer.get_attribute(name)) is not None
                 },
-                indent=2,
-            )
-
-            await safe_gather(
-                prompt_file.write(prompt),
-                completion_file.write(result.content.model_dump_json(indent=2)),
-                usage_file.write(usage_info),
             )
+        )
 
         return result
 
@@ -164,8 +164,13 @@ class DocumentCollection(ABC, Generic[TDocument]):
         limit: Optional[int] = None,
         cursor: Optional[Cursor] = None,
         sort_direction: Optional[SortDirection] = None,
+        exclude_fields: Optional[Sequence[str]] = None,
     ) -> FindResult[TDocument]:
-        """Finds documents with cursor-based pagination. Results are sorted by creation_utc with id as tiebreaker."""
+        """Finds documents with cursor-based pagination. Results are sorted by creation_utc with id as tiebreaker.
+
+        Fields listed in `exclude_fields` (as dot-separated paths) are left out of the returned
+        documents, preferably by the database itself, so that large fields aren't transferred.
+        """
         ...
 
     @abstractmethod
@@ -202,3 +207,14 @@ class DocumentCollection(ABC, Generic[TDocument]):
     ) -> DeleteResult[TDocument]:
         """Deletes the first document that matches the query criteria."""
         ...
+
+    async def ensure_index(
+        self,
+        fields: Sequence[str],
+    ) -> None:
+        """Declares that documents are looked up by the given fields, matched in that order.
+
+        Databases that support it index the fields (once), so that such lookups don't have
+        to scan the whole collection. By default, nothing is done.
+        """
+        pass
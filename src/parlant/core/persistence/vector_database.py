@@ -28,6 +28,7 @@ from typing import (
 )
 from typing_extensions import Required, override
 
+from parlant.core.async_utils import safe_gather
 from parlant.core.common import JSONSerializable, Version
 from parlant.core.nlp.embedding import Embedder
 from parlant.core.persistence.common import ObjectId, Where
@@ -176,6 +177,39 @@ class VectorCollection(ABC, Generic[TDocument]):
         hints: Mapping[str, Any] = {},
     ) -> Sequence[SimilarDocumentResult[TDocument]]: ...
 
+    async def find_similar_documents_for_queries(
+        self,
+        filters: Where,
+        queries: Sequence[str],
+        k: int,
+        hints: Mapping[str, Any] = {},
+    ) -> Sequence[SimilarDocumentResult[TDocument]]:
+        """Returns the k documents most similar to any of the queries.
+
+        Each document's distance is its smallest distance to any of the queries.
+        """
+        return merge_similar_documents(
+            await safe_gather(
+                *(self.find_similar_documents(filters, q, k, hints) for q in queries)
+            ),
+            k,
+        )
+
+
+def merge_similar_documents(
+    results: Sequence[Sequence[SimilarDocumentResult[TDocument]]],
+    k: int,
+) -> Sequence[SimilarDocumentResult[TDocument]]:
+    """Merges per-query results, keeping each document once, with its smallest distance."""
+    closest: dict[ObjectId, SimilarDocumentResult[TDocument]] = {}
+
+    for query_results in results:
+        for r in query_results:
+            if r.document["id"] not in closest or closest[r.document["id"]].distance > r.distance:
+                closest[r.document["id"]] = r
+
+    return sorted(closest.values(), key=lambda r: r.distance)[:k]
+
 
 class BaseVectorCollection(VectorCollection[TDocument]):
     def __init__(self, tracer: Tracer) -> None:
@@ -200,3 +234,28 @@ class BaseVectorCollection(VectorCollection[TDocument]):
     ) -> Sequence[SimilarDocumentResult[TDocument]]:
         with self._tracer.span("find_similar_documents"):
             return await self.do_find_similar_documents(filters, query, k, hints)
+
+    async def do_find_similar_documents_for_queries(
+        self,
+        filters: Where,
+        queries: Sequence[str],
+        k: int,
+        hints: Mapping[str, Any] = {},
+    ) -> Sequence[SimilarDocumentResult[TDocument]]:
+        return merge_similar_documents(
+            await safe_gather(
+                *(self.do_find_similar_documents(filters, q, k, hints) for q in queries)
+            ),
+            k,
+        )
+
+    @override
+    async def find_similar_documents_for_queries(
+        self,
+        filters: Where,
+        queries: Sequence[str],
+        k: int,
+        hints: Mapping[str, Any] = {},
+    ) -> Sequence[SimilarDocumentResult[TDocument]]:
+        with self._tracer.span("find_similar_documents", {"queries": len(queries)}):
+            return await self.do_find_similar_documents_for_queries(filters, queries, k, hints)
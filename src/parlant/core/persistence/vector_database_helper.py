@@ -22,8 +22,11 @@ from parlant.core.persistence.vector_database import BaseDocument, TDocument, Ve
 
 
 async def query_chunks(query: str, embedder: Embedder) -> list[str]:
+    # Chunking is only a budget check
+    tokenizer = embedder.tokenizer.budgeting
+
     max_length = embedder.max_tokens // 5
-    total_token_count = await embedder.tokenizer.estimate_token_count(query)
+    total_token_count = await tokenizer.estimate_token_count(query)
 
     words = query.split()
     total_word_count = len(words)
@@ -38,7 +41,7 @@ async def query_chunks(query: str, embedder: Embedder) -> list[str]:
         chunk = " ".join(chunk_words)
         chunks.append(chunk)
 
-    return [text if await embedder.tokenizer.estimate_token_count(text) else "" for text in chunks]
+    return [text if await tokenizer.estimate_token_count(text) else "" for text in chunks]
 
 
 T = TypeVar("T")
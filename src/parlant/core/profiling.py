@@ -0,0 +1,286 @@
+# Copyright 2025 Emcie Co Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+from contextlib import contextmanager
+import contextvars
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+import random
+import time
+from typing import Iterator, Mapping, Optional, cast
+from typing_extensions import override
+
+from parlant.core.common import JSONSerializable
+from parlant.core.sessions import SessionId, SpanProfile, TurnProfile
+from parlant.core.tracer import AttributeValue, Tracer
+
+
+DURATION_ATTRIBUTE = "duration"
+INPUT_TOKENS_ATTRIBUTE = "usage.input_tokens"
+OUTPUT_TOKENS_ATTRIBUTE = "usage.output_tokens"
+
+_RESERVED_EVENT_ATTRIBUTES = {
+    DURATION_ATTRIBUTE,
+    INPUT_TOKENS_ATTRIBUTE,
+    OUTPUT_TOKENS_ATTRIBUTE,
+}
+
+
+def _now() -> float:
+    return time.perf_counter()
+
+
+@dataclass
+class _SpanRecord:
+    name: str
+    attributes: Mapping[str, AttributeValue]
+    start: float
+    end: Optional[float] = None
+    input_tokens: int = 0
+    output_tokens: int = 0
+    children: list[_SpanRecord] = field(default_factory=list)
+
+    def freeze(self, origin: float, default_end: float) -> SpanProfile:
+        end = self.end if self.end is not None else default_end
+
+        return SpanProfile(
+            name=self.name,
+            start_offset=self.start - origin,
+            end_offset=end - origin,
+            input_tokens=self.input_tokens,
+            output_tokens=self.output_tokens,
+            attributes={
+                k: cast(JSONSerializable, list(v) if isinstance(v, (list, tuple)) else v)
+                for k, v in self.attributes.items()
+            },
+            children=[c.freeze(origin, end) for c in self.children],
+        )
+
+
+class TurnProfileRecording:
+    """A handle over a profile that is being recorded. Its result is available once it ends."""
+
+    def __init__(self, session_id: SessionId, root: _SpanRecord) -> None:
+        self.session_id = session_id
+        self.trace_id = "<main>"
+
+        self._root = root
+        self._result: Optional[TurnProfile] = None
+
+    @property
+    def result(self) -> TurnProfile:
+        if not self._result:
+            raise RuntimeError("Profile is still being recorded")
+
+        return self._result
+
+    def _finish(self) -> None:
+        end = _now()
+        self._root.end = end
+
+        self._result = TurnProfile(
+            session_id=self.session_id,
+            trace_id=self.trace_id,
+            creation_utc=datetime.now(timezone.utc),
+            root=self._root.freeze(origin=self._root.start, default_end=end),
+        )
+
+
+class TurnProfiler:
+    """Records a tree of spans for each agent turn.
+
+    Spans are reported to it by a ProfilingTracer. Recording only happens
+    within `profile()`, so spans opened outside of a turn cost nothing extra.
+    Only a `sample_rate` fraction of the turns is recorded.
+    """
+
+    def __init__(self, enabled: bool = True, sample_rate: float = 1.0) -> None:
+        self.enabled = enabled
+        self.sample_rate = sample_rate
+
+        self._current_span = contextvars.ContextVar[Optional[_SpanRecord]](
+            "turn_profiler_current_span",
+            default=None,
+        )
+        self._dispatched_at = contextvars.ContextVar[Optional[float]](
+            "turn_profiler_dispatched_at",
+            default=None,
+        )
+
+    @contextmanager
+    def dispatching(self, queued_for: float = 0.0) -> Iterator[None]:
+        """Marks the time at which processing was requested, `queued_for` seconds ago.
+
+        Tasks created within this context would report the time they
+        spent waiting to be picked up as their turn's "queue" span.
+        """
+        reset_token = self._dispatched_at.set(_now() - queued_for)
+
+        try:
+            yield
+        finally:
+            self._dispatched_at.reset(reset_token)
+
+    @contextmanager
+    def profile(
+        self,
+        name: str,
+        session_id: SessionId,
+    ) -> Iterator[Optional[TurnProfileRecording]]:
+        if not self.enabled or random.random() >= self.sample_rate:
+            yield None
+            return
+
+        start = _now()
+        dispatched_at = self._dispatched_at.get()
+
+        root = _SpanRecord(name=name, attributes={}, start=dispatched_at or start)
+
+        if dispatched_at is not None:
+            root.children.append(
+                _SpanRecord(name="queue", attributes={}, start=dispatched_at, end=start)
+            )
+
+        recording = TurnProfileRecording(session_id, root)
+
+        span_reset_token = self._current_span.set(root)
+        # A turn is only queued once; nested tasks must not report it again
+        dispatched_at_reset_token = self._dispatched_at.set(None)
+
+        try:
+            yield recording
+        finally:
+            self._dispatched_at.reset(dispatched_at_reset_token)
+            self._current_span.reset(span_reset_token)
+
+            recording._finish()
+
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        attributes: Mapping[str, AttributeValue] = {},
+    ) -> Iterator[None]:
+        parent = self._current_span.get()
+
+        if parent is None:
+            yield
+            return
+
+        record = _SpanRecord(name=name, attributes=attributes, start=_now())
+        parent.children.append(record)
+
+        reset_token = self._current_span.set(record)
+
+        try:
+            yield
+        finally:
+            record.end = _now()
+            self._current_span.reset(reset_token)
+
+    def add_event(self, name: str, attributes: Mapping[str, AttributeValue]) -> None:
+        """Records events that report their own duration (e.g., an LLM request) as leaf spans."""
+
+        parent = self._current_span.get()
+
+        if parent is None:
+            return
+
+        duration = attributes.get(DURATION_ATTRIBUTE)
+
+        if not isinstance(duration, (int, float)):
+            return
+
+        end = _now()
+        input_tokens = attributes.get(INPUT_TOKENS_ATTRIBUTE, 0)
+        output_tokens = attributes.get(OUTPUT_TOKENS_ATTRIBUTE, 0)
+
+        parent.children.append(
+            _SpanRecord(
+                name=name,
+                attributes={
+                    k: v for k, v in attributes.items() if k not in _RESERVED_EVENT_ATTRIBUTES
+                },
+                start=end - duration,
+                end=end,
+                input_tokens=input_tokens if isinstance(input_tokens, int) else 0,
+                output_tokens=output_tokens if isinstance(output_tokens, int) else 0,
+            )
+        )
+
+
+class ProfilingTracer(Tracer):
+    """Wraps another tracer, reporting its spans and events to a TurnProfiler."""
+
+    def __init__(self, tracer: Tracer, profiler: TurnProfiler) -> None:
+        self._tracer = tracer
+        self._profiler = profiler
+
+    @property
+    def wrapped(self) -> Tracer:
+        return self._tracer
+
+    @contextmanager
+    @override
+    def span(
+        self,
+        span_id: str,
+        attributes: Mapping[str, AttributeValue] = {},
+    ) -> Iterator[None]:
+        with self._tracer.span(span_id, attributes):
+            with self._profiler.span(span_id, attributes):
+                yield
+
+    @contextmanager
+    @override
+    def attributes(
+        self,
+        attributes: Mapping[str, AttributeValue],
+    ) -> Iterator[None]:
+        with self._tracer.attributes(attributes):
+            yield
+
+    @contextmanager
+    @override
+    def continue_trace(self, trace_id: str) -> Iterator[None]:
+        with self._tracer.continue_trace(trace_id):
+            yield
+
+    @property
+    @override
+    def trace_id(self) -> str:
+        return self._tracer.trace_id
+
+    @property
+    @override
+    def span_id(self) -> str:
+        return self._tracer.span_id
+
+    @override
+    def get_attribute(self, name: str) -> AttributeValue | None:
+        return self._tracer.get_attribute(name)
+
+    @override
+    def set_attribute(self, name: str, value: AttributeValue) -> None:
+        self._tracer.set_attribute(name, value)
+
+    @override
+    def add_event(self, name: str, attributes: Mapping[str, AttributeValue] = {}) -> None:
+        self._tracer.add_event(name, attributes)
+        self._profiler.add_event(name, attributes)
+
+    @override
+    def flush(self) -> None:
+        self._tracer.flush()
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
@@ -170,12 +171,21 @@ class RelationshipDocumentStore(RelationshipStore):
         id_generator: IdGenerator,
         database: DocumentDatabase,
         allow_migration: bool = False,
+        cache_graphs: bool = True,
     ) -> None:
         self._id_generator = id_generator
 
         self._database = database
         self._collection: DocumentCollection[RelationshipDocument]
+        # Graphs only reflect the mutations made through this store, so they must not
+        # be cached when other processes mutate the same database
+        self._cache_graphs = cache_graphs
         self._graphs: dict[RelationshipKind | RelationshipKind, networkx.DiGraph] = {}
+        self._relationships: dict[RelationshipId, Relationship] = {}
+        self._closures: dict[
+            RelationshipKind,
+            dict[tuple[RelationshipEntityId, bool], Sequence[Relationship]],
+        ] = defaultdict(dict)
         self._allow_migration = allow_migration
         self._lock = ReaderWriterLock()
 
@@ -206,6 +216,10 @@ class RelationshipDocumentStore(RelationshipStore):
                 document_loader=self._document_loader,
             )
 
+        await self._collection.ensure_index(["kind"])
+        await self._collection.ensure_index(["source"])
+        await self._collection.ensure_index(["target"])
+
         return self
 
     async def __aexit__(
@@ -276,7 +290,7 @@ class RelationshipDocumentStore(RelationshipStore):
         )
 
     async def _get_relationships_graph(self, kind: RelationshipKind) -> networkx.DiGraph:
-        if kind not in self._graphs:
+        if kind not in self._graphs or not self._cache_graphs:
             g = networkx.DiGraph()
             g.graph["strict"] = True  # Ensure no loops are allowed
 
@@ -288,7 +302,12 @@ class RelationshipDocumentStore(RelationshipStore):
             nodes = set()
             edges = list()
 
+            # Drop relationships of this kind that were deleted since the last build
+            self._relationships = {id: r for id, r in self._relationships.items() if r.kind != kind}
+
             for r in relationships:
+                self._relationships[r.id] = r
+
                 nodes.add(r.source.id)
                 nodes.add(r.target.id)
                 edges.append(
@@ -304,6 +323,7 @@ class RelationshipDocumentStore(RelationshipStore):
             g.update(edges=edges, nodes=nodes)
 
             self._graphs[kind] = g
+            self._closures.pop(kind, None)
 
         return self._graphs[kind]
 
@@ -351,6 +371,9 @@ class RelationshipDocumentStore(RelationshipStore):
                 id=relationship.id,
             )
 
+            self._relationships[relationship.id] = relationship
+            self._closures.pop(kind, None)
+
         return relationship
 
     @override
@@ -387,6 +410,9 @@ class RelationshipDocumentStore(RelationshipStore):
 
             graph.remove_edge(relationship.source.id, relationship.target.id)
 
+            self._relationships.pop(relationship.id, None)
+            self._closures.pop(relationship.kind, None)
+
             await self._collection.delete_one(filters={"id": {"$eq": relationship_id}})
 
     @override
@@ -397,29 +423,45 @@ class RelationshipDocumentStore(RelationshipStore):
         source_id: Optional[RelationshipEntityId] = None,
         target_id: Optional[RelationshipEntityId] = None,
     ) -> Sequence[Relationship]:
-        async def get_node_relationships_by_kind(
+        def get_node_relationships_by_kind(
+            kind: RelationshipKind,
             source_id: RelationshipEntityId,
             reversed_graph: bool = False,
         ) -> Sequence[Relationship]:
+            # Closures are cached per kind until a relationship of that kind is created or deleted
+            graph = self._graphs[kind]
+            closures = self._closures[kind]
+
+            if (source_id, reversed_graph) in closures:
+                return closures[(source_id, reversed_graph)]
+
             if not graph.has_node(source_id):
                 return []
 
-            _graph = graph.reverse() if reversed_graph else graph
-
-            descendant_edges = networkx.bfs_edges(_graph, source_id)
             relationships = []
 
-            for edge_source, edge_target in descendant_edges:
-                edge_data = _graph.get_edge_data(edge_source, edge_target)
-
-                relationship_document = await self._collection.find_one(
-                    filters={"id": {"$eq": edge_data["id"]}},
-                )
-
-                if not relationship_document:
+            # Traverse predecessors in node order, as a reversed copy of the graph would,
+            # so that the same spanning edges are returned without copying the graph
+            node_order = {node: i for i, node in enumerate(graph)} if reversed_graph else {}
+
+            for u, v in networkx.bfs_edges(
+                graph,
+                source_id,
+                reverse=reversed_graph,
+                sort_neighbors=(lambda nodes: sorted(nodes, key=node_order.__getitem__))
+                if reversed_graph
+                else None,
+            ):
+                # A reverse traversal yields each edge target-first
+                edge_source, edge_target = (v, u) if reversed_graph else (u, v)
+                edge_data = graph.get_edge_data(edge_source, edge_target)
+
+                if not (relationship := self._relationships.get(edge_data["id"])):
                     raise ItemNotFoundError(item_id=UniqueId(edge_data["id"]))
 
-                relationships.append(self._deserialize(relationship_document))
+                relationships.append(relationship)
+
+            closures[(source_id, reversed_graph)] = relationships
 
             return relationships
 
@@ -442,15 +484,15 @@ class RelationshipDocumentStore(RelationshipStore):
                         *list(RelationshipKind),
                     ]
                 ):
-                    graph = await self._get_relationships_graph(_kind)
+                    await self._get_relationships_graph(_kind)
 
                     if source_id:
                         relationships.extend(
-                            await get_node_relationships_by_kind(source_id, reversed_graph=False)
+                            get_node_relationships_by_kind(_kind, source_id, reversed_graph=False)
                         )
                     if target_id:
                         relationships.extend(
-                            await get_node_relationships_by_kind(target_id, reversed_graph=True)
+                            get_node_relationships_by_kind(_kind, target_id, reversed_graph=True)
                         )
 
                 return relationships
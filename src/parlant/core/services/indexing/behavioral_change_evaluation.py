@@ -13,9 +13,10 @@
 # limitations under the License.
 
 import asyncio
+from contextlib import AbstractContextManager, nullcontext
 import traceback
 from dataclasses import replace
-from typing import Optional, Sequence, cast
+from typing import Any, Awaitable, Optional, Sequence, cast
 
 from parlant.core import async_utils
 from parlant.core.agents import AgentStore
@@ -27,6 +28,7 @@ from parlant.core.evaluations import (
     EvaluationId,
     GuidelinePayload,
     InvoiceData,
+    Payload,
     InvoiceJourneyData,
     JourneyPayload,
     Invoice,
@@ -43,6 +45,7 @@ from parlant.core.journey_guideline_projection import (
 )
 from parlant.core.journeys import Journey, JourneyId, JourneyNodeId, JourneyStore
 from parlant.core.services.indexing.common import EvaluationError, ProgressReport
+from parlant.core.services.indexing.evaluation_cache import EvaluationCache
 from parlant.core.services.indexing.customer_dependent_action_detector import (
     CustomerDependentActionDetector,
     CustomerDependentActionProposition,
@@ -75,6 +78,17 @@ from parlant.core.services.indexing.tool_running_action_detector import (
 )
 
 
+def _stage(
+    progress_report: Optional[ProgressReport],
+    name: str,
+) -> AbstractContextManager[None]:
+    return progress_report.stage(name) if progress_report else nullcontext()
+
+
+def _normalize(text: Optional[str]) -> str:
+    return " ".join((text or "").split())
+
+
 class EvaluationValidationError(Exception):
     def __init__(self, message: str) -> None:
         super().__init__(message)
@@ -156,198 +170,165 @@ class GuidelineEvaluator:
         payloads: Sequence[GuidelinePayload],
         progress_report: Optional[ProgressReport] = None,
     ) -> Sequence[InvoiceGuidelineData]:
-        action_propositions = await self._propose_actions(
-            payloads,
-            progress_report,
+        results = await async_utils.safe_gather(
+            *(self._evaluate_payload(p, progress_report) for p in payloads)
         )
 
-        continuous_propositions = await self._propose_continuous(
-            payloads,
-            action_propositions,
-            progress_report,
-        )
+        if progress_report and payloads:
+            self._logger.debug(
+                "Guideline evaluation stages: "
+                + ", ".join(
+                    f"{stage}={duration:.3f}s"
+                    for stage, duration in progress_report.stage_durations.items()
+                )
+            )
 
-        customer_dependant_action_detections = await self._detect_customer_dependant_actions(
-            payloads, action_propositions, progress_report
+        return self._build_invoice_data(
+            [r[0] for r in results],
+            [r[1] for r in results],
+            [r[2] for r in results],
+            [r[3] for r in results],
+            [r[4] for r in results],
         )
 
-        agent_intention_propositions = await self._propose_agent_intention(
-            payloads, progress_report
+    async def _evaluate_payload(
+        self,
+        payload: GuidelinePayload,
+        progress_report: Optional[ProgressReport],
+    ) -> tuple[
+        Optional[GuidelineActionProposition],
+        Optional[GuidelineContinuousProposition],
+        Optional[CustomerDependentActionProposition],
+        Optional[AgentIntentionProposition],
+        Optional[ToolRunningActionProposition],
+    ]:
+        # Each stage waits only for the stages it depends on, and only for this payload,
+        # so that stages run concurrently and a payload doesn't wait for the others
+        action_proposition = asyncio.create_task(self._propose_action(payload, progress_report))
+
+        continuous_proposition = asyncio.create_task(
+            self._propose_continuous(payload, action_proposition, progress_report)
         )
-
-        tool_running_action_propositions = await self._detect_tool_running_actions(
-            payloads, progress_report
+        customer_dependent_action_detection = asyncio.create_task(
+            self._detect_customer_dependent_action(payload, action_proposition, progress_report)
         )
-
-        return self._build_invoice_data(
-            action_propositions,
-            continuous_propositions,
-            customer_dependant_action_detections,
-            agent_intention_propositions,
-            tool_running_action_propositions,
+        agent_intention_proposition = asyncio.create_task(
+            self._propose_agent_intention(payload, progress_report)
+        )
+        tool_running_action_proposition = asyncio.create_task(
+            self._detect_tool_running_action(payload, progress_report)
         )
 
-    async def _propose_actions(
-        self,
-        payloads: Sequence[GuidelinePayload],
-        progress_report: Optional[ProgressReport] = None,
-    ) -> Sequence[Optional[GuidelineActionProposition]]:
-        tasks: list[asyncio.Task[Optional[GuidelineActionProposition]]] = []
-        indices: list[int] = []
-
-        for i, p in enumerate(payloads):
-            if p.action_proposition:
-                indices.append(i)
-                tasks.append(
-                    asyncio.create_task(
-                        self._guideline_action_proposer.propose_action(
-                            guideline=p.content,
-                            tool_ids=p.tool_ids or [],
-                            progress_report=progress_report,
-                        )
-                    )
-                )
+        stages: list[asyncio.Task[Any]] = [
+            action_proposition,
+            continuous_proposition,
+            customer_dependent_action_detection,
+            agent_intention_proposition,
+            tool_running_action_proposition,
+        ]
 
-        sparse_results = await async_utils.safe_gather(*tasks)
-        results: list[Optional[GuidelineActionProposition]] = [None] * len(payloads)
-        for i, res in zip(indices, sparse_results):
-            results[i] = res
+        await async_utils.safe_gather(*stages)
 
-        return results
+        return (
+            action_proposition.result(),
+            continuous_proposition.result(),
+            customer_dependent_action_detection.result(),
+            agent_intention_proposition.result(),
+            tool_running_action_proposition.result(),
+        )
 
-    async def _detect_customer_dependant_actions(
+    def _action_content(
         self,
-        payloads: Sequence[GuidelinePayload],
-        proposed_actions: Sequence[Optional[GuidelineActionProposition]],
+        payload: GuidelinePayload,
+        action_proposition: Optional[GuidelineActionProposition],
+    ) -> GuidelineContent:
+        return GuidelineContent(
+            condition=payload.content.condition,
+            action=action_proposition.content.action
+            if action_proposition is not None
+            else payload.content.action,
+        )
+
+    async def _propose_action(
+        self,
+        payload: GuidelinePayload,
         progress_report: Optional[ProgressReport] = None,
-    ) -> Sequence[Optional[CustomerDependentActionProposition]]:
-        tasks: list[asyncio.Task[CustomerDependentActionProposition]] = []
-        indices: list[int] = []
-        for i, (p, action_prop) in enumerate(zip(payloads, proposed_actions)):
-            if not p.properties_proposition and not p.journey_node_proposition:
-                continue
-            action_to_use = (
-                action_prop.content.action if action_prop is not None else p.content.action
-            )
-            guideline_content = GuidelineContent(
-                condition=p.content.condition,
-                action=action_to_use,
-            )
-            indices.append(i)
-            tasks.append(
-                asyncio.create_task(
-                    self._customer_dependent_action_detector.detect_if_customer_dependent(
-                        guideline=guideline_content,
-                        progress_report=progress_report,
-                    )
-                )
+    ) -> Optional[GuidelineActionProposition]:
+        if not payload.action_proposition:
+            return None
+
+        with _stage(progress_report, "action"):
+            return await self._guideline_action_proposer.propose_action(
+                guideline=payload.content,
+                tool_ids=payload.tool_ids or [],
+                progress_report=progress_report,
             )
-        sparse_results = await async_utils.safe_gather(*tasks)
-        results: list[Optional[CustomerDependentActionProposition]] = [None] * len(payloads)
-        for i, res in zip(indices, sparse_results):
-            results[i] = res
-        return results
 
-    async def _propose_continuous(
+    async def _detect_customer_dependent_action(
         self,
-        payloads: Sequence[GuidelinePayload],
-        proposed_actions: Sequence[Optional[GuidelineActionProposition]],
+        payload: GuidelinePayload,
+        action_proposition: Awaitable[Optional[GuidelineActionProposition]],
         progress_report: Optional[ProgressReport] = None,
-    ) -> Sequence[Optional[GuidelineContinuousProposition]]:
-        tasks: list[asyncio.Task[GuidelineContinuousProposition]] = []
-        indices: list[int] = []
-
-        for i, (p, action_prop) in enumerate(zip(payloads, proposed_actions)):
-            if not p.properties_proposition:
-                continue
+    ) -> Optional[CustomerDependentActionProposition]:
+        if not payload.properties_proposition and not payload.journey_node_proposition:
+            return None
 
-            action_to_use = (
-                action_prop.content.action if action_prop is not None else p.content.action
-            )
-            guideline_content = GuidelineContent(
-                condition=p.content.condition,
-                action=action_to_use,
-            )
+        guideline_content = self._action_content(payload, await action_proposition)
 
-            indices.append(i)
-            tasks.append(
-                asyncio.create_task(
-                    self._guideline_continuous_proposer.propose_continuous(
-                        guideline=guideline_content,
-                        progress_report=progress_report,
-                    )
-                )
+        with _stage(progress_report, "customer_dependent_action"):
+            return await self._customer_dependent_action_detector.detect_if_customer_dependent(
+                guideline=guideline_content,
+                progress_report=progress_report,
             )
 
-        sparse_results = await async_utils.safe_gather(*tasks)
-        results: list[Optional[GuidelineContinuousProposition]] = [None] * len(payloads)
-        for i, res in zip(indices, sparse_results):
-            results[i] = res
-        return results
-
-    async def _propose_agent_intention(
+    async def _propose_continuous(
         self,
-        payloads: Sequence[GuidelinePayload],
+        payload: GuidelinePayload,
+        action_proposition: Awaitable[Optional[GuidelineActionProposition]],
         progress_report: Optional[ProgressReport] = None,
-    ) -> Sequence[Optional[AgentIntentionProposition]]:
-        tasks: list[asyncio.Task[AgentIntentionProposition]] = []
-        indices: list[int] = []
+    ) -> Optional[GuidelineContinuousProposition]:
+        if not payload.properties_proposition:
+            return None
 
-        for i, p in enumerate(payloads):
-            if not p.properties_proposition:
-                continue
+        guideline_content = self._action_content(payload, await action_proposition)
 
-            guideline_content = GuidelineContent(
-                condition=p.content.condition,
-                action=p.content.action,
+        with _stage(progress_report, "continuous"):
+            return await self._guideline_continuous_proposer.propose_continuous(
+                guideline=guideline_content,
+                progress_report=progress_report,
             )
 
-            indices.append(i)
-            tasks.append(
-                asyncio.create_task(
-                    self._agent_intention_proposer.propose_agent_intention(
-                        guideline=guideline_content,
-                        progress_report=progress_report,
-                    )
-                )
+    async def _propose_agent_intention(
+        self,
+        payload: GuidelinePayload,
+        progress_report: Optional[ProgressReport] = None,
+    ) -> Optional[AgentIntentionProposition]:
+        if not payload.properties_proposition:
+            return None
+
+        with _stage(progress_report, "agent_intention"):
+            return await self._agent_intention_proposer.propose_agent_intention(
+                guideline=GuidelineContent(
+                    condition=payload.content.condition,
+                    action=payload.content.action,
+                ),
+                progress_report=progress_report,
             )
 
-        sparse_results = await async_utils.safe_gather(*tasks)
-        results: list[Optional[AgentIntentionProposition]] = [None] * len(payloads)
-        for i, res in zip(indices, sparse_results):
-            results[i] = res
-        return results
-
-    async def _detect_tool_running_actions(
+    async def _detect_tool_running_action(
         self,
-        payloads: Sequence[GuidelinePayload],
+        payload: GuidelinePayload,
         progress_report: Optional[ProgressReport] = None,
-    ) -> Sequence[Optional[ToolRunningActionProposition]]:
-        tasks: list[asyncio.Task[ToolRunningActionProposition]] = []
-        indices: list[int] = []
-
-        for i, p in enumerate(payloads):
-            if not p.journey_node_proposition:
-                continue
-
-            tasks.append(
-                asyncio.create_task(
-                    self._tool_running_action_detector.detect_if_tool_running(
-                        guideline=p.content,
-                        tool_ids=p.tool_ids,
-                        progress_report=progress_report,
-                    )
-                )
+    ) -> Optional[ToolRunningActionProposition]:
+        if not payload.journey_node_proposition:
+            return None
+
+        with _stage(progress_report, "tool_running_action"):
+            return await self._tool_running_action_detector.detect_if_tool_running(
+                guideline=payload.content,
+                tool_ids=payload.tool_ids,
+                progress_report=progress_report,
             )
-            indices.append(i)
-
-        sparse_results = await async_utils.safe_gather(*tasks)
-        results: list[Optional[ToolRunningActionProposition]] = [None] * len(payloads)
-
-        for i, res in zip(indices, sparse_results):
-            results[i] = res
-
-        return results
 
 
 class JourneyEvaluator:
@@ -680,14 +661,18 @@ class BehavioralChangeEvaluator:
         tool_running_action_detector: ToolRunningActionDetector,
         relative_action_proposer: RelativeActionProposer,
         journey_reachable_node_evaluator: JourneyReachableNodesEvaluator,
+        evaluation_cache: EvaluationCache,
     ) -> None:
         self._logger = logger
         self._background_task_service = background_task_service
 
         self._agent_store = agent_store
+        self._guideline_store = guideline_store
+        self._journey_store = journey_store
 
         self._evaluation_store = evaluation_store
         self._entity_queries = entity_queries
+        self._evaluation_cache = evaluation_cache
 
         self._guideline_evaluator = GuidelineEvaluator(
             logger=logger,
@@ -733,6 +718,57 @@ class BehavioralChangeEvaluator:
 
         return evaluation.id
 
+    async def read_cached_evaluation(self, payload: Payload) -> Optional[InvoiceData]:
+        """Returns the result of a previous evaluation of the same content, if there was one."""
+        return await self._evaluation_cache.get(await self._cache_key(payload))
+
+    async def _cache_key(self, payload: Payload) -> JSONSerializable:
+        if isinstance(payload, GuidelinePayload):
+            return {
+                "kind": "guideline",
+                "condition": _normalize(payload.content.condition),
+                "action": _normalize(payload.content.action),
+                "tool_ids": sorted(":".join(t) for t in payload.tool_ids),
+                "action_proposition": payload.action_proposition,
+                "properties_proposition": payload.properties_proposition,
+                "journey_node_proposition": payload.journey_node_proposition,
+            }
+
+        journey = await self._journey_store.read_journey(payload.journey_id)
+        conditions = [
+            await self._guideline_store.read_guideline(guideline_id=condition)
+            for condition in journey.conditions
+        ]
+        nodes = await self._journey_store.list_nodes(journey.id)
+        edges = await self._journey_store.list_edges(journey.id)
+
+        # Journey results refer to nodes and edges by their ids, so those are part of the content
+        return {
+            "kind": "journey",
+            "title": _normalize(journey.title),
+            "description": _normalize(journey.description),
+            "conditions": sorted(_normalize(c.content.condition) for c in conditions),
+            "root_id": journey.root_id,
+            "nodes": [
+                {
+                    "id": n.id,
+                    "action": _normalize(n.action),
+                    "description": _normalize(n.description),
+                    "tool_ids": sorted(":".join(t) for t in n.tools),
+                }
+                for n in sorted(nodes, key=lambda n: n.id)
+            ],
+            "edges": [
+                {
+                    "id": e.id,
+                    "source": e.source,
+                    "target": e.target,
+                    "condition": _normalize(e.condition),
+                }
+                for e in sorted(edges, key=lambda e: e.id)
+            ],
+        }
+
     async def run_evaluation(
         self,
         evaluation: Evaluation,
@@ -753,38 +789,68 @@ class BehavioralChangeEvaluator:
 
             evaluation_invoices = list(evaluation.invoices)
 
+            cache_keys = [await self._cache_key(invoice.payload) for invoice in evaluation_invoices]
+
+            evaluation_data: list[Optional[InvoiceData]] = [
+                await self._evaluation_cache.get(key) for key in cache_keys
+            ]
+
+            # Only what isn't cached yet is evaluated
+            guideline_indices = [
+                i
+                for i, invoice in enumerate(evaluation_invoices)
+                if evaluation_data[i] is None and invoice.kind == PayloadKind.GUIDELINE
+            ]
+            journey_indices = [
+                i
+                for i, invoice in enumerate(evaluation_invoices)
+                if evaluation_data[i] is None and invoice.kind == PayloadKind.JOURNEY
+            ]
+
+            if (
+                cached_count := len(evaluation_invoices)
+                - len(guideline_indices)
+                - len(journey_indices)
+            ):
+                self._logger.trace(
+                    f"evaluation task '{evaluation.id}': {cached_count} payload(s) found in the evaluation cache"
+                )
+
             guideline_evaluation_data, journey_evaluation_data = await async_utils.safe_gather(
                 self._guideline_evaluator.evaluate(
                     payloads=[
-                        cast(GuidelinePayload, invoice.payload)
-                        for invoice in evaluation_invoices
-                        if invoice.kind == PayloadKind.GUIDELINE
+                        cast(GuidelinePayload, evaluation_invoices[i].payload)
+                        for i in guideline_indices
                     ],
                     progress_report=progress_report,
                 ),
                 self._journey_evaluator.evaluate(
                     payloads=[
-                        cast(JourneyPayload, invoice.payload)
-                        for invoice in evaluation_invoices
-                        if invoice.kind == PayloadKind.JOURNEY
+                        cast(JourneyPayload, evaluation_invoices[i].payload)
+                        for i in journey_indices
                     ],
                     progress_report=progress_report,
                 ),
             )
 
-            evaluation_data: Sequence[InvoiceData] = list(guideline_evaluation_data) + list(
-                journey_evaluation_data
-            )
+            evaluated: list[tuple[int, InvoiceData]] = [
+                *zip(guideline_indices, guideline_evaluation_data),
+                *zip(journey_indices, journey_evaluation_data),
+            ]
+
+            for i, data in evaluated:
+                evaluation_data[i] = data
+                await self._evaluation_cache.set(cache_keys[i], data)
 
             invoices: list[Invoice] = []
-            for i, result in enumerate(evaluation_data):
-                invoice_checksum = md5_checksum(str(evaluation.invoices[i].payload))
+            for invoice, result in zip(evaluation_invoices, evaluation_data):
+                invoice_checksum = md5_checksum(str(invoice.payload))
                 state_version = str(hash("Temporarily"))
 
                 invoices.append(
                     Invoice(
-                        kind=evaluation.invoices[i].kind,
-                        payload=evaluation.invoices[i].payload,
+                        kind=invoice.kind,
+                        payload=invoice.payload,
                         checksum=invoice_checksum,
                         state_version=state_version,
                         approved=True,
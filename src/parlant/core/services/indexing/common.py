@@ -13,7 +13,9 @@
 # limitations under the License.
 
 import asyncio
-from typing import Awaitable, Callable
+from contextlib import contextmanager
+import time
+from typing import Awaitable, Callable, Iterator, Mapping
 
 
 class EvaluationError(Exception):
@@ -27,6 +29,7 @@ class ProgressReport:
         self._current = 0
         self._lock = asyncio.Lock()
         self._progress_callback = progress_callback
+        self._stages: dict[str, tuple[float, float]] = {}
 
     @property
     def percentage(self) -> float:
@@ -34,6 +37,26 @@ class ProgressReport:
             return 0.0
         return self._current / self._total * 100
 
+    @property
+    def stage_durations(self) -> Mapping[str, float]:
+        """The wall time of each stage, from its first start to its last end."""
+        return {name: end - start for name, (start, end) in self._stages.items()}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        start = time.monotonic()
+
+        try:
+            yield
+        finally:
+            end = time.monotonic()
+
+            if name in self._stages:
+                first_start, last_end = self._stages[name]
+                self._stages[name] = (min(first_start, start), max(last_end, end))
+            else:
+                self._stages[name] = (start, end)
+
     async def stretch(self, amount: int) -> None:
         async with self._lock:
             self._total += amount
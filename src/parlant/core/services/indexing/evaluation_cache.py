@@ -0,0 +1,171 @@
+# Copyright 2025 Emcie Co Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+import hashlib
+import json
+from typing import Optional, TypedDict, cast
+from typing_extensions import override
+
+from parlant.core.common import JSONSerializable, Version
+from parlant.core.evaluations import InvoiceData, InvoiceGuidelineData, InvoiceJourneyData
+from parlant.core.journeys import JourneyEdgeId, JourneyNodeId
+from parlant.core.persistence.common import ObjectId
+from parlant.core.persistence.document_database import (
+    BaseDocument,
+    DocumentCollection,
+    DocumentDatabase,
+)
+
+
+class EvaluationCache(ABC):
+    """An interface for caching evaluation results by the content that was evaluated.
+
+    The content is a JSON-serializable description of everything an evaluation
+    depends on, so that identical content always maps to the same result.
+    """
+
+    @abstractmethod
+    async def get(
+        self,
+        content: JSONSerializable,
+    ) -> Optional[InvoiceData]: ...
+
+    @abstractmethod
+    async def set(
+        self,
+        content: JSONSerializable,
+        data: InvoiceData,
+    ) -> None: ...
+
+
+class NullEvaluationCache(EvaluationCache):
+    @override
+    async def get(
+        self,
+        content: JSONSerializable,
+    ) -> Optional[InvoiceData]:
+        return None
+
+    @override
+    async def set(
+        self,
+        content: JSONSerializable,
+        data: InvoiceData,
+    ) -> None:
+        pass
+
+
+class EvaluationCacheDocument(TypedDict, total=False):
+    id: ObjectId
+    creation_utc: str
+    version: Version.String
+    kind: str
+    properties: Optional[dict[str, JSONSerializable]]
+    node_properties: dict[JourneyNodeId, dict[str, JSONSerializable]]
+    edge_properties: dict[JourneyEdgeId, dict[str, JSONSerializable]]
+
+
+class BasicEvaluationCache(EvaluationCache):
+    """An evaluation cache that stores results in a document database.
+
+    Results are keyed by a hash of the content and of the models that evaluate it,
+    so they survive restarts and upgrades, and are shared by identical entities.
+    """
+
+    VERSION = Version.from_string("0.1.0")
+
+    def __init__(
+        self,
+        document_database: DocumentDatabase,
+        model_id: str,
+    ) -> None:
+        self._database = document_database
+        self._model_id = model_id
+        self._collection: Optional[DocumentCollection[EvaluationCacheDocument]] = None
+
+    async def _document_loader(self, doc: BaseDocument) -> Optional[EvaluationCacheDocument]:
+        if doc["version"] == "0.1.0":
+            return cast(EvaluationCacheDocument, doc)
+
+        return None
+
+    async def _get_collection(self) -> DocumentCollection[EvaluationCacheDocument]:
+        if not self._collection:
+            self._collection = await self._database.get_or_create_collection(
+                name="evaluations",
+                schema=EvaluationCacheDocument,
+                document_loader=self._document_loader,
+            )
+
+        return self._collection
+
+    def _generate_id(self, content: JSONSerializable) -> ObjectId:
+        key_content = json.dumps(content, sort_keys=True, separators=(",", ":"))
+        return ObjectId(hashlib.sha256(f"{self._model_id}:{key_content}".encode()).hexdigest())
+
+    @override
+    async def get(
+        self,
+        content: JSONSerializable,
+    ) -> Optional[InvoiceData]:
+        collection = await self._get_collection()
+
+        doc = await collection.find_one({"id": {"$eq": self._generate_id(content)}})
+
+        if not doc:
+            return None
+
+        if doc["kind"] == "journey":
+            return InvoiceJourneyData(
+                node_properties_proposition=doc["node_properties"],
+                edge_properties_proposition=doc["edge_properties"],
+            )
+
+        return InvoiceGuidelineData(properties_proposition=doc["properties"])
+
+    @override
+    async def set(
+        self,
+        content: JSONSerializable,
+        data: InvoiceData,
+    ) -> None:
+        collection = await self._get_collection()
+
+        if isinstance(data, InvoiceJourneyData):
+            kind, properties = "journey", None
+            node_properties, edge_properties = (
+                data.node_properties_proposition,
+                data.edge_properties_proposition,
+            )
+        else:
+            kind, properties = "guideline", data.properties_proposition
+            node_properties, edge_properties = {}, {}
+
+        doc = EvaluationCacheDocument(
+            id=self._generate_id(content),
+            creation_utc=datetime.now(timezone.utc).isoformat(),
+            version=self.VERSION.to_string(),
+            kind=kind,
+            properties=properties,
+            node_properties=node_properties,
+            edge_properties=edge_properties,
+        )
+
+        await collection.update_one(
+            filters={"id": {"$eq": doc["id"]}},
+            params=doc,
+            upsert=True,
+        )
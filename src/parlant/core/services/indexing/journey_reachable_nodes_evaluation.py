@@ -681,7 +681,9 @@ OUTPUT FORMAT
                     hints={"temperature": generation_attempt_temperatures[generation_attempt]},
                 )
 
-                self._logger.trace(f"Completion:\n{inference.content.model_dump_json(indent=2)}")
+                self._logger.trace(
+                    lambda: f"Completion:\n{inference.content.model_dump_json(indent=2)}"
+                )
 
                 reachable_follow_ups = []
 
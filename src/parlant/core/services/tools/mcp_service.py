@@ -17,16 +17,11 @@ from __future__ import annotations
 from ast import literal_eval
 from datetime import datetime, timezone
 from mailbox import FormatError
-from mcp.types import Tool as McpTool
 from types import TracebackType
-from typing import Any, Sequence, Mapping, Optional, Literal, Callable
+from typing import TYPE_CHECKING, Any, Sequence, Mapping, Optional, Literal, Callable
 from typing_extensions import override
 import asyncio
-
-from fastmcp import FastMCP
-from fastmcp.tools import Tool as FastMCPTool
-from fastmcp.client import Client
-from fastmcp.client.transports import StreamableHttpTransport
+import httpx
 
 from parlant.core.loggers import Logger
 from parlant.core.tools import (
@@ -43,6 +38,14 @@ from parlant.core.tools import (
 from parlant.core.common import JSONSerializable
 from parlant.core.tracer import Tracer
 from parlant.core.emissions import EventEmitterFactory
+from parlant.core.services.tools.transport import ToolServiceTransport
+
+if TYPE_CHECKING:
+    # fastmcp and mcp take a while to import, so they're only
+    # loaded once an MCP server or client is actually created
+    from fastmcp import FastMCP
+    from fastmcp.client import Client
+    from mcp.types import Tool as McpTool
 
 DEFAULT_MCP_PORT: int = 8181
 
@@ -69,6 +72,9 @@ class MCPToolServer:
         name: str = "",
         transport: Optional[Literal["stdio", "streamable-http", "sse"]] = "streamable-http",
     ) -> None:
+        from fastmcp import FastMCP
+        from fastmcp.tools import Tool as FastMCPTool
+
         self._server: FastMCP[Any] = FastMCP(name=name)
 
         self._server.settings.port = port
@@ -132,10 +138,14 @@ class MCPToolClient(ToolService):
         logger: Logger,
         tracer: Tracer,
         port: int = DEFAULT_MCP_PORT,
+        transport: Optional[ToolServiceTransport] = None,
+        service_name: Optional[str] = None,
     ) -> None:
         self._event_emitter_factory = event_emitter_factory
         self._logger = logger
         self._tracer = tracer
+        self._transport = transport
+        self._service_name = service_name or url
         if ":" in url[-6:]:
             parts = url.split(":")
             self.url = ":".join(parts[:-1])
@@ -145,8 +155,16 @@ class MCPToolClient(ToolService):
             self.port = port
 
     async def __aenter__(self) -> MCPToolClient:
+        from fastmcp.client import Client
+        from fastmcp.client.transports import StreamableHttpTransport
+
         try:
-            self._client = Client(StreamableHttpTransport(url=f"{self.url}:{self.port}/mcp"))
+            self._client: Client[Any] = Client(
+                StreamableHttpTransport(
+                    url=f"{self.url}:{self.port}/mcp",
+                    httpx_client_factory=self._create_http_client if self._transport else None,
+                )
+            )
             await asyncio.wait_for(self._client.__aenter__(), timeout=10.0)  # type: ignore
             return self
         except asyncio.TimeoutError:
@@ -167,6 +185,22 @@ class MCPToolClient(ToolService):
                 pass
         return False
 
+    def _create_http_client(
+        self,
+        headers: dict[str, str] | None = None,
+        timeout: httpx.Timeout | None = None,
+        auth: httpx.Auth | None = None,
+    ) -> httpx.AsyncClient:
+        assert self._transport
+
+        return self._transport.create_client(
+            self._service_name,
+            headers=headers,
+            auth=auth,
+            follow_redirects=True,
+            **({"timeout": timeout} if timeout else {}),
+        )
+
     @override
     async def list_tools(self) -> Sequence[Tool]:
         try:
@@ -42,6 +42,7 @@ from parlant.core.tools import (
 )
 from parlant.core.common import ItemNotFoundError, JSONSerializable, UniqueId
 from parlant.core.tools import ToolService
+from parlant.core.services.tools.transport import ToolServiceTransport
 
 
 class _ToolSpec(NamedTuple):
@@ -50,26 +51,45 @@ class _ToolSpec(NamedTuple):
 
 
 class OpenAPIClient(ToolService):
-    def __init__(self, server_url: str, openapi_json: str) -> None:
+    def __init__(
+        self,
+        server_url: str,
+        openapi_json: str,
+        transport: Optional[ToolServiceTransport] = None,
+        service_name: Optional[str] = None,
+    ) -> None:
         self.server_url = server_url
         self.openapi_json = openapi_json
+        self._transport = transport
+        self._service_name = service_name or server_url
         self._tools = self._parse_tools(openapi_json)
 
     async def __aenter__(self) -> OpenAPIClient:
-        class CustomClient(httpx.AsyncClient):
-            def __init__(self, *args: Any, **kwargs: Any) -> None:
-                super().__init__(
-                    *args,
-                    **{
-                        **kwargs,
-                        "timeout": httpx.Timeout(120),
-                    },
-                )
+        session_factory: Callable[..., httpx.AsyncClient]
+
+        if transport := self._transport:
+            # aiopenapi3 creates (and closes) a client per request,
+            # so route them all through the shared pool to reuse connections.
+            def session_factory(**kwargs: Any) -> httpx.AsyncClient:
+                return transport.create_client(self._service_name, **kwargs)
+        else:
+
+            class CustomClient(httpx.AsyncClient):
+                def __init__(self, *args: Any, **kwargs: Any) -> None:
+                    super().__init__(
+                        *args,
+                        **{
+                            **kwargs,
+                            "timeout": httpx.Timeout(120),
+                        },
+                    )
+
+            session_factory = CustomClient
 
         self._openapi_client = aiopenapi3.OpenAPI.loads(
             url=self.server_url,
             data=self.openapi_json,
-            session_factory=CustomClient,
+            session_factory=session_factory,
         )
 
         return self
@@ -69,6 +69,7 @@ from parlant.core.tracer import Tracer
 from parlant.core.emissions import EventEmitterFactory
 from parlant.core.sessions import SessionId, SessionStatus
 from parlant.core.tools import ToolExecutionError, ToolService
+from parlant.core.services.tools.transport import ToolServiceTransport
 
 TOOL_RESULT_MAX_PAYLOAD_KB = int(os.environ.get("PARLANT_TOOL_RESULT_MAX_PAYLOAD_KB", 16))
 
@@ -755,17 +756,29 @@ class PluginClient(ToolService):
         event_emitter_factory: EventEmitterFactory,
         logger: Logger,
         tracer: Tracer,
+        transport: Optional[ToolServiceTransport] = None,
+        service_name: Optional[str] = None,
     ) -> None:
         self.url = url
         self._event_emitter_factory = event_emitter_factory
         self._logger = logger
         self._tracer = tracer
+        self._transport = transport
+        self._service_name = service_name or url
 
     async def __aenter__(self) -> PluginClient:
-        self._http_client = await httpx.AsyncClient(
-            follow_redirects=True,
-            timeout=httpx.Timeout(120),
-        ).__aenter__()
+        if self._transport:
+            http_client = self._transport.create_client(
+                self._service_name,
+                follow_redirects=True,
+            )
+        else:
+            http_client = httpx.AsyncClient(
+                follow_redirects=True,
+                timeout=httpx.Timeout(120),
+            )
+
+        self._http_client = await http_client.__aenter__()
         return self
 
     async def __aexit__(
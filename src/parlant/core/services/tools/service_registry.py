@@ -27,12 +27,17 @@ from parlant.core.async_utils import ReaderWriterLock
 from parlant.core.tracer import Tracer
 from parlant.core.emissions import EventEmitterFactory
 from parlant.core.loggers import Logger
+from parlant.core.meter import Meter
 from parlant.core.nlp.moderation import ModerationService
 from parlant.core.nlp.service import NLPService
 from parlant.core.persistence.document_database_helper import DocumentStoreMigrationHelper
 from parlant.core.services.tools.openapi import OpenAPIClient
 from parlant.core.services.tools.plugins import PluginClient
 from parlant.core.services.tools.mcp_service import MCPToolClient
+from parlant.core.services.tools.transport import (
+    ToolServiceTransport,
+    ToolServiceTransportConfig,
+)
 from parlant.core.tools import LocalToolService, ToolService
 from parlant.core.common import ItemNotFoundError, Version, UniqueId
 from parlant.core.persistence.common import ObjectId
@@ -127,8 +132,10 @@ class ServiceDocumentRegistry(ServiceRegistry):
         event_emitter_factory: EventEmitterFactory,
         logger: Logger,
         tracer: Tracer,
+        meter: Meter,
         nlp_services_provider: Callable[[], Mapping[str, NLPService]],
         allow_migration: bool = False,
+        transport: Optional[ToolServiceTransport] = None,
     ):
         self._database = database
         self._tool_services_collection: DocumentCollection[_ToolServiceDocument]
@@ -136,6 +143,7 @@ class ServiceDocumentRegistry(ServiceRegistry):
         self._event_emitter_factory = event_emitter_factory
         self._logger = logger
         self._tracer = tracer
+        self._meter = meter
 
         self._nlp_services_provider = nlp_services_provider
         self._nlp_services: Mapping[str, NLPService]
@@ -148,6 +156,9 @@ class ServiceDocumentRegistry(ServiceRegistry):
         self._allow_migration = allow_migration
         self._lock = ReaderWriterLock()
 
+        self._transport = transport
+        self._owns_transport = transport is None
+
     def _cast_to_specific_tool_service_class(
         self,
         service: ToolService,
@@ -180,6 +191,8 @@ class ServiceDocumentRegistry(ServiceRegistry):
                 document_loader=self._document_loader,
             )
 
+        await self._tool_services_collection.ensure_index(["name"])
+
         self._moderation_services = {
             name: await nlp_service.get_moderation_service()
             for name, nlp_service in self._nlp_services.items()
@@ -188,6 +201,15 @@ class ServiceDocumentRegistry(ServiceRegistry):
         self._exit_stack = AsyncExitStack()
         await self._exit_stack.__aenter__()
 
+        if self._owns_transport:
+            self._transport = await self._exit_stack.enter_async_context(
+                ToolServiceTransport(
+                    logger=self._logger,
+                    meter=self._meter,
+                    config=ToolServiceTransportConfig.from_environment(),
+                )
+            )
+
         documents = await self._tool_services_collection.find({})
 
         for document in documents:
@@ -259,6 +281,8 @@ class ServiceDocumentRegistry(ServiceRegistry):
             return OpenAPIClient(
                 server_url=document["url"],
                 openapi_json=openapi_json,
+                transport=self._transport,
+                service_name=document["name"],
             )
         elif document["kind"] == "sdk":
             return PluginClient(
@@ -266,6 +290,8 @@ class ServiceDocumentRegistry(ServiceRegistry):
                 event_emitter_factory=self._event_emitter_factory,
                 logger=self._logger,
                 tracer=self._tracer,
+                transport=self._transport,
+                service_name=document["name"],
             )
         elif document["kind"] == "mcp":
             return MCPToolClient(
@@ -273,6 +299,8 @@ class ServiceDocumentRegistry(ServiceRegistry):
                 event_emitter_factory=self._event_emitter_factory,
                 logger=self._logger,
                 tracer=self._tracer,
+                transport=self._transport,
+                service_name=document["name"],
             )
         else:
             raise ValueError("Unsupported ToolService kind.")
@@ -295,7 +323,12 @@ class ServiceDocumentRegistry(ServiceRegistry):
             elif kind == "openapi":
                 assert source
                 openapi_json = await self._get_openapi_json_from_source(source)
-                service = OpenAPIClient(server_url=url, openapi_json=openapi_json)
+                service = OpenAPIClient(
+                    server_url=url,
+                    openapi_json=openapi_json,
+                    transport=self._transport,
+                    service_name=name,
+                )
                 self._service_sources[name] = source
             elif kind == "mcp":
                 service = MCPToolClient(
@@ -303,6 +336,8 @@ class ServiceDocumentRegistry(ServiceRegistry):
                     event_emitter_factory=self._event_emitter_factory,
                     logger=self._logger,
                     tracer=self._tracer,
+                    transport=self._transport,
+                    service_name=name,
                 )
             elif kind == "sdk":
                 service = PluginClient(
@@ -310,6 +345,8 @@ class ServiceDocumentRegistry(ServiceRegistry):
                     event_emitter_factory=self._event_emitter_factory,
                     logger=self._logger,
                     tracer=self._tracer,
+                    transport=self._transport,
+                    service_name=name,
                 )
             else:
                 raise ValueError(f"Unsupported ToolService kind: {kind}")
@@ -319,6 +356,9 @@ class ServiceDocumentRegistry(ServiceRegistry):
                     self._cast_to_specific_tool_service_class(self._running_services[name])
                 ).__aexit__(None, None, None)
 
+                if self._transport:
+                    self._transport.evict(name)
+
             await self._exit_stack.enter_async_context(
                 self._cast_to_specific_tool_service_class(service)
             )
@@ -409,6 +449,9 @@ class ServiceDocumentRegistry(ServiceRegistry):
                 if name in self._service_sources:
                     del self._service_sources[name]
 
+                if self._transport:
+                    self._transport.evict(name)
+
             result = await self._tool_services_collection.delete_one({"name": {"$eq": name}})
 
         if not result.deleted_count:
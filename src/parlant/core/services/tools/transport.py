@@ -0,0 +1,361 @@
+# Copyright 2025 Emcie Co Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+import asyncio
+from dataclasses import dataclass
+from enum import Enum
+import importlib.util
+import os
+from types import TracebackType
+from typing import Any, AsyncIterator, Optional
+from typing_extensions import Self, override
+
+import httpx
+
+from parlant.core.loggers import Logger
+from parlant.core.meter import Counter, DurationHistogram, Meter
+
+
+@dataclass(frozen=True)
+class ToolServiceTransportConfig:
+    """Connection pool, timeout and circuit breaker settings shared by all tool service clients."""
+
+    max_connections: int = 200
+    max_keepalive_connections: int = 50
+    keepalive_expiry: float = 30.0
+    max_connections_per_service: int = 50
+    http2: bool = True
+    connect_timeout: float = 10.0
+    read_timeout: float = 120.0
+    write_timeout: float = 30.0
+    pool_timeout: float = 30.0
+    circuit_breaker_failure_threshold: int = 5
+    circuit_breaker_reset_timeout: float = 30.0
+
+    @staticmethod
+    def from_environment() -> ToolServiceTransportConfig:
+        defaults = ToolServiceTransportConfig()
+
+        def get(name: str, default: Any) -> Any:
+            value = os.environ.get(f"PARLANT_TOOL_HTTP_{name.upper()}")
+
+            if value is None:
+                return default
+            if isinstance(default, bool):
+                return value.lower() not in ["false", "no", "0"]
+
+            return type(default)(value)
+
+        return ToolServiceTransportConfig(
+            **{
+                name: get(name, getattr(defaults, name))
+                for name in ToolServiceTransportConfig.__dataclass_fields__
+            }
+        )
+
+    @property
+    def timeout(self) -> httpx.Timeout:
+        return httpx.Timeout(
+            connect=self.connect_timeout,
+            read=self.read_timeout,
+            write=self.write_timeout,
+            pool=self.pool_timeout,
+        )
+
+    @property
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+
+class CircuitOpenError(httpx.TransportError):
+    """Raised when a request is short-circuited because its service is considered unavailable."""
+
+    def __init__(self, service_name: str, request: httpx.Request) -> None:
+        super().__init__(
+            f"Circuit breaker for tool service '{service_name}' is open",
+            request=request,
+        )
+
+        self.service_name = service_name
+
+
+class CircuitState(Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Opens after consecutive failures, then lets a single probe through once the reset timeout elapses."""
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        reset_timeout: float,
+    ) -> None:
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._state = CircuitState.CLOSED
+
+    @property
+    def state(self) -> CircuitState:
+        if (
+            self._state == CircuitState.OPEN
+            and self._now() - self._opened_at >= self._reset_timeout
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._probe_in_flight = False
+
+        return self._state
+
+    def allow_request(self) -> bool:
+        match self.state:
+            case CircuitState.CLOSED:
+                return True
+            case CircuitState.OPEN:
+                return False
+            case CircuitState.HALF_OPEN:
+                if self._probe_in_flight:
+                    return False
+
+                self._probe_in_flight = True
+                return True
+
+    def record_success(self) -> None:
+        self._consecutive_failures = 0
+        self._probe_in_flight = False
+        self._state = CircuitState.CLOSED
+
+    def record_failure(self) -> None:
+        self._consecutive_failures += 1
+        self._probe_in_flight = False
+
+        if (
+            self._state == CircuitState.HALF_OPEN
+            or self._consecutive_failures >= self._failure_threshold
+        ):
+            self._state = CircuitState.OPEN
+            self._opened_at = self._now()
+
+    def _now(self) -> float:
+        return asyncio.get_event_loop().time()
+
+
+class _ReleasingByteStream(httpx.AsyncByteStream):
+    def __init__(self, stream: httpx.AsyncByteStream, release: asyncio.Semaphore) -> None:
+        self._stream = stream
+        self._release = release
+        self._released = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if not self._released:
+                self._released = True
+                self._release.release()
+
+
+class _ServiceTransport(httpx.AsyncBaseTransport):
+    """A per-service view over the shared connection pool.
+
+    It caps the service's in-flight connections, applies its circuit breaker
+    and records its latency and errors. Closing it leaves the shared pool open,
+    since other services are still using it.
+    """
+
+    def __init__(
+        self,
+        service_name: str,
+        pool: httpx.AsyncBaseTransport,
+        semaphore: asyncio.Semaphore,
+        circuit_breaker: CircuitBreaker,
+        request_duration: DurationHistogram,
+        request_errors: Counter,
+    ) -> None:
+        self._service_name = service_name
+        self._pool = pool
+        self._semaphore = semaphore
+        self._circuit_breaker = circuit_breaker
+        self._request_duration = request_duration
+        self._request_errors = request_errors
+
+    @override
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if not self._circuit_breaker.allow_request():
+            await self._request_errors.increment(
+                1, {"service": self._service_name, "error": "circuit_open"}
+            )
+            raise CircuitOpenError(self._service_name, request)
+
+        await self._semaphore.acquire()
+
+        try:
+            async with self._request_duration.measure({"service": self._service_name}):
+                response = await self._pool.handle_async_request(request)
+        except BaseException as exc:
+            self._semaphore.release()
+
+            if isinstance(exc, Exception):
+                self._circuit_breaker.record_failure()
+                await self._request_errors.increment(
+                    1, {"service": self._service_name, "error": type(exc).__name__}
+                )
+
+            raise
+
+        if response.status_code >= 500:
+            self._circuit_breaker.record_failure()
+            await self._request_errors.increment(
+                1, {"service": self._service_name, "error": str(response.status_code)}
+            )
+        else:
+            self._circuit_breaker.record_success()
+
+        response.stream = _ReleasingByteStream(
+            stream=response.stream,  # type: ignore[arg-type]
+            release=self._semaphore,
+        )
+
+        return response
+
+    @override
+    async def aclose(self) -> None:
+        pass
+
+
+class ToolServiceTransport:
+    """A connection pool shared by all HTTP-based tool services.
+
+    Each service gets its own client over the same pool (see `create_client`),
+    so TLS sessions and keep-alive connections are reused across tool calls,
+    while connection caps, circuit breaking and metrics stay per-service.
+    """
+
+    def __init__(
+        self,
+        logger: Logger,
+        meter: Meter,
+        config: ToolServiceTransportConfig | None = None,
+    ) -> None:
+        self._logger = logger
+        self._config = config or ToolServiceTransportConfig()
+
+        self._pool: httpx.AsyncHTTPTransport | None = None
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        self._circuit_breakers: dict[str, CircuitBreaker] = {}
+
+        self._hist_request_duration = meter.create_duration_histogram(
+            "ts.request",
+            description="Duration of HTTP requests to tool services",
+        )
+        self._request_errors = meter.create_counter(
+            "ts.errors",
+            description="Failed HTTP requests to tool services",
+        )
+
+    @property
+    def config(self) -> ToolServiceTransportConfig:
+        return self._config
+
+    async def __aenter__(self) -> Self:
+        http2 = self._config.http2
+
+        if http2 and importlib.util.find_spec("h2") is None:
+            self._logger.warning(
+                "HTTP/2 was requested for tool services, but the 'h2' package is not installed; "
+                "falling back to HTTP/1.1. Install it with `pip install httpx[http2]`."
+            )
+            http2 = False
+
+        self._pool = httpx.AsyncHTTPTransport(
+            limits=self._config.limits,
+            http2=http2,
+        )
+
+        await self._pool.__aenter__()
+
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> bool:
+        if self._pool:
+            await self._pool.__aexit__(exc_type, exc_value, traceback)
+            self._pool = None
+
+        self._semaphores.clear()
+        self._circuit_breakers.clear()
+
+        return False
+
+    def circuit_breaker(self, service_name: str) -> CircuitBreaker:
+        if service_name not in self._circuit_breakers:
+            self._circuit_breakers[service_name] = CircuitBreaker(
+                failure_threshold=self._config.circuit_breaker_failure_threshold,
+                reset_timeout=self._config.circuit_breaker_reset_timeout,
+            )
+
+        return self._circuit_breakers[service_name]
+
+    def create_service_transport(self, service_name: str) -> httpx.AsyncBaseTransport:
+        if not self._pool:
+            raise RuntimeError("ToolServiceTransport must be entered before it is used")
+
+        if service_name not in self._semaphores:
+            self._semaphores[service_name] = asyncio.Semaphore(
+                self._config.max_connections_per_service
+            )
+
+        return _ServiceTransport(
+            service_name=service_name,
+            pool=self._pool,
+            semaphore=self._semaphores[service_name],
+            circuit_breaker=self.circuit_breaker(service_name),
+            request_duration=self._hist_request_duration,
+            request_errors=self._request_errors,
+        )
+
+    def create_client(self, service_name: str, **kwargs: Any) -> httpx.AsyncClient:
+        """Creates a client for a service over the shared pool.
+
+        The client may be closed freely; doing so does not close the shared pool.
+        """
+        return httpx.AsyncClient(
+            **{
+                "timeout": self._config.timeout,
+                **kwargs,
+                "transport": self.create_service_transport(service_name),
+            }
+        )
+
+    def evict(self, service_name: str) -> None:
+        self._semaphores.pop(service_name, None)
+        self._circuit_breakers.pop(service_name, None)
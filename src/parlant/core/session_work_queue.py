@@ -0,0 +1,267 @@
+# Copyright 2025 Emcie Co Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+from abc import ABC, abstractmethod
+import asyncio
+from collections import deque
+from dataclasses import dataclass, field
+import time
+import traceback
+from typing import Optional
+
+from parlant.core.common import generate_id
+from parlant.core.emissions import EventEmitterFactory
+from parlant.core.engines.types import Context, Engine
+from parlant.core.loggers import Logger
+from parlant.core.profiling import TurnProfiler
+from parlant.core.sessions import SessionId, SessionStore
+from parlant.core.tracer import Tracer
+
+
+@dataclass(frozen=True)
+class SessionLease:
+    """A worker's exclusive claim on processing a session, up to a given request."""
+
+    id: str
+    session_id: SessionId
+    generation: int
+    trace_id: str
+    requested_at: float
+    """The (wall-clock) time of the latest request the lease covers"""
+
+
+class SessionWorkQueue(ABC):
+    """Hands sessions that need processing to the workers that process them.
+
+    Every request to process a session supersedes the previous ones. A session is
+    leased to a single worker at a time, which loses its lease as soon as the
+    session is requested again, so that it can stop and let the session be
+    claimed anew with the latest request.
+    """
+
+    @abstractmethod
+    async def enqueue(
+        self,
+        session_id: SessionId,
+        trace_id: str,
+    ) -> None: ...
+
+    @abstractmethod
+    async def claim(self) -> SessionLease:
+        """Waits for a session that needs processing, and leases it."""
+        ...
+
+    @abstractmethod
+    async def hold(self, lease: SessionLease) -> None:
+        """Keeps the lease alive, returning once it has been superseded or lost."""
+        ...
+
+    @abstractmethod
+    async def complete(self, lease: SessionLease) -> None:
+        """Ends the lease, marking the requests it covered as processed."""
+        ...
+
+    @abstractmethod
+    async def release(self, lease: SessionLease) -> None:
+        """Ends the lease without processing, leaving the session to be claimed again."""
+        ...
+
+
+@dataclass
+class _SessionWork:
+    generation: int = 0
+    completed: int = 0
+    trace_id: str = ""
+    requested_at: float = 0.0
+    lease: Optional[SessionLease] = None
+    superseded: asyncio.Event = field(default_factory=asyncio.Event)
+
+
+class InProcessSessionWorkQueue(SessionWorkQueue):
+    """A work queue for a single process, in which requests and workers share memory."""
+
+    def __init__(self) -> None:
+        self._sessions: dict[SessionId, _SessionWork] = {}
+        self._pending: deque[SessionId] = deque()
+        self._condition = asyncio.Condition()
+
+    async def enqueue(
+        self,
+        session_id: SessionId,
+        trace_id: str,
+    ) -> None:
+        async with self._condition:
+            work = self._sessions.setdefault(session_id, _SessionWork())
+
+            work.generation += 1
+            work.trace_id = trace_id
+            work.requested_at = time.time()
+
+            if work.lease:
+                work.superseded.set()
+            elif session_id not in self._pending:
+                self._pending.append(session_id)
+                self._condition.notify()
+
+    async def claim(self) -> SessionLease:
+        async with self._condition:
+            await self._condition.wait_for(lambda: bool(self._pending))
+
+            session_id = self._pending.popleft()
+            work = self._sessions[session_id]
+
+            work.lease = SessionLease(
+                id=generate_id(),
+                session_id=session_id,
+                generation=work.generation,
+                trace_id=work.trace_id,
+                requested_at=work.requested_at,
+            )
+            work.superseded = asyncio.Event()
+
+            return work.lease
+
+    async def hold(self, lease: SessionLease) -> None:
+        work = self._sessions.get(lease.session_id)
+
+        if not work or work.lease != lease:
+            return
+
+        await work.superseded.wait()
+
+    async def complete(self, lease: SessionLease) -> None:
+        await self._end(lease, completed=True)
+
+    async def release(self, lease: SessionLease) -> None:
+        await self._end(lease, completed=False)
+
+    async def _end(self, lease: SessionLease, completed: bool) -> None:
+        async with self._condition:
+            work = self._sessions.get(lease.session_id)
+
+            if not work or work.lease != lease:
+                return
+
+            work.lease = None
+
+            if completed:
+                work.completed = lease.generation
+
+            if work.generation > work.completed:
+                self._pending.append(lease.session_id)
+                self._condition.notify()
+            else:
+                del self._sessions[lease.session_id]
+
+
+class SessionWorker:
+    """Claims sessions from the work queue, and processes them with the engine."""
+
+    def __init__(
+        self,
+        logger: Logger,
+        tracer: Tracer,
+        session_store: SessionStore,
+        engine: Engine,
+        event_emitter_factory: EventEmitterFactory,
+        work_queue: SessionWorkQueue,
+        turn_profiler: TurnProfiler,
+        max_concurrent_sessions: int = 100,
+    ) -> None:
+        self._logger = logger
+        self._tracer = tracer
+        self._session_store = session_store
+        self._engine = engine
+        self._event_emitter_factory = event_emitter_factory
+        self._work_queue = work_queue
+        self._turn_profiler = turn_profiler
+        self._max_concurrent_sessions = max_concurrent_sessions
+
+    async def run(self) -> None:
+        semaphore = asyncio.Semaphore(self._max_concurrent_sessions)
+        tasks: set[asyncio.Task[None]] = set()
+
+        def on_done(task: asyncio.Task[None]) -> None:
+            tasks.discard(task)
+            semaphore.release()
+
+        try:
+            while True:
+                await semaphore.acquire()
+
+                try:
+                    lease = await self._work_queue.claim()
+                except BaseException:
+                    semaphore.release()
+                    raise
+
+                task = asyncio.create_task(self._process(lease))
+                tasks.add(task)
+                task.add_done_callback(on_done)
+        finally:
+            for task in tasks:
+                task.cancel("Session worker stopped")
+
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _process(self, lease: SessionLease) -> None:
+        # The turn's queueing time counts from the request, which may have come from another process
+        with self._turn_profiler.dispatching(queued_for=max(0.0, time.time() - lease.requested_at)):
+            processing = asyncio.create_task(self._process_session(lease))
+
+        holding = asyncio.create_task(self._work_queue.hold(lease))
+
+        try:
+            await asyncio.wait([processing, holding], return_when=asyncio.FIRST_COMPLETED)
+        except asyncio.CancelledError:
+            await self._abandon(processing, lease)
+            raise
+        finally:
+            holding.cancel()
+
+        if not processing.done():
+            # The session was requested again (or the lease was lost) mid-processing
+            await self._abandon(processing, lease)
+            return
+
+        if not processing.cancelled() and (exception := processing.exception()):
+            self._logger.warning(
+                f"{type(self).__name__}: Processing session {lease.session_id} failed: {traceback.format_exception(exception)}"
+            )
+
+        await self._work_queue.complete(lease)
+
+    async def _abandon(self, processing: asyncio.Task[None], lease: SessionLease) -> None:
+        processing.cancel(f"Lease on session {lease.session_id} ended")
+        await asyncio.gather(processing, return_exceptions=True)
+
+        await self._work_queue.release(lease)
+
+    async def _process_session(self, lease: SessionLease) -> None:
+        session = await self._session_store.read_session(lease.session_id)
+
+        with self._tracer.continue_trace(lease.trace_id):
+            event_emitter = await self._event_emitter_factory.create_event_emitter(
+                emitting_agent_id=session.agent_id,
+                session_id=session.id,
+            )
+
+            await self._engine.process(
+                Context(
+                    session_id=session.id,
+                    agent_id=session.agent_id,
+                ),
+                event_emitter=event_emitter,
+            )
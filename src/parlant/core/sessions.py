@@ -15,10 +15,14 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+import asyncio
+from collections import defaultdict
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
 from typing import (
+    AsyncGenerator,
     Iterator,
     Literal,
     Mapping,
@@ -26,9 +30,12 @@ from typing import (
     Sequence,
     TypeAlias,
     cast,
+    overload,
 )
 from typing_extensions import override, TypedDict, NotRequired, Self
 
+from cachetools import LRUCache
+
 from parlant.core import async_utils
 from parlant.core.async_utils import ReaderWriterLock, Timeout
 from parlant.core.common import (
@@ -250,6 +257,52 @@ class Inspection:
     preparation_iterations: Sequence[PreparationIteration]
 
 
+@dataclass(frozen=True)
+class SpanProfile:
+    """A timed section of a turn. Offsets are in seconds, relative to the start of the turn."""
+
+    name: str
+    start_offset: float
+    end_offset: float
+    input_tokens: int
+    output_tokens: int
+    attributes: Mapping[str, JSONSerializable]
+    children: Sequence[SpanProfile]
+
+    @property
+    def duration(self) -> float:
+        return self.end_offset - self.start_offset
+
+    @property
+    def total_input_tokens(self) -> int:
+        return self.input_tokens + sum(c.total_input_tokens for c in self.children)
+
+    @property
+    def total_output_tokens(self) -> int:
+        return self.output_tokens + sum(c.total_output_tokens for c in self.children)
+
+    def critical_path(self) -> Sequence[SpanProfile]:
+        """The chain of nested spans that determined when this one ended.
+
+        At each level, this follows the child that ended last.
+        """
+        if not self.children:
+            return [self]
+
+        last_child = max(self.children, key=lambda c: c.end_offset)
+        return [self, *last_child.critical_path()]
+
+
+@dataclass(frozen=True)
+class TurnProfile:
+    """Where the wall-clock time of a single agent turn went."""
+
+    session_id: SessionId
+    trace_id: str
+    creation_utc: datetime
+    root: SpanProfile
+
+
 ConsumerId: TypeAlias = Literal["client"]
 """In the future we may support multiple consumer IDs"""
 
@@ -309,6 +362,27 @@ class SessionListing:
         return len(self.items)
 
 
+@dataclass(frozen=True)
+class EventListing(Sequence[Event]):
+    """A page of events, which can also be used as a sequence of them."""
+
+    items: Sequence[Event]
+    has_more: bool = False
+    next_cursor: Cursor | None = None
+
+    @overload
+    def __getitem__(self, index: int) -> Event: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[Event]: ...
+
+    def __getitem__(self, index: int | slice) -> Event | Sequence[Event]:
+        return self.items[index]
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+
 class SessionStore(ABC):
     @abstractmethod
     async def create_session(
@@ -399,7 +473,17 @@ class SessionStore(ABC):
         kinds: Sequence[EventKind] = [],
         min_offset: int | None = None,
         exclude_deleted: bool = True,
-    ) -> Sequence[Event]: ...
+        max_offset: int | None = None,
+        limit: int | None = None,
+        cursor: Cursor | None = None,
+        omit_tool_results: bool = False,
+        sort_direction: SortDirection | None = None,
+    ) -> EventListing:
+        """Lists events by their order of creation, or its reverse with `SortDirection.DESC`.
+
+        If `omit_tool_results` is set, the results of tool calls are left out of tool events' data.
+        """
+        ...
 
     @abstractmethod
     async def update_event(
@@ -409,6 +493,25 @@ class SessionStore(ABC):
         params: EventUpdateParams,
     ) -> Event: ...
 
+    @abstractmethod
+    async def create_turn_profile(
+        self,
+        profile: TurnProfile,
+    ) -> TurnProfile: ...
+
+    @abstractmethod
+    async def read_turn_profile(
+        self,
+        session_id: SessionId,
+        trace_id: str,
+    ) -> TurnProfile: ...
+
+    @abstractmethod
+    async def list_turn_profiles(
+        self,
+        session_id: SessionId,
+    ) -> Sequence[TurnProfile]: ...
+
 
 class _SessionDocument_v0_4_0(TypedDict, total=False):
     id: ObjectId
@@ -609,6 +712,25 @@ class _InspectionDocument(TypedDict, total=False):
     preparation_iterations: Sequence[_PreparationIterationDocument]
 
 
+class _SpanProfileDocument(TypedDict):
+    name: str
+    start_offset: float
+    end_offset: float
+    input_tokens: int
+    output_tokens: int
+    attributes: Mapping[str, JSONSerializable]
+    children: Sequence[_SpanProfileDocument]
+
+
+class _TurnProfileDocument(TypedDict, total=False):
+    id: ObjectId
+    version: Version.String
+    session_id: SessionId
+    trace_id: str
+    creation_utc: str
+    root: _SpanProfileDocument
+
+
 class _MessageEventData_v0_5_0(TypedDict):
     message: str
     participant: Participant
@@ -636,13 +758,112 @@ class _ToolEventData_v0_5_0(TypedDict):
     tool_calls: list[_ToolCall_v0_5_0]
 
 
+@dataclass(frozen=True)
+class EventNotification:
+    session_id: SessionId
+    event: Event
+    created: bool
+    ephemeral: bool = False
+
+
+class SessionEventSubscription:
+    def __init__(self, queue_size: int) -> None:
+        self._queue = asyncio.Queue[EventNotification](maxsize=queue_size)
+        self.overflowed = False
+
+    def _put(self, notification: EventNotification) -> None:
+        try:
+            self._queue.put_nowait(notification)
+        except asyncio.QueueFull:
+            # The subscriber is expected to catch up from the store
+            self.overflowed = True
+
+    async def get(self, timeout: Timeout) -> EventNotification | None:
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout=timeout.remaining())
+        except asyncio.TimeoutError:
+            return None
+
+    def clear(self) -> None:
+        while not self._queue.empty():
+            self._queue.get_nowait()
+
+        self.overflowed = False
+
+
+class SessionEventNotifier:
+    """Lets in-process listeners know as soon as a session's events are written.
+
+    Session stores publish the events they create and update to it, so that
+    listeners don't have to poll the store in order to find out about them.
+    """
+
+    def __init__(self, queue_size: int = 1000, tracked_sessions: int = 10_000) -> None:
+        self._queue_size = queue_size
+        self._subscriptions: defaultdict[SessionId, set[SessionEventSubscription]] = defaultdict(
+            set
+        )
+        self._last_offsets: LRUCache[SessionId, int] = LRUCache(maxsize=tracked_sessions)
+
+    def publish(
+        self,
+        session_id: SessionId,
+        event: Event,
+        created: bool,
+        ephemeral: bool = False,
+    ) -> None:
+        if not ephemeral:
+            if created:
+                self._last_offsets[session_id] = max(
+                    event.offset, self._last_offsets.get(session_id, -1)
+                )
+            elif event.deleted:
+                # Offsets may be reused after a deletion, so the store has to be asked again
+                self._last_offsets.pop(session_id, None)
+
+        if subscriptions := self._subscriptions.get(session_id):
+            notification = EventNotification(
+                session_id=session_id,
+                event=event,
+                created=created,
+                ephemeral=ephemeral,
+            )
+
+            for subscription in subscriptions:
+                subscription._put(notification)
+
+    def read_last_offset(self, session_id: SessionId) -> int | None:
+        """Returns the offset of the last event created in the session, if it was published here."""
+        return self._last_offsets.get(session_id)
+
+    @contextmanager
+    def subscribe(self, session_id: SessionId) -> Iterator[SessionEventSubscription]:
+        subscription = SessionEventSubscription(self._queue_size)
+        self._subscriptions[session_id].add(subscription)
+
+        try:
+            yield subscription
+        finally:
+            self._subscriptions[session_id].discard(subscription)
+
+            if not self._subscriptions[session_id]:
+                del self._subscriptions[session_id]
+
+
 class SessionDocumentStore(SessionStore):
     VERSION = Version.from_string("0.8.0")
 
-    def __init__(self, database: DocumentDatabase, allow_migration: bool = False):
+    def __init__(
+        self,
+        database: DocumentDatabase,
+        allow_migration: bool = False,
+        event_notifier: SessionEventNotifier | None = None,
+    ):
         self._database = database
+        self._event_notifier = event_notifier or SessionEventNotifier()
         self._session_collection: DocumentCollection[_SessionDocument]
         self._event_collection: DocumentCollection[_EventDocument]
+        self._turn_profile_collection: DocumentCollection[_TurnProfileDocument]
         self._allow_migration = allow_migration
 
         self._lock = ReaderWriterLock()
@@ -869,6 +1090,13 @@ class SessionDocumentStore(SessionStore):
             },
         ).migrate(doc)
 
+    async def _turn_profile_document_loader(self, doc: BaseDocument) -> _TurnProfileDocument | None:
+        if doc["version"] == self.VERSION.to_string():
+            return cast(_TurnProfileDocument, doc)
+
+        # Profiles are diagnostic data, so older ones are simply dropped.
+        return None
+
     async def __aenter__(self) -> Self:
         async with DocumentStoreMigrationHelper(
             store=self,
@@ -885,6 +1113,16 @@ class SessionDocumentStore(SessionStore):
                 schema=_EventDocument,
                 document_loader=self._event_document_loader,
             )
+            self._turn_profile_collection = await self._database.get_or_create_collection(
+                name="turn_profiles",
+                schema=_TurnProfileDocument,
+                document_loader=self._turn_profile_document_loader,
+            )
+
+        await self._session_collection.ensure_index(["agent_id"])
+        await self._session_collection.ensure_index(["customer_id"])
+        await self._event_collection.ensure_index(["session_id", "offset"])
+        await self._turn_profile_collection.ensure_index(["session_id", "trace_id"])
 
         return self
 
@@ -1005,6 +1243,46 @@ class SessionDocumentStore(SessionStore):
             deleted=event_document["deleted"],
         )
 
+    def _serialize_span_profile(self, span: SpanProfile) -> _SpanProfileDocument:
+        return _SpanProfileDocument(
+            name=span.name,
+            start_offset=span.start_offset,
+            end_offset=span.end_offset,
+            input_tokens=span.input_tokens,
+            output_tokens=span.output_tokens,
+            attributes=span.attributes,
+            children=[self._serialize_span_profile(c) for c in span.children],
+        )
+
+    def _deserialize_span_profile(self, document: _SpanProfileDocument) -> SpanProfile:
+        return SpanProfile(
+            name=document["name"],
+            start_offset=document["start_offset"],
+            end_offset=document["end_offset"],
+            input_tokens=document["input_tokens"],
+            output_tokens=document["output_tokens"],
+            attributes=document["attributes"],
+            children=[self._deserialize_span_profile(c) for c in document["children"]],
+        )
+
+    def _serialize_turn_profile(self, profile: TurnProfile) -> _TurnProfileDocument:
+        return _TurnProfileDocument(
+            id=ObjectId(generate_id()),
+            version=self.VERSION.to_string(),
+            session_id=profile.session_id,
+            trace_id=profile.trace_id,
+            creation_utc=profile.creation_utc.isoformat(),
+            root=self._serialize_span_profile(profile.root),
+        )
+
+    def _deserialize_turn_profile(self, document: _TurnProfileDocument) -> TurnProfile:
+        return TurnProfile(
+            session_id=document["session_id"],
+            trace_id=document["trace_id"],
+            creation_utc=datetime.fromisoformat(document["creation_utc"]),
+            root=self._deserialize_span_profile(document["root"]),
+        )
+
     @override
     async def create_session(
         self,
@@ -1050,6 +1328,16 @@ class SessionDocumentStore(SessionStore):
                 )
             )
 
+            profiles = await self._turn_profile_collection.find(
+                filters={"session_id": {"$eq": session_id}}
+            )
+            await async_utils.safe_gather(
+                *(
+                    self._turn_profile_collection.delete_one(filters={"id": {"$eq": p["id"]}})
+                    for p in profiles
+                )
+            )
+
             await self._session_collection.delete_one({"id": {"$eq": session_id}})
 
     @override
@@ -1216,6 +1504,8 @@ class SessionDocumentStore(SessionStore):
                 document=self._serialize_event(event, session_id)
             )
 
+        self._event_notifier.publish(session_id, event, created=True)
+
         return event
 
     @override
@@ -1249,6 +1539,13 @@ class SessionDocumentStore(SessionStore):
         if result.matched_count == 0:
             raise ItemNotFoundError(item_id=UniqueId(event_id), message="Event not found")
 
+        if result.updated_document:
+            self._event_notifier.publish(
+                SessionId(result.updated_document["session_id"]),
+                self._deserialize_event(result.updated_document),
+                created=False,
+            )
+
     @override
     async def list_events(
         self,
@@ -1258,35 +1555,43 @@ class SessionDocumentStore(SessionStore):
         kinds: Sequence[EventKind] = [],
         min_offset: int | None = None,
         exclude_deleted: bool = True,
-    ) -> Sequence[Event]:
+        max_offset: int | None = None,
+        limit: int | None = None,
+        cursor: Cursor | None = None,
+        omit_tool_results: bool = False,
+        sort_direction: SortDirection | None = None,
+    ) -> EventListing:
         async with self._lock.reader_lock:
             if not await self._session_collection.find_one(filters={"id": {"$eq": session_id}}):
                 raise ItemNotFoundError(item_id=UniqueId(session_id), message="Session not found")
 
-            base_filters = {
+            offset_filter = {
+                **({"$gte": min_offset} if min_offset else {}),
+                **({"$lte": max_offset} if max_offset is not None else {}),
+            }
+
+            filters = {
                 "session_id": {"$eq": session_id},
                 **({"source": {"$eq": source.value}} if source else {}),
-                **({"offset": {"$gte": min_offset}} if min_offset else {}),
+                **({"offset": offset_filter} if offset_filter else {}),
                 **({"trace_id": {"$eq": trace_id}} if trace_id else {}),
                 **({"deleted": {"$eq": False}} if exclude_deleted else {}),
+                **({"kind": {"$in": [k.value for k in kinds]}} if kinds else {}),
             }
 
-            if kinds:
-                event_documents = await self._event_collection.find(
-                    cast(
-                        Where,
-                        {"$or": [{**base_filters, "kind": {"$eq": k.value}} for k in kinds]},
-                    )
-                )
-            else:
-                event_documents = await self._event_collection.find(
-                    cast(
-                        Where,
-                        base_filters,
-                    )
-                )
+            result = await self._event_collection.find(
+                cast(Where, filters),
+                limit=limit,
+                cursor=cursor,
+                sort_direction=sort_direction,
+                exclude_fields=["data.tool_calls.result"] if omit_tool_results else None,
+            )
 
-        return [self._deserialize_event(d) for d in event_documents]
+        return EventListing(
+            items=[self._deserialize_event(d) for d in result.items],
+            has_more=result.has_more,
+            next_cursor=result.next_cursor,
+        )
 
     @override
     async def update_event(
@@ -1326,7 +1631,153 @@ class SessionDocumentStore(SessionStore):
 
         assert result.updated_document
 
-        return self._deserialize_event(result.updated_document)
+        event = self._deserialize_event(result.updated_document)
+
+        self._event_notifier.publish(session_id, event, created=False)
+
+        return event
+
+    @override
+    async def create_turn_profile(
+        self,
+        profile: TurnProfile,
+    ) -> TurnProfile:
+        async with self._lock.writer_lock:
+            await self._turn_profile_collection.insert_one(
+                document=self._serialize_turn_profile(profile)
+            )
+
+        return profile
+
+    @override
+    async def read_turn_profile(
+        self,
+        session_id: SessionId,
+        trace_id: str,
+    ) -> TurnProfile:
+        async with self._lock.reader_lock:
+            documents = await self._turn_profile_collection.find(
+                filters={
+                    "session_id": {"$eq": session_id},
+                    "trace_id": {"$eq": trace_id},
+                }
+            )
+
+        if not documents:
+            raise ItemNotFoundError(item_id=UniqueId(trace_id), message="Turn profile not found")
+
+        # Should a trace have been processed more than once, its latest run is the relevant one
+        return self._deserialize_turn_profile(max(documents, key=lambda d: d["creation_utc"]))
+
+    @override
+    async def list_turn_profiles(
+        self,
+        session_id: SessionId,
+    ) -> Sequence[TurnProfile]:
+        async with self._lock.reader_lock:
+            documents = await self._turn_profile_collection.find(
+                filters={"session_id": {"$eq": session_id}}
+            )
+
+        return sorted(
+            (self._deserialize_turn_profile(d) for d in documents),
+            key=lambda p: p.creation_utc,
+        )
+
+
+FINAL_SESSION_STATUSES: frozenset[SessionStatus] = frozenset({"ready", "cancelled", "error"})
+
+
+class SessionStatusChannel:
+    """Broadcasts a session's status events to in-process listeners, without storing them.
+
+    Status events are mostly useful live, so only the final status of a trace is
+    persisted, and only if `persist_final_statuses` is set. Every other status is kept
+    in memory as the session's current status, until the next one replaces it.
+
+    Listeners in other processes never see the statuses kept in memory. Where sessions
+    are processed in one process and served in another, set `persist_all_statuses`.
+
+    An unstored status takes the offset of the last stored event in its session. That
+    way, clients that resume from the offset after the last one they got never skip
+    a stored event, and they still get the statuses that came after it.
+    """
+
+    def __init__(
+        self,
+        session_store: SessionStore,
+        event_notifier: SessionEventNotifier,
+        persist_final_statuses: bool = True,
+        persist_all_statuses: bool = False,
+        tracked_sessions: int = 10_000,
+    ) -> None:
+        self._session_store = session_store
+        self._event_notifier = event_notifier
+        self._persist_final_statuses = persist_final_statuses
+        self._persist_all_statuses = persist_all_statuses
+        self._statuses: LRUCache[SessionId, Event] = LRUCache(maxsize=tracked_sessions)
+
+    async def publish(
+        self,
+        session_id: SessionId,
+        source: EventSource,
+        trace_id: str,
+        data: StatusEventData,
+        metadata: Mapping[str, JSONSerializable] = {},
+    ) -> Event:
+        offset = await self._read_last_offset(session_id)
+
+        # With no event before it, a status would have no offset of its own to take
+        if (
+            offset is None
+            or self._persist_all_statuses
+            or (self._persist_final_statuses and data["status"] in FINAL_SESSION_STATUSES)
+        ):
+            self._statuses.pop(session_id, None)
+
+            return await self._session_store.create_event(
+                session_id=session_id,
+                source=source,
+                kind=EventKind.STATUS,
+                trace_id=trace_id,
+                data=cast(JSONSerializable, data),
+                metadata=metadata,
+            )
+
+        event = Event(
+            id=EventId(generate_id()),
+            source=source,
+            kind=EventKind.STATUS,
+            creation_utc=datetime.now(timezone.utc),
+            offset=offset,
+            trace_id=trace_id,
+            data=cast(JSONSerializable, data),
+            metadata=metadata,
+            deleted=False,
+        )
+
+        self._statuses[session_id] = event
+        self._event_notifier.publish(session_id, event, created=True, ephemeral=True)
+
+        return event
+
+    def read_status(self, session_id: SessionId) -> Event | None:
+        """Returns the session's current status, unless it was stored."""
+        return self._statuses.get(session_id)
+
+    async def _read_last_offset(self, session_id: SessionId) -> int | None:
+        offset = self._event_notifier.read_last_offset(session_id)
+
+        if offset is None:
+            # Events written before this process started were never published here
+            if events := await self._session_store.list_events(
+                session_id,
+                limit=1,
+                sort_direction=SortDirection.DESC,
+            ):
+                offset = events[0].offset
+
+        return offset
 
 
 class SessionListener(ABC):
@@ -1341,6 +1792,36 @@ class SessionListener(ABC):
         timeout: Timeout = Timeout.infinite(),
     ) -> bool: ...
 
+    @abstractmethod
+    def stream_events(
+        self,
+        session_id: SessionId,
+        kinds: Sequence[EventKind] = [],
+        min_offset: int | None = None,
+        source: EventSource | None = None,
+        trace_id: str | None = None,
+    ) -> AsyncGenerator[Event, None]:
+        """Yields matching events from the given offset onward, then keeps yielding new ones."""
+        ...
+
+
+def _event_matches(
+    event: Event,
+    kinds: Sequence[EventKind],
+    source: EventSource | None,
+    trace_id: str | None,
+) -> bool:
+    return (
+        (not kinds or event.kind in kinds)
+        and (source is None or event.source == source)
+        and (trace_id is None or event.trace_id == trace_id)
+    )
+
+
+def _notified_offset(notification: EventNotification) -> int:
+    # An unstored status comes right after the event whose offset it took
+    return notification.event.offset + 1 if notification.ephemeral else notification.event.offset
+
 
 class PollingSessionListener(SessionListener):
     def __init__(self, session_store: SessionStore) -> None:
@@ -1374,3 +1855,146 @@ class PollingSessionListener(SessionListener):
                 return False
             else:
                 await timeout.wait_up_to(0.25)
+
+    @override
+    async def stream_events(
+        self,
+        session_id: SessionId,
+        kinds: Sequence[EventKind] = [],
+        min_offset: int | None = None,
+        source: EventSource | None = None,
+        trace_id: str | None = None,
+    ) -> AsyncGenerator[Event, None]:
+        next_offset = min_offset or 0
+
+        while True:
+            events = await self._session_store.list_events(
+                session_id,
+                min_offset=next_offset,
+                source=source,
+                kinds=kinds,
+                trace_id=trace_id,
+            )
+
+            for event in events:
+                yield event
+                next_offset = max(next_offset, event.offset + 1)
+
+            await asyncio.sleep(0.25)
+
+
+class NotifyingSessionListener(SessionListener):
+    """Wakes up as soon as events are written, rather than polling the store for them.
+
+    Unlike PollingSessionListener, this also streams updates to events that were
+    already delivered (including their deletion), as well as statuses that aren't stored.
+    Since writes made by other processes are not notified, the store is still re-checked
+    every `poll_interval` seconds.
+    """
+
+    def __init__(
+        self,
+        session_store: SessionStore,
+        event_notifier: SessionEventNotifier,
+        poll_interval: float = 5.0,
+    ) -> None:
+        self._session_store = session_store
+        self._event_notifier = event_notifier
+        self._poll_interval = poll_interval
+
+    @override
+    async def wait_for_events(
+        self,
+        session_id: SessionId,
+        kinds: Sequence[EventKind] = [],
+        min_offset: int | None = None,
+        source: EventSource | None = None,
+        trace_id: str | None = None,
+        timeout: Timeout = Timeout.infinite(),
+    ) -> bool:
+        # Trigger exception if not found
+        _ = await self._session_store.read_session(session_id)
+
+        with self._event_notifier.subscribe(session_id) as subscription:
+            while True:
+                subscription.clear()
+
+                events = await self._session_store.list_events(
+                    session_id,
+                    min_offset=min_offset,
+                    source=source,
+                    kinds=kinds,
+                    trace_id=trace_id,
+                )
+
+                if events:
+                    return True
+                elif timeout.expired():
+                    return False
+
+                while notification := await subscription.get(
+                    timeout.afford_up_to(self._poll_interval)
+                ):
+                    if subscription.overflowed:
+                        break
+
+                    if (
+                        notification.created
+                        and _notified_offset(notification) >= (min_offset or 0)
+                        and _event_matches(notification.event, kinds, source, trace_id)
+                    ):
+                        return True
+
+    @override
+    async def stream_events(
+        self,
+        session_id: SessionId,
+        kinds: Sequence[EventKind] = [],
+        min_offset: int | None = None,
+        source: EventSource | None = None,
+        trace_id: str | None = None,
+    ) -> AsyncGenerator[Event, None]:
+        # Trigger exception if not found
+        _ = await self._session_store.read_session(session_id)
+
+        next_offset = min_offset or 0
+
+        # Subscribing before listing means nothing written in between is missed.
+        # Whatever is both listed and notified is told apart by its offset.
+        with self._event_notifier.subscribe(session_id) as subscription:
+            while True:
+                subscription.clear()
+
+                events = await self._session_store.list_events(
+                    session_id,
+                    min_offset=next_offset,
+                    source=source,
+                    kinds=kinds,
+                    trace_id=trace_id,
+                )
+
+                for event in events:
+                    yield event
+                    next_offset = max(next_offset, event.offset + 1)
+
+                while True:
+                    notification = await subscription.get(Timeout(self._poll_interval))
+
+                    if not notification or subscription.overflowed:
+                        break
+
+                    event = notification.event
+
+                    if not _event_matches(event, kinds, source, trace_id):
+                        continue
+
+                    if notification.ephemeral:
+                        # Unstored statuses don't move the stream past the event they follow
+                        if _notified_offset(notification) >= next_offset:
+                            yield event
+                    elif not notification.created:
+                        if event.offset < next_offset:
+                            yield event
+                    elif event.offset >= next_offset:
+                        yield event
+                        next_offset = event.offset + 1
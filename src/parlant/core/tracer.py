@@ -50,6 +50,15 @@ class Tracer(ABC):
         attributes: Mapping[str, AttributeValue],
     ) -> Iterator[None]: ...
 
+    @contextmanager
+    def continue_trace(self, trace_id: str) -> Iterator[None]:
+        """Makes the spans opened within the context belong to a trace that was started
+        elsewhere, e.g. by a request to another process.
+
+        Tracers that can't adopt an existing trace start their own, as by default.
+        """
+        yield
+
     @property
     @abstractmethod
     def trace_id(self) -> str: ...
@@ -103,7 +112,7 @@ class LocalTracer(Tracer):
         current_spans = self._spans.get()
 
         if not current_spans:
-            new_trace_id = generate_id({"strategy": "uuid4"})
+            new_trace_id = self._trace_id.get() or generate_id({"strategy": "uuid4"})
             new_spans = span_id
             trace_id_reset_token = self._trace_id.set(new_trace_id)
         else:
@@ -138,6 +147,16 @@ class LocalTracer(Tracer):
 
         self._attributes.reset(attributes_reset_token)
 
+    @contextmanager
+    @override
+    def continue_trace(self, trace_id: str) -> Iterator[None]:
+        # Continuing the main context's (non-)trace leaves root spans to start new ones
+        reset_token = self._trace_id.set(trace_id if trace_id != "<main>" else "")
+
+        yield
+
+        self._trace_id.reset(reset_token)
+
     @property
     @override
     def trace_id(self) -> str:
@@ -19,10 +19,8 @@ from collections import defaultdict, deque
 from contextlib import AsyncExitStack
 import contextvars
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
 import enum
 from functools import partial
-from hashlib import md5
 import importlib.util
 from itertools import chain
 from pathlib import Path
@@ -54,7 +52,6 @@ from typing import (
     Sequence,
     TypeVar,
     TypeAlias,
-    TypedDict,
     cast,
 )
 from typing_extensions import overload
@@ -63,7 +60,7 @@ import httpx
 from lagom import Container
 
 
-from parlant.adapters.db.json_file import JSONFileDocumentCollection, JSONFileDocumentDatabase
+from parlant.adapters.db.json_file import JSONFileDocumentDatabase
 from parlant.adapters.db.transient import TransientDocumentDatabase
 from parlant.adapters.vector_db.transient import TransientVectorDatabase
 from parlant.api.authorization import (
@@ -93,7 +90,6 @@ from parlant.core.common import (
     IdGenerator,
     ItemNotFoundError,
     JSONSerializable,
-    Version,
     classproperty,
 )
 from parlant.core.context_variables import (
@@ -152,8 +148,7 @@ from parlant.core.nlp.generation import (
     SchematicGenerator,
 )
 from parlant.core.nlp.tokenization import EstimatingTokenizer
-from parlant.core.persistence.common import ObjectId
-from parlant.core.persistence.document_database import DocumentDatabase, identity_loader_for
+from parlant.core.persistence.document_database import DocumentDatabase
 from parlant.core.relationships import (
     RelationshipKind,
     RelationshipDocumentStore,
@@ -165,12 +160,14 @@ from parlant.core.relationships import (
 )
 from parlant.core.services.indexing.behavioral_change_evaluation import BehavioralChangeEvaluator
 from parlant.core.services.tools.service_registry import ServiceDocumentRegistry, ServiceRegistry
+from parlant.core.services.tools.transport import ToolServiceTransport, ToolServiceTransportConfig
 from parlant.core.sessions import (
     EventKind,
     EventSource,
     MessageEventData,
     SessionId,
     SessionDocumentStore,
+    SessionEventNotifier,
     SessionStore,
     StatusEventData,
     ToolCall as _SessionToolCall,
@@ -257,7 +254,6 @@ from parlant.core.tools import (
     ToolParameterType,
     ToolResult,
 )
-from parlant.core.version import VERSION
 
 INTEGRATED_TOOL_SERVICE_NAME = "built-in"
 
@@ -496,21 +492,6 @@ class NLPServices:
         return ZhipuService(container[Logger], container[Tracer], container[Meter])
 
 
-class _CachedGuidelineEvaluation(TypedDict, total=False):
-    id: ObjectId
-    creation_utc: str
-    version: Version.String
-    properties: dict[str, JSONSerializable]
-
-
-class _CachedJourneyEvaluation(TypedDict, total=False):
-    id: ObjectId
-    creation_utc: str
-    version: Version.String
-    node_properties: dict[JourneyStateId, dict[str, JSONSerializable]]
-    edge_properties: dict[JourneyTransitionId, dict[str, JSONSerializable]]
-
-
 class _CachedEvaluator:
     @dataclass(frozen=True)
     class JourneyEvaluation:
@@ -523,16 +504,10 @@ class _CachedEvaluator:
 
     def __init__(
         self,
-        db: JSONFileDocumentDatabase,
         container: Container,
     ) -> None:
-        self._db: JSONFileDocumentDatabase = db
-        self._guideline_collection: JSONFileDocumentCollection[_CachedGuidelineEvaluation]
-        self._journey_collection: JSONFileDocumentCollection[_CachedJourneyEvaluation]
-
         self._container = container
         self._logger = container[Logger]
-        self._exit_stack = AsyncExitStack()
         self._progress: dict[str, float] = {}
 
     def _set_progress(self, key: str, pct: float) -> None:
@@ -541,58 +516,6 @@ class _CachedEvaluator:
     def _progress_for(self, key: str) -> float:
         return self._progress.get(key, 0.0)
 
-    async def __aenter__(self) -> _CachedEvaluator:
-        await self._exit_stack.enter_async_context(self._db)
-
-        self._guideline_collection = await self._db.get_or_create_collection(
-            name=f"guideline_evaluations_{VERSION}",
-            schema=_CachedGuidelineEvaluation,
-            document_loader=identity_loader_for(_CachedGuidelineEvaluation),
-        )
-
-        self._journey_collection = await self._db.get_or_create_collection(
-            name=f"journey_evaluations_{VERSION}",
-            schema=_CachedJourneyEvaluation,
-            document_loader=identity_loader_for(_CachedJourneyEvaluation),
-        )
-
-        return self
-
-    async def __aexit__(
-        self,
-        exc_type: type[BaseException] | None,
-        exc_value: BaseException | None,
-        tb: TracebackType | None,
-    ) -> bool:
-        await self._exit_stack.aclose()
-        return False
-
-    def _hash_guideline_evaluation_request(
-        self,
-        g: GuidelineContent,
-        tool_ids: Sequence[ToolId],
-        journey_state_propositions: bool,
-        properties_proposition: bool,
-    ) -> str:
-        """Generate a hash for the guideline evaluation request."""
-        tool_ids_str = ",".join(str(tool_id) for tool_id in tool_ids) if tool_ids else ""
-
-        return md5(
-            f"{g.condition or ''}:{g.action or ''}:{tool_ids_str}:{journey_state_propositions}:{properties_proposition}".encode()
-        ).hexdigest()
-
-    def _hash_journey_evaluation_request(
-        self,
-        journey: Journey,
-    ) -> str:
-        """Generate a hash for the journey evaluation request."""
-        node_ids_str = ",".join(str(node.id) for node in journey.states) if journey.states else ""
-        edge_ids_str = (
-            ",".join(str(edge.id) for edge in journey.transitions) if journey.transitions else ""
-        )
-
-        return md5(f"{journey.id}:{node_ids_str}:{edge_ids_str}".encode()).hexdigest()
-
     async def evaluate_guideline(
         self,
         entity_id: GuidelineId,
@@ -614,21 +537,31 @@ class _CachedEvaluator:
         journey_state_proposition: bool = False,
         properties_proposition: bool = True,
     ) -> _CachedEvaluator.GuidelineEvaluation:
-        # First check if we have a cached evaluation for this guideline
-        _hash = self._hash_guideline_evaluation_request(
-            g=g,
+        payload = GuidelinePayload(
+            content=GuidelineContent(
+                condition=g.condition,
+                action=g.action,
+            ),
             tool_ids=tool_ids,
-            journey_state_propositions=journey_state_proposition,
+            operation=PayloadOperation.ADD,
+            action_proposition=action_proposition,
             properties_proposition=properties_proposition,
+            journey_node_proposition=journey_state_proposition,
         )
 
-        if cached_evaluation := await self._guideline_collection.find_one({"id": {"$eq": _hash}}):
+        # Identical content may have been evaluated before, by this or any other server
+        if cached_evaluation := await self._container[
+            BehavioralChangeEvaluator
+        ].read_cached_evaluation(payload):
             self._logger.trace(
                 f"Using cached evaluation for guideline: Condition: {g.condition or 'None'}; Action: {g.action or 'None'}"
             )
 
+            self._set_progress(entity_id, 100.0)
+
             return self.GuidelineEvaluation(
-                properties=cached_evaluation["properties"],
+                properties=cast(InvoiceGuidelineData, cached_evaluation).properties_proposition
+                or {},
             )
 
         self._logger.trace(
@@ -636,22 +569,7 @@ class _CachedEvaluator:
         )
 
         evaluation_id = await self._container[BehavioralChangeEvaluator].create_evaluation_task(
-            payload_descriptors=[
-                PayloadDescriptor(
-                    PayloadKind.GUIDELINE,
-                    GuidelinePayload(
-                        content=GuidelineContent(
-                            condition=g.condition,
-                            action=g.action,
-                        ),
-                        tool_ids=tool_ids,
-                        operation=PayloadOperation.ADD,
-                        action_proposition=action_proposition,
-                        properties_proposition=properties_proposition,
-                        journey_node_proposition=journey_state_proposition,
-                    ),
-                )
-            ],
+            payload_descriptors=[PayloadDescriptor(PayloadKind.GUIDELINE, payload)],
         )
 
         while True:
@@ -681,18 +599,6 @@ class _CachedEvaluator:
 
             assert invoice.data
 
-            # Cache the evaluation result
-            await self._guideline_collection.insert_one(
-                {
-                    "id": ObjectId(_hash),
-                    "creation_utc": datetime.now(timezone.utc).isoformat(),
-                    "version": Version.String(VERSION),
-                    "properties": cast(InvoiceGuidelineData, invoice.data).properties_proposition
-                    or {},
-                }
-            )
-
-            # Return the evaluation result
             return self.GuidelineEvaluation(
                 properties=cast(InvoiceGuidelineData, invoice.data).properties_proposition or {},
             )
@@ -701,33 +607,33 @@ class _CachedEvaluator:
         self,
         journey: Journey,
     ) -> _CachedEvaluator.JourneyEvaluation:
-        # First check if we have a cached evaluation for this journey
-        _hash = self._hash_journey_evaluation_request(
-            journey=journey,
+        payload = JourneyPayload(
+            journey_id=journey.id,
+            operation=PayloadOperation.ADD,
         )
 
-        if cached_evaluation := await self._journey_collection.find_one({"id": {"$eq": _hash}}):
+        if cached_evaluation := await self._container[
+            BehavioralChangeEvaluator
+        ].read_cached_evaluation(payload):
             self._logger.trace(
                 f"Using cached evaluation for journey: Title: {journey.title or 'None'};"
             )
 
+            self._set_progress(journey.id, 100.0)
+
             return self.JourneyEvaluation(
-                node_properties=cached_evaluation["node_properties"],
-                edge_properties=cached_evaluation["edge_properties"],
+                node_properties=cast(
+                    InvoiceJourneyData, cached_evaluation
+                ).node_properties_proposition,
+                edge_properties=cast(
+                    InvoiceJourneyData, cached_evaluation
+                ).edge_properties_proposition,
             )
 
         self._logger.trace(f"Evaluating journey: Title: {journey.title or 'None'}")
 
         evaluation_id = await self._container[BehavioralChangeEvaluator].create_evaluation_task(
-            payload_descriptors=[
-                PayloadDescriptor(
-                    PayloadKind.JOURNEY,
-                    JourneyPayload(
-                        journey_id=journey.id,
-                        operation=PayloadOperation.ADD,
-                    ),
-                )
-            ],
+            payload_descriptors=[PayloadDescriptor(PayloadKind.JOURNEY, payload)],
         )
 
         while True:
@@ -755,23 +661,6 @@ class _CachedEvaluator:
 
             assert invoice.data
 
-            # Cache the evaluation result
-            await self._journey_collection.insert_one(
-                {
-                    "id": ObjectId(_hash),
-                    "creation_utc": datetime.now(timezone.utc).isoformat(),
-                    "version": Version.String(VERSION),
-                    "node_properties": cast(
-                        InvoiceJourneyData, invoice.data
-                    ).node_properties_proposition,
-                    "edge_properties": cast(
-                        InvoiceJourneyData, invoice.data
-                    ).edge_properties_proposition
-                    or {},
-                }
-            )
-
-            # Return the evaluation result
             return self.JourneyEvaluation(
                 node_properties=cast(InvoiceJourneyData, invoice.data).node_properties_proposition
                 or {},
@@ -4233,7 +4122,10 @@ class Server:
                 c()[SessionStore] = self._session_store
             else:
                 c()[SessionStore] = await make_persistable_store(
-                    SessionDocumentStore, self._session_store, "sessions"
+                    SessionDocumentStore,
+                    self._session_store,
+                    "sessions",
+                    event_notifier=c()[SessionEventNotifier],
                 )
 
             if isinstance(self._customer_store, CustomerStore):
@@ -4256,14 +4148,24 @@ class Server:
                     id_generator=c()[IdGenerator],
                 )
 
+            c()[ToolServiceTransport] = await self._exit_stack.enter_async_context(
+                ToolServiceTransport(
+                    logger=c()[Logger],
+                    meter=c()[Meter],
+                    config=ToolServiceTransportConfig.from_environment(),
+                )
+            )
+
             c()[ServiceRegistry] = await self._exit_stack.enter_async_context(
                 ServiceDocumentRegistry(
                     database=TransientDocumentDatabase(),
                     event_emitter_factory=c()[EventEmitterFactory],
                     logger=c()[Logger],
                     tracer=c()[Tracer],
+                    meter=c()[Meter],
                     nlp_services_provider=lambda: {"__nlp__": c()[NLPService]},
                     allow_migration=False,
+                    transport=c()[ToolServiceTransport],
                 )
             )
 
@@ -4338,11 +4240,7 @@ class Server:
             await self._exit_stack.enter_async_context(self._plugin_server)
             self._exit_stack.push_async_callback(self._plugin_server.shutdown)
 
-            self._evaluator = _CachedEvaluator(
-                db=JSONFileDocumentDatabase(c[Logger], PARLANT_HOME_DIR / "evaluation_cache.json"),
-                container=c,
-            )
-            await self._exit_stack.enter_async_context(self._evaluator)
+            self._evaluator = _CachedEvaluator(container=c)
 
             if self._initialize:
                 await self._initialize(c)
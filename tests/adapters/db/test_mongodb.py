@@ -16,9 +16,9 @@ import asyncio
 import os
 from typing import Any, AsyncIterator, Optional, TypedDict, cast
 from pymongo import AsyncMongoClient
-import pytest
 from typing_extensions import Self
 from lagom import Container
+from mongomock_motor import AsyncMongoMockClient
 from pytest import fixture, raises
 
 from parlant.core.common import Version
@@ -33,6 +33,7 @@ from parlant.core.persistence.document_database import (
 )
 from parlant.core.persistence.document_database_helper import DocumentStoreMigrationHelper
 from parlant.core.loggers import Logger
+from parlant.core.sessions import SessionDocumentStore
 
 
 @fixture
@@ -55,8 +56,8 @@ async def test_mongo_client() -> AsyncIterator[AsyncMongoClient[Any]]:
         await client.close()
         await pymongo_tasks_still_running()
     else:
-        print("could not find `TEST_MONGO_SERVER` in environment, skipping mongo tests...")
-        raise pytest.skip()
+        # Without a server, the adapter is tested against an in-memory mock of one
+        yield cast(AsyncMongoClient[Any], AsyncMongoMockClient())
 
 
 class MongoTestDocument(TypedDict, total=False):
@@ -391,6 +392,46 @@ async def test_that_document_upgrade_happens_during_loading_of_store(
             assert upgraded_doc["additional_field"] == "default_value"
 
 
+async def test_that_documents_are_upgraded_across_migration_batches(
+    container: Container,
+    test_mongo_client: AsyncMongoClient[Any],
+    test_database_name: str,
+) -> None:
+    await test_mongo_client.drop_database(test_database_name)
+
+    adb = test_mongo_client[test_database_name]
+    await adb.metadata.insert_one({"id": "123", "version": "1.0.0"})
+    await adb.dummy_collection.insert_many(
+        [{"id": f"old_{i}", "version": "1.0.0", "name": f"Old {i}"} for i in range(5)]
+        + [
+            {
+                "id": f"new_{i}",
+                "version": "2.0.0",
+                "name": f"New {i}",
+                "additional_field": "kept",
+                "creation_utc": "2024-01-01T00:00:00Z",
+            }
+            for i in range(2)
+        ]
+    )
+
+    logger = container[Logger]
+
+    for _ in range(2):
+        async with MongoDocumentDatabase(
+            test_mongo_client, "test_db", logger, migration_batch_size=2
+        ) as db:
+            async with DummyStore(db, allow_migration=True) as store:
+                result = await store.list_dummy()
+
+                assert result.total_count == 7
+                assert all(doc["version"] == "2.0.0" for doc in result.items)
+                assert {doc["additional_field"] for doc in result.items} == {
+                    "default_value",
+                    "kept",
+                }
+
+
 async def test_that_migration_is_not_needed_for_new_store(
     container: Container,
     test_mongo_client: AsyncMongoClient[Any],
@@ -1145,3 +1186,66 @@ async def test_that_creation_utc_index_is_created_for_get_or_create_collections(
         assert creation_utc_index_found, (
             "creation_utc index should be created for get_or_create collections"
         )
+
+
+async def test_that_upserting_a_missing_document_reports_no_match(
+    container: Container,
+    test_mongo_client: AsyncMongoClient[Any],
+    test_database_name: str,
+) -> None:
+    await test_mongo_client.drop_database(test_database_name)
+
+    async with MongoDocumentDatabase(
+        test_mongo_client, test_database_name, container[Logger]
+    ) as dummy_db:
+        collection = await dummy_db.create_collection("test_upserts", MongoTestDocument)
+
+        document = MongoTestDocument(
+            id=ObjectId("upserted"),
+            creation_utc="2023-01-01T00:00:00Z",
+            version=Version.String("1.0.0"),
+            name="first",
+        )
+
+        inserted = await collection.update_one({"id": {"$eq": "upserted"}}, document, upsert=True)
+
+        assert inserted.matched_count == 0
+        assert inserted.updated_document == document
+
+        updated = await collection.update_one(
+            {"id": {"$eq": "upserted"}},
+            MongoTestDocument(name="second"),
+            upsert=True,
+        )
+
+        assert updated.matched_count == 1
+        assert updated.updated_document
+        assert updated.updated_document["name"] == "second"
+        assert updated.updated_document["version"] == "1.0.0"
+
+        deleted = await collection.delete_one({"id": {"$eq": "upserted"}})
+
+        assert deleted.deleted_count == 1
+        assert deleted.deleted_document
+        assert deleted.deleted_document["name"] == "second"
+
+        assert (await collection.delete_one({"id": {"$eq": "upserted"}})).deleted_count == 0
+
+
+async def test_that_indexes_declared_by_stores_are_created(
+    container: Container,
+    test_mongo_client: AsyncMongoClient[Any],
+    test_database_name: str,
+) -> None:
+    await test_mongo_client.drop_database(test_database_name)
+
+    async with MongoDocumentDatabase(
+        test_mongo_client, test_database_name, container[Logger]
+    ) as db:
+        async with SessionDocumentStore(db, allow_migration=True):
+            indexes = await test_mongo_client[test_database_name]["events"].index_information()
+
+    index_keys = [index["key"] for index in indexes.values()]
+
+    assert [("session_id", 1), ("offset", 1)] in index_keys
+    assert [("id", 1)] in index_keys
@@ -218,6 +218,25 @@ async def test_find_adds_cursor_clause(monkeypatch: pytest.MonkeyPatch) -> None:
     assert params["cursor_id"] == "abc"
 
 
+@pytest.mark.asyncio
+async def test_find_excludes_fields(monkeypatch: pytest.MonkeyPatch) -> None:
+    db = _make_database()
+    collection = SnowflakeDocumentCollection(db, "events", _SessionDocument, _TestLogger())
+    collection._table_ready = True  # type: ignore[attr-defined]
+
+    rows = [{"DATA": {"id": "1", "data": {"tool_calls": [{"tool_id": "t", "result": {}}]}}}]
+    execute_mock = AsyncMock(return_value=rows)
+    monkeypatch.setattr(db, "_execute", execute_mock)
+
+    result = await collection.find({}, exclude_fields=["metadata", "data.tool_calls.result"])
+
+    sql = execute_mock.call_args[0][0]
+    params = execute_mock.call_args[0][1]
+    assert "SELECT OBJECT_DELETE(DATA, %(exclude_0)s) AS DATA" in sql
+    assert params["exclude_0"] == "metadata"
+    assert result.items[0] == {"id": "1", "data": {"tool_calls": [{"tool_id": "t"}]}}
+
+
 @pytest.mark.asyncio
 async def test_update_one_upserts_when_missing(monkeypatch: pytest.MonkeyPatch) -> None:
     db = _make_database()
@@ -0,0 +1,220 @@
+# Copyright 2025 Emcie Co Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pathlib import Path
+
+from lagom import Container
+from pytest import raises
+
+from parlant.adapters.db.transient import TransientDocumentDatabase
+from parlant.adapters.nlp.replay_service import (
+    RecordedGeneration,
+    ReplayCorpus,
+    ReplayEmbedder,
+    ReplayMissError,
+    ReplayService,
+    SimulatedLatency,
+    prompt_hash,
+)
+from parlant.adapters.vector_db.transient import TransientVectorDatabase
+from parlant.core.common import DefaultBaseModel, IdGenerator
+from parlant.core.glossary import GlossaryVectorStore
+from parlant.core.loggers import Logger
+from parlant.core.meter import Meter
+from parlant.core.nlp.embedding import Embedder, EmbedderFactory, NullEmbeddingCache
+from parlant.core.persistence.data_collection import (
+    DataCollectingSchematicGenerator,
+    DataCollectionConfig,
+    DataCollectionSink,
+)
+from parlant.core.tracer import Tracer
+
+
+class GreetingSchema(DefaultBaseModel):
+    greeting: str
+
+
+def recorded(prompt: str, greeting: str, duration: float = 0.0) -> RecordedGeneration:
+    return RecordedGeneration(
+        schema=GreetingSchema.__name__,
+        prompt_hash=prompt_hash(prompt),
+        completion={"greeting": greeting},
+        model="some-model",
+        duration=duration,
+        input_tokens=10,
+        output_tokens=2,
+    )
+
+
+def create_service(container: Container, corpus: ReplayCorpus) -> ReplayService:
+    return ReplayService(corpus, container[Logger], container[Tracer], container[Meter])
+
+
+def test_that_latency_distributions_are_parsed_and_sampled() -> None:
+    assert SimulatedLatency.parse("none").sampler().sample(recorded=1.5) == 0
+    assert SimulatedLatency.parse("recorded").sampler().sample(recorded=1.5) == 1.5
+    assert SimulatedLatency.parse("fixed:0.25").sampler().sample() == 0.25
+
+    uniform = SimulatedLatency.parse("uniform:0.1,0.2").sampler()
+    assert all(0.1 <= uniform.sample() <= 0.2 for _ in range(100))
+
+    with raises(ValueError):
+        SimulatedLatency.parse("normal:0.1")
+
+    with raises(ValueError):
+        SimulatedLatency.parse("exponential:1")
+
+
+def test_that_latency_samples_are_reproducible_with_a_seed() -> None:
+    def samples() -> list[float]:
+        sampler = SimulatedLatency.parse("lognormal:0,0.5", seed=7).sampler()
+        return [sampler.sample() for _ in range(5)]
+
+    assert samples() == samples()
+
+
+async def test_that_a_recorded_prompt_replays_its_completions_in_order(
+    container: Container,
+) -> None:
+    corpus = ReplayCorpus(
+        [
+            recorded("Say hello", "Hello"),
+            recorded("Say goodbye", "Goodbye"),
+            recorded("Say hello", "Hi"),
+        ]
+    )
+
+    generator = await create_service(container, corpus).get_schematic_generator(GreetingSchema)
+
+    # Whitespace differences don't matter
+    results = [
+        (await generator.generate(prompt)).content.greeting
+        for prompt in ["Say hello", "Say   hello\n", "Say hello"]
+    ]
+
+    assert results == ["Hello", "Hi", "Hello"]
+
+
+async def test_that_an_unrecorded_prompt_replays_the_schema_round_robin(
+    container: Container,
+) -> None:
+    corpus = ReplayCorpus([recorded("Say hello", "Hello"), recorded("Say goodbye", "Goodbye")])
+
+    generator = await create_service(container, corpus).get_schematic_generator(GreetingSchema)
+
+    results = [(await generator.generate("Greet me")).content.greeting for _ in range(3)]
+
+    assert results == ["Hello", "Goodbye", "Hello"]
+
+
+def test_that_a_strict_corpus_fails_on_unrecorded_prompts() -> None:
+    corpus = ReplayCorpus([recorded("Say hello", "Hello")], strict=True)
+
+    with raises(ReplayMissError):
+        corpus.find(GreetingSchema.__name__, "Greet me")
+
+
+async def test_that_embeddings_are_deterministic_and_reflect_shared_words(
+    container: Container,
+) -> None:
+    embedder = await create_service(container, ReplayCorpus([])).get_embedder()
+
+    def similarity(a: list[float], b: list[float]) -> float:
+        return sum(x * y for x, y in zip(a, b))
+
+    first, again, related, unrelated = (
+        await embedder.embed(
+            [
+                "refund my order",
+                "refund my order",
+                "I want a refund for my order",
+                "what's the weather like",
+            ]
+        )
+    ).vectors
+
+    assert list(first) == list(again)
+    assert len(first) == embedder.dimensions
+    assert similarity(list(first), list(related)) > similarity(list(first), list(unrelated))
+
+
+async def test_that_vector_lookups_work_with_the_replay_embedder(
+    container: Container,
+) -> None:
+    embedder = await create_service(container, ReplayCorpus([])).get_embedder()
+    assert isinstance(embedder, ReplayEmbedder)
+    container[ReplayEmbedder] = embedder
+
+    async def get_embedder_type() -> type[Embedder]:
+        return ReplayEmbedder
+
+    embedder_factory = EmbedderFactory(container)
+
+    async with GlossaryVectorStore(
+        container[IdGenerator],
+        vector_db=TransientVectorDatabase(
+            container[Logger],
+            container[Tracer],
+            embedder_factory,
+            NullEmbeddingCache,
+        ),
+        document_db=TransientDocumentDatabase(),
+        embedder_factory=embedder_factory,
+        embedder_type_provider=get_embedder_type,
+    ) as glossary_store:
+        terms = [
+            await glossary_store.create_term(name="Refund", description="money paid back"),
+            await glossary_store.create_term(name="Weather", description="rain or sunshine"),
+            await glossary_store.create_term(name="Shipping", description="sending an order"),
+        ]
+
+        relevant_terms = await glossary_store.find_relevant_terms(
+            "I want my money back, so how does a refund work?",
+            available_terms=terms,
+            max_terms=1,
+        )
+
+    assert [t.name for t in relevant_terms] == ["Refund"]
+
+
+async def test_that_generations_recorded_by_the_data_collection_sink_can_be_replayed(
+    container: Container,
+    tmp_path: Path,
+) -> None:
+    original = await create_service(
+        container,
+        ReplayCorpus([recorded("Say hello", "Hello", duration=1.0)]),
+    ).get_schematic_generator(GreetingSchema)
+
+    async with DataCollectionSink(
+        container[Logger],
+        container[Meter],
+        DataCollectionConfig(path=str(tmp_path)),
+    ) as sink:
+        recording_generator = DataCollectingSchematicGenerator[GreetingSchema](
+            original,
+            container[Tracer],
+            sink,
+        )
+
+        await recording_generator.generate("Say hello")
+
+    corpus = ReplayCorpus.load(tmp_path, strict=True)
+    generator = await create_service(container, corpus).get_schematic_generator(GreetingSchema)
+
+    result = await generator.generate("Say hello")
+
+    assert result.content.greeting == "Hello"
+    assert result.info.model == "replay/replay/some-model"
+    assert result.info.usage.input_tokens == 10
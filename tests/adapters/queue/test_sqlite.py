@@ -0,0 +1,72 @@
+# Copyright 2025 Emcie Co Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from pathlib import Path
+from pytest import raises
+
+from parlant.adapters.queue.sqlite import SQLiteSessionWorkQueue
+from parlant.core.sessions import SessionId
+
+
+async def test_that_a_request_from_one_process_supersedes_a_lease_held_by_another(
+    tmp_path: Path,
+) -> None:
+    async with (
+        SQLiteSessionWorkQueue(tmp_path / "queue.db", poll_interval=0.01) as api_queue,
+        SQLiteSessionWorkQueue(tmp_path / "queue.db", poll_interval=0.01) as worker_queue,
+    ):
+        await api_queue.enqueue(SessionId("s1"), trace_id="first")
+        first_lease = await asyncio.wait_for(worker_queue.claim(), timeout=1)
+
+        holding = asyncio.create_task(worker_queue.hold(first_lease))
+        await asyncio.sleep(0.05)
+        assert not holding.done()
+
+        await api_queue.enqueue(SessionId("s1"), trace_id="second")
+        await asyncio.wait_for(holding, timeout=1)
+
+        await worker_queue.release(first_lease)
+        second_lease = await asyncio.wait_for(api_queue.claim(), timeout=1)
+
+        assert second_lease.generation > first_lease.generation
+        assert second_lease.trace_id == "second"
+
+        await api_queue.complete(second_lease)
+
+        with raises(asyncio.TimeoutError):
+            await asyncio.wait_for(worker_queue.claim(), timeout=0.1)
+
+
+async def test_that_the_session_of_an_expired_lease_is_claimed_again(
+    tmp_path: Path,
+) -> None:
+    async with SQLiteSessionWorkQueue(
+        tmp_path / "queue.db",
+        lease_duration=0.05,
+        poll_interval=0.01,
+    ) as queue:
+        await queue.enqueue(SessionId("s1"), trace_id="trace")
+        abandoned_lease = await queue.claim()
+
+        reclaimed_lease = await asyncio.wait_for(queue.claim(), timeout=1)
+
+        assert reclaimed_lease.session_id == abandoned_lease.session_id
+        assert reclaimed_lease.id != abandoned_lease.id
+
+        await queue.complete(abandoned_lease)
+        await queue.complete(reclaimed_lease)
+
+        with raises(asyncio.TimeoutError):
+            await asyncio.wait_for(queue.claim(), timeout=0.1)
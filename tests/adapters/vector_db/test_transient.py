@@ -0,0 +1,138 @@
+# Copyright 2025 Emcie Co Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Any, Mapping, TypedDict, cast
+from typing_extensions import Required, override
+from lagom import Container, Singleton
+
+from parlant.adapters.vector_db.transient import TransientVectorDatabase
+from parlant.core.common import Version
+from parlant.core.loggers import Logger
+from parlant.core.nlp.embedding import (
+    Embedder,
+    EmbedderFactory,
+    EmbeddingResult,
+    NullEmbeddingCache,
+)
+from parlant.core.nlp.tokenization import EstimatingTokenizer, ZeroEstimatingTokenizer
+from parlant.core.persistence.common import ObjectId
+from parlant.core.persistence.vector_database import BaseDocument
+from parlant.core.tracer import Tracer
+
+_KEYWORDS = ["refund", "shipping", "password", "invoice"]
+
+
+class _KeywordEmbedder(Embedder):
+    """Embeds texts by which of a few keywords they mention."""
+
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+
+    @override
+    async def embed(
+        self,
+        texts: list[str],
+        hints: Mapping[str, Any] = {},
+    ) -> EmbeddingResult:
+        self.calls.append(texts)
+
+        return EmbeddingResult(
+            vectors=[[float(k in text) + 0.01 for k in _KEYWORDS] for text in texts]
+        )
+
+    @property
+    @override
+    def id(self) -> str:
+        return "keywords"
+
+    @property
+    @override
+    def max_tokens(self) -> int:
+        return 8192
+
+    @property
+    @override
+    def tokenizer(self) -> EstimatingTokenizer:
+        return ZeroEstimatingTokenizer()
+
+    @property
+    @override
+    def dimensions(self) -> int:
+        return len(_KEYWORDS)
+
+
+class _TestDocument(TypedDict, total=False):
+    id: ObjectId
+    version: Version.String
+    content: str
+    checksum: Required[str]
+    topic: str
+
+
+async def _identity_loader(doc: BaseDocument) -> _TestDocument:
+    return cast(_TestDocument, doc)
+
+
+async def test_that_documents_are_ranked_by_their_closest_query_with_a_single_embedding_call(
+    container: Container,
+) -> None:
+    container[_KeywordEmbedder] = Singleton(_KeywordEmbedder)
+    embedder = container[_KeywordEmbedder]
+
+    database = TransientVectorDatabase(
+        container[Logger],
+        container[Tracer],
+        EmbedderFactory(container),
+        NullEmbeddingCache,
+    )
+
+    collection = await database.get_or_create_collection(
+        "test_collection",
+        _TestDocument,
+        embedder_type=_KeywordEmbedder,
+        document_loader=_identity_loader,
+    )
+
+    for i, (content, topic) in enumerate(
+        [
+            ("how to ask for a refund", "billing"),
+            ("shipping times", "logistics"),
+            ("resetting your password", "account"),
+            ("getting a copy of an invoice", "billing"),
+        ]
+    ):
+        await collection.insert_one(
+            _TestDocument(
+                id=ObjectId(str(i)),
+                version=Version.String("0.1.0"),
+                content=content,
+                checksum=content,
+                topic=topic,
+            )
+        )
+
+    embedder.calls.clear()
+
+    results = await collection.find_similar_documents_for_queries(
+        filters={"topic": {"$eq": "billing"}},
+        queries=["I want my refund", "something about an invoice", "and my password"],
+        k=3,
+    )
+
+    assert len(embedder.calls) == 1
+    assert {r.document["content"] for r in results} == {
+        "how to ask for a refund",
+        "getting a copy of an invoice",
+    }
+    assert all(r.distance < 0.01 for r in results)
@@ -14,6 +14,9 @@
 
 from fastapi import status
 import httpx
+from lagom import Container
+
+from parlant.core.meter import Meter
 
 
 async def test_health_check_endpoint(async_client: httpx.AsyncClient) -> None:
@@ -21,3 +24,18 @@ async def test_health_check_endpoint(async_client: httpx.AsyncClient) -> None:
 
     assert response.status_code == status.HTTP_200_OK
     assert response.json() == {"status": "ok"}
+
+
+async def test_that_metrics_endpoint_exposes_local_metrics_in_prometheus_format(
+    container: Container,
+    async_client: httpx.AsyncClient,
+) -> None:
+    histogram = container[Meter].create_duration_histogram("gen", description="Generation")
+    await histogram.record(42, {"model": "test"})
+
+    response = await async_client.get("/metrics")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "# TYPE parlant_gen_ms histogram" in response.text
+    assert 'parlant_gen_ms_count{model="test"} 1' in response.text
@@ -15,6 +15,7 @@
 import pytest
 from fastapi import Request
 from limits import RateLimitItemPerMinute
+from limits.storage import MemoryStorage
 
 from parlant.api.authorization import (
     AuthorizationException,
@@ -117,3 +118,28 @@ async def test_that_missing_client_ip_raises_authorization_exception() -> None:
 
     with pytest.raises(AuthorizationException):
         await limiter.check(request, Operation.LIST_EVENTS)
+
+
+async def test_that_limiters_sharing_a_storage_enforce_a_single_limit_with_batched_hits() -> None:
+    storage = MemoryStorage()
+
+    first_limiter, second_limiter = [
+        BasicRateLimiter(
+            rate_limit_item_per_operation={
+                Operation.LIST_EVENTS: RateLimitItemPerMinute(4),
+            },
+            storage=storage,
+            batch_size=3,
+        )
+        for _ in range(2)
+    ]
+
+    request = make_request()
+
+    assert await first_limiter.check(request, Operation.LIST_EVENTS) is True
+    assert await second_limiter.check(request, Operation.LIST_EVENTS) is True
+    assert await second_limiter.check(request, Operation.LIST_EVENTS) is False
+
+    assert await first_limiter.check(request, Operation.LIST_EVENTS) is True
+    assert await first_limiter.check(request, Operation.LIST_EVENTS) is True
+    assert await first_limiter.check(request, Operation.LIST_EVENTS) is False
@@ -15,7 +15,7 @@
 import asyncio
 import os
 import time
-from typing import Any, Mapping
+from typing import Any, Mapping, cast
 import dateutil
 from fastapi import status
 import httpx
@@ -36,6 +36,9 @@ from parlant.core.sessions import (
     SessionId,
     SessionListener,
     SessionStore,
+    SpanProfile,
+    ToolEventData,
+    TurnProfile,
 )
 
 from tests.test_utilities import (
@@ -1828,3 +1831,198 @@ async def test_that_customer_message_fetches_participant_from_db_when_not_provid
     assert event["data"]["participant"]["id"] == session.customer_id
     # The display_name should be fetched from customer store (or fallback to customer_id)
     assert event["data"]["participant"]["display_name"] is not None
+
+
+async def test_that_a_turn_profile_can_be_read(
+    async_client: httpx.AsyncClient,
+    container: Container,
+    session_id: SessionId,
+) -> None:
+    llm_request = SpanProfile(
+        name="gen.request_completed",
+        start_offset=0.1,
+        end_offset=0.6,
+        input_tokens=1000,
+        output_tokens=100,
+        attributes={},
+        children=[],
+    )
+
+    await container[SessionStore].create_turn_profile(
+        TurnProfile(
+            session_id=session_id,
+            trace_id="trace_1",
+            creation_utc=datetime.now(timezone.utc),
+            root=SpanProfile(
+                name="turn",
+                start_offset=0.0,
+                end_offset=0.7,
+                input_tokens=0,
+                output_tokens=0,
+                attributes={},
+                children=[
+                    SpanProfile(
+                        name="queue",
+                        start_offset=0.0,
+                        end_offset=0.1,
+                        input_tokens=0,
+                        output_tokens=0,
+                        attributes={},
+                        children=[],
+                    ),
+                    llm_request,
+                ],
+            ),
+        )
+    )
+
+    profiles = (
+        (await async_client.get(f"/sessions/{session_id}/profiles")).raise_for_status().json()
+    )
+    assert [p["trace_id"] for p in profiles] == ["trace_1"]
+
+    profile = (
+        (await async_client.get(f"/sessions/{session_id}/profiles/trace_1"))
+        .raise_for_status()
+        .json()
+    )
+
+    queue, request = profile["root"]["children"]
+
+    assert profile["root"]["on_critical_path"]
+    assert not queue["on_critical_path"]
+    assert request["on_critical_path"]
+    assert request["duration"] == 0.5
+    assert (request["input_tokens"], request["output_tokens"]) == (1000, 100)
+
+
+async def test_that_reading_a_nonexistent_turn_profile_returns_404(
+    async_client: httpx.AsyncClient,
+    session_id: SessionId,
+) -> None:
+    response = await async_client.get(f"/sessions/{session_id}/profiles/trace_1")
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+async def test_that_streaming_events_of_a_nonexistent_session_returns_404(
+    async_client: httpx.AsyncClient,
+) -> None:
+    response = await async_client.get("/sessions/nonexistent/events/stream")
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+async def test_that_events_can_be_listed_a_page_at_a_time(
+    async_client: httpx.AsyncClient,
+    container: Container,
+    session_id: SessionId,
+) -> None:
+    for i in range(5):
+        await container[SessionStore].create_event(
+            session_id=session_id,
+            source=EventSource.CUSTOMER,
+            kind=EventKind.MESSAGE,
+            trace_id="<main>",
+            data={"message": f"message {i}"},
+        )
+
+    offsets: list[int] = []
+    cursor: str | None = None
+
+    while True:
+        page = (
+            (
+                await async_client.get(
+                    f"/sessions/{session_id}/events",
+                    params={
+                        "limit": 2,
+                        "wait_for_data": 0,
+                        **({"cursor": cursor} if cursor else {}),
+                    },
+                )
+            )
+            .raise_for_status()
+            .json()
+        )
+
+        offsets.extend(e["offset"] for e in page["items"])
+
+        if not page["has_more"]:
+            break
+
+        cursor = page["next_cursor"]
+
+    assert offsets == [0, 1, 2, 3, 4]
+
+
+async def test_that_events_can_be_listed_up_to_a_max_offset(
+    async_client: httpx.AsyncClient,
+    container: Container,
+    session_id: SessionId,
+) -> None:
+    for i in range(5):
+        await container[SessionStore].create_event(
+            session_id=session_id,
+            source=EventSource.CUSTOMER,
+            kind=EventKind.MESSAGE,
+            trace_id="<main>",
+            data={"message": f"message {i}"},
+        )
+
+    events = (
+        (
+            await async_client.get(
+                f"/sessions/{session_id}/events",
+                params={"min_offset": 1, "max_offset": 3, "wait_for_data": 0},
+            )
+        )
+        .raise_for_status()
+        .json()
+    )
+
+    assert [e["offset"] for e in events] == [1, 2, 3]
+
+
+async def test_that_tool_results_can_be_omitted_from_listed_events(
+    async_client: httpx.AsyncClient,
+    container: Container,
+    session_id: SessionId,
+) -> None:
+    await container[SessionStore].create_event(
+        session_id=session_id,
+        source=EventSource.AI_AGENT,
+        kind=EventKind.TOOL,
+        trace_id="<main>",
+        data={
+            "tool_calls": [
+                {
+                    "tool_id": "local:get_balance",
+                    "arguments": {"account": "123"},
+                    "result": {
+                        "data": "a very large result",
+                        "metadata": {},
+                        "control": {},
+                        "canned_responses": [],
+                        "canned_response_fields": {},
+                    },
+                }
+            ]
+        },
+    )
+
+    events = (
+        (
+            await async_client.get(
+                f"/sessions/{session_id}/events",
+                params={"omit_tool_results": True, "wait_for_data": 0},
+            )
+        )
+        .raise_for_status()
+        .json()
+    )
+
+    assert events[0]["data"] == {
+        "tool_calls": [{"tool_id": "local:get_balance", "arguments": {"account": "123"}}]
+    }
+
+    stored_event = (await container[SessionStore].list_events(session_id))[0]
+    assert "result" in cast(ToolEventData, stored_event.data)["tool_calls"][0]
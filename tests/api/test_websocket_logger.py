@@ -13,12 +13,14 @@
 # limitations under the License.
 
 import asyncio
+import contextvars
 from fastapi.testclient import TestClient
 from parlant.api.app import ASGIApplication
 from lagom import Container
 import pytest
 
 from parlant.adapters.loggers.websocket import WebSocketLogger
+from parlant.core.loggers import LogLevel
 from parlant.core.tracer import Tracer
 
 
@@ -69,3 +71,89 @@ async def test_that_websocket_reconnects_and_receives_messages(
         assert "Second connection test" in data2["message"]
         assert data2["level"] == "INFO"
         assert data2["trace_id"] == tracer.trace_id
+
+
+async def test_that_websocket_only_receives_messages_at_or_above_the_requested_level(
+    container: Container,
+    test_client: TestClient,
+) -> None:
+    ws_logger = container[WebSocketLogger]
+
+    with test_client.websocket_connect("/logs?level=warning") as ws:
+        ws_logger.info("Not this one")
+        ws_logger.warning("This one")
+        await asyncio.sleep(1)
+
+        data = ws.receive_json()
+
+        assert "This one" in data["message"]
+        assert data["level"] == "WARNING"
+
+
+async def test_that_websocket_only_receives_messages_of_the_requested_trace(
+    container: Container,
+    test_client: TestClient,
+) -> None:
+    ws_logger = container[WebSocketLogger]
+    tracer = container[Tracer]
+
+    with tracer.span("requested"):
+        trace_id = tracer.trace_id
+
+        with test_client.websocket_connect(f"/logs?trace_id={trace_id}") as ws:
+            contextvars.Context().run(ws_logger.info, "From another trace")
+            ws_logger.info("From the requested trace")
+            await asyncio.sleep(1)
+
+            data = ws.receive_json()
+
+            assert "From the requested trace" in data["message"]
+            assert data["trace_id"] == trace_id
+
+
+async def test_that_websocket_receives_batched_frames(
+    container: Container,
+    test_client: TestClient,
+) -> None:
+    ws_logger = container[WebSocketLogger]
+
+    with test_client.websocket_connect("/logs?batch=true") as ws:
+        ws_logger.info("First")
+        ws_logger.info("Second")
+        await asyncio.sleep(1)
+
+        data = ws.receive_json()
+
+        assert [m["message"].split()[-1] for m in data["messages"]] == ["First", "Second"]
+        assert data["dropped"] == 0
+
+
+async def test_that_a_full_subscription_queue_drops_its_oldest_lines(
+    container: Container,
+) -> None:
+    ws_logger = WebSocketLogger(container[Tracer], queue_size=2)
+
+    subscription = await ws_logger.subscribe(object(), batched=True)  # type: ignore[arg-type]
+
+    for i in range(5):
+        ws_logger.info(f"Line {i}")
+
+    assert [p["message"].split()[-1] for p in subscription.queue] == ["3", "4"]
+    assert subscription.dropped == 3
+
+
+async def test_that_lines_are_not_formatted_when_no_one_is_subscribed(
+    container: Container,
+) -> None:
+    ws_logger = WebSocketLogger(container[Tracer])
+    built: list[str] = []
+
+    def message() -> str:
+        built.append("built")
+        return "built"
+
+    assert not ws_logger.is_enabled(LogLevel.CRITICAL)
+
+    ws_logger.critical(message)
+
+    assert built == []
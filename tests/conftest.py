@@ -43,6 +43,7 @@ from parlant.core.engines.alpha.guideline_matching.generic.journey.journey_next_
     JourneyNextStepSelectionSchema,
 )
 from parlant.core.meter import Meter, LocalMeter
+from parlant.core.profiling import ProfilingTracer, TurnProfiler
 from parlant.core.services.indexing.journey_reachable_nodes_evaluation import (
     ReachableNodesEvaluationSchema,
 )
@@ -124,6 +125,8 @@ from parlant.core.evaluations import (
     EvaluationStore,
 )
 from parlant.core.journey_guideline_projection import JourneyGuidelineProjection
+from parlant.core.behavior_snapshots import BehaviorSnapshotProvider
+from parlant.core.engines.alpha.context_variable_loader import ContextVariableLoader
 from parlant.core.journeys import JourneyStore, JourneyVectorStore
 from parlant.core.services.indexing.customer_dependent_action_detector import (
     CustomerDependentActionDetector,
@@ -165,16 +168,27 @@ from parlant.core.relationships import (
 from parlant.core.guidelines import GuidelineDocumentStore, GuidelineStore
 from parlant.adapters.db.transient import TransientDocumentDatabase
 from parlant.core.nlp.service import NLPService
-from parlant.core.persistence.data_collection import DataCollectingSchematicGenerator
+from parlant.core.persistence.data_collection import (
+    DataCollectingSchematicGenerator,
+    DataCollectionConfig,
+    DataCollectionSink,
+)
 from parlant.core.persistence.document_database import DocumentCollection
 from parlant.core.services.tools.service_registry import (
     ServiceDocumentRegistry,
     ServiceRegistry,
 )
+from parlant.core.session_work_queue import (
+    InProcessSessionWorkQueue,
+    SessionWorker,
+    SessionWorkQueue,
+)
 from parlant.core.sessions import (
-    PollingSessionListener,
+    NotifyingSessionListener,
     SessionDocumentStore,
+    SessionEventNotifier,
     SessionListener,
+    SessionStatusChannel,
     SessionStore,
 )
 from parlant.core.engines.alpha.engine import AlphaEngine
@@ -205,6 +219,7 @@ from parlant.core.services.indexing.behavioral_change_evaluation import (
     GuidelineEvaluator,
     JourneyEvaluator,
 )
+from parlant.core.services.indexing.evaluation_cache import EvaluationCache, NullEvaluationCache
 
 
 from parlant.core.loggers import LogLevel, Logger, StdoutLogger
@@ -315,6 +330,7 @@ async def make_schematic_generator(
         generator = DataCollectingSchematicGenerator[schema](  # type: ignore
             generator,
             container[Tracer],
+            container[DataCollectionSink],
         )
 
     return generator
@@ -328,7 +344,8 @@ async def container(
 ) -> AsyncIterator[Container]:
     container = Container()
 
-    container[Tracer] = tracer
+    container[TurnProfiler] = TurnProfiler()
+    container[Tracer] = ProfilingTracer(tracer, container[TurnProfiler])
     container[Logger] = logger
     container[Meter] = Singleton(LocalMeter)
     container[WebSocketLogger] = WebSocketLogger(container[Tracer])
@@ -353,8 +370,12 @@ async def container(
         container[RelationshipStore] = await stack.enter_async_context(
             RelationshipDocumentStore(container[IdGenerator], TransientDocumentDatabase())
         )
+        container[SessionEventNotifier] = SessionEventNotifier()
         container[SessionStore] = await stack.enter_async_context(
-            SessionDocumentStore(TransientDocumentDatabase())
+            SessionDocumentStore(
+                TransientDocumentDatabase(),
+                event_notifier=container[SessionEventNotifier],
+            )
         )
         container[ContextVariableStore] = await stack.enter_async_context(
             ContextVariableDocumentStore(container[IdGenerator], TransientDocumentDatabase())
@@ -370,7 +391,10 @@ async def container(
                 container[IdGenerator], TransientDocumentDatabase()
             )
         )
-        container[SessionListener] = PollingSessionListener
+        container[SessionListener] = NotifyingSessionListener
+        container[SessionStatusChannel] = Singleton(SessionStatusChannel)
+        container[SessionWorkQueue] = Singleton(InProcessSessionWorkQueue)
+        container[SessionWorker] = Singleton(SessionWorker)
         container[EvaluationStore] = await stack.enter_async_context(
             EvaluationDocumentStore(TransientDocumentDatabase())
         )
@@ -383,6 +407,7 @@ async def container(
                 event_emitter_factory=container[EventEmitterFactory],
                 logger=container[Logger],
                 tracer=container[Tracer],
+                meter=container[Meter],
                 nlp_services_provider=lambda: {
                     "default": EmcieService(
                         container[Logger],
@@ -472,6 +497,17 @@ async def container(
         container[EntityCommands] = Singleton(EntityCommands)
 
         container[JourneyGuidelineProjection] = Singleton(JourneyGuidelineProjection)
+        container[BehaviorSnapshotProvider] = Singleton(BehaviorSnapshotProvider)
+        container[ContextVariableLoader] = Singleton(ContextVariableLoader)
+
+        if os.environ.get("PARLANT_DATA_COLLECTION", "false").lower() not in ["false", "no", "0"]:
+            container[DataCollectionSink] = await stack.enter_async_context(
+                DataCollectionSink(
+                    container[Logger],
+                    container[Meter],
+                    DataCollectionConfig.from_environment(),
+                )
+            )
 
         for generation_schema in (
             GenericObservationalGuidelineMatchesSchema,
@@ -562,6 +598,7 @@ async def container(
         container[GuidelineMatcher] = Singleton(GuidelineMatcher)
         container[GuidelineEvaluator] = Singleton(GuidelineEvaluator)
         container[JourneyEvaluator] = Singleton(JourneyEvaluator)
+        container[EvaluationCache] = NullEvaluationCache()
 
         container[DefaultToolCallBatcher] = Singleton(DefaultToolCallBatcher)
         container[ToolCallBatcher] = lambda container: container[DefaultToolCallBatcher]
@@ -585,6 +622,10 @@ async def container(
 
         container[Application] = Singleton(Application)
 
+        await container[BackgroundTaskService].start(
+            container[SessionWorker].run(), tag="session-worker"
+        )
+
         yield container
 
         await container[BackgroundTaskService].cancel_all()
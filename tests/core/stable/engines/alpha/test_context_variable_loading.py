@@ -12,18 +12,21 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 from datetime import datetime, timedelta, timezone
 from croniter import croniter
 from lagom import Container
 from pytest import mark
 
 from parlant.core.agents import AgentId
+from parlant.core.background_tasks import BackgroundTaskService
 from parlant.core.sessions import Session
 from parlant.core.context_variables import ContextVariableStore
-from parlant.core.engines.alpha.engine import load_fresh_context_variable_value
+from parlant.core.engines.alpha.context_variable_loader import ContextVariableLoader
 from parlant.core.tags import Tag
 from parlant.core.tools import LocalToolService, ToolId
 from parlant.core.entity_cq import EntityQueries, EntityCommands
+from parlant.core.loggers import Logger
 
 from tests.core.common.utils import ContextOfTest
 
@@ -40,6 +43,15 @@ async def create_fetch_account_balance_tool(container: Container) -> None:
     )
 
 
+def create_loader(context: ContextOfTest) -> ContextVariableLoader:
+    return ContextVariableLoader(
+        context.container[Logger],
+        context.container[EntityQueries],
+        context.container[EntityCommands],
+        context.container[BackgroundTaskService],
+    )
+
+
 @mark.parametrize(
     "freshness_rules, current_time",
     [
@@ -76,8 +88,6 @@ async def test_that_value_is_not_refreshed_when_freshness_rules_are_not_met(
     await create_fetch_account_balance_tool(context.container)
 
     context_variable_store = context.container[ContextVariableStore]
-    entity_queries = context.container[EntityQueries]
-    entity_commands = context.container[EntityCommands]
 
     context_variable = await context_variable_store.create_variable(
         name=variable_name,
@@ -97,9 +107,7 @@ async def test_that_value_is_not_refreshed_when_freshness_rules_are_not_met(
         data=current_data,
     )
 
-    await load_fresh_context_variable_value(
-        entity_queries=entity_queries,
-        entity_commands=entity_commands,
+    await create_loader(context).load(
         agent_id=agent_id,
         session=new_session,
         variable=context_variable,
@@ -147,8 +155,6 @@ async def test_that_value_refreshes_when_freshness_rules_are_met(
     await create_fetch_account_balance_tool(context.container)
 
     context_variable_store = context.container[ContextVariableStore]
-    entity_queries = context.container[EntityQueries]
-    entity_commands = context.container[EntityCommands]
 
     context_variable = await context_variable_store.create_variable(
         name=variable_name,
@@ -168,9 +174,7 @@ async def test_that_value_refreshes_when_freshness_rules_are_met(
         data=current_data,
     )
 
-    value = await load_fresh_context_variable_value(
-        entity_queries=entity_queries,
-        entity_commands=entity_commands,
+    value = await create_loader(context).load(
         agent_id=agent_id,
         session=new_session,
         variable=context_variable,
@@ -195,8 +199,6 @@ async def test_that_value_is_created_when_need_to_be_freshed(
     await create_fetch_account_balance_tool(context.container)
 
     context_variable_store = context.container[ContextVariableStore]
-    entity_queries = context.container[EntityQueries]
-    entity_commands = context.container[EntityCommands]
 
     context_variable = await context_variable_store.create_variable(
         name=variable_name,
@@ -209,9 +211,7 @@ async def test_that_value_is_created_when_need_to_be_freshed(
         tag_id=Tag.for_agent_id(agent_id),
     )
 
-    created_value = await load_fresh_context_variable_value(
-        entity_queries=entity_queries,
-        entity_commands=entity_commands,
+    created_value = await create_loader(context).load(
         agent_id=agent_id,
         session=new_session,
         variable=context_variable,
@@ -224,3 +224,66 @@ async def test_that_value_is_created_when_need_to_be_freshed(
         key=test_key,
     )
     assert stored_value == created_value
+
+
+async def test_that_concurrent_loads_of_a_stale_value_share_a_single_refresh(
+    context: ContextOfTest,
+    agent_id: AgentId,
+    new_session: Session,
+) -> None:
+    await create_fetch_account_balance_tool(context.container)
+
+    context_variable_store = context.container[ContextVariableStore]
+
+    context_variable = await context_variable_store.create_variable(
+        name="AccountBalance",
+        description="Customer's account balance",
+        tool_id=ToolId(service_name="local", tool_name="fetch_account_balance"),
+    )
+
+    loader = create_loader(context)
+
+    values = await asyncio.gather(
+        *(loader.load(agent_id, new_session, context_variable, "test-key") for _ in range(10))
+    )
+
+    assert all(v is values[0] for v in values)
+    assert values[0] and values[0].data == {"balance": 1000.0}
+
+
+async def test_that_a_used_value_is_refreshed_in_the_background_when_it_expires(
+    context: ContextOfTest,
+    agent_id: AgentId,
+    new_session: Session,
+) -> None:
+    await create_fetch_account_balance_tool(context.container)
+
+    context_variable_store = context.container[ContextVariableStore]
+
+    context_variable = await context_variable_store.create_variable(
+        name="AccountBalance",
+        description="Customer's account balance",
+        tool_id=ToolId(service_name="local", tool_name="fetch_account_balance"),
+        freshness_rules="* * * * * *",  # Every second
+    )
+
+    loader = ContextVariableLoader(
+        context.container[Logger],
+        context.container[EntityQueries],
+        context.container[EntityCommands],
+        context.container[BackgroundTaskService],
+        refresh_in_background=True,
+    )
+
+    first_value = await loader.load(agent_id, new_session, context_variable, "test-key")
+    assert first_value
+
+    # Finding the value fresh schedules its refresh
+    assert await loader.load(agent_id, new_session, context_variable, "test-key") == first_value
+
+    await asyncio.sleep(1.5)
+
+    refreshed_value = await context_variable_store.read_value(context_variable.id, "test-key")
+
+    assert refreshed_value
+    assert refreshed_value.last_modified > first_value.last_modified
@@ -315,6 +315,45 @@ async def test_that_relational_guideline_resolver_infers_guidelines_from_tags(
     assert any(m.guideline.id == g4.id for m in result)
 
 
+async def test_that_relational_guideline_resolver_infers_guidelines_from_a_tag_entailed_by_its_own_guidelines(
+    container: Container,
+) -> None:
+    relationship_store = container[RelationshipStore]
+    guideline_store = container[GuidelineStore]
+    tag_store = container[TagStore]
+    resolver = container[RelationalGuidelineResolver]
+
+    g1 = await guideline_store.create_guideline(condition="x", action="y")
+    g2 = await guideline_store.create_guideline(condition="y", action="z")
+
+    t1 = await tag_store.create_tag(name="t1")
+
+    await guideline_store.upsert_tag(guideline_id=g2.id, tag_id=t1.id)
+
+    for source in [g1, g2]:
+        await relationship_store.create_relationship(
+            source=RelationshipEntity(
+                id=source.id,
+                kind=RelationshipEntityKind.GUIDELINE,
+            ),
+            target=RelationshipEntity(
+                id=t1.id,
+                kind=RelationshipEntityKind.TAG,
+            ),
+            kind=RelationshipKind.ENTAILMENT,
+        )
+
+    result = await resolver.resolve(
+        [g1, g2],
+        [
+            GuidelineMatch(guideline=g1, score=8, rationale=""),
+        ],
+        journeys=[],
+    )
+
+    assert [m.guideline.id for m in result] == [g1.id, g2.id]
+
+
 async def test_that_relational_guideline_resolver_does_not_ignore_a_deprioritized_tag_when_its_prioritized_counterpart_is_not_active(
     container: Container,
 ) -> None:
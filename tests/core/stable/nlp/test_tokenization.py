@@ -0,0 +1,88 @@
+# Copyright 2025 Emcie Co Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pytest import raises
+from typing_extensions import override
+
+from parlant.core.nlp.tokenization import (
+    ApproximateEstimatingTokenizer,
+    CachingEstimatingTokenizer,
+    EstimatingTokenizer,
+    parse_approximate_token_counts,
+)
+
+
+class _WordCountingTokenizer(EstimatingTokenizer):
+    def __init__(self) -> None:
+        self.prompts: list[str] = []
+
+    @override
+    async def estimate_token_count(self, prompt: str) -> int:
+        self.prompts.append(prompt)
+        return len(prompt.split())
+
+
+async def test_that_a_caching_tokenizer_counts_each_prompt_only_once() -> None:
+    reference = _WordCountingTokenizer()
+    tokenizer = CachingEstimatingTokenizer(reference)
+
+    assert await tokenizer.estimate_token_count("one two three") == 3
+    assert await tokenizer.estimate_token_count("one two three") == 3
+    assert await tokenizer.estimate_token_count("four five") == 2
+
+    assert reference.prompts == ["one two three", "four five"]
+
+
+async def test_that_an_approximate_tokenizer_stops_using_its_reference_once_calibrated() -> None:
+    reference = _WordCountingTokenizer()
+    tokenizer = ApproximateEstimatingTokenizer(reference, calibration_samples=2)
+
+    assert await tokenizer.estimate_token_count("abcd abcd") == 2
+    assert await tokenizer.estimate_token_count("abcd abcd abcd") == 3
+
+    assert tokenizer.bytes_per_token == 23 / 5
+
+    assert await tokenizer.estimate_token_count("abcd abcd abcd abcd") == 5
+    assert await tokenizer.estimate_token_count("") == 0
+
+    assert len(reference.prompts) == 2
+
+
+async def test_that_budget_checks_count_exactly_with_caching_by_default() -> None:
+    reference = _WordCountingTokenizer()
+
+    assert await reference.budgeting.estimate_token_count("one two three") == 3
+    assert await reference.budgeting.estimate_token_count("one two three") == 3
+
+    assert reference.prompts == ["one two three"]
+
+
+async def test_that_an_approximate_tokenizer_with_a_fixed_ratio_needs_no_reference() -> None:
+    tokenizer = ApproximateEstimatingTokenizer(bytes_per_token=4)
+
+    assert await tokenizer.estimate_token_count("abcdefghi") == 3
+
+
+def test_that_approximate_token_counts_are_parsed_as_a_flag_or_a_positive_ratio() -> None:
+    for value in ["false", "No", "off", "0", ""]:
+        assert parse_approximate_token_counts(value) is False
+
+    for value in ["true", "YES", "on", "1"]:
+        assert parse_approximate_token_counts(value) is True
+
+    assert parse_approximate_token_counts("3.5") == 3.5
+
+    for value in ["maybe", "-2", "0.0", "nan", "inf"]:
+        with raises(ValueError, match="PARLANT_APPROXIMATE_TOKEN_COUNTS"):
+            parse_approximate_token_counts(value)
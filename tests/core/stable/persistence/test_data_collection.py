@@ -0,0 +1,130 @@
+# Copyright 2025 Emcie Co Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from datetime import datetime, timezone
+import gzip
+import json
+from pathlib import Path
+from typing import Any
+
+from lagom import Container
+
+from parlant.core.common import DefaultBaseModel
+from parlant.core.loggers import Logger
+from parlant.core.meter import LocalCounter, LocalMeter
+from parlant.core.nlp.generation import SchematicGenerationResult
+from parlant.core.nlp.generation_info import GenerationInfo, UsageInfo
+from parlant.core.persistence.data_collection import (
+    CollectedGeneration,
+    DataCollectionConfig,
+    DataCollectionSink,
+)
+
+
+class GreetingSchema(DefaultBaseModel):
+    greeting: str
+
+
+def make_generation(greeting: str) -> CollectedGeneration:
+    return CollectedGeneration(
+        creation_utc=datetime.now(timezone.utc),
+        schema=GreetingSchema.__name__,
+        generator="test-generator",
+        prompt="Say hello",
+        result=SchematicGenerationResult(
+            content=GreetingSchema(greeting=greeting),
+            info=GenerationInfo(
+                schema_name=GreetingSchema.__name__,
+                model="test-model",
+                duration=0.5,
+                usage=UsageInfo(input_tokens=10, output_tokens=2),
+            ),
+        ),
+        trace_id="trace-1",
+        attributes={"session_id": "s1"},
+    )
+
+
+def read_records(path: Path) -> list[dict[str, Any]]:
+    return [
+        json.loads(line)
+        for segment in sorted(path.glob("*.jsonl.gz"))
+        for line in gzip.decompress(segment.read_bytes()).decode("utf-8").splitlines()
+    ]
+
+
+async def test_that_collected_generations_are_written_as_compressed_json_lines(
+    container: Container,
+    tmp_path: Path,
+) -> None:
+    sink = DataCollectionSink(
+        container[Logger],
+        LocalMeter(container[Logger]),
+        DataCollectionConfig(path=str(tmp_path)),
+    )
+
+    async with sink:
+        await sink.collect(make_generation("Hello"))
+        await sink.collect(make_generation("Hi"))
+
+    records = read_records(tmp_path)
+
+    assert [r["completion"] for r in records] == [{"greeting": "Hello"}, {"greeting": "Hi"}]
+    assert records[0]["prompt"] == "Say hello"
+    assert records[0]["attributes"] == {"session_id": "s1"}
+    assert records[0]["usage"]["input_tokens"] == 10
+
+
+async def test_that_a_new_segment_is_started_once_the_current_one_is_full(
+    container: Container,
+    tmp_path: Path,
+) -> None:
+    sink = DataCollectionSink(
+        container[Logger],
+        LocalMeter(container[Logger]),
+        DataCollectionConfig(path=str(tmp_path), batch_size=1, max_segment_bytes=1),
+    )
+
+    async with sink:
+        for greeting in ["Hello", "Hi", "Hey"]:
+            await sink.collect(make_generation(greeting))
+
+    assert len(list(tmp_path.glob("*.jsonl.gz"))) == 3
+    assert len(read_records(tmp_path)) == 3
+
+
+async def test_that_generations_are_dropped_and_counted_when_the_queue_is_full(
+    container: Container,
+    tmp_path: Path,
+) -> None:
+    meter = LocalMeter(container[Logger])
+
+    sink = DataCollectionSink(
+        container[Logger],
+        meter,
+        DataCollectionConfig(path=str(tmp_path), queue_size=2),
+    )
+
+    # The writer isn't running yet, so nothing leaves the queue
+    for greeting in ["Hello", "Hi", "Hey"]:
+        await sink.collect(make_generation(greeting))
+
+    async with sink:
+        pass
+
+    dropped = meter.metrics["data_collection.dropped"]
+    assert isinstance(dropped, LocalCounter)
+
+    assert dropped.value() == 1
+    assert [r["completion"]["greeting"] for r in read_records(tmp_path)] == ["Hello", "Hi"]
@@ -0,0 +1,54 @@
+# Copyright 2025 Emcie Co Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Any
+
+from parlant.core.persistence.common import exclude_document_fields
+
+
+def test_that_a_top_level_field_is_excluded() -> None:
+    document = {"id": "1", "data": {"message": "hi"}}
+
+    assert exclude_document_fields(document, ["data"]) == {"id": "1"}
+
+
+def test_that_a_nested_field_is_excluded_from_each_item_of_a_list() -> None:
+    document: dict[str, Any] = {
+        "id": "1",
+        "data": {
+            "tool_calls": [
+                {"tool_id": "a", "result": {"data": "big"}},
+                {"tool_id": "b", "result": {"data": "bigger"}},
+            ]
+        },
+    }
+
+    assert exclude_document_fields(document, ["data.tool_calls.result"]) == {
+        "id": "1",
+        "data": {"tool_calls": [{"tool_id": "a"}, {"tool_id": "b"}]},
+    }
+
+
+def test_that_missing_fields_are_ignored() -> None:
+    document = {"id": "1", "data": {"message": "hi"}}
+
+    assert exclude_document_fields(document, ["data.tool_calls.result", "other"]) == document
+
+
+def test_that_the_original_document_is_not_modified() -> None:
+    document = {"id": "1", "data": {"tool_calls": [{"tool_id": "a", "result": {}}]}}
+
+    exclude_document_fields(document, ["data.tool_calls.result"])
+
+    assert document == {"id": "1", "data": {"tool_calls": [{"tool_id": "a", "result": {}}]}}
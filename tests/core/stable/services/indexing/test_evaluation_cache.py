@@ -0,0 +1,219 @@
+# Copyright 2025 Emcie Co Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Optional
+from lagom import Container
+from typing_extensions import override
+
+from parlant.adapters.db.transient import TransientDocumentDatabase
+from parlant.core.agents import AgentStore
+from parlant.core.background_tasks import BackgroundTaskService
+from parlant.core.common import JSONSerializable
+from parlant.core.entity_cq import EntityQueries
+from parlant.core.evaluations import (
+    EvaluationStore,
+    GuidelinePayload,
+    InvoiceGuidelineData,
+    InvoiceJourneyData,
+    PayloadDescriptor,
+    PayloadKind,
+    PayloadOperation,
+)
+from parlant.core.guidelines import GuidelineContent, GuidelineStore
+from parlant.core.journey_guideline_projection import JourneyGuidelineProjection
+from parlant.core.journeys import JourneyEdgeId, JourneyNodeId, JourneyStore
+from parlant.core.loggers import Logger
+from parlant.core.services.indexing.behavioral_change_evaluation import (
+    BehavioralChangeEvaluator,
+)
+from parlant.core.services.indexing.common import ProgressReport
+from parlant.core.services.indexing.customer_dependent_action_detector import (
+    CustomerDependentActionDetector,
+    CustomerDependentActionProposition,
+)
+from parlant.core.services.indexing.evaluation_cache import BasicEvaluationCache
+from parlant.core.services.indexing.guideline_action_proposer import GuidelineActionProposer
+from parlant.core.services.indexing.guideline_agent_intention_proposer import (
+    AgentIntentionProposer,
+    AgentIntentionProposition,
+)
+from parlant.core.services.indexing.guideline_continuous_proposer import (
+    GuidelineContinuousProposer,
+    GuidelineContinuousProposition,
+)
+from parlant.core.services.indexing.journey_reachable_nodes_evaluation import (
+    JourneyReachableNodesEvaluator,
+)
+from parlant.core.services.indexing.relative_action_proposer import RelativeActionProposer
+from parlant.core.services.indexing.tool_running_action_detector import (
+    ToolRunningActionDetector,
+)
+
+
+async def test_that_a_cached_evaluation_is_found_by_its_content_regardless_of_key_order() -> None:
+    cache = BasicEvaluationCache(TransientDocumentDatabase(), model_id="model-a")
+
+    await cache.set(
+        {"kind": "guideline", "condition": "the customer greets you", "action": "greet back"},
+        InvoiceGuidelineData(properties_proposition={"continuous": False}),
+    )
+
+    assert await cache.get(
+        {"action": "greet back", "condition": "the customer greets you", "kind": "guideline"}
+    ) == InvoiceGuidelineData(properties_proposition={"continuous": False})
+
+    assert not await cache.get(
+        {"kind": "guideline", "condition": "the customer greets you", "action": "wave"}
+    )
+
+
+async def test_that_evaluations_are_not_shared_between_models() -> None:
+    database = TransientDocumentDatabase()
+    content: JSONSerializable = {
+        "kind": "journey",
+        "nodes": [{"id": "n1", "action": "ask for their name"}],
+    }
+    data = InvoiceJourneyData(
+        node_properties_proposition={JourneyNodeId("n1"): {"internal_action": "ask"}},
+        edge_properties_proposition={JourneyEdgeId("e1"): {}},
+    )
+
+    await BasicEvaluationCache(database, model_id="model-a").set(content, data)
+
+    assert await BasicEvaluationCache(database, model_id="model-a").get(content) == data
+    assert not await BasicEvaluationCache(database, model_id="model-b").get(content)
+
+
+class _ContinuousProposer(GuidelineContinuousProposer):
+    def __init__(self) -> None:
+        self.conditions: list[str] = []
+
+    @override
+    async def propose_continuous(
+        self,
+        guideline: GuidelineContent,
+        progress_report: Optional[ProgressReport] = None,
+    ) -> GuidelineContinuousProposition:
+        self.conditions.append(guideline.condition)
+        return GuidelineContinuousProposition(is_continuous="throughout" in guideline.condition)
+
+
+class _CustomerDependentActionDetector(CustomerDependentActionDetector):
+    def __init__(self) -> None:
+        pass
+
+    @override
+    async def detect_if_customer_dependent(
+        self,
+        guideline: GuidelineContent,
+        progress_report: Optional[ProgressReport] = None,
+    ) -> CustomerDependentActionProposition:
+        return CustomerDependentActionProposition(is_customer_dependent=False)
+
+
+class _AgentIntentionProposer(AgentIntentionProposer):
+    def __init__(self) -> None:
+        pass
+
+    @override
+    async def propose_agent_intention(
+        self,
+        guideline: GuidelineContent,
+        progress_report: Optional[ProgressReport] = None,
+    ) -> AgentIntentionProposition:
+        return AgentIntentionProposition(
+            is_agent_intention=True,
+            rewritten_condition=f"the agent sees that {guideline.condition}",
+        )
+
+
+def guideline_payload(condition: str) -> PayloadDescriptor:
+    return PayloadDescriptor(
+        PayloadKind.GUIDELINE,
+        GuidelinePayload(
+            content=GuidelineContent(condition=condition, action="help them"),
+            tool_ids=[],
+            operation=PayloadOperation.ADD,
+            action_proposition=False,
+            properties_proposition=True,
+            journey_node_proposition=False,
+        ),
+    )
+
+
+async def test_that_an_evaluation_only_evaluates_uncached_payloads_and_keeps_invoice_order(
+    container: Container,
+) -> None:
+    continuous_proposer = _ContinuousProposer()
+    evaluation_store = container[EvaluationStore]
+
+    evaluator = BehavioralChangeEvaluator(
+        logger=container[Logger],
+        background_task_service=container[BackgroundTaskService],
+        agent_store=container[AgentStore],
+        guideline_store=container[GuidelineStore],
+        journey_store=container[JourneyStore],
+        evaluation_store=evaluation_store,
+        entity_queries=container[EntityQueries],
+        journey_guideline_projection=container[JourneyGuidelineProjection],
+        guideline_action_proposer=container[GuidelineActionProposer],
+        guideline_continuous_proposer=continuous_proposer,
+        customer_dependent_action_detector=_CustomerDependentActionDetector(),
+        agent_intention_proposer=_AgentIntentionProposer(),
+        tool_running_action_detector=container[ToolRunningActionDetector],
+        relative_action_proposer=container[RelativeActionProposer],
+        journey_reachable_node_evaluator=container[JourneyReachableNodesEvaluator],
+        evaluation_cache=BasicEvaluationCache(TransientDocumentDatabase(), model_id="model-a"),
+    )
+
+    first = guideline_payload("the customer asks about returns")
+    second = guideline_payload("the customer is upset throughout the conversation")
+    third = guideline_payload("the customer asks about shipping")
+
+    await evaluator.run_evaluation(await evaluation_store.create_evaluation([second]))
+
+    assert continuous_proposer.conditions == ["the customer is upset throughout the conversation"]
+
+    cached_second = await evaluator.read_cached_evaluation(second.payload)
+    assert cached_second
+
+    continuous_proposer.conditions.clear()
+
+    evaluation = await evaluation_store.create_evaluation([first, second, third])
+    await evaluator.run_evaluation(evaluation)
+
+    assert sorted(continuous_proposer.conditions) == [
+        "the customer asks about returns",
+        "the customer asks about shipping",
+    ]
+
+    invoices = (await evaluation_store.read_evaluation(evaluation.id)).invoices
+
+    assert [i.payload for i in invoices] == [first.payload, second.payload, third.payload]
+
+    first_data, second_data, third_data = [i.data for i in invoices]
+
+    assert second_data == cached_second
+
+    for descriptor, data, condition in [
+        (first, first_data, "the customer asks about returns"),
+        (third, third_data, "the customer asks about shipping"),
+    ]:
+        assert isinstance(data, InvoiceGuidelineData)
+        assert data.properties_proposition
+        assert (
+            data.properties_proposition["agent_intention_condition"]
+            == f"the agent sees that {condition}"
+        )
+        assert await evaluator.read_cached_evaluation(descriptor.payload) == data
@@ -0,0 +1,195 @@
+# Copyright 2025 Emcie Co Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from typing import Optional, Sequence
+from lagom import Container
+from typing_extensions import override
+
+from parlant.core.entity_cq import EntityQueries
+from parlant.core.evaluations import GuidelinePayload, PayloadOperation
+from parlant.core.guidelines import GuidelineContent
+from parlant.core.loggers import Logger
+from parlant.core.services.indexing.behavioral_change_evaluation import GuidelineEvaluator
+from parlant.core.services.indexing.common import ProgressReport
+from parlant.core.services.indexing.customer_dependent_action_detector import (
+    CustomerDependentActionDetector,
+    CustomerDependentActionProposition,
+)
+from parlant.core.services.indexing.guideline_action_proposer import (
+    GuidelineActionProposer,
+    GuidelineActionProposition,
+)
+from parlant.core.services.indexing.guideline_agent_intention_proposer import (
+    AgentIntentionProposer,
+    AgentIntentionProposition,
+)
+from parlant.core.services.indexing.guideline_continuous_proposer import (
+    GuidelineContinuousProposer,
+    GuidelineContinuousProposition,
+)
+from parlant.core.services.indexing.tool_running_action_detector import (
+    ToolRunningActionDetector,
+    ToolRunningActionProposition,
+)
+from parlant.core.tools import ToolId
+
+
+class _ActionProposer(GuidelineActionProposer):
+    def __init__(self, independent_stage_started: asyncio.Event) -> None:
+        self._independent_stage_started = independent_stage_started
+
+    @override
+    async def propose_action(
+        self,
+        guideline: GuidelineContent,
+        tool_ids: Sequence[ToolId],
+        progress_report: Optional[ProgressReport] = None,
+    ) -> Optional[GuidelineActionProposition]:
+        # Stages that don't depend on the action must not wait for it
+        await asyncio.wait_for(self._independent_stage_started.wait(), timeout=5)
+
+        return GuidelineActionProposition(
+            content=GuidelineContent(condition=guideline.condition, action="check the balance"),
+            rationale="The tool checks the balance",
+        )
+
+
+class _ContinuousProposer(GuidelineContinuousProposer):
+    def __init__(self) -> None:
+        self.actions: list[Optional[str]] = []
+
+    @override
+    async def propose_continuous(
+        self,
+        guideline: GuidelineContent,
+        progress_report: Optional[ProgressReport] = None,
+    ) -> GuidelineContinuousProposition:
+        self.actions.append(guideline.action)
+        return GuidelineContinuousProposition(is_continuous=False)
+
+
+class _CustomerDependentActionDetector(CustomerDependentActionDetector):
+    def __init__(self) -> None:
+        self.actions: list[Optional[str]] = []
+
+    @override
+    async def detect_if_customer_dependent(
+        self,
+        guideline: GuidelineContent,
+        progress_report: Optional[ProgressReport] = None,
+    ) -> CustomerDependentActionProposition:
+        self.actions.append(guideline.action)
+        return CustomerDependentActionProposition(is_customer_dependent=False)
+
+
+class _AgentIntentionProposer(AgentIntentionProposer):
+    def __init__(self, started: asyncio.Event) -> None:
+        self._started = started
+
+    @override
+    async def propose_agent_intention(
+        self,
+        guideline: GuidelineContent,
+        progress_report: Optional[ProgressReport] = None,
+    ) -> AgentIntentionProposition:
+        self._started.set()
+        return AgentIntentionProposition(is_agent_intention=False)
+
+
+class _ToolRunningActionDetector(ToolRunningActionDetector):
+    def __init__(self) -> None:
+        pass
+
+    @override
+    async def detect_if_tool_running(
+        self,
+        guideline: GuidelineContent,
+        tool_ids: Sequence[ToolId],
+        progress_report: Optional[ProgressReport] = None,
+    ) -> ToolRunningActionProposition:
+        return ToolRunningActionProposition(is_tool_running_only=True)
+
+
+async def test_that_dependent_stages_see_the_proposed_action_and_all_stages_are_timed(
+    container: Container,
+) -> None:
+    agent_intention_started = asyncio.Event()
+
+    continuous_proposer = _ContinuousProposer()
+    customer_dependent_action_detector = _CustomerDependentActionDetector()
+
+    evaluator = GuidelineEvaluator(
+        logger=container[Logger],
+        entity_queries=container[EntityQueries],
+        guideline_action_proposer=_ActionProposer(agent_intention_started),
+        guideline_continuous_proposer=continuous_proposer,
+        customer_dependent_action_detector=customer_dependent_action_detector,
+        agent_intention_proposer=_AgentIntentionProposer(agent_intention_started),
+        tool_running_action_detector=_ToolRunningActionDetector(),
+    )
+
+    async def on_progress(percentage: float) -> None:
+        pass
+
+    progress_report = ProgressReport(on_progress)
+
+    [result] = await evaluator.evaluate(
+        [
+            GuidelinePayload(
+                content=GuidelineContent(
+                    condition="the customer asks for their balance", action=None
+                ),
+                tool_ids=[ToolId(service_name="local", tool_name="get_balance")],
+                operation=PayloadOperation.ADD,
+                action_proposition=True,
+                properties_proposition=True,
+                journey_node_proposition=True,
+            )
+        ],
+        progress_report,
+    )
+
+    assert continuous_proposer.actions == ["check the balance"]
+    assert customer_dependent_action_detector.actions == ["check the balance"]
+
+    assert result.properties_proposition
+    assert result.properties_proposition["internal_action"] == "check the balance"
+    assert result.properties_proposition["tool_running_only"] is True
+
+    assert set(progress_report.stage_durations) == {
+        "action",
+        "continuous",
+        "customer_dependent_action",
+        "agent_intention",
+        "tool_running_action",
+    }
+    assert all(d >= 0 for d in progress_report.stage_durations.values())
+
+
+async def test_that_a_stage_spans_from_its_first_start_to_its_last_end() -> None:
+    async def on_progress(percentage: float) -> None:
+        pass
+
+    progress_report = ProgressReport(on_progress)
+
+    async def run_stage(delay: float, duration: float) -> None:
+        await asyncio.sleep(delay)
+
+        with progress_report.stage("action"):
+            await asyncio.sleep(duration)
+
+    await asyncio.gather(run_stage(0, 0.05), run_stage(0.1, 0.05))
+
+    assert progress_report.stage_durations["action"] >= 0.15
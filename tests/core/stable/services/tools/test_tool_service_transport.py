@@ -0,0 +1,151 @@
+# Copyright 2025 Emcie Co Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from lagom import Container
+import pytest
+from pytest import raises
+
+from parlant.core.emission.event_buffer import EventBufferFactory
+from parlant.core.loggers import Logger
+from parlant.core.meter import LocalMeter
+from parlant.core.services.tools.plugins import PluginClient, tool
+from parlant.core.services.tools.transport import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+    ToolServiceTransport,
+    ToolServiceTransportConfig,
+)
+from parlant.core.tools import ToolContext, ToolResult
+from parlant.core.tracer import Tracer
+from tests.test_utilities import run_service_server
+
+
+def state_of(breaker: CircuitBreaker) -> CircuitState:
+    # Keeps mypy from narrowing the state across calls that change it
+    return breaker.state
+
+
+async def test_that_a_circuit_breaker_opens_after_consecutive_failures() -> None:
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.allow_request()
+
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+    assert not breaker.allow_request()
+
+
+async def test_that_a_circuit_breaker_lets_a_single_probe_through_after_reset_timeout() -> None:
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+
+    breaker.record_failure()
+    assert not breaker.allow_request()
+
+    await asyncio.sleep(0.06)
+
+    assert state_of(breaker) == CircuitState.HALF_OPEN
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+
+    breaker.record_success()
+    assert state_of(breaker) == CircuitState.CLOSED
+
+
+async def test_that_a_successful_request_resets_the_failure_count() -> None:
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitState.CLOSED
+
+
+async def test_that_plugin_clients_share_the_transport_connection_pool(
+    container: Container,
+) -> None:
+    @tool
+    def my_tool(context: ToolContext, arg_1: int) -> ToolResult:
+        return ToolResult(arg_1 * 2)
+
+    async with run_service_server([my_tool]) as server:
+        async with ToolServiceTransport(
+            logger=container[Logger],
+            meter=LocalMeter(container[Logger]),
+            config=ToolServiceTransportConfig(http2=False),
+        ) as transport:
+            clients = [
+                PluginClient(
+                    url=server.url,
+                    event_emitter_factory=container[EventBufferFactory],
+                    logger=container[Logger],
+                    tracer=container[Tracer],
+                    transport=transport,
+                    service_name=f"service_{i}",
+                )
+                for i in range(2)
+            ]
+
+            for client in clients:
+                async with client:
+                    tools = await client.list_tools()
+                    assert tools[0].name == "my_tool"
+
+            # Closing the clients must leave the shared pool usable
+            async with clients[0]:
+                assert await clients[0].list_tools()
+
+
+async def test_that_requests_are_short_circuited_once_a_service_keeps_failing(
+    container: Container,
+) -> None:
+    async with ToolServiceTransport(
+        logger=container[Logger],
+        meter=LocalMeter(container[Logger]),
+        config=ToolServiceTransportConfig(
+            http2=False,
+            connect_timeout=1,
+            circuit_breaker_failure_threshold=2,
+        ),
+    ) as transport:
+        async with transport.create_client("unreachable") as client:
+            for _ in range(2):
+                with raises(Exception) as exc:
+                    await client.get("http://127.0.0.1:1/tools")
+                assert not isinstance(exc.value, CircuitOpenError)
+
+            with raises(CircuitOpenError):
+                await client.get("http://127.0.0.1:1/tools")
+
+        assert transport.circuit_breaker("unreachable").state == CircuitState.OPEN
+        assert transport.circuit_breaker("another").state == CircuitState.CLOSED
+
+
+async def test_that_transport_config_is_read_from_the_environment(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("PARLANT_TOOL_HTTP_MAX_CONNECTIONS", "7")
+    monkeypatch.setenv("PARLANT_TOOL_HTTP_HTTP2", "false")
+    monkeypatch.setenv("PARLANT_TOOL_HTTP_READ_TIMEOUT", "2.5")
+
+    config = ToolServiceTransportConfig.from_environment()
+
+    assert config.max_connections == 7
+    assert config.http2 is False
+    assert config.read_timeout == 2.5
+    assert config.connect_timeout == ToolServiceTransportConfig().connect_timeout
@@ -0,0 +1,164 @@
+# Copyright 2025 Emcie Co Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from lagom import Container
+from pytest import raises
+
+from parlant.adapters.db.transient import TransientDocumentDatabase
+from parlant.core.agents import Agent, AgentDocumentStore, AgentStore
+from parlant.core.behavior_snapshots import BehaviorSnapshotProvider
+from parlant.core.canned_responses import CannedResponseStore
+from parlant.core.common import IdGenerator, ItemNotFoundError
+from parlant.core.context_variables import ContextVariableStore
+from parlant.core.guideline_tool_associations import GuidelineToolAssociationStore
+from parlant.core.guidelines import GuidelineDocumentStore, GuidelineStore
+from parlant.core.journeys import JourneyStore
+from parlant.core.tags import Tag, TagId
+
+
+async def test_that_a_snapshot_is_reused_while_the_stores_are_unchanged(
+    container: Container,
+    agent: Agent,
+) -> None:
+    provider = container[BehaviorSnapshotProvider]
+    context_variable_store = container[ContextVariableStore]
+
+    await container[GuidelineStore].create_guideline(
+        condition="the customer greets you",
+        action="greet them back",
+        tags=[Tag.for_agent_id(agent.id)],
+    )
+
+    first = await provider.read_snapshot(agent.id)
+
+    variable = await context_variable_store.create_variable(name="plan", tags=[])
+    await context_variable_store.update_value(variable.id, "customer", "premium")
+
+    second = await provider.read_snapshot(agent.id)
+    third = await provider.read_snapshot(agent.id)
+
+    assert second is not first
+    assert third is second
+    assert [v.id for v in second.context_variables] == [variable.id]
+
+
+async def test_that_a_snapshot_reflects_guidelines_added_after_it_was_read(
+    container: Container,
+    agent: Agent,
+) -> None:
+    provider = container[BehaviorSnapshotProvider]
+    guideline_store = container[GuidelineStore]
+
+    assert not (await provider.read_snapshot(agent.id)).guidelines
+
+    agent_guideline = await guideline_store.create_guideline(
+        condition="the customer asks for a refund",
+        action="explain the refund policy",
+        tags=[Tag.for_agent_id(agent.id)],
+    )
+
+    other_guideline = await guideline_store.create_guideline(
+        condition="the customer asks about shipping",
+        action="explain the shipping policy",
+        tags=[TagId("other_tag")],
+    )
+
+    assert [g.id for g in (await provider.read_snapshot(agent.id)).guidelines] == [
+        agent_guideline.id
+    ]
+
+    await container[AgentStore].upsert_tag(agent.id, TagId("other_tag"))
+
+    snapshot = await provider.read_snapshot(agent.id)
+
+    assert {g.id for g in snapshot.guidelines} == {agent_guideline.id, other_guideline.id}
+    assert snapshot.agent.tags == [TagId("other_tag")]
+
+
+async def test_that_the_snapshot_of_a_deleted_agent_is_evicted(
+    container: Container,
+) -> None:
+    provider = container[BehaviorSnapshotProvider]
+    agent_store = container[AgentStore]
+
+    agent = await agent_store.create_agent(name="Deleted Agent")
+
+    await provider.read_snapshot(agent.id)
+    await agent_store.delete_agent(agent.id)
+
+    with raises(ItemNotFoundError):
+        await provider.read_snapshot(agent.id)
+
+    assert agent.id not in provider._snapshots
+    assert agent.id not in provider._locks
+
+
+async def test_that_snapshots_are_kept_for_the_most_recently_read_agents(
+    container: Container,
+) -> None:
+    agent_store = container[AgentStore]
+
+    provider = BehaviorSnapshotProvider(
+        agent_store,
+        container[GuidelineStore],
+        container[JourneyStore],
+        container[ContextVariableStore],
+        container[CannedResponseStore],
+        container[GuidelineToolAssociationStore],
+        cached_agents=2,
+    )
+
+    agents = [await agent_store.create_agent(name=f"Agent {i}") for i in range(3)]
+
+    for agent in agents:
+        await provider.read_snapshot(agent.id)
+
+    assert set(provider._snapshots) == {agents[1].id, agents[2].id}
+    assert set(provider._locks) == {agents[1].id, agents[2].id}
+
+
+async def test_that_an_uncached_snapshot_reflects_guidelines_added_by_another_process(
+    container: Container,
+) -> None:
+    # Two processes sharing databases, each counting only its own mutations
+    agent_database, guideline_database = TransientDocumentDatabase(), TransientDocumentDatabase()
+    id_generator = container[IdGenerator]
+
+    async with (
+        AgentDocumentStore(id_generator, agent_database) as api_agent_store,
+        GuidelineDocumentStore(id_generator, guideline_database) as api_guideline_store,
+        AgentDocumentStore(id_generator, agent_database) as worker_agent_store,
+        GuidelineDocumentStore(id_generator, guideline_database) as worker_guideline_store,
+    ):
+        provider = BehaviorSnapshotProvider(
+            worker_agent_store,
+            worker_guideline_store,
+            container[JourneyStore],
+            container[ContextVariableStore],
+            container[CannedResponseStore],
+            container[GuidelineToolAssociationStore],
+            cached=False,
+        )
+
+        agent = await api_agent_store.create_agent(name="Test Agent")
+
+        assert not (await provider.read_snapshot(agent.id)).guidelines
+
+        guideline = await api_guideline_store.create_guideline(
+            condition="the customer asks for a refund",
+            action="explain the refund policy",
+            tags=[Tag.for_agent_id(agent.id)],
+        )
+
+        assert [g.id for g in (await provider.read_snapshot(agent.id)).guidelines] == [guideline.id]
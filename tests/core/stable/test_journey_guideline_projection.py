@@ -1,7 +1,8 @@
 from typing import cast
 from lagom import Container
+from pytest import raises
 
-from parlant.core.common import JSONSerializable
+from parlant.core.common import ItemNotFoundError, JSONSerializable
 from parlant.core.guidelines import GuidelineStore
 from parlant.core.journey_guideline_projection import JourneyGuidelineProjection
 from parlant.core.journeys import JourneyStore
@@ -53,3 +54,103 @@ async def test_that_projection_yields_followup_for_existing_guideline(container:
             assert f_id in all_ids, (
                 f"Bug: follow-up ID {f_id} listed in {g.id} but no guideline was created for it"
             )
+
+
+async def test_that_an_unchanged_journey_is_projected_from_the_cache(
+    container: Container,
+) -> None:
+    journey_store = container[JourneyStore]
+
+    projection = JourneyGuidelineProjection(
+        journey_store=journey_store,
+        guideline_store=container[GuidelineStore],
+    )
+
+    journey = await journey_store.create_journey(
+        title="Cached Journey",
+        description="A journey whose projection is reused",
+        conditions=[],
+    )
+
+    _ = await journey_store.create_node(journey.id, action="ask_name", tools=[])
+
+    first = await projection.project_journey_to_guidelines(journey.id)
+    second = await projection.project_journey_to_guidelines(journey.id)
+
+    assert [g.id for g in first] == [g.id for g in second]
+    assert all(a is b for a, b in zip(first, second))
+
+
+async def test_that_mutating_a_journey_invalidates_its_projection(
+    container: Container,
+) -> None:
+    journey_store = container[JourneyStore]
+
+    projection = JourneyGuidelineProjection(
+        journey_store=journey_store,
+        guideline_store=container[GuidelineStore],
+    )
+
+    journey = await journey_store.create_journey(
+        title="Changing Journey",
+        description="A journey that changes after being projected",
+        conditions=[],
+    )
+
+    node = await journey_store.create_node(journey.id, action="ask_name", tools=[])
+
+    _ = await journey_store.create_edge(
+        journey.id, source=journey.root_id, target=node.id, condition=None
+    )
+
+    before = await projection.project_journey_to_guidelines(journey.id)
+
+    await journey_store.update_node(node.id, {"action": "ask_full_name"})
+
+    after_update = await projection.project_journey_to_guidelines(journey.id)
+
+    assert "ask_name" in {g.content.action for g in before}
+    assert "ask_full_name" in {g.content.action for g in after_update}
+
+    new_node = await journey_store.create_node(journey.id, action="ask_email", tools=[])
+    edge = await journey_store.create_edge(
+        journey.id, source=node.id, target=new_node.id, condition=None
+    )
+
+    after_edge = await projection.project_journey_to_guidelines(journey.id)
+
+    assert "ask_email" in {g.content.action for g in after_edge}
+
+    await journey_store.delete_edge(edge.id)
+
+    after_delete = await projection.project_journey_to_guidelines(journey.id)
+
+    assert "ask_email" not in {g.content.action for g in after_delete}
+
+
+async def test_that_the_projection_of_a_deleted_journey_is_dropped(container: Container) -> None:
+    journey_store = container[JourneyStore]
+    projection = JourneyGuidelineProjection(
+        journey_store=journey_store,
+        guideline_store=container[GuidelineStore],
+    )
+
+    journey = await journey_store.create_journey(
+        title="Deleted Journey",
+        description="A journey that is deleted after being projected",
+        conditions=[],
+    )
+
+    node = await journey_store.create_node(journey.id, action="ask_name", tools=[])
+    _ = await journey_store.create_edge(
+        journey.id, source=journey.root_id, target=node.id, condition=None
+    )
+
+    await projection.project_journey_to_guidelines(journey.id)
+
+    await journey_store.delete_journey(journey.id)
+
+    with raises(ItemNotFoundError):
+        await projection.project_journey_to_guidelines(journey.id)
+
+    assert journey.id not in projection._cache
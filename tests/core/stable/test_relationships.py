@@ -477,3 +477,118 @@ async def test_that_relationships_can_be_listed_with_both_source_and_target_filt
     unique_pairs = {(rel.source.id, rel.target.id) for rel in relationships}
 
     assert unique_pairs == {(a_id, b_id), (c_id, a_id)}
+
+
+async def test_that_indirect_relationships_reflect_relationships_created_and_deleted_after_listing(
+    relationship_store: RelationshipStore,
+) -> None:
+    a_id = GuidelineId("a")
+    b_id = GuidelineId("b")
+    c_id = GuidelineId("c")
+
+    def entity(id: GuidelineId) -> RelationshipEntity:
+        return RelationshipEntity(id=id, kind=RelationshipEntityKind.GUIDELINE)
+
+    a_to_b = await relationship_store.create_relationship(
+        source=entity(a_id),
+        target=entity(b_id),
+        kind=RelationshipKind.ENTAILMENT,
+    )
+
+    assert (
+        len(
+            await relationship_store.list_relationships(
+                kind=RelationshipKind.ENTAILMENT,
+                indirect=True,
+                target_id=c_id,
+            )
+        )
+        == 0
+    )
+
+    await relationship_store.create_relationship(
+        source=entity(b_id),
+        target=entity(c_id),
+        kind=RelationshipKind.ENTAILMENT,
+    )
+
+    c_relationships = await relationship_store.list_relationships(
+        kind=RelationshipKind.ENTAILMENT,
+        indirect=True,
+        target_id=c_id,
+    )
+
+    assert len(c_relationships) == 2
+    assert has_relationship(c_relationships, (b_id, c_id))
+    assert has_relationship(c_relationships, (a_id, b_id))
+
+    await relationship_store.delete_relationship(a_to_b.id)
+
+    c_relationships = await relationship_store.list_relationships(
+        kind=RelationshipKind.ENTAILMENT,
+        indirect=True,
+        target_id=c_id,
+    )
+
+    assert len(c_relationships) == 1
+    assert has_relationship(c_relationships, (b_id, c_id))
+
+
+async def test_that_indirect_relationships_reflect_changes_made_by_another_process_when_graphs_are_not_cached(
+    underlying_database: DocumentDatabase,
+) -> None:
+    a_id = GuidelineId("a")
+    b_id = GuidelineId("b")
+    c_id = GuidelineId("c")
+
+    def entity(id: GuidelineId) -> RelationshipEntity:
+        return RelationshipEntity(id=id, kind=RelationshipEntityKind.GUIDELINE)
+
+    # Two processes sharing a database
+    async with (
+        RelationshipDocumentStore(IdGenerator(), database=underlying_database) as api_store,
+        RelationshipDocumentStore(
+            IdGenerator(),
+            database=underlying_database,
+            cache_graphs=False,
+        ) as worker_store,
+    ):
+        a_to_b = await api_store.create_relationship(
+            source=entity(a_id),
+            target=entity(b_id),
+            kind=RelationshipKind.ENTAILMENT,
+        )
+
+        c_relationships = await worker_store.list_relationships(
+            kind=RelationshipKind.ENTAILMENT,
+            indirect=True,
+            target_id=c_id,
+        )
+
+        assert len(c_relationships) == 0
+
+        await api_store.create_relationship(
+            source=entity(b_id),
+            target=entity(c_id),
+            kind=RelationshipKind.ENTAILMENT,
+        )
+
+        c_relationships = await worker_store.list_relationships(
+            kind=RelationshipKind.ENTAILMENT,
+            indirect=True,
+            target_id=c_id,
+        )
+
+        assert len(c_relationships) == 2
+        assert has_relationship(c_relationships, (a_id, b_id))
+
+        await api_store.delete_relationship(a_to_b.id)
+
+        c_relationships = await worker_store.list_relationships(
+            kind=RelationshipKind.ENTAILMENT,
+            indirect=True,
+            target_id=c_id,
+        )
+
+        assert len(c_relationships) == 1
+        assert has_relationship(c_relationships, (b_id, c_id))
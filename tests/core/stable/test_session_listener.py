@@ -0,0 +1,322 @@
+# Copyright 2025 Emcie Co Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from typing import AsyncIterator
+
+from lagom import Container
+
+from parlant.adapters.db.transient import TransientDocumentDatabase
+from parlant.core.agents import Agent
+from parlant.core.async_utils import Timeout
+from parlant.core.customers import CustomerId
+from parlant.core.sessions import (
+    Event,
+    EventKind,
+    EventSource,
+    NotifyingSessionListener,
+    Session,
+    SessionDocumentStore,
+    SessionEventNotifier,
+    SessionStatusChannel,
+    SessionStore,
+)
+
+
+async def create_session(container: Container, agent: Agent) -> Session:
+    return await container[SessionStore].create_session(
+        customer_id=CustomerId("test_customer"),
+        agent_id=agent.id,
+    )
+
+
+async def create_message(
+    container: Container,
+    session: Session,
+    message: str,
+    source: EventSource = EventSource.CUSTOMER,
+) -> Event:
+    return await container[SessionStore].create_event(
+        session_id=session.id,
+        source=source,
+        kind=EventKind.MESSAGE,
+        trace_id="<main>",
+        data={"message": message},
+    )
+
+
+def create_listener(container: Container) -> NotifyingSessionListener:
+    # A long poll interval makes sure nothing is found by polling the store
+    return NotifyingSessionListener(
+        container[SessionStore],
+        container[SessionEventNotifier],
+        poll_interval=60,
+    )
+
+
+async def next_event(stream: AsyncIterator[Event]) -> Event:
+    return await asyncio.wait_for(anext(stream), timeout=5)
+
+
+async def test_that_waiting_for_events_wakes_up_as_soon_as_an_event_is_created(
+    container: Container,
+    agent: Agent,
+) -> None:
+    session = await create_session(container, agent)
+    listener = create_listener(container)
+
+    waiting = asyncio.create_task(
+        listener.wait_for_events(session.id, min_offset=0, timeout=Timeout(30))
+    )
+
+    await asyncio.sleep(0.05)
+    assert not waiting.done()
+
+    await create_message(container, session, "Hello")
+
+    assert await asyncio.wait_for(waiting, timeout=5)
+
+
+async def test_that_waiting_for_events_times_out_when_no_matching_event_is_created(
+    container: Container,
+    agent: Agent,
+) -> None:
+    session = await create_session(container, agent)
+    listener = create_listener(container)
+
+    waiting = asyncio.create_task(
+        listener.wait_for_events(
+            session.id,
+            min_offset=0,
+            source=EventSource.AI_AGENT,
+            timeout=Timeout(0.2),
+        )
+    )
+
+    await create_message(container, session, "Hello", source=EventSource.CUSTOMER)
+
+    assert not await asyncio.wait_for(waiting, timeout=5)
+
+
+async def test_that_streaming_sends_existing_events_and_then_new_ones(
+    container: Container,
+    agent: Agent,
+) -> None:
+    session = await create_session(container, agent)
+    listener = create_listener(container)
+
+    await create_message(container, session, "first")
+    await create_message(container, session, "second")
+
+    stream = listener.stream_events(session.id, min_offset=1)
+
+    try:
+        assert (await next_event(stream)).data == {"message": "second"}
+
+        await create_message(container, session, "third")
+
+        assert (await next_event(stream)).data == {"message": "third"}
+    finally:
+        await stream.aclose()
+
+
+async def test_that_streaming_sends_updates_to_events_that_were_already_sent(
+    container: Container,
+    agent: Agent,
+) -> None:
+    session = await create_session(container, agent)
+    listener = create_listener(container)
+
+    event = await create_message(container, session, "Hello")
+
+    stream = listener.stream_events(session.id)
+
+    try:
+        assert (await next_event(stream)).id == event.id
+
+        await container[SessionStore].delete_event(event.id)
+
+        update = await next_event(stream)
+
+        assert update.id == event.id
+        assert update.deleted
+    finally:
+        await stream.aclose()
+
+
+async def test_that_streaming_only_sends_events_matching_the_filters(
+    container: Container,
+    agent: Agent,
+) -> None:
+    session = await create_session(container, agent)
+    listener = create_listener(container)
+
+    stream = listener.stream_events(session.id, source=EventSource.AI_AGENT)
+
+    try:
+        pending = asyncio.ensure_future(next_event(stream))
+
+        await create_message(container, session, "Hi", source=EventSource.CUSTOMER)
+        await create_message(container, session, "Hello!", source=EventSource.AI_AGENT)
+
+        assert (await pending).data == {"message": "Hello!"}
+    finally:
+        await stream.aclose()
+
+
+async def test_that_notifications_stop_once_a_subscription_ends(
+    container: Container,
+    agent: Agent,
+) -> None:
+    session = await create_session(container, agent)
+    notifier = container[SessionEventNotifier]
+
+    with notifier.subscribe(session.id) as subscription:
+        await create_message(container, session, "Hello")
+        assert await subscription.get(Timeout(1))
+
+    await create_message(container, session, "Hello again")
+
+    assert await subscription.get(Timeout(0.05)) is None
+
+
+async def test_that_streaming_sends_unstored_statuses_without_skipping_the_next_event(
+    container: Container,
+    agent: Agent,
+) -> None:
+    session = await create_session(container, agent)
+    listener = create_listener(container)
+    channel = container[SessionStatusChannel]
+
+    customer_message = await create_message(container, session, "Hi")
+
+    stream = listener.stream_events(session.id, min_offset=customer_message.offset + 1)
+
+    try:
+        pending = asyncio.ensure_future(next_event(stream))
+        await asyncio.sleep(0.05)
+
+        typing = await channel.publish(
+            session_id=session.id,
+            source=EventSource.AI_AGENT,
+            trace_id="<main>",
+            data={"status": "typing", "data": {}},
+        )
+
+        assert (await pending).id == typing.id
+        assert typing.offset == customer_message.offset
+
+        await create_message(container, session, "Hello!", source=EventSource.AI_AGENT)
+
+        assert (await next_event(stream)).data == {"message": "Hello!"}
+    finally:
+        await stream.aclose()
+
+
+async def test_that_only_final_statuses_are_stored(
+    container: Container,
+    agent: Agent,
+) -> None:
+    session = await create_session(container, agent)
+    channel = container[SessionStatusChannel]
+
+    await create_message(container, session, "Hi")
+
+    typing = await channel.publish(
+        session_id=session.id,
+        source=EventSource.AI_AGENT,
+        trace_id="<main>",
+        data={"status": "typing", "data": {}},
+    )
+
+    assert channel.read_status(session.id) == typing
+
+    ready = await channel.publish(
+        session_id=session.id,
+        source=EventSource.AI_AGENT,
+        trace_id="<main>",
+        data={"status": "ready", "data": {}},
+    )
+
+    assert channel.read_status(session.id) is None
+
+    statuses = await container[SessionStore].list_events(session.id, kinds=[EventKind.STATUS])
+
+    assert [e.id for e in statuses] == [ready.id]
+
+
+async def test_that_a_status_takes_the_offset_of_events_stored_before_the_channel_started(
+    container: Container,
+    agent: Agent,
+) -> None:
+    session = await create_session(container, agent)
+
+    await create_message(container, session, "Hi")
+    last_message = await create_message(container, session, "Anyone there?")
+
+    # A fresh notifier, as in a process that never saw these events being written
+    channel = SessionStatusChannel(container[SessionStore], SessionEventNotifier())
+
+    typing = await channel.publish(
+        session_id=session.id,
+        source=EventSource.AI_AGENT,
+        trace_id="<main>",
+        data={"status": "typing", "data": {}},
+    )
+
+    assert typing.offset == last_message.offset
+
+
+async def test_that_statuses_reach_listeners_in_another_process_when_all_are_stored(
+    agent: Agent,
+) -> None:
+    # Two processes sharing a database, each notified only of its own writes
+    database = TransientDocumentDatabase()
+    api_notifier, worker_notifier = SessionEventNotifier(), SessionEventNotifier()
+
+    async with (
+        SessionDocumentStore(database, event_notifier=api_notifier) as api_store,
+        SessionDocumentStore(database, event_notifier=worker_notifier) as worker_store,
+    ):
+        session = await api_store.create_session(
+            customer_id=CustomerId("test_customer"),
+            agent_id=agent.id,
+        )
+
+        customer_message = await api_store.create_event(
+            session_id=session.id,
+            source=EventSource.CUSTOMER,
+            kind=EventKind.MESSAGE,
+            trace_id="<main>",
+            data={"message": "Hi"},
+        )
+
+        listener = NotifyingSessionListener(api_store, api_notifier, poll_interval=0.05)
+        channel = SessionStatusChannel(worker_store, worker_notifier, persist_all_statuses=True)
+
+        stream = listener.stream_events(session.id, min_offset=customer_message.offset + 1)
+
+        try:
+            pending = asyncio.ensure_future(next_event(stream))
+
+            typing = await channel.publish(
+                session_id=session.id,
+                source=EventSource.AI_AGENT,
+                trace_id="<main>",
+                data={"status": "typing", "data": {}},
+            )
+
+            assert (await pending).id == typing.id
+        finally:
+            await stream.aclose()
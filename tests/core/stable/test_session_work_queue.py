@@ -0,0 +1,53 @@
+# Copyright 2025 Emcie Co Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from pytest import raises
+
+from parlant.core.session_work_queue import InProcessSessionWorkQueue
+from parlant.core.sessions import SessionId
+
+
+async def test_that_a_new_request_supersedes_the_lease_of_a_session_being_processed() -> None:
+    queue = InProcessSessionWorkQueue()
+
+    await queue.enqueue(SessionId("s1"), trace_id="first")
+    first_lease = await queue.claim()
+
+    holding = asyncio.create_task(queue.hold(first_lease))
+    await asyncio.sleep(0)
+    assert not holding.done()
+
+    await queue.enqueue(SessionId("s1"), trace_id="second")
+    await asyncio.wait_for(holding, timeout=1)
+
+    await queue.release(first_lease)
+    second_lease = await asyncio.wait_for(queue.claim(), timeout=1)
+
+    assert second_lease.session_id == SessionId("s1")
+    assert second_lease.generation > first_lease.generation
+    assert second_lease.trace_id == "second"
+
+
+async def test_that_a_completed_session_is_not_claimed_again() -> None:
+    queue = InProcessSessionWorkQueue()
+
+    await queue.enqueue(SessionId("s1"), trace_id="first")
+    await queue.enqueue(SessionId("s1"), trace_id="second")
+
+    lease = await queue.claim()
+    await queue.complete(lease)
+
+    with raises(asyncio.TimeoutError):
+        await asyncio.wait_for(queue.claim(), timeout=0.1)
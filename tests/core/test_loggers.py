@@ -0,0 +1,98 @@
+# Copyright 2025 Emcie Co Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+from pathlib import Path
+from typing import Callable
+
+from parlant.core.common import generate_id
+from parlant.core.loggers import (
+    CompositeLogger,
+    FileLogger,
+    LogFormat,
+    LogLevel,
+    StdoutLogger,
+)
+from parlant.core.tracer import LocalTracer
+
+
+def recording(built: list[str], message: str) -> Callable[[], str]:
+    def build() -> str:
+        built.append(message)
+        return message
+
+    return build
+
+
+def test_that_a_lazy_message_is_not_built_when_its_level_is_disabled() -> None:
+    logger = StdoutLogger(LocalTracer(), LogLevel.INFO, logger_id=generate_id())
+    built: list[str] = []
+
+    logger.trace(recording(built, "trace"))
+    logger.debug(recording(built, "debug"))
+    logger.info(recording(built, "info"))
+
+    assert built == ["info"]
+
+
+def test_that_a_composite_logger_builds_a_lazy_message_once() -> None:
+    loggers = [
+        StdoutLogger(LocalTracer(), LogLevel.DEBUG, logger_id=generate_id()) for _ in range(3)
+    ]
+    logger = CompositeLogger(loggers)
+    built: list[str] = []
+
+    logger.debug(recording(built, "debug"))
+
+    assert built == ["debug"]
+
+
+def test_that_a_composite_logger_is_enabled_if_any_of_its_loggers_is() -> None:
+    logger = CompositeLogger(
+        [
+            StdoutLogger(LocalTracer(), LogLevel.WARNING, logger_id=generate_id()),
+            StdoutLogger(LocalTracer(), LogLevel.DEBUG, logger_id=generate_id()),
+        ]
+    )
+
+    assert logger.is_enabled(LogLevel.DEBUG)
+    assert not logger.is_enabled(LogLevel.TRACE)
+
+
+def test_that_a_background_file_logger_writes_json_lines(tmp_path: Path) -> None:
+    log_file = tmp_path / "parlant.log"
+    tracer = LocalTracer()
+
+    logger = FileLogger(
+        log_file,
+        tracer,
+        LogLevel.TRACE,
+        logger_id=generate_id(),
+        log_format=LogFormat.JSON,
+        background=True,
+    )
+
+    with tracer.span("test"), logger.scope("Scope"):
+        logger.trace("first")
+        logger.info(lambda: "second")
+
+    logger.close()
+
+    records = [json.loads(line) for line in log_file.read_text().splitlines()]
+
+    assert [(r["event"], r["level"], r["scope"]) for r in records] == [
+        ("first", "trace", "[Scope]"),
+        ("second", "info", "[Scope]"),
+    ]
+    assert all(r["trace_id"] for r in records)
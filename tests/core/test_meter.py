@@ -0,0 +1,92 @@
+# Copyright 2025 Emcie Co Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from lagom import Container
+from pytest import raises
+
+from parlant.core.loggers import Logger
+from parlant.core.meter import LocalMeter
+
+
+async def test_that_local_histogram_counts_values_into_buckets(container: Container) -> None:
+    meter = LocalMeter(container[Logger])
+    histogram = meter.create_duration_histogram("gen", description="Generation")
+
+    for value in [3, 7, 7, 40, 200_000]:
+        await histogram.record(value, {"model": "a"})
+
+    await histogram.record(1, {"model": "b"})
+
+    assert histogram.count({"model": "a"}) == 5
+    assert histogram.sum({"model": "a"}) == 200_057
+    assert histogram.count({"model": "b"}) == 1
+    assert histogram.count() == 0
+
+
+async def test_that_local_histogram_estimates_percentiles(container: Container) -> None:
+    meter = LocalMeter(container[Logger])
+    histogram = meter.create_duration_histogram("gen", description="Generation")
+
+    for _ in range(90):
+        await histogram.record(20)
+    for _ in range(10):
+        await histogram.record(700)
+
+    p50 = histogram.percentile(50)
+    p99 = histogram.percentile(99)
+
+    assert p50 is not None and 10 < p50 <= 25
+    assert p99 is not None and 500 < p99 <= 1_000
+    assert histogram.percentile(50, {"unknown": "series"}) is None
+
+
+async def test_that_local_meter_returns_the_same_metric_for_the_same_name(
+    container: Container,
+) -> None:
+    meter = LocalMeter(container[Logger])
+
+    assert meter.create_counter("tokens", "Tokens") is meter.create_counter("tokens", "Tokens")
+
+    with raises(ValueError):
+        meter.create_gauge("tokens", "Tokens")
+
+
+async def test_that_local_meter_renders_prometheus_text(container: Container) -> None:
+    meter = LocalMeter(container[Logger])
+
+    counter = meter.create_counter("input_tokens", "Input tokens")
+    gauge = meter.create_gauge("sessions.active", "Active sessions")
+    histogram = meter.create_duration_histogram("gm.match", "Guideline matching")
+
+    await counter.increment(3, {"model": 'gpt "4"'})
+    await counter.increment(2, {"model": 'gpt "4"'})
+    await gauge.set(7)
+    await histogram.record(12)
+    await histogram.record(3_000)
+
+    text = meter.render_prometheus()
+
+    assert "# HELP parlant_input_tokens_total Input tokens" in text
+    assert "# TYPE parlant_input_tokens_total counter" in text
+    assert 'parlant_input_tokens_total{model="gpt \\"4\\""} 5' in text
+
+    assert "# TYPE parlant_sessions_active gauge" in text
+    assert "parlant_sessions_active 7" in text
+
+    assert "# TYPE parlant_gm_match_ms histogram" in text
+    assert 'parlant_gm_match_ms_bucket{le="10"} 0' in text
+    assert 'parlant_gm_match_ms_bucket{le="25"} 1' in text
+    assert 'parlant_gm_match_ms_bucket{le="+Inf"} 2' in text
+    assert "parlant_gm_match_ms_sum 3012" in text
+    assert "parlant_gm_match_ms_count 2" in text
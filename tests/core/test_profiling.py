@@ -0,0 +1,154 @@
+# Copyright 2025 Emcie Co Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import time
+
+from parlant.core.profiling import ProfilingTracer, TurnProfiler
+from parlant.core.sessions import SessionId
+from parlant.core.tracer import LocalTracer
+
+
+def test_that_spans_opened_within_a_turn_are_recorded_as_a_tree() -> None:
+    profiler = TurnProfiler()
+    tracer = ProfilingTracer(LocalTracer(), profiler)
+
+    with profiler.profile("turn", SessionId("s1")) as recording:
+        with tracer.span("process"):
+            with tracer.span("guideline_matcher"):
+                time.sleep(0.01)
+            with tracer.span("message_generator"):
+                time.sleep(0.02)
+
+    assert recording
+    root = recording.result.root
+
+    assert root.name == "turn"
+    assert [c.name for c in root.children] == ["process"]
+    assert [c.name for c in root.children[0].children] == [
+        "guideline_matcher",
+        "message_generator",
+    ]
+    assert root.children[0].children[1].duration >= 0.02
+    assert root.duration >= root.children[0].duration
+
+
+def test_that_spans_opened_outside_of_a_turn_are_not_recorded() -> None:
+    profiler = TurnProfiler()
+    tracer = ProfilingTracer(LocalTracer(), profiler)
+
+    with tracer.span("process"):
+        pass
+
+    with profiler.profile("turn", SessionId("s1")) as recording:
+        pass
+
+    assert recording
+    assert recording.result.root.children == []
+
+
+def test_that_a_disabled_profiler_does_not_record() -> None:
+    profiler = TurnProfiler(enabled=False)
+
+    with profiler.profile("turn", SessionId("s1")) as recording:
+        assert recording is None
+
+
+def test_that_only_sampled_turns_are_recorded() -> None:
+    never = TurnProfiler(sample_rate=0.0)
+    always = TurnProfiler(sample_rate=1.0)
+
+    for _ in range(10):
+        with never.profile("turn", SessionId("s1")) as recording:
+            assert recording is None
+
+        with always.profile("turn", SessionId("s1")) as recording:
+            assert recording
+
+
+def test_that_events_reporting_their_duration_are_recorded_as_leaf_spans_with_tokens() -> None:
+    profiler = TurnProfiler()
+    tracer = ProfilingTracer(LocalTracer(), profiler)
+
+    with profiler.profile("turn", SessionId("s1")) as recording:
+        with tracer.span("message_generator"):
+            tracer.add_event(
+                "gen.request_completed",
+                {
+                    "duration": 0.5,
+                    "usage.input_tokens": 1000,
+                    "usage.output_tokens": 100,
+                    "model": "some-model",
+                },
+            )
+            tracer.add_event("some_event_without_duration")
+
+    assert recording
+    generator = recording.result.root.children[0]
+    [request] = generator.children
+
+    assert request.name == "gen.request_completed"
+    assert request.duration == 0.5
+    assert request.attributes == {"model": "some-model"}
+    assert (request.input_tokens, request.output_tokens) == (1000, 100)
+    assert recording.result.root.total_input_tokens == 1000
+    assert recording.result.root.total_output_tokens == 100
+
+
+async def test_that_time_spent_waiting_to_be_processed_is_recorded_as_a_queue_span() -> None:
+    profiler = TurnProfiler()
+    recordings = []
+
+    async def process() -> None:
+        with profiler.profile("turn", SessionId("s1")) as recording:
+            recordings.append(recording)
+
+    with profiler.dispatching():
+        task = asyncio.create_task(process())
+
+    # Keep the loop busy, so the task has to wait before it's picked up
+    time.sleep(0.02)
+    await task
+
+    [recording] = recordings
+    assert recording
+    [queue] = recording.result.root.children
+
+    assert queue.name == "queue"
+    assert queue.start_offset == 0
+    assert queue.duration >= 0.02
+
+
+def test_that_the_critical_path_follows_the_latest_ending_child() -> None:
+    profiler = TurnProfiler()
+    tracer = ProfilingTracer(LocalTracer(), profiler)
+
+    async def run() -> None:
+        with tracer.span("process"):
+
+            async def match(name: str, duration: float) -> None:
+                with tracer.span(name):
+                    await asyncio.sleep(duration)
+
+            await asyncio.gather(match("fast_batch", 0.01), match("slow_batch", 0.03))
+
+    with profiler.profile("turn", SessionId("s1")) as recording:
+        asyncio.run(run())
+
+    assert recording
+    assert [s.name for s in recording.result.root.critical_path()] == [
+        "turn",
+        "process",
+        "slow_batch",
+    ]
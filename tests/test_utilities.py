@@ -65,7 +65,7 @@ from parlant.core.engines.alpha.prompt_builder import PromptBuilder
 from parlant.core.glossary import GlossaryStore, Term
 from parlant.core.guideline_tool_associations import GuidelineToolAssociationStore
 from parlant.core.guidelines import Guideline, GuidelineStore
-from parlant.core.loggers import LogLevel, Logger
+from parlant.core.loggers import LogLevel, LogMessage, Logger, resolve_log_message
 from parlant.core.meter import LocalMeter
 from parlant.core.nlp.generation import (
     FallbackSchematicGenerator,
@@ -150,23 +150,23 @@ class _TestLogger(Logger):
             }[log_level]
         )
 
-    def trace(self, message: str) -> None:
-        self.logger.debug(message)
+    def trace(self, message: LogMessage) -> None:
+        self.logger.debug(resolve_log_message(message))
 
-    def debug(self, message: str) -> None:
-        self.logger.debug(message)
+    def debug(self, message: LogMessage) -> None:
+        self.logger.debug(resolve_log_message(message))
 
-    def info(self, message: str) -> None:
-        self.logger.info(message)
+    def info(self, message: LogMessage) -> None:
+        self.logger.info(resolve_log_message(message))
 
-    def warning(self, message: str) -> None:
-        self.logger.warning(message)
+    def warning(self, message: LogMessage) -> None:
+        self.logger.warning(resolve_log_message(message))
 
-    def error(self, message: str) -> None:
-        self.logger.error(message)
+    def error(self, message: LogMessage) -> None:
+        self.logger.error(resolve_log_message(message))
 
-    def critical(self, message: str) -> None:
-        self.logger.critical(message)
+    def critical(self, message: LogMessage) -> None:
+        self.logger.critical(resolve_log_message(message))
 
     @contextmanager
     def scope(self, scope_id: str) -> Iterator[None]: